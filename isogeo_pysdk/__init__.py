@@ -8,17 +8,46 @@ https://www.isogeo.com/
 
 # submodules
 from .__about__ import __version__  # noqa: F401
-from .api_hooks import IsogeoHooks  # noqa: F401
-from .checker import IsogeoChecker  # noqa: F401
-from .decorators import ApiDecorators  # noqa: F401
-from .exceptions import AlreadyExistError  # noqa: F401
-from .isogeo import Isogeo  # noqa: F401
-from .translator import IsogeoTranslator  # noqa: F401
-from .utils import IsogeoUtils  # noqa: F401
+from .lazy import lazy_attributes
 
-# subpackages
-from .api import *  # noqa: F401 F403
-from .enums import *  # noqa: F401 F403
-from .models import *  # noqa: F401 F403
+# subpackages, whose objects are imported on first access
+from . import api, enums, models
+
+# public objects by module, imported on first access (PEP 562): importing the package \
+# does not import the HTTP client nor its dependencies
+_OBJECTS = {
+    "IsogeoHooks": ".api_hooks",
+    "IsogeoBatch": ".batch",
+    "IsogeoCache": ".cache",
+    "IsogeoCassette": ".cassette",
+    "IsogeoHttpCache": ".http_cache",
+    "IsogeoChecker": ".checker",
+    "ApiDecorators": ".decorators",
+    "IsogeoDownloader": ".downloader",
+    "AlreadyExistError": ".exceptions",
+    "Isogeo": ".isogeo",
+    "AsyncIsogeo": ".isogeo_async",
+    "IsogeoMetrics": ".metrics",
+    "IsogeoMiddleware": ".middlewares",
+    "IsogeoScheduler": ".scheduler",
+    "IsogeoSync": ".sync",
+    "IsogeoTranslator": ".translator",
+    "IsogeoUploader": ".uploader",
+    "IsogeoUtils": ".utils",
+    "IsogeoXmlExporter": ".exporter",
+}
+_OBJECTS.update(
+    {
+        name: package.__name__
+        for package in (api, enums, models)
+        for name in package.__all__
+    }
+)
+
+__all__ = ["VERSION", *_OBJECTS]
+__getattr__, __dir__ = lazy_attributes(__name__, _OBJECTS)
+# helper and its module are not part of the package namespace
+del lazy_attributes
+globals().pop("lazy", None)
 
 VERSION = __version__
@@ -1,28 +1,39 @@
 # coding: utf-8
 #! python3  # noqa: E265 F401
 
-from .routes_application import ApiApplication  # noqa: F401
-from .routes_about import ApiAbout  # noqa: F401
-from .routes_account import ApiAccount  # noqa: F401
-from .routes_catalog import ApiCatalog  # noqa: F401
-from .routes_contact import ApiContact  # noqa: F401
-from .routes_condition import ApiCondition  # noqa: F401
-from .routes_coordinate_systems import ApiCoordinateSystem  # noqa: F401
-from .routes_datasource import ApiDatasource  # noqa: F401
-from .routes_directives import ApiDirective  # noqa: F401
-from .routes_feature_attributes import ApiFeatureAttribute  # noqa: F401
-from .routes_format import ApiFormat  # noqa: F401
-from .routes_keyword import ApiKeyword  # noqa: F401
-from .routes_invitation import ApiInvitation  # noqa: F401
-from .routes_license import ApiLicense  # noqa: F401
-from .routes_metadata import ApiMetadata  # noqa: F401
-from .routes_metadata_bulk import ApiBulk  # noqa: F401
-from .routes_search import ApiSearch  # noqa: F401
-from .routes_service import ApiService  # noqa: F401
-from .routes_service_layers import ApiServiceLayer  # noqa: F401
-from .routes_service_operations import ApiServiceOperation  # noqa: F401
-from .routes_share import ApiShare  # noqa: F401
-from .routes_specification import ApiSpecification  # noqa: F401
-from .routes_thesaurus import ApiThesaurus  # noqa: F401
-from .routes_user import ApiUser  # noqa: F401
-from .routes_workgroup import ApiWorkgroup  # noqa: F401
+# submodules
+from isogeo_pysdk.lazy import lazy_attributes
+
+# public objects by module, imported on first access
+_OBJECTS = {
+    "ApiApplication": ".routes_application",
+    "ApiAbout": ".routes_about",
+    "ApiAccount": ".routes_account",
+    "ApiCatalog": ".routes_catalog",
+    "ApiContact": ".routes_contact",
+    "ApiCondition": ".routes_condition",
+    "ApiCoordinateSystem": ".routes_coordinate_systems",
+    "ApiDatasource": ".routes_datasource",
+    "ApiDirective": ".routes_directives",
+    "ApiFeatureAttribute": ".routes_feature_attributes",
+    "ApiFormat": ".routes_format",
+    "ApiKeyword": ".routes_keyword",
+    "ApiInvitation": ".routes_invitation",
+    "ApiLicense": ".routes_license",
+    "ApiMetadata": ".routes_metadata",
+    "ApiBulk": ".routes_metadata_bulk",
+    "ApiSearch": ".routes_search",
+    "ApiService": ".routes_service",
+    "ApiServiceLayer": ".routes_service_layers",
+    "ApiServiceOperation": ".routes_service_operations",
+    "ApiShare": ".routes_share",
+    "ApiSpecification": ".routes_specification",
+    "ApiThesaurus": ".routes_thesaurus",
+    "ApiUser": ".routes_user",
+    "ApiWorkgroup": ".routes_workgroup",
+}
+
+__all__ = list(_OBJECTS)
+__getattr__, __dir__ = lazy_attributes(__name__, _OBJECTS)
+# helper is not part of the package namespace
+del lazy_attributes
@@ -23,7 +23,6 @@ from isogeo_pysdk.utils import IsogeoUtils
 
 logger = logging.getLogger(__name__)
 checker = IsogeoChecker()
-utils = IsogeoUtils()
 
 
 # #############################################################################
@@ -37,6 +36,7 @@ class ApiAbout:
     ):
         self.proxies = proxies
         self.protocol = protocol
+        self.utils = IsogeoUtils(proxies=proxies)
 
         # ensure platform and others params to request
         (
@@ -47,7 +47,7 @@ class ApiAbout:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(platform)
+        ) = self.utils.set_base_url(platform)
         # initialize
         super(ApiAbout, self).__init__()
 
@@ -57,7 +57,9 @@ class ApiAbout:
         with Session() as req_session:
             req_session.proxies = self.proxies
             # request URL
-            url_account = utils.get_request_base_url(route="about", prot=self.protocol)
+            url_account = self.utils.get_request_base_url(
+                route="about", prot=self.protocol
+            )
 
             # request
             req_api_version = req_session.get(
@@ -78,7 +80,7 @@ class ApiAbout:
         with Session() as req_session:
             req_session.proxies = self.proxies
             # request URL
-            url_account = utils.get_request_base_url(
+            url_account = self.utils.get_request_base_url(
                 route="about/{}".format("database"), prot=self.protocol
             )
 
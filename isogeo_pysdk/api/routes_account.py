@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
@@ -40,9 +39,9 @@ class ApiAccount:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -53,11 +52,11 @@ class ApiAccount:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiAccount, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("account")
     @ApiDecorators._check_bearer_validity
     def get(self, include: tuple = ("_abilities",), caching: bool = 1) -> User:
         """Get authenticated user account(= profile) informations.
@@ -72,16 +71,12 @@ class ApiAccount:
             payload = None
 
         # request URL
-        url_account = utils.get_request_base_url(route="account")
+        url_account = self.utils.get_request_base_url(route="account")
 
         # request
         req_account = self.api_client.get(
             url=url_account,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -96,6 +91,7 @@ class ApiAccount:
         # end of method
         return User(**req_account.json())
 
+    @ApiDecorators._invalidate_cache("account")
     @ApiDecorators._check_bearer_validity
     def update(self, account: User, caching: bool = 1) -> User:
         """Update authenticated user account(= profile) informations.
@@ -110,16 +106,12 @@ class ApiAccount:
             pass
 
         # URL
-        url_account_update = utils.get_request_base_url(route="account")
+        url_account_update = self.utils.get_request_base_url(route="account")
 
         # request
         req_account_update = self.api_client.put(
             url=url_account_update,
             json=account.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -135,7 +127,7 @@ class ApiAccount:
         return User(**req_account_update.json())
 
     # -- Routes to manage the related objects ------------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("account")
     @ApiDecorators._check_bearer_validity
     def memberships(self) -> list:
         """Returns memberships for the authenticated user.
@@ -156,15 +148,13 @@ class ApiAccount:
         1
         """
         # URL builder
-        url_user_memberships = utils.get_request_base_url(route="account/memberships")
+        url_user_memberships = self.utils.get_request_base_url(
+            route="account/memberships"
+        )
 
         # request
         req_user_memberships = self.api_client.get(
             url=url_user_memberships,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
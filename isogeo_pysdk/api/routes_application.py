@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
@@ -40,9 +39,9 @@ class ApiApplication:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -53,11 +52,11 @@ class ApiApplication:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiApplication, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("application")
     @ApiDecorators._check_bearer_validity
     def listing(
         self,
@@ -88,7 +87,7 @@ class ApiApplication:
                     "Workgroup ID is not a correct UUID: {}".format(workgroup_id)
                 )
             else:
-                url_applications = utils.get_request_base_url(
+                url_applications = self.utils.get_request_base_url(
                     route="groups/{}/applications".format(workgroup_id)
                 )
         else:
@@ -97,16 +96,12 @@ class ApiApplication:
                     self.api_client._user.contact.name
                 )
             )
-            url_applications = utils.get_request_base_url(route="applications")
+            url_applications = self.utils.get_request_base_url(route="applications")
 
         # request
         req_applications = self.api_client.get(
             url=url_applications,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -155,18 +150,14 @@ class ApiApplication:
             payload = None
 
         # URL
-        url_application = utils.get_request_base_url(
+        url_application = self.utils.get_request_base_url(
             route="applications/{}".format(application_id)
         )
 
         # request
         req_application = self.api_client.get(
             url=url_application,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -177,6 +168,7 @@ class ApiApplication:
         # end of method
         return Application(**req_application.json())
 
+    @ApiDecorators._invalidate_cache("application")
     @ApiDecorators._check_bearer_validity
     def create(self, application: Application, check_exists: int = 1) -> Application:
         """Add a new application to Isogeo.
@@ -205,16 +197,12 @@ class ApiApplication:
             pass
 
         # URL
-        url_application_create = utils.get_request_base_url(route="applications")
+        url_application_create = self.utils.get_request_base_url(route="applications")
 
         # request
         req_new_application = self.api_client.post(
             url=url_application_create,
             json=application.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -229,6 +217,7 @@ class ApiApplication:
         # end of method
         return new_application
 
+    @ApiDecorators._invalidate_cache("application")
     @ApiDecorators._check_bearer_validity
     def delete(self, application_id: str):
         """Delete a application from Isogeo database.
@@ -244,17 +233,13 @@ class ApiApplication:
             pass
 
         # request URL
-        url_application_delete = utils.get_request_base_url(
+        url_application_delete = self.utils.get_request_base_url(
             route="applications/{}".format(application_id)
         )
 
         # request
         req_application_deletion = self.api_client.delete(
             url=url_application_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -280,16 +265,12 @@ class ApiApplication:
 
         # URL builder
         url_application_exists = "{}{}".format(
-            utils.get_request_base_url("applications"), application_id
+            self.utils.get_request_base_url("applications"), application_id
         )
 
         # request
         req_application_exists = self.api_client.get(
             url_application_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -299,6 +280,7 @@ class ApiApplication:
 
         return req_application_exists
 
+    @ApiDecorators._invalidate_cache("application")
     @ApiDecorators._check_bearer_validity
     def update(self, application: Application, caching: bool = 1) -> Application:
         """Update a application owned by a workgroup.
@@ -315,7 +297,7 @@ class ApiApplication:
             pass
 
         # URL
-        url_application_update = utils.get_request_base_url(
+        url_application_update = self.utils.get_request_base_url(
             route="applications/{}".format(application._id)
         )
 
@@ -323,10 +305,6 @@ class ApiApplication:
         req_application_update = self.api_client.put(
             url=url_application_update,
             json=application.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -345,7 +323,7 @@ class ApiApplication:
         return new_application
 
     # -- Routes to manage the related objects ------------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("application")
     @ApiDecorators._check_bearer_validity
     def workgroups(self, application_id: str = None) -> list:
         """Get all groups associated with an application.
@@ -367,17 +345,13 @@ class ApiApplication:
         #     payload = None
 
         # URL
-        url_application_groups = utils.get_request_base_url(
+        url_application_groups = self.utils.get_request_base_url(
             route="applications/{}/groups".format(application_id)
         )
 
         # request
         req_applications = self.api_client.get(
             url=url_application_groups,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -388,6 +362,7 @@ class ApiApplication:
         # end of method
         return req_applications.json()
 
+    @ApiDecorators._invalidate_cache("application")
     @ApiDecorators._check_bearer_validity
     def associate_group(
         self, application: Application, workgroup: Workgroup, force: bool = 0
@@ -464,17 +439,13 @@ class ApiApplication:
             pass
 
         # URL
-        url_application_association = utils.get_request_base_url(
+        url_application_association = self.utils.get_request_base_url(
             route="applications/{}/groups/{}".format(application._id, workgroup._id)
         )
 
         # request
         req_application_assocation = self.api_client.put(
             url=url_application_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -485,6 +456,7 @@ class ApiApplication:
         # end of method
         return req_application_assocation
 
+    @ApiDecorators._invalidate_cache("application")
     @ApiDecorators._check_bearer_validity
     def dissociate_group(self, application: Application, workgroup: Workgroup) -> tuple:
         """Removes the association between the specified group and the specified application.
@@ -519,17 +491,13 @@ class ApiApplication:
             pass
 
         # URL
-        url_application_dissociation = utils.get_request_base_url(
+        url_application_dissociation = self.utils.get_request_base_url(
             route="applications/{}/groups/{}".format(application._id, workgroup._id)
         )
 
         # request
         req_application_dissociation = self.api_client.delete(
             url=url_application_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
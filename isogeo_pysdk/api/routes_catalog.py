@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 from typing import Tuple, Union
 
 # 3rd party
@@ -46,9 +45,9 @@ class ApiCatalog:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -59,11 +58,11 @@ class ApiCatalog:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiCatalog, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("catalog")
     @ApiDecorators._check_bearer_validity
     def listing(
         self,
@@ -106,18 +105,14 @@ class ApiCatalog:
             payload = None
 
         # request URL
-        url_catalogs = utils.get_request_base_url(
+        url_catalogs = self.utils.get_request_base_url(
             route="groups/{}/catalogs".format(workgroup_id)
         )
 
         # request
         req_wg_catalogs = self.api_client.get(
             url_catalogs,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -136,7 +131,7 @@ class ApiCatalog:
         # end of method
         return wg_catalogs
 
-    @lru_cache()
+    @ApiDecorators._cached("catalog")
     @ApiDecorators._check_bearer_validity
     def metadata(self, metadata_id: str) -> list:
         """List metadata's catalogs with complete information.
@@ -155,17 +150,13 @@ class ApiCatalog:
             pass
 
         # URL
-        url_metadata_catalogs = utils.get_request_base_url(
+        url_metadata_catalogs = self.utils.get_request_base_url(
             route="resources/{}/catalogs/".format(metadata_id)
         )
 
         # request
         req_metadata_catalogs = self.api_client.get(
             url=url_metadata_catalogs,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -176,7 +167,7 @@ class ApiCatalog:
         # end of method
         return req_metadata_catalogs.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("catalog")
     @ApiDecorators._check_bearer_validity
     def get(
         self,
@@ -210,18 +201,14 @@ class ApiCatalog:
             payload = None
 
         # catalog route
-        url_catalog = utils.get_request_base_url(
+        url_catalog = self.utils.get_request_base_url(
             route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
         )
 
         # request
         req_catalog = self.api_client.get(
             url=url_catalog,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -232,6 +219,7 @@ class ApiCatalog:
         # end of method
         return Catalog.clean_attributes(req_catalog.json())
 
+    @ApiDecorators._invalidate_cache("catalog")
     @ApiDecorators._check_bearer_validity
     def create(
         self, workgroup_id: str, catalog: Catalog, check_exists: bool = 1
@@ -273,7 +261,7 @@ class ApiCatalog:
             pass
 
         # build request url
-        url_catalog_create = utils.get_request_base_url(
+        url_catalog_create = self.utils.get_request_base_url(
             route="groups/{}/catalogs".format(workgroup_id)
         )
 
@@ -281,10 +269,6 @@ class ApiCatalog:
         req_new_catalog = self.api_client.post(
             url_catalog_create,
             data=catalog.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -303,6 +287,7 @@ class ApiCatalog:
         # end of method
         return new_catalog
 
+    @ApiDecorators._invalidate_cache("catalog")
     @ApiDecorators._check_bearer_validity
     def delete(self, workgroup_id: str, catalog_id: str):
         """Delete a catalog from Isogeo database.
@@ -325,17 +310,13 @@ class ApiCatalog:
             pass
 
         # request URL
-        url_catalog_delete = utils.get_request_base_url(
+        url_catalog_delete = self.utils.get_request_base_url(
             route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
         )
 
         # request
         req_catalog_deletion = self.api_client.delete(
             url_catalog_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -366,17 +347,13 @@ class ApiCatalog:
             pass
 
         # URL builder
-        url_catalog_exists = utils.get_request_base_url(
+        url_catalog_exists = self.utils.get_request_base_url(
             route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
         )
 
         # request
         req_catalog_exists = self.api_client.get(
             url=url_catalog_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -386,6 +363,7 @@ class ApiCatalog:
 
         return req_catalog_exists
 
+    @ApiDecorators._invalidate_cache("catalog")
     @ApiDecorators._check_bearer_validity
     def update(self, catalog: Catalog, caching: bool = 1) -> Catalog:
         """Update a catalog owned by a workgroup.
@@ -400,7 +378,7 @@ class ApiCatalog:
             pass
 
         # URL
-        url_catalog_update = utils.get_request_base_url(
+        url_catalog_update = self.utils.get_request_base_url(
             route="groups/{}/catalogs/{}".format(catalog.owner.get("_id"), catalog._id)
         )
 
@@ -408,10 +386,6 @@ class ApiCatalog:
         req_catalog_update = self.api_client.put(
             url=url_catalog_update,
             json=catalog.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -432,6 +406,7 @@ class ApiCatalog:
         return new_catalog
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("catalog")
     @ApiDecorators._check_bearer_validity
     def associate_metadata(
         self, metadata: Union[Metadata, Tuple[Metadata, ...]], catalog: Catalog
@@ -459,6 +434,15 @@ class ApiCatalog:
             raise ValueError(
                 "Metadata ID is not a correct UUID: {}".format(metadata._id)
             )
+        elif isinstance(metadata, (list, tuple)) and getattr(
+            self.api_client, "active_batch", None
+        ):
+            return [
+                self.api_client.active_batch.add(
+                    action="add", target="catalogs", metadata=md, model=catalog
+                )
+                for md in metadata
+            ]
         elif isinstance(metadata, (list, tuple)):
             logger.info("Multiple association detected: using bulk instead...")
             # prepare request
@@ -479,18 +463,21 @@ class ApiCatalog:
         else:
             pass
 
+        # within a batch: queued, sent later as a bulk request
+        batch = getattr(self.api_client, "active_batch", None)
+        if batch is not None:
+            return batch.add(
+                action="add", target="catalogs", metadata=metadata, model=catalog
+            )
+
         # URL
-        url_catalog_association = utils.get_request_base_url(
+        url_catalog_association = self.utils.get_request_base_url(
             route="catalogs/{}/resources/{}".format(catalog._id, metadata._id)
         )
 
         # request
         req_catalog_association = self.api_client.put(
             url=url_catalog_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -501,6 +488,7 @@ class ApiCatalog:
         # end of method
         return req_catalog_association
 
+    @ApiDecorators._invalidate_cache("catalog")
     @ApiDecorators._check_bearer_validity
     def dissociate_metadata(self, metadata: Metadata, catalog: Catalog) -> Response:
         """Removes the association between a metadata and a catalog.
@@ -524,18 +512,21 @@ class ApiCatalog:
         else:
             pass
 
+        # within a batch: queued, sent later as a bulk request
+        batch = getattr(self.api_client, "active_batch", None)
+        if batch is not None:
+            return batch.add(
+                action="delete", target="catalogs", metadata=metadata, model=catalog
+            )
+
         # URL
-        url_catalog_dissociation = utils.get_request_base_url(
+        url_catalog_dissociation = self.utils.get_request_base_url(
             route="catalogs/{}/resources/{}".format(catalog._id, metadata._id)
         )
 
         # request
         req_catalog_dissociation = self.api_client.delete(
             url=url_catalog_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -546,7 +537,7 @@ class ApiCatalog:
         # end of method
         return req_catalog_dissociation
 
-    @lru_cache()
+    @ApiDecorators._cached("catalog")
     @ApiDecorators._check_bearer_validity
     def shares(self, catalog_id: str) -> list:
         """Returns shares for the specified catalog.
@@ -563,17 +554,13 @@ class ApiCatalog:
             pass
 
         # URL builder
-        url_catalog_shares = utils.get_request_base_url(
+        url_catalog_shares = self.utils.get_request_base_url(
             route="catalogs/{}/shares".format(catalog_id)
         )
 
         # request
         req_catalog_shares = self.api_client.get(
             url=url_catalog_shares,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -583,7 +570,7 @@ class ApiCatalog:
 
         return req_catalog_shares.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("catalog")
     @ApiDecorators._check_bearer_validity
     def statistics(self, catalog_id: str) -> dict:
         """Returns statistics for the specified catalog.
@@ -597,17 +584,13 @@ class ApiCatalog:
             pass
 
         # URL builder
-        url_catalog_statistics = utils.get_request_base_url(
+        url_catalog_statistics = self.utils.get_request_base_url(
             route="catalogs/{}/statistics".format(catalog_id)
         )
 
         # request
         req_catalog_statistics = self.api_client.get(
             url=url_catalog_statistics,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -617,7 +600,7 @@ class ApiCatalog:
 
         return req_catalog_statistics.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("catalog")
     @ApiDecorators._check_bearer_validity
     def statistics_by_tag(self, catalog_id: str, tag: str) -> dict:
         """Returns statistics on a specific tag for the specified catalog.
@@ -642,7 +625,7 @@ class ApiCatalog:
             )
 
         # URL builder
-        url_catalog_statistics = utils.get_request_base_url(
+        url_catalog_statistics = self.utils.get_request_base_url(
             route="catalogs/{}/statistics/tag/{}".format(catalog_id, tag)
         )
 
@@ -650,10 +633,6 @@ class ApiCatalog:
         try:
             req_catalog_statistics = self.api_client.get(
                 url=url_catalog_statistics,
-                headers=self.api_client.header,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=self.api_client.timeout,
             )
         except Timeout as e:
             logger.error(
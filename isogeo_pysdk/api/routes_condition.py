@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # 3rd party
 from requests import Response
@@ -43,9 +42,9 @@ class ApiCondition:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -56,11 +55,11 @@ class ApiCondition:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiCondition, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("condition")
     @ApiDecorators._check_bearer_validity
     def listing(self, metadata_id: str) -> list:
         """List metadata's conditions with complete information.
@@ -79,17 +78,13 @@ class ApiCondition:
             pass
 
         # URL
-        url_metadata_conditions = utils.get_request_base_url(
+        url_metadata_conditions = self.utils.get_request_base_url(
             route="resources/{}/conditions/".format(metadata_id)
         )
 
         # request
         req_metadata_conditions = self.api_client.get(
             url=url_metadata_conditions,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -100,7 +95,7 @@ class ApiCondition:
         # end of method
         return req_metadata_conditions.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("condition")
     @ApiDecorators._check_bearer_validity
     def get(self, metadata_id: str, condition_id: str) -> Condition:
         """Get details about a specific condition.
@@ -124,17 +119,13 @@ class ApiCondition:
             pass
 
         # condition route
-        url_condition = utils.get_request_base_url(
+        url_condition = self.utils.get_request_base_url(
             route="resources/{}/conditions/{}".format(metadata_id, condition_id)
         )
 
         # request
         req_condition = self.api_client.get(
             url=url_condition,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -149,6 +140,7 @@ class ApiCondition:
         # end of method
         return Condition(**condition_returned)
 
+    @ApiDecorators._invalidate_cache("condition")
     @ApiDecorators._check_bearer_validity
     def create(self, metadata: Metadata, condition: Condition) -> Condition:
         """Add a new condition (license + specific description) to a metadata.
@@ -177,7 +169,7 @@ class ApiCondition:
             pass
 
         # URL
-        url_condition_create = utils.get_request_base_url(
+        url_condition_create = self.utils.get_request_base_url(
             route="resources/{}/conditions".format(metadata._id)
         )
 
@@ -185,10 +177,6 @@ class ApiCondition:
         req_condition_create = self.api_client.post(
             url=url_condition_create,
             json=condition.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -203,6 +191,7 @@ class ApiCondition:
         # end of method
         return Condition(**condition_returned)
 
+    @ApiDecorators._invalidate_cache("condition")
     @ApiDecorators._check_bearer_validity
     def delete(self, metadata: Metadata, condition: Condition) -> Response:
         """Removes a condition from a metadata.
@@ -227,17 +216,13 @@ class ApiCondition:
             pass
 
         # URL
-        url_condition_delete = utils.get_request_base_url(
+        url_condition_delete = self.utils.get_request_base_url(
             route="resources/{}/conditions/{}".format(metadata._id, condition._id)
         )
 
         # request
         req_condition_delete = self.api_client.delete(
             url=url_condition_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
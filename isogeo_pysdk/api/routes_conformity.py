@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # 3rd party
 from requests import Response
@@ -43,9 +42,9 @@ class ApiConformity:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -56,11 +55,11 @@ class ApiConformity:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiConformity, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("conformity")
     @ApiDecorators._check_bearer_validity
     def listing(self, metadata_id: str) -> list:
         """List metadata's conformity specifications with complete information.
@@ -79,17 +78,13 @@ class ApiConformity:
             pass
 
         # URL
-        url_metadata_conformities = utils.get_request_base_url(
+        url_metadata_conformities = self.utils.get_request_base_url(
             route="resources/{}/specifications/".format(metadata_id)
         )
 
         # request
         req_metadata_conformities = self.api_client.get(
             url=url_metadata_conformities,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -100,6 +95,7 @@ class ApiConformity:
         # end of method
         return req_metadata_conformities.json()
 
+    @ApiDecorators._invalidate_cache("conformity")
     @ApiDecorators._check_bearer_validity
     def create(self, metadata: Metadata, conformity: Conformity) -> Conformity:
         """Add a new conformity (specification + specific conformant) to a metadata.
@@ -126,7 +122,7 @@ class ApiConformity:
             pass
 
         # URL
-        url_conformity_create = utils.get_request_base_url(
+        url_conformity_create = self.utils.get_request_base_url(
             route="resources/{}/specifications/{}".format(
                 metadata._id, conformity.specification._id
             )
@@ -136,10 +132,6 @@ class ApiConformity:
         req_conformity_create = self.api_client.put(
             url=url_conformity_create,
             json=conformity.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -154,6 +146,7 @@ class ApiConformity:
         # end of method
         return Conformity(**conformity_returned)
 
+    @ApiDecorators._invalidate_cache("conformity")
     @ApiDecorators._check_bearer_validity
     def delete(
         self,
@@ -198,7 +191,7 @@ class ApiConformity:
             pass
 
         # URL
-        url_conformity_delete = utils.get_request_base_url(
+        url_conformity_delete = self.utils.get_request_base_url(
             route="resources/{}/specifications/{}".format(
                 metadata._id, specification_id
             )
@@ -207,10 +200,6 @@ class ApiConformity:
         # request
         req_conformity_delete = self.api_client.delete(
             url=url_conformity_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
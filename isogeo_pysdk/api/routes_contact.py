@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # 3rd party
 from requests.models import Response
@@ -44,9 +43,9 @@ class ApiContact:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -57,11 +56,11 @@ class ApiContact:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiContact, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("contact")
     @ApiDecorators._check_bearer_validity
     def listing(
         self, workgroup_id: str = None, include: tuple = ("count",), caching: bool = 1
@@ -85,18 +84,14 @@ class ApiContact:
             payload = None
 
         # request URL
-        url_contacts = utils.get_request_base_url(
+        url_contacts = self.utils.get_request_base_url(
             route="groups/{}/contacts".format(workgroup_id)
         )
 
         # request
         req_wg_contacts = self.api_client.get(
             url_contacts,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -132,15 +127,13 @@ class ApiContact:
             pass
 
         # contact route
-        url_contact = utils.get_request_base_url(route="contacts/{}".format(contact_id))
+        url_contact = self.utils.get_request_base_url(
+            route="contacts/{}".format(contact_id)
+        )
 
         # request
         req_contact = self.api_client.get(
             url_contact,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -151,6 +144,7 @@ class ApiContact:
         # end of method
         return Contact(**req_contact.json())
 
+    @ApiDecorators._invalidate_cache("contact")
     @ApiDecorators._check_bearer_validity
     def create(
         self, workgroup_id: str, contact: Contact, check_exists: int = 1
@@ -209,7 +203,7 @@ class ApiContact:
             pass
 
         # build request url
-        url_contact_create = utils.get_request_base_url(
+        url_contact_create = self.utils.get_request_base_url(
             route="groups/{}/contacts".format(workgroup_id)
         )
 
@@ -217,10 +211,6 @@ class ApiContact:
         req_new_contact = self.api_client.post(
             url_contact_create,
             json=contact.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -236,6 +226,7 @@ class ApiContact:
         # end of method
         return new_contact
 
+    @ApiDecorators._invalidate_cache("contact")
     @ApiDecorators._check_bearer_validity
     def delete(self, workgroup_id: str, contact_id: str):
         """Delete a contact from Isogeo database.
@@ -258,17 +249,13 @@ class ApiContact:
             pass
 
         # request URL
-        url_contact_delete = utils.get_request_base_url(
+        url_contact_delete = self.utils.get_request_base_url(
             route="groups/{}/contacts/{}".format(workgroup_id, contact_id)
         )
 
         # request
         req_contact_deletion = self.api_client.delete(
             url_contact_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -292,16 +279,12 @@ class ApiContact:
 
         # URL builder
         url_contact_exists = "{}{}".format(
-            utils.get_request_base_url("contacts"), contact_id
+            self.utils.get_request_base_url("contacts"), contact_id
         )
 
         # request
         req_contact_exists = self.api_client.get(
             url_contact_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -311,6 +294,7 @@ class ApiContact:
 
         return req_contact_exists
 
+    @ApiDecorators._invalidate_cache("contact")
     @ApiDecorators._check_bearer_validity
     def update(self, contact: Contact, caching: bool = 1) -> Contact:
         """Update a contact owned by a workgroup.
@@ -325,7 +309,7 @@ class ApiContact:
             pass
 
         # URL
-        url_contact_update = utils.get_request_base_url(
+        url_contact_update = self.utils.get_request_base_url(
             route="groups/{}/contacts/{}".format(contact.owner.get("_id"), contact._id)
         )
 
@@ -333,10 +317,6 @@ class ApiContact:
         req_contact_update = self.api_client.put(
             url=url_contact_update,
             json=contact.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -353,6 +333,7 @@ class ApiContact:
         return new_contact
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("contact")
     @ApiDecorators._check_bearer_validity
     def associate_metadata(
         self, metadata: Metadata, contact: Contact, role: str = "pointOfContact"
@@ -408,8 +389,18 @@ class ApiContact:
         else:
             pass
 
+        # within a batch: queued, sent later as a bulk request
+        batch = getattr(self.api_client, "active_batch", None)
+        if batch is not None:
+            return batch.add(
+                action="add",
+                target="contacts",
+                metadata=metadata,
+                model={"contact": contact.to_dict(), "role": role},
+            )
+
         # URL
-        url_contact_association = utils.get_request_base_url(
+        url_contact_association = self.utils.get_request_base_url(
             route="resources/{}/contacts/{}".format(metadata._id, contact._id)
         )
 
@@ -417,10 +408,6 @@ class ApiContact:
         req_contact_association = self.api_client.put(
             url=url_contact_association,
             json={"role": role},
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -431,6 +418,7 @@ class ApiContact:
         # end of method
         return req_contact_association
 
+    @ApiDecorators._invalidate_cache("contact")
     @ApiDecorators._check_bearer_validity
     def dissociate_metadata(self, metadata: Metadata, contact: Contact) -> Response:
         """Removes the association between a metadata and a contact.
@@ -454,18 +442,24 @@ class ApiContact:
         else:
             pass
 
+        # within a batch: queued, sent later as a bulk request
+        batch = getattr(self.api_client, "active_batch", None)
+        if batch is not None:
+            return batch.add(
+                action="delete",
+                target="contacts",
+                metadata=metadata,
+                model={"contact": contact.to_dict()},
+            )
+
         # URL
-        url_contact_dissociation = utils.get_request_base_url(
+        url_contact_dissociation = self.utils.get_request_base_url(
             route="resources/{}/contacts/{}".format(metadata._id, contact._id)
         )
 
         # request
         req_contact_dissociation = self.api_client.delete(
             url=url_contact_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
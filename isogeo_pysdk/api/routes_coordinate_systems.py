@@ -42,9 +42,9 @@ class ApiCoordinateSystem:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -55,7 +55,7 @@ class ApiCoordinateSystem:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiCoordinateSystem, self).__init__()
 
@@ -82,7 +82,7 @@ class ApiCoordinateSystem:
         # check if workgroup or global
         if workgroup_id is None:
             # request URL
-            url_coordinate_systems = utils.get_request_base_url(
+            url_coordinate_systems = self.utils.get_request_base_url(
                 route="coordinate-systems"
             )
         else:
@@ -92,17 +92,13 @@ class ApiCoordinateSystem:
                     "Workgroup ID is not a correct UUID: {}".format(workgroup_id)
                 )
             # request URL
-            url_coordinate_systems = utils.get_request_base_url(
+            url_coordinate_systems = self.utils.get_request_base_url(
                 route="groups/{}/coordinate-systems".format(workgroup_id)
             )
 
         # request
         req_coordinate_systems = self.api_client.get(
             url=url_coordinate_systems,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -150,7 +146,7 @@ class ApiCoordinateSystem:
         # check if workgroup or global
         if workgroup_id is None:
             # request URL
-            url_coordinate_system = utils.get_request_base_url(
+            url_coordinate_system = self.utils.get_request_base_url(
                 route="coordinate-systems/{}".format(coordinate_system_code)
             )
         else:
@@ -160,7 +156,7 @@ class ApiCoordinateSystem:
                     "Workgroup ID is not a correct UUID: {}".format(workgroup_id)
                 )
             # request URL
-            url_coordinate_system = utils.get_request_base_url(
+            url_coordinate_system = self.utils.get_request_base_url(
                 route="groups/{}/coordinate-systems/{}".format(
                     workgroup_id, coordinate_system_code
                 )
@@ -169,10 +165,6 @@ class ApiCoordinateSystem:
         # request
         req_coordinate_system = self.api_client.get(
             url=url_coordinate_system,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -184,6 +176,7 @@ class ApiCoordinateSystem:
         return CoordinateSystem(**req_coordinate_system.json())
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def associate_metadata(
         self, metadata: Metadata, coordinate_system: CoordinateSystem
@@ -224,7 +217,7 @@ class ApiCoordinateSystem:
             pass
 
         # URL
-        url_srs_association = utils.get_request_base_url(
+        url_srs_association = self.utils.get_request_base_url(
             route="resources/{}/coordinate-system".format(metadata._id)
         )
 
@@ -232,10 +225,6 @@ class ApiCoordinateSystem:
         req_srs_association = self.api_client.put(
             url=url_srs_association,
             json=coordinate_system.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -246,6 +235,7 @@ class ApiCoordinateSystem:
         # end of method
         return CoordinateSystem(**req_srs_association.json())
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def dissociate_metadata(self, metadata: Metadata) -> Response:
         """Removes the coordinate-system from a metadata.
@@ -261,17 +251,13 @@ class ApiCoordinateSystem:
             pass
 
         # URL
-        url_coordinateSystem_dissociation = utils.get_request_base_url(
+        url_coordinateSystem_dissociation = self.utils.get_request_base_url(
             route="resources/{}/coordinate-system".format(metadata._id)
         )
 
         # request
         req_coordinateSystem_dissociation = self.api_client.delete(
             url=url_coordinateSystem_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -282,6 +268,7 @@ class ApiCoordinateSystem:
         # end of method
         return req_coordinateSystem_dissociation
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def associate_workgroup(
         self, coordinate_system: CoordinateSystem, workgroup: Workgroup = None
@@ -316,7 +303,7 @@ class ApiCoordinateSystem:
             pass
 
         # request URL
-        url_coordinate_system_association = utils.get_request_base_url(
+        url_coordinate_system_association = self.utils.get_request_base_url(
             route="groups/{}/coordinate-systems/{}".format(
                 workgroup._id, coordinate_system.code
             )
@@ -326,10 +313,6 @@ class ApiCoordinateSystem:
         req_coordinate_system = self.api_client.put(
             url=url_coordinate_system_association,
             json={"alias": coordinate_system.alias},
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -340,6 +323,7 @@ class ApiCoordinateSystem:
         # end of method
         return CoordinateSystem(**req_coordinate_system.json())
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def dissociate_workgroup(
         self, coordinate_system_code: str, workgroup_id: str = None
@@ -367,7 +351,7 @@ class ApiCoordinateSystem:
             pass
 
         # request URL
-        url_coordinate_system_dissociation = utils.get_request_base_url(
+        url_coordinate_system_dissociation = self.utils.get_request_base_url(
             route="groups/{}/coordinate-systems/{}".format(
                 workgroup_id, coordinate_system_code
             )
@@ -376,10 +360,6 @@ class ApiCoordinateSystem:
         # request
         req_coordinate_system_dissociation = self.api_client.delete(
             url=url_coordinate_system_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
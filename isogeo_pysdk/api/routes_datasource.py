@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
@@ -40,9 +39,9 @@ class ApiDatasource:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -53,11 +52,11 @@ class ApiDatasource:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiDatasource, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("datasource")
     @ApiDecorators._check_bearer_validity
     def listing(
         self, workgroup_id: str = None, include: tuple = None, caching: bool = 1
@@ -81,18 +80,14 @@ class ApiDatasource:
             payload = None
 
         # request URL
-        url_datasources = utils.get_request_base_url(
+        url_datasources = self.utils.get_request_base_url(
             route="groups/{}/data-sources".format(workgroup_id)
         )
 
         # request
         req_wg_datasources = self.api_client.get(
             url=url_datasources,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -130,17 +125,13 @@ class ApiDatasource:
             pass
 
         # datasource route
-        url_datasource = utils.get_request_base_url(
+        url_datasource = self.utils.get_request_base_url(
             route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
         )
 
         # request
         req_datasource = self.api_client.get(
             url=url_datasource,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -151,6 +142,7 @@ class ApiDatasource:
         # end of method
         return Datasource(**req_datasource.json())
 
+    @ApiDecorators._invalidate_cache("datasource")
     @ApiDecorators._check_bearer_validity
     def create(
         self,
@@ -212,7 +204,7 @@ class ApiDatasource:
             pass
 
         # build request url
-        url_datasource_create = utils.get_request_base_url(
+        url_datasource_create = self.utils.get_request_base_url(
             route="groups/{}/data-sources".format(workgroup_id)
         )
 
@@ -220,10 +212,6 @@ class ApiDatasource:
         req_new_datasource = self.api_client.post(
             url=url_datasource_create,
             json=datasource.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -241,6 +229,7 @@ class ApiDatasource:
         # end of method
         return new_datasource
 
+    @ApiDecorators._invalidate_cache("datasource")
     @ApiDecorators._check_bearer_validity
     def delete(self, workgroup_id: str, datasource_id: str):
         """Delete a datasource from Isogeo database.
@@ -265,17 +254,13 @@ class ApiDatasource:
             pass
 
         # request URL
-        url_datasource_delete = utils.get_request_base_url(
+        url_datasource_delete = self.utils.get_request_base_url(
             route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
         )
 
         # request
         req_datasource_deletion = self.api_client.delete(
             url=url_datasource_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -309,17 +294,13 @@ class ApiDatasource:
             pass
 
         # URL
-        url_datasource_exists = utils.get_request_base_url(
+        url_datasource_exists = self.utils.get_request_base_url(
             route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
         )
 
         # request
         req_datasource_exists = self.api_client.get(
             url=url_datasource_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -329,6 +310,7 @@ class ApiDatasource:
 
         return req_datasource_exists
 
+    @ApiDecorators._invalidate_cache("datasource")
     @ApiDecorators._check_bearer_validity
     def update(
         self, workgroup_id: str, datasource: Datasource, caching: bool = 1
@@ -356,7 +338,7 @@ class ApiDatasource:
             pass
 
         # URL
-        url_datasource_update = utils.get_request_base_url(
+        url_datasource_update = self.utils.get_request_base_url(
             route="groups/{}/data-sources/{}".format(workgroup_id, datasource._id)
         )
 
@@ -364,10 +346,6 @@ class ApiDatasource:
         req_datasource_update = self.api_client.put(
             url=url_datasource_update,
             json=datasource.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -39,9 +39,9 @@ class ApiDirective:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -52,7 +52,7 @@ class ApiDirective:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiDirective, self).__init__()
 
@@ -63,15 +63,11 @@ class ApiDirective:
         :param bool caching: option to cache the response
         """
         # request URL
-        url_directives = utils.get_request_base_url(route="directives")
+        url_directives = self.utils.get_request_base_url(route="directives")
 
         # request
         req_directives = self.api_client.get(
             url=url_directives,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
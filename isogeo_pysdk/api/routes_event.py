@@ -40,9 +40,9 @@ class ApiEvent:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -53,7 +53,7 @@ class ApiEvent:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiEvent, self).__init__()
 
@@ -64,17 +64,13 @@ class ApiEvent:
         :param Metadata metadata: metadata (resource) to edit
         """
         # URL
-        url_events = utils.get_request_base_url(
+        url_events = self.utils.get_request_base_url(
             route="resources/{}/events".format(metadata._id)
         )
 
         # request
         req_events = self.api_client.get(
             url=url_events,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -107,17 +103,13 @@ class ApiEvent:
             pass
 
         # URL
-        url_event = utils.get_request_base_url(
+        url_event = self.utils.get_request_base_url(
             route="resources/{}/events/{}".format(metadata_id, event_id)
         )
 
         # request
         req_event = self.api_client.get(
             url=url_event,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -132,6 +124,7 @@ class ApiEvent:
         # end of method
         return Event(**event_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(self, metadata: Metadata, event: Event) -> Event:
         """Add a new event to a metadata (= resource).
@@ -181,7 +174,7 @@ class ApiEvent:
             logger.warning("Event comments are not allowed for creation dates")
 
         # URL
-        url_event_create = utils.get_request_base_url(
+        url_event_create = self.utils.get_request_base_url(
             route="resources/{}/events".format(metadata._id)
         )
 
@@ -193,10 +186,6 @@ class ApiEvent:
                 "description": event.description,
                 "kind": event.kind,
             },
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -211,6 +200,7 @@ class ApiEvent:
         # end of method
         return Event(**event_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def delete(self, event: Event, metadata: Metadata = None):
         """Delete a event from Isogeo database.
@@ -233,17 +223,13 @@ class ApiEvent:
             pass
 
         # URL
-        url_event_delete = utils.get_request_base_url(
+        url_event_delete = self.utils.get_request_base_url(
             route="resources/{}/events/{}".format(event.parent_resource, event._id)
         )
 
         # request
         req_event_deletion = self.api_client.delete(
             url=url_event_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -253,6 +239,7 @@ class ApiEvent:
 
         return req_event_deletion
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def update(self, event: Event, metadata: Metadata = None) -> Event:
         """Update an event.
@@ -275,7 +262,7 @@ class ApiEvent:
             pass
 
         # URL
-        url_event_update = utils.get_request_base_url(
+        url_event_update = self.utils.get_request_base_url(
             route="resources/{}/events/{}".format(event.parent_resource, event._id)
         )
 
@@ -283,10 +270,6 @@ class ApiEvent:
         req_event_update = self.api_client.put(
             url=url_event_update,
             json=event.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
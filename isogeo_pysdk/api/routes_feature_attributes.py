@@ -38,9 +38,9 @@ class ApiFeatureAttribute:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -51,7 +51,7 @@ class ApiFeatureAttribute:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiFeatureAttribute, self).__init__()
 
@@ -71,17 +71,13 @@ class ApiFeatureAttribute:
         else:
             pass
         # URL
-        url_feature_attributes = utils.get_request_base_url(
+        url_feature_attributes = self.utils.get_request_base_url(
             route="resources/{}/feature-attributes/".format(metadata._id)
         )
 
         # request
         req_feature_attributes = self.api_client.get(
             url=url_feature_attributes,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -127,17 +123,13 @@ class ApiFeatureAttribute:
             pass
 
         # URL
-        url_feature_attribute = utils.get_request_base_url(
+        url_feature_attribute = self.utils.get_request_base_url(
             route="resources/{}/feature-attributes/{}".format(metadata_id, attribute_id)
         )
 
         # request
         req_feature_attribute = self.api_client.get(
             url=url_feature_attribute,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -152,6 +144,7 @@ class ApiFeatureAttribute:
         # end of method
         return FeatureAttribute(**feature_attribute_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(
         self, metadata: Metadata, attribute: FeatureAttribute
@@ -208,7 +201,7 @@ class ApiFeatureAttribute:
             attribute.dataType = ""
 
         # URL
-        url_feature_attribute_create = utils.get_request_base_url(
+        url_feature_attribute_create = self.utils.get_request_base_url(
             route="resources/{}/feature-attributes/".format(metadata._id)
         )
 
@@ -216,10 +209,6 @@ class ApiFeatureAttribute:
         req_new_feature_attribute = self.api_client.post(
             url=url_feature_attribute_create,
             json=attribute.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -234,6 +223,7 @@ class ApiFeatureAttribute:
         # end of method
         return FeatureAttribute(**feature_attribute_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def delete(self, attribute: FeatureAttribute, metadata: Metadata = None):
         """Delete a feature-attribute from a metadata.
@@ -260,7 +250,7 @@ class ApiFeatureAttribute:
             pass
 
         # URL
-        url_feature_attribute_delete = utils.get_request_base_url(
+        url_feature_attribute_delete = self.utils.get_request_base_url(
             route="resources/{}/feature-attributes/{}".format(
                 attribute.parent_resource, attribute._id
             )
@@ -269,10 +259,6 @@ class ApiFeatureAttribute:
         # request
         req_feature_attribute_deletion = self.api_client.delete(
             url=url_feature_attribute_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -282,6 +268,7 @@ class ApiFeatureAttribute:
 
         return req_feature_attribute_deletion
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def update(
         self, attribute: FeatureAttribute, metadata: Metadata = None
@@ -310,7 +297,7 @@ class ApiFeatureAttribute:
             pass
 
         # URL
-        url_feature_attribute_update = utils.get_request_base_url(
+        url_feature_attribute_update = self.utils.get_request_base_url(
             route="resources/{}/feature-attributes/{}".format(
                 attribute.parent_resource, attribute._id
             )
@@ -320,10 +307,6 @@ class ApiFeatureAttribute:
         req_feature_attribute_update = self.api_client.put(
             url=url_feature_attribute_update,
             json=attribute.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -339,8 +322,13 @@ class ApiFeatureAttribute:
         return FeatureAttribute(**feature_attribute_augmented)
 
     # -- Extra methods as helpers --------------------------------------------------
+    @ApiDecorators._invalidate_cache("metadata")
     def import_from_dataset(
-        self, metadata_source: Metadata, metadata_dest: Metadata, mode: str = "add", case_sensitive_matching: bool = True
+        self,
+        metadata_source: Metadata,
+        metadata_dest: Metadata,
+        mode: str = "add",
+        case_sensitive_matching: bool = True,
     ) -> bool:
         """Import feature-attributes from another vector metadata.
 
@@ -351,7 +339,7 @@ class ApiFeatureAttribute:
             - 'add': add the attributes except those with a duplicated name
             - 'update': update only the attributes with the same name
             - 'update_or_add': update the attributes with the same name or create
-        : param bool case_sensitive_matching: False to make featureattributes's name 
+        : param bool case_sensitive_matching: False to make featureattributes's name
         matching case-insensitive when mode == "update"
 
         :raises TypeError: if one metadata is not a vector
@@ -387,7 +375,9 @@ class ApiFeatureAttribute:
         attributes_source = self.listing(metadata_source)
         attributes_dest = self.listing(metadata_dest)
         attributes_dest_names = [attr.get("name") for attr in attributes_dest]
-        attributes_dest_names_low = [attr.get("name").lower() for attr in attributes_dest]
+        attributes_dest_names_low = [
+            attr.get("name").lower() for attr in attributes_dest
+        ]
 
         # according to the selected mode
         if mode == "add":
@@ -420,7 +410,10 @@ class ApiFeatureAttribute:
                             if attr.get("name") == attr_src.name
                         ][0]
                     )
-                elif attr_src.name.lower() in attributes_dest_names_low and not case_sensitive_matching:
+                elif (
+                    attr_src.name.lower() in attributes_dest_names_low
+                    and not case_sensitive_matching
+                ):
                     attr_dst = FeatureAttribute(
                         **[
                             attr
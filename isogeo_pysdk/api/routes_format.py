@@ -44,9 +44,9 @@ class ApiFormat:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -57,7 +57,7 @@ class ApiFormat:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiFormat, self).__init__()
 
@@ -94,7 +94,7 @@ class ApiFormat:
         # URL
         if data_type:
             if MetadataTypes.has_value(data_type):
-                url_formats = utils.get_request_base_url(
+                url_formats = self.utils.get_request_base_url(
                     route="formats/{}".format(data_type)
                 )
                 logger.debug(
@@ -109,16 +109,12 @@ class ApiFormat:
                     )
                 )
         else:
-            url_formats = utils.get_request_base_url(route="formats/")
+            url_formats = self.utils.get_request_base_url(route="formats/")
             logger.debug("Listing all available geographic formats...")
 
         # request
         req_formats = self.api_client.get(
             url=url_formats,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -167,15 +163,13 @@ class ApiFormat:
         """
 
         # format route
-        url_format = utils.get_request_base_url(route="formats/{}".format(format_code))
+        url_format = self.utils.get_request_base_url(
+            route="formats/{}".format(format_code)
+        )
 
         # request
         req_format = self.api_client.get(
             url=url_format,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -233,16 +227,12 @@ class ApiFormat:
             pass
 
         # URL
-        url_format_create = utils.get_request_base_url(route="formats")
+        url_format_create = self.utils.get_request_base_url(route="formats")
 
         # request
         req_new_format = self.api_client.post(
             url=url_format_create,
             json=frmt.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -263,17 +253,13 @@ class ApiFormat:
         :param Format frmt: Format model object to delete
         """
         # URL
-        url_format_delete = utils.get_request_base_url(
+        url_format_delete = self.utils.get_request_base_url(
             route="formats/{}".format(frmt.code)
         )
 
         # request
         req_format_deletion = self.api_client.delete(
             url=url_format_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -314,7 +300,7 @@ class ApiFormat:
             pass
 
         # URL
-        url_format_update = utils.get_request_base_url(
+        url_format_update = self.utils.get_request_base_url(
             route="formats/{}".format(frmt.code)
         )
 
@@ -322,10 +308,6 @@ class ApiFormat:
         req_format_update = self.api_client.put(
             url=url_format_update,
             json=frmt.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -373,18 +355,14 @@ class ApiFormat:
         payload = {"q": query, "_limit": page_size, "_offset": offset}
 
         # URL
-        url_formats_search_nogeo = utils.get_request_base_url(
+        url_formats_search_nogeo = self.utils.get_request_base_url(
             route="formats/resource/search"
         )
 
         # request
         req_formats_search_nogeo = self.api_client.get(
             url=url_formats_search_nogeo,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -39,9 +39,9 @@ class ApiInvitation:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -52,7 +52,7 @@ class ApiInvitation:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiInvitation, self).__init__()
 
@@ -73,17 +73,13 @@ class ApiInvitation:
             pass
 
         # URL builder
-        url_workgroup_invitations = utils.get_request_base_url(
+        url_workgroup_invitations = self.utils.get_request_base_url(
             route="groups/{}/invitations".format(workgroup_id)
         )
 
         # request
         req_workgroup_invitations = self.api_client.get(
             url=url_workgroup_invitations,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -93,6 +89,7 @@ class ApiInvitation:
 
         return req_workgroup_invitations.json()
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def create(
         self, workgroup_id: str, invitation: object = Invitation()
@@ -113,7 +110,7 @@ class ApiInvitation:
         >>> isogeo.invitation.create(WORKGROUP_UUID, new_invit)
         """
         # URL
-        url_invitation_create = utils.get_request_base_url(
+        url_invitation_create = self.utils.get_request_base_url(
             route="groups/{}/invitations".format(workgroup_id)
         )
 
@@ -121,10 +118,6 @@ class ApiInvitation:
         req_new_invitation = self.api_client.post(
             url=url_invitation_create,
             data=invitation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -149,17 +142,13 @@ class ApiInvitation:
             pass
 
         # URL
-        url_invitation = utils.get_request_base_url(
+        url_invitation = self.utils.get_request_base_url(
             route="invitations/{}".format(invitation_id)
         )
 
         # request
         req_invitation = self.api_client.get(
             url=url_invitation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -170,6 +159,7 @@ class ApiInvitation:
         # end of method
         return Invitation(**req_invitation.json())
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def accept(self, invitation: object = Invitation) -> Invitation:
         """Accept the invitation to join an Isogeo Workgroup.
@@ -177,17 +167,13 @@ class ApiInvitation:
         :param class invitation: Invitation model object to accept
         """
         # URL
-        url_invitation_accept = utils.get_request_base_url(
+        url_invitation_accept = self.utils.get_request_base_url(
             route="invitations/{}/accept".format(invitation._id)
         )
 
         # request
         req_new_invitation = self.api_client.post(
             url=url_invitation_accept,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -206,6 +192,7 @@ class ApiInvitation:
         # end of method
         return new_invitation
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def decline(self, invitation: object = Invitation) -> Invitation:
         """Decline the invitation to join an Isogeo Workgroup.
@@ -213,17 +200,13 @@ class ApiInvitation:
         :param class invitation: Invitation model object to decline
         """
         # URL
-        url_invitation_refuse = utils.get_request_base_url(
+        url_invitation_refuse = self.utils.get_request_base_url(
             route="invitations/{}/refuse".format(invitation._id)
         )
 
         # request
         req_new_invitation = self.api_client.post(
             url=url_invitation_refuse,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -242,6 +225,7 @@ class ApiInvitation:
         # end of method
         return new_invitation
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def delete(self, invitation_id: str):
         """Delete an invitation from Isogeo database.
@@ -257,17 +241,13 @@ class ApiInvitation:
             pass
 
         # URL
-        url_invitation_delete = utils.get_request_base_url(
+        url_invitation_delete = self.utils.get_request_base_url(
             route="invitations/{}".format(invitation_id)
         )
 
         # request
         req_invitation_deletion = self.api_client.delete(
             url=url_invitation_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -277,6 +257,7 @@ class ApiInvitation:
 
         return req_invitation_deletion
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def update(self, invitation: Invitation) -> Invitation:
         """Update a invitation owned by a invitation.
@@ -292,7 +273,7 @@ class ApiInvitation:
             pass
 
         # URL
-        url_invitation_update = utils.get_request_base_url(
+        url_invitation_update = self.utils.get_request_base_url(
             route="invitations/{}".format(invitation._id)
         )
 
@@ -300,10 +281,6 @@ class ApiInvitation:
         req_invitation_update = self.api_client.put(
             url=url_invitation_update,
             json=invitation.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -38,9 +38,9 @@ class ApiKeyword:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -51,7 +51,7 @@ class ApiKeyword:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiKeyword, self).__init__()
 
@@ -87,18 +87,14 @@ class ApiKeyword:
             payload = None
 
         # URL
-        url_metadata_keywords = utils.get_request_base_url(
+        url_metadata_keywords = self.utils.get_request_base_url(
             route="resources/{}/keywords/".format(metadata_id)
         )
 
         # request
         req_metadata_keywords = self.api_client.get(
             url=url_metadata_keywords,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -167,18 +163,14 @@ class ApiKeyword:
         }
 
         # URL
-        url_thesauri_keywords = utils.get_request_base_url(
+        url_thesauri_keywords = self.utils.get_request_base_url(
             route="thesauri/{}/keywords/search".format(thesaurus_id)
         )
 
         # request
         req_thesaurus_keywords = self.api_client.get(
             url=url_thesauri_keywords,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -256,18 +248,14 @@ class ApiKeyword:
         }
 
         # URL
-        url_workgroup_keywords = utils.get_request_base_url(
+        url_workgroup_keywords = self.utils.get_request_base_url(
             route="groups/{}/keywords/search".format(workgroup_id)
         )
 
         # request
         req_thesaurus_keywords = self.api_client.get(
             url=url_workgroup_keywords,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -309,16 +297,14 @@ class ApiKeyword:
             payload = None
 
         # keyword route
-        url_keyword = utils.get_request_base_url(route="keywords/{}".format(keyword_id))
+        url_keyword = self.utils.get_request_base_url(
+            route="keywords/{}".format(keyword_id)
+        )
 
         # request
         req_keyword = self.api_client.get(
             url=url_keyword,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -329,6 +315,7 @@ class ApiKeyword:
         # end of method
         return Keyword(**req_keyword.json())
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(self, keyword: Keyword) -> Keyword:
         """Add a new keyword to the Isogeo thesaurus.
@@ -339,7 +326,7 @@ class ApiKeyword:
         :param Keyword keyword: Keyword model object to create
         """
         # URL
-        url_keyword_create = utils.get_request_base_url(
+        url_keyword_create = self.utils.get_request_base_url(
             route="thesauri/1616597fbc4348c8b11ef9d59cf594c8/keywords"
         )
 
@@ -347,10 +334,6 @@ class ApiKeyword:
         req_new_keyword = self.api_client.post(
             url=url_keyword_create,
             json=keyword.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -392,6 +375,7 @@ class ApiKeyword:
         # end of method
         return Keyword(**req_new_keyword.json())
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def delete(self, keyword: Keyword):
         """Delete a keyword from Isogeo database.
@@ -405,7 +389,7 @@ class ApiKeyword:
             pass
 
         # URL
-        url_keyword_delete = utils.get_request_base_url(
+        url_keyword_delete = self.utils.get_request_base_url(
             route="thesauri/1616597fbc4348c8b11ef9d59cf594c8/keywords/{}".format(
                 keyword._id
             )
@@ -414,10 +398,6 @@ class ApiKeyword:
         # request
         req_keyword_deletion = self.api_client.delete(
             url=url_keyword_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -428,6 +408,7 @@ class ApiKeyword:
         return req_keyword_deletion
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def tagging(
         self, metadata: Metadata, keyword: Keyword, check_exists: bool = 0
@@ -438,6 +419,10 @@ class ApiKeyword:
         :param Keyword keyword: object to associate
         :param bool check_exists: check if a metadata with the same service base URL and format already exists. Defaults to True.
 
+        :raises ValueError: if `check_exists` is enabled within a batch: the check would \
+            ignore the calls queued before. The bulk request reports the keywords already \
+            associated instead (see: :class:`~isogeo_pysdk.batch.BatchedCall`).
+
         :Example:
 
         .. code-block:: python
@@ -463,6 +448,14 @@ class ApiKeyword:
         else:
             pass
 
+        # within a batch, the association is checked by the bulk request
+        batch = getattr(self.api_client, "active_batch", None)
+        if batch is not None and check_exists:
+            raise ValueError(
+                "Tagging with check_exists can't be queued into a batch: existing keywords "
+                "are reported as ignored by the bulk request (alreadyPresent) instead."
+            )
+
         # check if kyword is already associated
         if check_exists:
             # retrieve metadata existing keywords
@@ -502,18 +495,20 @@ class ApiKeyword:
         else:
             pass
 
+        # within a batch: queued, sent later as a bulk request
+        if batch is not None:
+            return batch.add(
+                action="add", target="keywords", metadata=metadata, model=keyword
+            )
+
         # URL
-        url_keyword_associate = utils.get_request_base_url(
+        url_keyword_associate = self.utils.get_request_base_url(
             route="resources/{}/keywords/{}".format(metadata._id, keyword._id)
         )
 
         # request
         req_keyword_associate = self.api_client.post(
             url=url_keyword_associate,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -538,6 +533,7 @@ class ApiKeyword:
         # end of method
         return req_keyword_associate
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def untagging(self, metadata: Metadata, keyword: Keyword) -> dict:
         """Dissociate a keyword from a metadata.
@@ -557,18 +553,21 @@ class ApiKeyword:
         else:
             pass
 
+        # within a batch: queued, sent later as a bulk request
+        batch = getattr(self.api_client, "active_batch", None)
+        if batch is not None:
+            return batch.add(
+                action="delete", target="keywords", metadata=metadata, model=keyword
+            )
+
         # URL
-        url_keyword_dissociate = utils.get_request_base_url(
+        url_keyword_dissociate = self.utils.get_request_base_url(
             route="resources/{}/keywords/{}".format(metadata._id, keyword._id)
         )
 
         # request
         req_keyword_dissociate = self.api_client.delete(
             url=url_keyword_dissociate,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
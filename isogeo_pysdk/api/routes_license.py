@@ -42,9 +42,9 @@ class ApiLicense:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -55,7 +55,7 @@ class ApiLicense:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiLicense, self).__init__()
 
@@ -85,18 +85,14 @@ class ApiLicense:
             payload = None
 
         # request URL
-        url_licenses = utils.get_request_base_url(
+        url_licenses = self.utils.get_request_base_url(
             route="groups/{}/licenses".format(workgroup_id)
         )
 
         # request
         req_wg_licenses = self.api_client.get(
             url_licenses,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -128,15 +124,13 @@ class ApiLicense:
             pass
 
         # license route
-        url_license = utils.get_request_base_url(route="licenses/{}".format(license_id))
+        url_license = self.utils.get_request_base_url(
+            route="licenses/{}".format(license_id)
+        )
 
         # request
         req_license = self.api_client.get(
             url=url_license,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -147,6 +141,7 @@ class ApiLicense:
         # end of method
         return License(**req_license.json())
 
+    @ApiDecorators._invalidate_cache("condition")
     @ApiDecorators._check_bearer_validity
     def create(
         self, workgroup_id: str, check_exists: int = 1, license: object = License()
@@ -184,7 +179,7 @@ class ApiLicense:
             pass
 
         # build request url
-        url_license_create = utils.get_request_base_url(
+        url_license_create = self.utils.get_request_base_url(
             route="groups/{}/licenses".format(workgroup_id)
         )
 
@@ -192,10 +187,6 @@ class ApiLicense:
         req_new_license = self.api_client.post(
             url_license_create,
             data=license.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -210,6 +201,7 @@ class ApiLicense:
         # end of method
         return new_license
 
+    @ApiDecorators._invalidate_cache("condition")
     @ApiDecorators._check_bearer_validity
     def delete(self, workgroup_id: str, license_id: str):
         """Delete a license from Isogeo database.
@@ -232,17 +224,13 @@ class ApiLicense:
             pass
 
         # request URL
-        url_license_delete = utils.get_request_base_url(
+        url_license_delete = self.utils.get_request_base_url(
             route="groups/{}/licenses/{}".format(workgroup_id, license_id)
         )
 
         # request
         req_license_deletion = self.api_client.delete(
             url_license_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -266,16 +254,12 @@ class ApiLicense:
 
         # URL builder
         url_license_exists = "{}{}".format(
-            utils.get_request_base_url("licenses"), license_id
+            self.utils.get_request_base_url("licenses"), license_id
         )
 
         # request
         req_license_exists = self.api_client.get(
             url_license_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -285,6 +269,7 @@ class ApiLicense:
 
         return req_license_exists
 
+    @ApiDecorators._invalidate_cache("condition")
     @ApiDecorators._check_bearer_validity
     def update(self, license: License, caching: bool = 1) -> License:
         """Update a license owned by a workgroup.
@@ -299,7 +284,7 @@ class ApiLicense:
             pass
 
         # URL
-        url_license_update = utils.get_request_base_url(
+        url_license_update = self.utils.get_request_base_url(
             route="groups/{}/licenses/{}".format(license.owner.get("_id"), license._id)
         )
 
@@ -307,10 +292,6 @@ class ApiLicense:
         req_license_update = self.api_client.put(
             url=url_license_update,
             data=license.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -327,6 +308,7 @@ class ApiLicense:
         return new_license
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def associate_metadata(
         self, metadata: Metadata, license: License, description: str, force: bool = 0
@@ -39,9 +39,9 @@ class ApiLimitation:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [oAuthlib] Session) and pass it to the decorators
+        # store API client (Request [oAuthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -52,7 +52,7 @@ class ApiLimitation:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiLimitation, self).__init__()
 
@@ -63,17 +63,13 @@ class ApiLimitation:
         :param Metadata metadata: metadata (resource)
         """
         # request URL
-        url_limitations = utils.get_request_base_url(
+        url_limitations = self.utils.get_request_base_url(
             route="resources/{}/limitations/".format(metadata._id)
         )
 
         # request
         req_limitations = self.api_client.get(
             url=url_limitations,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -117,17 +113,13 @@ class ApiLimitation:
             pass
 
         # URL
-        url_limitation = utils.get_request_base_url(
+        url_limitation = self.utils.get_request_base_url(
             route="resources/{}/limitations/{}".format(metadata_id, limitation_id)
         )
 
         # request
         req_limitation = self.api_client.get(
             url=url_limitation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -142,6 +134,7 @@ class ApiLimitation:
         # end of method
         return Limitation(**limitation_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(self, metadata: Metadata, limitation: Limitation) -> Limitation:
         """Add a new limitation to a metadata (= resource).
@@ -190,7 +183,7 @@ class ApiLimitation:
                 )
 
         # URL
-        url_limitation_create = utils.get_request_base_url(
+        url_limitation_create = self.utils.get_request_base_url(
             route="resources/{}/limitations/".format(metadata._id)
         )
 
@@ -198,10 +191,6 @@ class ApiLimitation:
         req_new_limitation = self.api_client.post(
             url=url_limitation_create,
             json=limitation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -216,6 +205,7 @@ class ApiLimitation:
         # end of method
         return Limitation(**limitation_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def delete(self, limitation: Limitation, metadata: Metadata = None):
         """Delete a limitation from a metadata.
@@ -240,7 +230,7 @@ class ApiLimitation:
             pass
 
         # URL
-        url_limitation_delete = utils.get_request_base_url(
+        url_limitation_delete = self.utils.get_request_base_url(
             route="resources/{}/limitations/{}".format(
                 limitation.parent_resource, limitation._id
             )
@@ -249,10 +239,6 @@ class ApiLimitation:
         # request
         req_limitation_deletion = self.api_client.delete(
             url=url_limitation_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -262,6 +248,7 @@ class ApiLimitation:
 
         return req_limitation_deletion
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def update(self, limitation: Limitation, metadata: Metadata = None) -> Limitation:
         """Update a limitation.
@@ -286,7 +273,7 @@ class ApiLimitation:
             pass
 
         # URL
-        url_limitation_update = utils.get_request_base_url(
+        url_limitation_update = self.utils.get_request_base_url(
             route="resources/{}/limitations/{}".format(
                 limitation.parent_resource, limitation._id
             )
@@ -296,10 +283,6 @@ class ApiLimitation:
         req_limitation_update = self.api_client.put(
             url=url_limitation_update,
             json=limitation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -26,6 +26,7 @@ from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
 from isogeo_pysdk.enums import LinkActions, LinkKinds, LinkTypes
 from isogeo_pysdk.models import Link, Metadata
+from isogeo_pysdk.uploader import MultipartFileEncoder
 from isogeo_pysdk.utils import IsogeoUtils
 
 # #############################################################################
@@ -47,9 +48,9 @@ class ApiLink:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [oAuthlib] Session) and pass it to the decorators
+        # store API client (Request [oAuthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -60,7 +61,7 @@ class ApiLink:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiLink, self).__init__()
 
@@ -71,17 +72,13 @@ class ApiLink:
         :param Metadata metadata: metadata (resource)
         """
         # request URL
-        url_links = utils.get_request_base_url(
+        url_links = self.utils.get_request_base_url(
             route="resources/{}/links/".format(metadata._id)
         )
 
         # request
         req_links = self.api_client.get(
             url=url_links,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -92,7 +89,7 @@ class ApiLink:
         # end of method
         return req_links.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("link")
     @ApiDecorators._check_bearer_validity
     def get(self, metadata_id: str, link_id: str) -> Link:
         """Get details about a specific link.
@@ -131,17 +128,13 @@ class ApiLink:
             pass
 
         # URL
-        url_link = utils.get_request_base_url(
+        url_link = self.utils.get_request_base_url(
             route="resources/{}/links/{}".format(metadata_id, link_id)
         )
 
         # request
         req_link = self.api_client.get(
             url=url_link,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -156,6 +149,7 @@ class ApiLink:
         # end of method
         return Link(**link_augmented)
 
+    @ApiDecorators._invalidate_cache("link")
     @ApiDecorators._check_bearer_validity
     def create(self, metadata: Metadata, link: Link) -> Link:
         """Add a new link to a metadata (= resource).
@@ -260,7 +254,7 @@ class ApiLink:
             )
 
         # URL
-        url_link_create = utils.get_request_base_url(
+        url_link_create = self.utils.get_request_base_url(
             route="resources/{}/links".format(metadata._id)
         )
 
@@ -268,10 +262,6 @@ class ApiLink:
         req_new_link = self.api_client.post(
             url=url_link_create,
             json=link.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -286,6 +276,7 @@ class ApiLink:
         # end of method
         return Link(**link_augmented)
 
+    @ApiDecorators._invalidate_cache("link")
     @ApiDecorators._check_bearer_validity
     def delete(self, link: Link, metadata: Metadata = None) -> Response:
         """Delete a link from a metadata.
@@ -310,17 +301,13 @@ class ApiLink:
             pass
 
         # URL
-        url_link_delete = utils.get_request_base_url(
+        url_link_delete = self.utils.get_request_base_url(
             route="resources/{}/links/{}".format(link.parent_resource, link._id)
         )
 
         # request
         req_link_deletion = self.api_client.delete(
             url=url_link_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -330,6 +317,7 @@ class ApiLink:
 
         return req_link_deletion
 
+    @ApiDecorators._invalidate_cache("link")
     @ApiDecorators._check_bearer_validity
     def update(self, link: Link, metadata: Metadata = None) -> Link:
         """Update a link.
@@ -352,7 +340,7 @@ class ApiLink:
             pass
 
         # URL
-        url_link_update = utils.get_request_base_url(
+        url_link_update = self.utils.get_request_base_url(
             route="resources/{}/links/{}".format(link.parent_resource, link._id)
         )
 
@@ -360,10 +348,6 @@ class ApiLink:
         req_link_update = self.api_client.put(
             url=url_link_update,
             json=link.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -380,11 +364,17 @@ class ApiLink:
 
     # -- Methods to manage links with hosted data --------------------------------------
     @ApiDecorators._check_bearer_validity
-    def download_hosted(self, link: Link, encode_clean: bool = 1) -> tuple:
+    def download_hosted(
+        self, link: Link, encode_clean: bool = 1, offset: int = 0
+    ) -> tuple:
         """Download hosted resource.
 
         :param Link link: link object
         :param bool encode_clean: option to ensure a clean filename and avoid OS errors
+        :param int offset: position (bytes) from which the file is requested, to resume a \
+            partial download (HTTP Range). The stream starts at this position only if its \
+            status code is `206 Partial Content`. For many files, see \
+            :class:`~isogeo_pysdk.downloader.IsogeoDownloader`.
 
         :returns: tuple(stream, filename, human readable size)
         :rtype: tuple
@@ -416,16 +406,22 @@ class ApiLink:
             pass
 
         # request URL
-        url_download_hosted = utils.get_request_base_url(route=link.url)
+        url_download_hosted = self.utils.get_request_base_url(route=link.url)
+
+        # request the end of the file, not encoded to keep positions
+        if offset:
+            headers = dict(
+                self.api_client.header or {},
+                **{"Accept-Encoding": "identity", "Range": "bytes={}-".format(offset)}
+            )
+        else:
+            headers = None
 
         # request
         req_download_hosted = self.api_client.get(
             url=url_download_hosted,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
+            headers=headers,
             stream=True,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -448,16 +444,24 @@ class ApiLink:
         # end of method
         return (req_download_hosted, filename, utils.convert_octets(link.size))
 
+    @ApiDecorators._invalidate_cache("link")
     @ApiDecorators._check_bearer_validity
     def upload_hosted(
-        self, metadata: Metadata, link: Link, file_to_upload: str
+        self,
+        metadata: Metadata,
+        link: Link,
+        file_to_upload: str,
+        progress: callable = None,
     ) -> Link:
-        """Add a new link to a metadata uploading a file to hosted data. \
-            See: https://requests.readthedocs.io/en/latest/user/quickstart/#post-a-multipart-encoded-file
+        """Add a new link to a metadata uploading a file to hosted data. The file is streamed \
+            by blocks, never loaded into memory. For many files, see \
+            :class:`~isogeo_pysdk.uploader.IsogeoUploader`.
 
         :param Metadata metadata: metadata (resource) to edit
         :param Link link: link object to create
         :param Path file_to_upload: file path to upload
+        :param callable progress: function called after each block sent with the bytes of the \
+            file sent and the file size. See: :class:`~isogeo_pysdk.uploader.MultipartFileEncoder`
 
         :returns: the new Link if successed or the tuple with the request error code
         :rtype: Link or tuple
@@ -532,7 +536,7 @@ class ApiLink:
             )
 
         # URL
-        url_link_create = utils.get_request_base_url(
+        url_link_create = self.utils.get_request_base_url(
             route="resources/{}/links".format(metadata._id)
         )
 
@@ -542,22 +546,20 @@ class ApiLink:
                 filename, filetype, metadata._id
             )
         )
-        with filepath.open("rb") as opened_file:
+        with MultipartFileEncoder(
+            fields=link.to_dict_creation(),
+            file_path=filepath,
+            filename=filename,
+            file_type=filetype,
+            progress=progress,
+        ) as body:
             # request
             req_new_link = self.api_client.post(
                 url=url_link_create,
-                data=link.to_dict_creation(),
-                files={
-                    "file": (
-                        filename,  # file name
-                        opened_file,  # file content (binary mode required)
-                        filetype,  # file mime type
-                    )
-                },
-                headers=self.api_client.headers,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=self.api_client.timeout,
+                data=body,
+                headers=dict(
+                    self.api_client.headers, **{"Content-Type": body.content_type}
+                ),
             )
 
         # checking response
@@ -573,7 +575,7 @@ class ApiLink:
         return Link(**link_augmented)
 
     # -- Routes to manage the related objects ------------------------------------------
-    @lru_cache(maxsize=512)
+    @ApiDecorators._cached("reference")
     @ApiDecorators._check_bearer_validity
     def kinds_actions(self, caching: bool = 1) -> list:
         """Get the relation between kinds and action for links.
@@ -640,15 +642,11 @@ class ApiLink:
 
         """
         # request URL
-        url_links = utils.get_request_base_url(route="link-kinds/")
+        url_links = self.utils.get_request_base_url(route="link-kinds/")
 
         # request
         req_links = self.api_client.get(
             url=url_links,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
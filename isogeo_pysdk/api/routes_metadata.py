@@ -12,7 +12,7 @@
 
 # Standard library
 import logging
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # 3rd party
 from requests.models import Response
@@ -21,6 +21,7 @@ from requests.models import Response
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
 from isogeo_pysdk.models import Metadata
+from isogeo_pysdk.models.serializer import model_to_json
 from isogeo_pysdk.utils import IsogeoUtils
 
 # other routes
@@ -53,9 +54,9 @@ class ApiMetadata:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform to request
         (
@@ -66,7 +67,7 @@ class ApiMetadata:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
 
         # sub routes
         self.attributes = ApiFeatureAttribute(self.api_client)
@@ -82,7 +83,7 @@ class ApiMetadata:
         # initialize
         super(ApiMetadata, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("metadata")
     @ApiDecorators._check_bearer_validity
     def get(self, metadata_id: str, include: tuple or str = ()) -> Metadata:
         """Get complete or partial metadata about a specific metadata (= resource).
@@ -109,18 +110,14 @@ class ApiMetadata:
         }
 
         # URL
-        url_resource = utils.get_request_base_url(
+        url_resource = self.utils.get_request_base_url(
             route="resources/{}".format(metadata_id)
         )
 
         # request
         req_metadata = self.api_client.get(
             url=url_resource,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -131,6 +128,140 @@ class ApiMetadata:
         # end of method
         return Metadata.clean_attributes(req_metadata.json())
 
+    def get_many(
+        self,
+        metadata_ids: list,
+        include: tuple or str = (),
+        group: str = None,
+        max_workers: int = None,
+        fallback: bool = True,
+    ) -> list:
+        """Get many metadata at once. Instead of one request by metadata, UUIDs are packed by \
+            100 into search requests (using the `specific_md` filter), sent in parallel. \
+            Metadata which could not be retrieved that way (failed request, not returned by \
+            the search) are requested one by one with :meth:`get`, in parallel too.
+
+        :param list metadata_ids: metadata UUIDs to get (any iterable)
+        :param tuple include: subresources that should be included. Same values as :meth:`get`.
+        :param str group: workgroup UUID to search within. Global context by default.
+        :param int max_workers: maximum number of requests sent at the same time. \
+            Defaults to the highest concurrency of the client scheduler, which adapts the \
+            requests actually sent at once. See :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`.
+        :param bool fallback: option to request missing metadata one by one
+
+        :returns: list of Metadata, in the same order as metadata_ids. If a metadata can't be \
+            retrieved, its place contains the error returned by :meth:`get` or None if \
+            fallback is disabled.
+        :rtype: list
+
+        :Example:
+
+        .. code-block:: python
+
+            # enrich a list of metadata UUIDs with their contacts and links
+            li_md = isogeo.metadata.get_many(
+                metadata_ids=md_uuids,
+                include=("contacts", "links"),
+            )
+        """
+        # check metadata UUIDs
+        metadata_ids = list(metadata_ids)
+        for metadata_id in metadata_ids:
+            if not checker.check_is_uuid(metadata_id):
+                raise ValueError(
+                    "Metadata ID is not a correct UUID: {}".format(metadata_id)
+                )
+
+        # unique UUIDs, keeping order, packed by 100
+        unique_ids = list(dict.fromkeys(metadata_ids))
+        chunks = [unique_ids[i : i + 100] for i in range(0, len(unique_ids), 100)]
+
+        # URL
+        if group is None:
+            url_search = self.utils.get_request_base_url(route="resources/search")
+        elif checker.check_is_uuid(group):
+            url_search = self.utils.get_request_base_url(
+                route="groups/{}/resources/search".format(group)
+            )
+        else:
+            raise ValueError("Workgroup ID is not a correct UUID: {}".format(group))
+
+        # request parameters
+        str_include = checker._check_filter_includes(
+            includes=include, entity="metadata"
+        )
+
+        # parallel searches, then individual requests for the missing metadata
+        retrieved = {}
+        if max_workers is None:
+            max_workers = getattr(self.api_client.scheduler, "max_concurrency", 5)
+        if chunks:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="IsogeoGetMany"
+            ) as executor:
+                pages = executor.map(
+                    lambda chunk: self._get_many_chunk(url_search, chunk, str_include),
+                    chunks,
+                )
+                for page in pages:
+                    retrieved.update(page)
+
+                missing_ids = [md_id for md_id in unique_ids if md_id not in retrieved]
+                if missing_ids:
+                    logger.debug(
+                        "{} metadata not retrieved by search. Fallback: {}".format(
+                            len(missing_ids), fallback
+                        )
+                    )
+                if fallback:
+                    li_md = executor.map(
+                        lambda md_id: self.get(md_id, include=include), missing_ids
+                    )
+                    retrieved.update(zip(missing_ids, li_md))
+
+        # results in input order
+        return [retrieved.get(md_id) for md_id in metadata_ids]
+
+    @ApiDecorators._check_bearer_validity
+    def _get_many_chunk(self, url: str, metadata_ids: list, include: str) -> dict:
+        """Search a batch of metadata by their UUIDs. Used by :meth:`get_many`.
+
+        :param str url: search URL
+        :param list metadata_ids: up to 100 metadata UUIDs
+        :param str include: subresources to include, already formatted
+
+        :returns: dict of Metadata by UUID. Empty if the request failed.
+        :rtype: dict
+        """
+        payload = {
+            "_id": ",".join(metadata_ids),
+            "_include": include,
+            "_limit": 100,
+            "_offset": 0,
+        }
+
+        # request
+        try:
+            req_search = self.api_client.get(
+                url=url,
+                params=payload,
+                stream=self.api_client.json_stream,
+            )
+        except Exception as e:
+            logger.error("Batch of {} metadata failed: {}".format(len(metadata_ids), e))
+            return {}
+
+        # checking response
+        req_check = checker.check_api_response(req_search)
+        if isinstance(req_check, tuple):
+            return {}
+
+        return {
+            md.get("_id"): Metadata.clean_attributes(md)
+            for md in req_search.json().get("results", [])
+        }
+
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(
         self, workgroup_id: str, metadata: Metadata, return_basic_or_complete: int = 0
@@ -185,18 +316,15 @@ class ApiMetadata:
             pass
 
         # build request url
-        url_metadata_create = utils.get_request_base_url(
+        url_metadata_create = self.utils.get_request_base_url(
             route="groups/{}/resources".format(workgroup_id)
         )
 
         # request
         req_new_metadata = self.api_client.post(
             url=url_metadata_create,
-            json=metadata.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+            data=model_to_json(metadata, creation=True),
+            headers={**self.api_client.header, "Content-Type": "application/json"},
         )
 
         # checking response
@@ -217,6 +345,7 @@ class ApiMetadata:
         else:
             return new_metadata
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def delete(self, metadata_id: str) -> Response:
         """Delete a metadata from Isogeo database.
@@ -232,17 +361,13 @@ class ApiMetadata:
             pass
 
         # request URL
-        url_metadata_delete = utils.get_request_base_url(
+        url_metadata_delete = self.utils.get_request_base_url(
             route="resources/{}".format(metadata_id)
         )
 
         # request
         req_metadata_deletion = self.api_client.delete(
             url_metadata_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -267,17 +392,13 @@ class ApiMetadata:
             pass
 
         # request URL
-        url_metadata_exists = utils.get_request_base_url(
+        url_metadata_exists = self.utils.get_request_base_url(
             route="resources/{}".format(resource_id)
         )
 
         # request
         req_metadata_exists = self.api_client.get(
             url=url_metadata_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -287,6 +408,7 @@ class ApiMetadata:
 
         return True
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def update(self, metadata: Metadata, _http_method: str = "PATCH") -> Metadata:
         """Update a metadata, but **ONLY** the root attributes, not the subresources.
@@ -344,7 +466,7 @@ class ApiMetadata:
             pass
 
         # URL builder
-        url_metadata_update = utils.get_request_base_url(
+        url_metadata_update = self.utils.get_request_base_url(
             route="resources/{}".format(metadata._id)
         )
 
@@ -356,11 +478,8 @@ class ApiMetadata:
         req_metadata_update = self.api_client.request(
             method=_http_method,
             url=url_metadata_update,
-            json=metadata.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+            data=model_to_json(metadata, creation=True),
+            headers={**self.api_client.header, "Content-Type": "application/json"},
         )
 
         # checking response
@@ -400,18 +519,14 @@ class ApiMetadata:
             pass
 
         # URL
-        url_metadata_dl_xml = utils.get_request_base_url(
+        url_metadata_dl_xml = self.utils.get_request_base_url(
             route="resources/{}.xml".format(metadata._id)
         )
 
         # request
         req_metadata_dl_xml = self.api_client.get(
             url=url_metadata_dl_xml,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
             stream=True,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -423,7 +538,7 @@ class ApiMetadata:
         return req_metadata_dl_xml
 
     # -- Routes to manage subresources -------------------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("metadata")
     def catalogs(self, metadata: Metadata) -> list:
         """Returns asssociated catalogs with a metadata. Just a shortcut.
 
@@ -9,7 +9,12 @@
 # ##################################
 
 # Standard library
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# 3rd party
+from requests.exceptions import ConnectionError, Timeout
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
@@ -70,20 +75,22 @@ class ApiBulk:
             models=(keyword,),
         )
 
-        # send the one-shot request
-        isogeo.metadata.bulk.send()
+        # send the requests: merged, split into chunks of 100 metadata and sent in parallel,
+        # requests depending on previous ones being sent after them
+        isogeo.metadata.bulk.send(chunk_size=100)
 
     """
 
-    BULK_DATA = []
-
     def __init__(self, api_client=None):
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # requests prepared to be sent in one shot, specific to this API client
+        self.BULK_DATA = []
+
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform to request
         (
@@ -94,7 +101,7 @@ class ApiBulk:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
 
         # initialize
         super(ApiBulk, self).__init__()
@@ -117,26 +124,23 @@ class ApiBulk:
         # prepared_request.target = target.lower()
         prepared_request.target = target
 
-        # check metadatas uuid
-        metadatas = list(metadatas)
+        # check metadatas uuid, building a new list to keep the passed one untouched
+        md_ids = []
         for i in metadatas:
             if isinstance(i, str) and not checker.check_is_uuid(i):
                 logger.error("Not a correct UUID: {}".format(i))
-                metadatas.remove(i)
             elif isinstance(i, Metadata) and not checker.check_is_uuid(i._id):
                 logger.error(
                     "Metadata passed but with an incorrect UUID: {}".format(i._id)
                 )
-                metadatas.remove(i)
-            elif isinstance(i, Metadata) and checker.check_is_uuid(i._id):
+            elif isinstance(i, Metadata):
                 logger.debug("Metadata passed, extracting the UUID: {}".format(i._id))
-                metadatas.append(i._id)
-                metadatas.remove(i)
+                md_ids.append(i._id)
             else:
-                continue
+                md_ids.append(i)
 
         # add it to the prepared request query
-        prepared_request.query = {"ids": metadatas}
+        prepared_request.query = {"ids": list(dict.fromkeys(md_ids))}
 
         # check passed objects
         obj_type = models[0]
@@ -154,36 +158,377 @@ class ApiBulk:
 
         return prepared_request
 
+    def plan(self, chunk_size: int = 100) -> list:
+        """Plan how prepared BULK_DATA will be sent: requests sharing the same action, \
+            target and models are merged, then split into bulk payloads of at most \
+            `chunk_size` metadata.
+
+        A request is merged with a previous one only if no request prepared between them \
+        works on the same target, models and metadata. Otherwise, it's kept apart and \
+        planned after the requests it depends on, so that the order of the prepare calls is \
+        respected: adding, deleting then adding again a keyword ends with the keyword added.
+
+        :param int chunk_size: maximum number of metadata UUIDs in a bulk payload
+
+        :returns: bulk payloads, each one being a list of requests
+        :rtype: list
+
+        :Example:
+
+        .. code-block:: python
+
+            # the same keyword added to 1 000 metadata, by 10 prepare calls
+            for i in range(0, 1000, 100):
+                isogeo.metadata.bulk.prepare(
+                    metadatas=md_uuids[i : i + 100],
+                    action="add",
+                    target="keywords",
+                    models=(keyword,),
+                )
+            payloads = isogeo.metadata.bulk.plan(chunk_size=250)
+            print(len(payloads), [len(p[0]["query"]["ids"]) for p in payloads])
+            >>> 4 [250, 250, 250, 250]
+        """
+        return [
+            [request for _, request in chunk]
+            for stage in self._plan(self.BULK_DATA, chunk_size)[1]
+            for chunk in stage
+        ]
+
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
-    def send(self) -> list:
+    def send(
+        self, chunk_size: int = 100, max_workers: int = None, retries: int = 1
+    ) -> list:
         """Send prepared BULK_DATA to the `POST BULK resources/`.
 
+        Requests are merged and split into chunks (see: :meth:`plan`), then the chunks are \
+        posted at the same time, except the ones depending on previous requests which are \
+        posted once these ones succeeded. A chunk which failed on a network error, a \
+        throttling (429) or a server error (5xx) is posted again, up to `retries` times: only \
+        its metadata are sent again. Requests of chunks which still failed, or were rejected \
+        by the API (4xx), stay in BULK_DATA with the ones depending on them, to be sent later.
+
+        :param int chunk_size: maximum number of metadata UUIDs in a bulk request
+        :param int max_workers: maximum number of bulk requests sent at the same time. \
+            Defaults to 4, within the highest concurrency of the client scheduler.
+        :param int retries: number of times a failed chunk is sent again
+
+        :returns: one report by merged request, with the UUIDs of the metadata processed \
+            and the ignored ones. If every chunk failed, the API error.
         :rtype: List[BulkReport]
         """
+        processed, self.BULK_DATA, failure = self._submit(
+            self.BULK_DATA,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            retries=retries,
+        )
+        if self.BULK_DATA:
+            logger.warning(
+                "{} bulk requests kept to be sent later.".format(len(self.BULK_DATA))
+            )
+        if failure is not None and not processed:
+            return failure
+
+        return list(processed.values())
+
+    def _submit(
+        self,
+        bulk_data: list,
+        chunk_size: int = 100,
+        max_workers: int = None,
+        retries: int = 1,
+    ) -> tuple:
+        """Send bulk requests: merged, split into chunks sent in parallel stage by stage, \
+            failed chunks sent again. See: :meth:`send`.
+
+        :param list bulk_data: requests to send
+        :param int chunk_size: maximum number of metadata UUIDs in a bulk request
+        :param int max_workers: maximum number of bulk requests sent at the same time
+        :param int retries: number of times a failed chunk is sent again
+
+        :returns: reports by index of merged request (see: :meth:`_merge`), requests not \
+            sent and the last error (or None)
+        :rtype: tuple
+        """
+        operations, stages = self._plan(bulk_data, chunk_size)
 
         # build request url
-        url_metadata_bulk = utils.get_request_base_url(route="resources")
-
-        # request
-        req_metadata_bulk = self.api_client.post(
-            url=url_metadata_bulk,
-            json=self.BULK_DATA,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            stream=True,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
+        url_metadata_bulk = self.utils.get_request_base_url(route="resources")
+
+        if max_workers is None:
+            max_workers = min(
+                4, getattr(self.api_client.scheduler, "max_concurrency", 4)
+            )
+
+        # stage by stage: parallel requests, then failed chunks again
+        responses = []
+        failed = []
+        failure = None
+        for idx_stage, stage in enumerate(stages):
+            pending = stage
+            for attempt in range(retries + 1):
+                if not pending:
+                    break
+                if attempt:
+                    logger.info(
+                        "{} bulk requests failed, sending them again.".format(
+                            len(pending)
+                        )
+                    )
+                with ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="IsogeoBulk"
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            lambda chunk: self._send_chunk(url_metadata_bulk, chunk),
+                            pending,
+                        )
+                    )
+                retry = []
+                for chunk, result in zip(pending, results):
+                    if not isinstance(result, tuple):
+                        responses.append((chunk, result))
+                        continue
+                    failure = result
+                    if self._is_retryable(result[1]):
+                        retry.append(chunk)
+                    else:
+                        failed.append(chunk)
+                pending = retry
+            failed.extend(pending)
+
+            # next stages depend on this one
+            if failed:
+                failed.extend(
+                    chunk
+                    for next_stage in stages[idx_stage + 1 :]
+                    for chunk in next_stage
+                )
+                break
+
+        # requests which were not sent
+        unsent = [request for chunk in failed for _, request in chunk]
+        if failed:
+            logger.error(
+                "{} bulk requests failed ({}).".format(len(unsent), failure[1])
+            )
+        else:
+            failure = None
+
+        # one report by merged request
+        processed = {}
+        for chunk, results in responses:
+            for (idx, request), result in zip(chunk, results):
+                report = processed.setdefault(idx, {"ids": [], "ignored": {}})
+                report["ids"].extend(request.get("query").get("ids"))
+                for key, value in (result.get("ignored") or {}).items():
+                    if isinstance(value, list):
+                        report["ignored"].setdefault(key, []).extend(value)
+                    else:
+                        report["ignored"][key] = value
+
+        reports = {
+            idx: BulkReport(
+                ignored=processed[idx].get("ignored"),
+                request=dict(
+                    operations[idx],
+                    query=dict(
+                        operations[idx].get("query"), ids=processed[idx].get("ids")
+                    ),
+                ),
+            )
+            for idx in sorted(processed)
+        }
+
+        return reports, unsent, failure
+
+    def _send_chunk(self, url: str, chunk: list):
+        """Send a chunk of bulk requests.
+
+        :param str url: bulk URL
+        :param list chunk: tuples of (merged request index, request)
+
+        :returns: raw reports of the requests, or a tuple with False and the error
+        :rtype: list or tuple
+        """
+        try:
+            req_metadata_bulk = self.api_client.post(
+                url=url, json=[request for _, request in chunk]
+            )
+        except (ConnectionError, Timeout) as err:
+            logger.warning("Bulk request failed: {}".format(err))
+            return False, err
 
         # checking response
         req_check = checker.check_api_response(req_metadata_bulk)
         if isinstance(req_check, tuple):
             return req_check
 
-        # empty bulk data
-        self.BULK_DATA.clear()
+        return req_metadata_bulk.json()
+
+    @staticmethod
+    def _is_retryable(error) -> bool:
+        """Tell if a failed bulk request is worth sending again: network error, throttling \
+            (429) or server error (5xx). Other API errors would fail again.
+
+        :param error: status code or exception returned by :meth:`_send_chunk`
+
+        :rtype: bool
+        """
+        if isinstance(error, int):
+            return error == 429 or error >= 500
+        return True
+
+    @staticmethod
+    def _operation_key(request: dict) -> str:
+        """Key of the requests which can be merged: same action, target and models.
+
+        :param dict request: bulk request
+
+        :rtype: str
+        """
+        return json.dumps(
+            [request.get("action"), request.get("target"), request.get("model")],
+            sort_keys=True,
+            default=str,
+        )
+
+    @staticmethod
+    def _conflict(request_a: dict, request_b: dict) -> bool:
+        """Tell if the order of two bulk requests matters: same target, with common models \
+            and metadata.
+
+        :param dict request_a: bulk request
+        :param dict request_b: bulk request
+
+        :rtype: bool
+        """
+        if request_a.get("target") != request_b.get("target"):
+            return False
+        if not set(request_a.get("query").get("ids")).intersection(
+            request_b.get("query").get("ids")
+        ):
+            return False
+
+        models_a = {
+            json.dumps(model, sort_keys=True, default=str)
+            for model in request_a.get("model") or []
+        }
+        models_b = {
+            json.dumps(model, sort_keys=True, default=str)
+            for model in request_b.get("model") or []
+        }
+        # requests without models (e.g. clearing a target) conflict with any other one
+        return not models_a or not models_b or bool(models_a.intersection(models_b))
+
+    @staticmethod
+    def _merge(bulk_data: list) -> tuple:
+        """Merge bulk requests sharing the same action, target and models, in order: a \
+            request is merged into a previous one only if no request in between conflicts \
+            with it (see: :meth:`_conflict`).
+
+        :param list bulk_data: prepared requests
+
+        :returns: merged requests and, for each prepared request, the index of the merged \
+            request it belongs to
+        :rtype: tuple
+        """
+        operations, indexes = [], []
+        for request in bulk_data:
+            key = ApiBulk._operation_key(request)
+            merge_into = None
+            for idx in range(len(operations) - 1, -1, -1):
+                if ApiBulk._operation_key(operations[idx]) == key:
+                    merge_into = idx
+                    break
+                if ApiBulk._conflict(operations[idx], request):
+                    break
+
+            if merge_into is None:
+                merge_into = len(operations)
+                operations.append(
+                    dict(request, query=dict(request.get("query"), ids=[]))
+                )
+            operations[merge_into].get("query").get("ids").extend(
+                request.get("query").get("ids")
+            )
+            indexes.append(merge_into)
+
+        # remove duplicated UUIDs, keeping their order
+        for operation in operations:
+            operation["query"]["ids"] = list(
+                dict.fromkeys(operation.get("query").get("ids"))
+            )
+
+        return operations, indexes
+
+    @staticmethod
+    def _plan(bulk_data: list, chunk_size: int) -> tuple:
+        """Merge bulk requests sharing the same action, target and models, then split their \
+            metadata UUIDs into chunks, grouped by stages to respect the dependencies between \
+            requests.
+
+        Requests are merged by :meth:`_merge`. Merged requests conflicting with previous \
+        ones go into the next stage.
+
+        :param list bulk_data: prepared requests
+        :param int chunk_size: maximum number of metadata UUIDs in a chunk
+
+        :returns: merged requests and stages, each one being a list of chunks to send after \
+            the ones of the previous stage. A chunk is a list of tuples of \
+            (merged request index, request with a part of the UUIDs).
+        :rtype: tuple
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive number of metadata.")
+
+        operations = ApiBulk._merge(bulk_data)[0]
+
+        # stages: after every previous conflicting request
+        levels = []
+        for idx, operation in enumerate(operations):
+            levels.append(
+                max(
+                    [
+                        levels[previous] + 1
+                        for previous in range(idx)
+                        if ApiBulk._conflict(operations[previous], operation)
+                    ],
+                    default=0,
+                )
+            )
 
-        return [BulkReport(**req) for req in req_metadata_bulk.json()]
+        # split
+        stages = []
+        for level in range(max(levels, default=-1) + 1):
+            chunks, chunk, room = [], [], chunk_size
+            for idx, operation in enumerate(operations):
+                if levels[idx] != level:
+                    continue
+                md_ids = operation.get("query").get("ids")
+                start = 0
+                while start < len(md_ids):
+                    part = md_ids[start : start + room]
+                    chunk.append(
+                        (
+                            idx,
+                            dict(
+                                operation, query=dict(operation.get("query"), ids=part)
+                            ),
+                        )
+                    )
+                    start += len(part)
+                    room -= len(part)
+                    if not room:
+                        chunks.append(chunk)
+                        chunk, room = [], chunk_size
+            if chunk:
+                chunks.append(chunk)
+            stages.append(chunks)
+
+        return operations, stages
 
 
 # ##############################################################################
@@ -13,14 +13,16 @@
 
 # Standard library
 import asyncio
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 import logging
-from functools import lru_cache, partial
+from functools import partial
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
-from isogeo_pysdk.models import MetadataSearch
+from isogeo_pysdk.exceptions import IsogeoSdkError
+from isogeo_pysdk.models import Metadata, MetadataSearch
 from isogeo_pysdk.utils import IsogeoUtils
 
 # #############################################################################
@@ -54,9 +56,9 @@ class ApiSearch:
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform to request
         (
@@ -67,13 +69,18 @@ class ApiSearch:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
 
         # initialize
         super(ApiSearch, self).__init__()
 
+    def __call__(self, *args, **kwargs) -> MetadataSearch:
+        """Shortcut to :meth:`search`, so that `isogeo.search(...)` keeps working while exposing \
+            other search methods like `isogeo.search.iter(...)`."""
+        return self.search(*args, **kwargs)
+
     # -- Routes to search --------------------------------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("search", skip=lambda kwargs: kwargs.get("whole_results"))
     @ApiDecorators._check_bearer_validity
     def search(
         self,
@@ -101,6 +108,7 @@ class ApiSearch:
         expected_total: int = None,
         tags_as_dicts: bool = False,
         whole_results: bool = False,
+        pagination: str = "offset",
     ) -> MetadataSearch:
         """Search within the resources shared to the application. It's the mainly used method to
         retrieve metadata.
@@ -152,6 +160,12 @@ class ApiSearch:
         :param bool augment: option to improve API response by adding some tags on the fly (like shares_id)
         :param int expected_total: if different of None, value will be used to paginate. Can save a request.
         :param bool tags_as_dicts: option to store tags as key/values by filter.
+        :param str pagination: strategy used to retrieve pages when `whole_results` is enabled:
+
+            * 'offset': every page is requested at once from offsets computed on the total [DEFAULT]
+            * 'keyset': pages are sorted on a stable key (`order_by` must be '_created' or \
+                '_modified'), overlap each others and are checked to detect records shifted \
+                during the harvest. See: :meth:`search_metadata_keyset`.
 
         :rtype: MetadataSearch
 
@@ -180,7 +194,29 @@ class ApiSearch:
                 augment=1,
                 whole_results=1
             )
+
+            # returns all results of a big share, checking pages consistency
+            search_full = isogeo.search(
+                share=share_id,
+                order_by="_modified",
+                whole_results=1,
+                pagination="keyset",
+            )
+            print(search_full.pagination_report)
         """
+        # check pagination strategy
+        if pagination not in ("offset", "keyset"):
+            raise ValueError(
+                "Pagination must be 'offset' or 'keyset', not: {}".format(pagination)
+            )
+        elif pagination == "keyset" and order_by not in ("_created", "_modified"):
+            raise ValueError(
+                "Keyset pagination requires results to be ordered by '_created' or "
+                "'_modified', not: {}".format(order_by)
+            )
+        else:
+            pass
+
         # handling request parameters
         payload = {
             "_id": checker._check_filter_specific_md(specific_md),
@@ -207,10 +243,12 @@ class ApiSearch:
         # URL
         if group is None:
             logger.debug("Searching as application")
-            url_resources_search = utils.get_request_base_url(route="resources/search")
+            url_resources_search = self.utils.get_request_base_url(
+                route="resources/search"
+            )
         elif checker.check_is_uuid(group):
             logger.debug("Searching as group")
-            url_resources_search = utils.get_request_base_url(
+            url_resources_search = self.utils.get_request_base_url(
                 route="groups/{}/resources/search".format(group)
             )
         else:
@@ -224,7 +262,7 @@ class ApiSearch:
             # determine if a request to get the total is required
             if expected_total is None:
                 # make an empty request with same filters
-                total_results = self.search(
+                total_results = self._search_uncached(
                     # search context: application or group
                     group=group,
                     # filters
@@ -251,7 +289,7 @@ class ApiSearch:
                         page_size, total_results
                     )
                 )
-                return self.search(
+                return self._search_uncached(
                     # search context: application or group
                     group=group,
                     # filters
@@ -272,6 +310,14 @@ class ApiSearch:
                     page_size=100,
                     whole_results=0,
                 )
+            elif pagination == "keyset":
+                req_metadata_search = self.search_metadata_keyset(
+                    url=url_resources_search,
+                    payload=payload,
+                    total_results=total_results,
+                    key=order_by,
+                    order_dir=order_dir,
+                )
             else:
                 # store search args as dict
                 search_params = {
@@ -324,11 +370,9 @@ class ApiSearch:
             # request
             req_metadata_search = self.api_client.get(
                 url=url_resources_search,
-                headers=self.api_client.header,
                 params=payload,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
                 timeout=(5, 200),
+                stream=self.api_client.json_stream,
             )
 
             # checking response
@@ -365,15 +409,400 @@ class ApiSearch:
         # end of method
         return req_metadata_search
 
+    def iter(
+        self,
+        # application or group
+        group: str = None,
+        # semantic and objects filters
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        # results model
+        include: tuple = (),
+        # geographic filters
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        # sorting
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        # results size
+        page_size: int = 100,
+        offset: int = 0,
+        # specific options of implemention
+        check: bool = True,
+        prefetch: int = 2,
+        as_model: bool = True,
+    ):
+        """Iterate over the whole search results, page by page, instead of loading every \
+            result in memory like :meth:`search` does with `whole_results`.
+
+        The first page is requested immediately to get the total. Then, the next pages are \
+            requested in background threads, keeping at most `prefetch` pages ahead of the \
+            consumer. Each metadata is yielded as soon as its page has been parsed, so memory \
+            stays flat whatever the total and downstream processing overlaps network time.
+
+        Filters and sorting parameters are the same as :meth:`search`.
+
+        :param int page_size: number of results per request. Maximum (and default): 100.
+        :param int offset: index of the first result to yield
+        :param bool check: option to check query parameters and avoid erros. *True* by DEFAULT.
+        :param int prefetch: maximum number of pages requested ahead. 0 disables prefetching.
+        :param bool as_model: if True (default), yields Metadata objects, raw dicts otherwise.
+
+        :raises IsogeoSdkError: if a page request fails
+
+        :Example:
+
+        .. code-block:: python
+
+            # process every vector dataset without storing the whole search
+            for md in isogeo.search.iter(query="type:vector-dataset", include=("links",)):
+                print(md.title_or_name())
+
+            # iterator can be stopped whenever, pending pages are then cancelled
+            for md in isogeo.search.iter(order_by="_modified"):
+                if md._modified < "2020-01-01":
+                    break
+        """
+        # check page size
+        if not 0 < page_size <= 100:
+            raise ValueError(
+                "Page size must be between 1 and 100, not: {}".format(page_size)
+            )
+        else:
+            pass
+
+        # handling request parameters
+        payload = {
+            "_id": checker._check_filter_specific_md(specific_md),
+            "_include": checker._check_filter_includes(
+                includes=include, entity="metadata"
+            ),
+            "_limit": page_size,
+            "_offset": offset,
+            "box": bbox,
+            "geo": poly,
+            "rel": georel,
+            "ob": order_by,
+            "od": order_dir,
+            "q": query,
+            "s": share,
+        }
+
+        # check query parameters
+        if query and check:
+            checker.check_request_parameters(payload)
+        else:
+            pass
+
+        # URL
+        if group is None:
+            url_resources_search = self.utils.get_request_base_url(
+                route="resources/search"
+            )
+        elif checker.check_is_uuid(group):
+            url_resources_search = self.utils.get_request_base_url(
+                route="groups/{}/resources/search".format(group)
+            )
+        else:
+            raise ValueError
+
+        # first page is requested synchronously to get the total
+        first_page = self._search_page(url_resources_search, payload)
+        total_results = first_page.get("total")
+        next_offsets = iter(range(offset + page_size, total_results, page_size))
+        logger.debug(
+            "Iterating over {} results from offset {}, with {} page(s) prefetched.".format(
+                total_results, offset, prefetch
+            )
+        )
+
+        # without prefetch, pages are requested on demand
+        if not prefetch:
+            yield from self._iter_page_results(first_page, as_model)
+            for page_offset in next_offsets:
+                page = self._search_page(
+                    url_resources_search, dict(payload, _offset=page_offset)
+                )
+                yield from self._iter_page_results(page, as_model)
+            return
+
+        # pages requests are queued in order, with a bounded number in flight
+        executor = ThreadPoolExecutor(
+            max_workers=prefetch, thread_name_prefix="IsogeoSearchIter"
+        )
+        pending = deque()
+
+        def _submit_next() -> bool:
+            page_offset = next(next_offsets, None)
+            if page_offset is None:
+                return False
+            pending.append(
+                executor.submit(
+                    self._search_page,
+                    url_resources_search,
+                    dict(payload, _offset=page_offset),
+                )
+            )
+            return True
+
+        try:
+            for _ in range(prefetch):
+                if not _submit_next():
+                    break
+            yield from self._iter_page_results(first_page, as_model)
+            del first_page
+
+            while pending:
+                page = pending.popleft().result()
+                _submit_next()
+                yield from self._iter_page_results(page, as_model)
+        finally:
+            # consumer stopped early or an error occurred: do not wait for pending pages
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    # -- SEARCH SUBMETHODS
+    def search_metadata_keyset(
+        self,
+        url: str,
+        payload: dict,
+        total_results: int,
+        key: str = "_created",
+        order_dir: str = "desc",
+        overlap: int = 10,
+        max_workers: int = None,
+    ) -> MetadataSearch:
+        """Method used to request big searches (> 100 results) which must stay consistent even if \
+            metadata are created, modified or deleted during the harvest. It's a private method \
+            launched by the main search method when `pagination="keyset"`.
+
+        Results are sorted in ascending order on a stable key and pages are requested in \
+            parallel with overlapping windows (each page starts `overlap` records before the end \
+            of the previous one). Then:
+
+        1. the boundary between two consecutive pages is checked: if the first record of a page \
+            is not in the previous one, records shifted between both requests. This boundary is \
+            requested again, once, and if it's still broken, the range is reported as missing;
+        2. results are deduplicated on `_id`, keeping the most recently modified version;
+        3. results are sorted according to `order_dir`.
+
+        A pagination report is stored in the `pagination_report` attribute of the returned search:
+
+        .. code-block:: python
+
+            {
+                "key": "_created",
+                "expected": 60012,  # total returned by the API
+                "retrieved": 60012,  # unique metadata retrieved
+                "duplicates": 6840,  # duplicates removed (including overlaps)
+                "retried": 1,  # boundaries requested again
+                "missing_ranges": [],  # see below
+            }
+
+        Each missing range is a dict with the offsets of the overlap where both pages should \
+            have met (from the start of the next page to the end of the previous one) and the \
+            key values surrounding the gap: missing records are sorted between `after` and \
+            `before`. For example, with the default overlap of 10 records: \
+            `{"offset_start": 900, "offset_end": 910, "after": "2019-...", "before": "2019-..."}`.
+
+        :param str url: search URL (application or group)
+        :param dict payload: request parameters
+        :param int total_results: total of results to retrieve
+        :param str key: attribute used to sort results. Must be '_created' (stable to \
+            creations and deletions) or '_modified' (stable to creations and deletions, \
+            modified records are moved to the end)
+        :param str order_dir: sorting direction of the final results ('asc' or 'desc')
+        :param int overlap: number of records shared by consecutive pages (1-50)
+        :param int max_workers: maximum number of thread to use :class:`python.concurrent.futures`. \
+            Defaults to the highest concurrency of the client scheduler, which limits the \
+            requests actually sent at once. See :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`.
+
+        :rtype: MetadataSearch
+        """
+        # check parameters
+        if key not in ("_created", "_modified"):
+            raise ValueError(
+                "Keyset pagination requires results to be ordered by '_created' or "
+                "'_modified', not: {}".format(key)
+            )
+        if not 0 < overlap <= 50:
+            raise ValueError(
+                "Overlap must be between 1 and 50, not: {}".format(overlap)
+            )
+
+        # pages windows: each page starts 'overlap' records before the end of the previous one
+        payload = dict(payload, ob=key, od="asc", _limit=100)
+        stride = 100 - overlap
+        li_offsets = list(range(0, max(total_results - overlap, 1), stride))
+        logger.debug(
+            "Keyset search launched with {} overlapping pages on {}.".format(
+                len(li_offsets), key
+            )
+        )
+
+        def _fetch(page_offset: int) -> dict:
+            return self._search_page(url, dict(payload, _offset=page_offset))
+
+        if max_workers is None:
+            max_workers = getattr(self.api_client.scheduler, "max_concurrency", 10)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="IsogeoSearchKeyset"
+        ) as executor:
+            pages = list(executor.map(_fetch, li_offsets))
+
+        # check boundaries between consecutive pages, retry once the broken ones
+        retried = 0
+        missing_ranges = []
+        for idx in range(1, len(pages)):
+            if not self._keyset_gap(pages[idx - 1], pages[idx]):
+                continue
+
+            # request both pages again, back to back, to reduce the shifting window
+            retried += 1
+            logger.debug(
+                "Records shifted between offsets {} and {}. Retrying.".format(
+                    li_offsets[idx - 1], li_offsets[idx]
+                )
+            )
+            retry_prev = _fetch(li_offsets[idx - 1])
+            retry_next = _fetch(li_offsets[idx])
+            pages.extend((retry_prev, retry_next))
+
+            if self._keyset_gap(retry_prev, retry_next):
+                missing_ranges.append(
+                    {
+                        "offset_start": li_offsets[idx],
+                        "offset_end": li_offsets[idx - 1] + 100,
+                        "after": retry_prev.get("results")[-1].get(key),
+                        "before": retry_next.get("results")[0].get(key),
+                    }
+                )
+
+        # store responses in a fresh Metadata Search object, deduplicating on _id
+        final_search = MetadataSearch(query={}, tags={})
+        unique_results = {}
+        retrieved_count = 0
+        for page in pages:
+            final_search.envelope = page.get("envelope")
+            final_search.query.update(page.get("query", {}))
+            final_search.tags.update(page.get("tags", {}))
+            final_search.total = page.get("total")
+            for md in page.get("results", []):
+                retrieved_count += 1
+                previous = unique_results.get(md.get("_id"))
+                if previous is None or (md.get("_modified") or "") > (
+                    previous.get("_modified") or ""
+                ):
+                    unique_results[md.get("_id")] = md
+
+        final_search.results = sorted(
+            unique_results.values(),
+            key=lambda md: (md.get(key) or "", md.get("_id")),
+            reverse=order_dir == "desc",
+        )
+        final_search.limit = len(final_search.results)
+        final_search.offset = 0
+
+        # report
+        final_search.pagination_report = {
+            "key": key,
+            "expected": final_search.total,
+            "retrieved": len(final_search.results),
+            "duplicates": retrieved_count - len(final_search.results),
+            "retried": retried,
+            "missing_ranges": missing_ranges,
+        }
+        if missing_ranges or len(final_search.results) < (final_search.total or 0):
+            logger.warning(
+                "Keyset search retrieved {} metadata instead of {}. Missing ranges: {}".format(
+                    len(final_search.results), final_search.total, missing_ranges
+                )
+            )
+
+        return final_search
+
+    @staticmethod
+    def _keyset_gap(prev_page: dict, next_page: dict) -> bool:
+        """Check if records are missing between two overlapping pages: the first record of the \
+            next page must be among the records of the previous one.
+
+        :param dict prev_page: search response as dict
+        :param dict next_page: search response as dict, starting within the previous one
+
+        :rtype: bool
+        """
+        prev_results = prev_page.get("results", [])
+        next_results = next_page.get("results", [])
+        # a partial previous page or an empty next one means end of results
+        if len(prev_results) < 100 or not next_results:
+            return False
+
+        return next_results[0].get("_id") not in {md.get("_id") for md in prev_results}
+
+    @ApiDecorators._check_bearer_validity
+    def _search_uncached(self, **kwargs) -> MetadataSearch:
+        """Run :meth:`search` without the responses cache. Used by whole results searches: \
+            their pages are merged into one result, so caching them would only copy them.
+
+        :rtype: MetadataSearch
+        """
+        return ApiSearch.search.__wrapped__(self, **kwargs)
+
+    def _search_page(self, url: str, payload: dict) -> dict:
+        """Request a single page of search results without caching it. Used by :meth:`iter`.
+
+        :param str url: search URL (application or group)
+        :param dict payload: request parameters
+
+        :raises IsogeoSdkError: if the request failed
+
+        :rtype: dict
+        """
+        req_search_page = self.api_client.get(
+            url=url,
+            params=payload,
+            timeout=(5, 200),
+            stream=self.api_client.json_stream,
+        )
+
+        # checking response
+        req_check = checker.check_api_response(req_search_page)
+        if isinstance(req_check, tuple):
+            raise IsogeoSdkError(
+                "Search page (offset={}) failed with status: {}".format(
+                    payload.get("_offset"), req_check[1]
+                )
+            )
+
+        return req_search_page.json()
+
+    @staticmethod
+    def _iter_page_results(page: dict, as_model: bool = True):
+        """Yield results of a raw search page, as Metadata or as dicts.
+
+        :param dict page: search response as dict
+        :param bool as_model: if True, results are loaded into Metadata objects
+        """
+        for md in page.get("results", []):
+            if as_model:
+                yield Metadata.clean_attributes(md)
+            else:
+                yield md
+
     # -- SEARCH SUBMETHODS
     async def search_metadata_asynchronous(
-        self, total_results: int, max_workers: int = 10, **kwargs
+        self, total_results: int, max_workers: int = None, **kwargs
     ) -> MetadataSearch:
         """Meta async method used to request big searches (> 100 results), using asyncio. It's a
         private method launched by the main search method.
 
         :param int total_results: total of results to retrieve
-        :param int max_workers: maximum number of thread to use :class:`python.concurrent.futures`
+        :param int max_workers: maximum number of thread to use :class:`python.concurrent.futures`. \
+            Defaults to the highest concurrency of the client scheduler, which limits the \
+            requests actually sent at once. See :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`.
 
         :rtype: MetadataSearch
         """
@@ -382,6 +811,8 @@ class ApiSearch:
         li_offsets = [offset * 100 for offset in range(0, total_pages)]
         logger.debug("Async search launched with {} pages.".format(total_pages))
 
+        if max_workers is None:
+            max_workers = getattr(self.api_client.scheduler, "max_concurrency", 10)
         with ThreadPoolExecutor(
             max_workers=max_workers, thread_name_prefix="IsogeoSearch"
         ) as executor:
@@ -390,7 +821,7 @@ class ApiSearch:
                 self.loop.run_in_executor(
                     executor,
                     partial(
-                        self.search,
+                        self._search_uncached,
                         # search context: application or group
                         group=kwargs.get("group"),
                         # filters
@@ -51,9 +51,9 @@ class ApiService:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform to request
         (
@@ -64,7 +64,7 @@ class ApiService:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
 
         # sub routes
         self.layers = ApiServiceLayer(self.api_client)
@@ -73,6 +73,7 @@ class ApiService:
         # initialize
         super(ApiService, self).__init__()
 
+    @ApiDecorators._invalidate_cache("metadata")
     def create(
         self,
         workgroup_id: str,
@@ -328,6 +329,7 @@ class ApiService:
 
         return new_md
 
+    @ApiDecorators._invalidate_cache("metadata")
     def update(self, service: Metadata, check_only: bool = 0) -> Metadata:
         """Update a metadata of service while keeping the associations of the layers.
 
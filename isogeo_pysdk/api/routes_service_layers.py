@@ -42,9 +42,9 @@ class ApiServiceLayer:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -55,7 +55,7 @@ class ApiServiceLayer:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiServiceLayer, self).__init__()
 
@@ -76,17 +76,13 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_service_layers = utils.get_request_base_url(
+        url_service_layers = self.utils.get_request_base_url(
             route="resources/{}/layers/".format(metadata._id)
         )
 
         # request
         req_service_layers = self.api_client.get(
             url=url_service_layers,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -121,17 +117,13 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_service_layer = utils.get_request_base_url(
+        url_service_layer = self.utils.get_request_base_url(
             route="resources/{}/layers/{}".format(metadata_id, layer_id)
         )
 
         # request
         req_service_layer = self.api_client.get(
             url=url_service_layer,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -146,6 +138,7 @@ class ApiServiceLayer:
         # end of method
         return ServiceLayer(**service_layer_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(self, metadata: Metadata, layer: ServiceLayer) -> ServiceLayer:
         """Add a new layer to a metadata (= resource).
@@ -164,7 +157,7 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_service_layer_create = utils.get_request_base_url(
+        url_service_layer_create = self.utils.get_request_base_url(
             route="resources/{}/layers/".format(metadata._id)
         )
 
@@ -172,10 +165,6 @@ class ApiServiceLayer:
         req_new_service_layer = self.api_client.post(
             url=url_service_layer_create,
             json=layer.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -190,6 +179,7 @@ class ApiServiceLayer:
         # end of method
         return ServiceLayer(**service_layer_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def delete(self, layer: ServiceLayer, metadata: Metadata = None):
         """Delete a service layer from Isogeo database.
@@ -216,17 +206,13 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_service_layer_delete = utils.get_request_base_url(
+        url_service_layer_delete = self.utils.get_request_base_url(
             route="resources/{}/layers/{}".format(layer.parent_resource, layer._id)
         )
 
         # request
         req_service_layer_deletion = self.api_client.delete(
             url=url_service_layer_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -236,6 +222,7 @@ class ApiServiceLayer:
 
         return req_service_layer_deletion
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def update(self, layer: ServiceLayer, metadata: Metadata = None) -> ServiceLayer:
         """Update a service layer.
@@ -262,7 +249,7 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_service_layer_update = utils.get_request_base_url(
+        url_service_layer_update = self.utils.get_request_base_url(
             route="resources/{}/layers/{}".format(layer.parent_resource, layer._id)
         )
 
@@ -270,10 +257,6 @@ class ApiServiceLayer:
         req_service_layer_update = self.api_client.put(
             url=url_service_layer_update,
             json=layer.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -289,6 +272,7 @@ class ApiServiceLayer:
         return ServiceLayer(**service_layer_augmented)
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def associate_metadata(
         self, service: Metadata, layer: ServiceLayer, dataset: Metadata
@@ -373,7 +357,7 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_layer_association = utils.get_request_base_url(
+        url_layer_association = self.utils.get_request_base_url(
             route="resources/{}/layers/{}/dataset/{}".format(
                 service._id, layer._id, dataset._id
             )
@@ -382,10 +366,6 @@ class ApiServiceLayer:
         # request
         req_layer_association = self.api_client.post(
             url=url_layer_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -406,6 +386,7 @@ class ApiServiceLayer:
         # end of method
         return req_layer_association
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def dissociate_metadata(
         self, service: Metadata, layer: ServiceLayer, dataset: Metadata
@@ -468,7 +449,7 @@ class ApiServiceLayer:
             pass
 
         # URL
-        url_layer_dissociation = utils.get_request_base_url(
+        url_layer_dissociation = self.utils.get_request_base_url(
             route="resources/{}/layers/{}/dataset/{}".format(
                 service._id, layer._id, dataset._id
             )
@@ -477,10 +458,6 @@ class ApiServiceLayer:
         # request
         req_layer_dissociation = self.api_client.delete(
             url=url_layer_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -39,9 +39,9 @@ class ApiServiceOperation:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -52,7 +52,7 @@ class ApiServiceOperation:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiServiceOperation, self).__init__()
 
@@ -73,17 +73,13 @@ class ApiServiceOperation:
             pass
 
         # URL
-        url_service_operations = utils.get_request_base_url(
+        url_service_operations = self.utils.get_request_base_url(
             route="resources/{}/operations/".format(metadata._id)
         )
 
         # request
         req_service_operations = self.api_client.get(
             url=url_service_operations,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -119,17 +115,13 @@ class ApiServiceOperation:
             pass
 
         # URL
-        url_service_operation = utils.get_request_base_url(
+        url_service_operation = self.utils.get_request_base_url(
             route="resources/{}/operations/{}".format(metadata_id, operation_id)
         )
 
         # request
         req_service_operation = self.api_client.get(
             url=url_service_operation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
         )
 
         # checking response
@@ -144,6 +136,7 @@ class ApiServiceOperation:
         # end of method
         return ServiceOperation(**service_operation_augmented)
 
+    @ApiDecorators._invalidate_cache("metadata")
     @ApiDecorators._check_bearer_validity
     def create(
         self, metadata: Metadata, operation: ServiceOperation
@@ -164,7 +157,7 @@ class ApiServiceOperation:
             pass
 
         # URL
-        url_service_operation_create = utils.get_request_base_url(
+        url_service_operation_create = self.utils.get_request_base_url(
             route="resources/{}/operations/".format(metadata._id)
         )
 
@@ -172,10 +165,6 @@ class ApiServiceOperation:
         req_new_service_operation = self.api_client.post(
             url=url_service_operation_create,
             json=operation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -216,7 +205,7 @@ class ApiServiceOperation:
     #         pass
 
     #     # URL
-    #     url_service_operation_delete = utils.get_request_base_url(
+    #     url_service_operation_delete = self.utils.get_request_base_url(
     #         route="resources/{}/operations/{}".format(operation.parent_resource, operation._id)
     #     )
 
@@ -262,7 +251,7 @@ class ApiServiceOperation:
     #         pass
 
     #     # URL
-    #     url_service_operation_update = utils.get_request_base_url(
+    #     url_service_operation_update = self.utils.get_request_base_url(
     #         route="resources/{}/operations/{}".format(operation.parent_resource, operation._id)
     #     )
 
@@ -373,7 +362,7 @@ class ApiServiceOperation:
     #         pass
 
     #     # URL
-    #     url_operation_association = utils.get_request_base_url(
+    #     url_operation_association = self.utils.get_request_base_url(
     #         route="resources/{}/operations/{}/dataset/{}".format(
     #             service._id, operation._id, dataset._id
     #         )
@@ -468,7 +457,7 @@ class ApiServiceOperation:
     #         pass
 
     #     # URL
-    #     url_operation_dissociation = utils.get_request_base_url(
+    #     url_operation_dissociation = self.utils.get_request_base_url(
     #         route="resources/{}/operations/{}/dataset/{}".format(
     #             service._id, operation._id, dataset._id
     #         )
@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # 3rd party
 from requests.models import Response
@@ -43,9 +42,9 @@ class ApiShare:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -56,12 +55,12 @@ class ApiShare:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiShare, self).__init__()
 
     # -- Routes to manage the object ---------------------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("share")
     @ApiDecorators._check_bearer_validity
     def listing(self, workgroup_id: str = None, caching: bool = 1) -> list:
         """Get all shares which are accessible by the authenticated user OR shares for a workgroup.
@@ -75,19 +74,16 @@ class ApiShare:
             if not checker.check_is_uuid(workgroup_id):
                 raise ValueError("Workgroup ID is not a correct UUID.")
             else:
-                url_shares = utils.get_request_base_url(
+                url_shares = self.utils.get_request_base_url(
                     route="groups/{}/shares".format(workgroup_id)
                 )
         else:
             logger.debug("Listing shares for the authenticated application/user")
-            url_shares = utils.get_request_base_url(route="shares")
+            url_shares = self.utils.get_request_base_url(route="shares")
 
         # request
         req_shares = self.api_client.get(
             url=url_shares,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
             timeout=(5, 200),
         )
 
@@ -129,16 +125,12 @@ class ApiShare:
             payload = None
 
         # URL
-        url_share = utils.get_request_base_url(route="shares/{}".format(share_id))
+        url_share = self.utils.get_request_base_url(route="shares/{}".format(share_id))
 
         # request
         req_share = self.api_client.get(
             url=url_share,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -149,6 +141,7 @@ class ApiShare:
         # end of method
         return Share(**req_share.json())
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def create(
         self, workgroup_id: str, share: object = Share(), check_exists: int = 1
@@ -179,7 +172,7 @@ class ApiShare:
             pass
 
         # URL
-        url_share_create = utils.get_request_base_url(
+        url_share_create = self.utils.get_request_base_url(
             route="groups/{}/shares".format(workgroup_id)
         )
 
@@ -187,10 +180,6 @@ class ApiShare:
         req_new_share = self.api_client.post(
             url=url_share_create,
             json=share.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -205,6 +194,7 @@ class ApiShare:
         # end of method
         return new_share
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def delete(self, share_id: str) -> Response:
         """Delete a share from Isogeo database.
@@ -218,17 +208,13 @@ class ApiShare:
             pass
 
         # request URL
-        url_share_delete = utils.get_request_base_url(
+        url_share_delete = self.utils.get_request_base_url(
             route="shares/{}".format(share_id)
         )
 
         # request
         req_share_deletion = self.api_client.delete(
             url=url_share_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -251,17 +237,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_exists = utils.get_request_base_url(
+        url_share_exists = self.utils.get_request_base_url(
             route="shares/{}".format(share_id)
         )
 
         # request
         req_share_exists = self.api_client.get(
             url=url_share_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -271,6 +253,7 @@ class ApiShare:
 
         return req_share_exists
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def update(self, share: Share, caching: bool = 1) -> Share:
         """Update a share owned by a workgroup.
@@ -285,7 +268,7 @@ class ApiShare:
             pass
 
         # URL
-        url_share_update = utils.get_request_base_url(
+        url_share_update = self.utils.get_request_base_url(
             route="shares/{}".format(share._id)
         )
 
@@ -293,10 +276,6 @@ class ApiShare:
         req_share_update = self.api_client.put(
             url=url_share_update,
             json=share.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -313,6 +292,7 @@ class ApiShare:
         return new_share
 
     # -- Routes which are really specific ----------------------------------------------
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def reshare(self, share: Share, reshare: bool = 1) -> Share:
         """Enable/disable the reshare option for the given share.
@@ -353,7 +333,7 @@ class ApiShare:
             share.rights = []
 
         # URL
-        url_share_refresh = utils.get_request_base_url(
+        url_share_refresh = self.utils.get_request_base_url(
             route="shares/{}".format(share._id)
         )
 
@@ -361,10 +341,6 @@ class ApiShare:
         req_share_refresh = self.api_client.put(
             url=url_share_refresh,
             json=share.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -375,6 +351,7 @@ class ApiShare:
         # end of method
         return Share(**req_share_refresh.json())
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def refresh_token(self, share: Share) -> Share:
         """Refresh the URL token of a share, used by Cartotheque, CSW, OpenCatalog.
@@ -388,17 +365,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_refresh = utils.get_request_base_url(
+        url_share_refresh = self.utils.get_request_base_url(
             route="shares/{}/refresh-token".format(share._id)
         )
 
         # request
         req_share_refresh = self.api_client.post(
             url=url_share_refresh,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -410,6 +383,7 @@ class ApiShare:
         return Share(**req_share_refresh.json())
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def associate_application(self, share: Share, application: Application) -> tuple:
         """Associate a share with an application.
@@ -440,17 +414,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_association = utils.get_request_base_url(
+        url_share_association = self.utils.get_request_base_url(
             route="shares/{}/applications/{}".format(share._id, application._id)
         )
 
         # request
         req_share_association = self.api_client.put(
             url=url_share_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -461,6 +431,7 @@ class ApiShare:
         # end of method
         return req_share_association
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def dissociate_application(self, share: Share, application: Application) -> tuple:
         """Removes the association between the specified share and the specified application.
@@ -491,17 +462,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_dissociation = utils.get_request_base_url(
+        url_share_dissociation = self.utils.get_request_base_url(
             route="shares/{}/applications/{}".format(share._id, application._id)
         )
 
         # request
         req_share_dissociation = self.api_client.delete(
             url=url_share_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -512,6 +479,7 @@ class ApiShare:
         # end of method
         return req_share_dissociation
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def associate_catalog(self, share: Share, catalog: Catalog) -> tuple:
         """Associate a share with a catalog.
@@ -532,17 +500,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_association = utils.get_request_base_url(
+        url_share_association = self.utils.get_request_base_url(
             route="shares/{}/catalogs/{}".format(share._id, catalog._id)
         )
 
         # request
         req_share_association = self.api_client.put(
             url=url_share_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -553,6 +517,7 @@ class ApiShare:
         # end of method
         return req_share_association
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def dissociate_catalog(self, share: Share, catalog: Catalog) -> tuple:
         """Removes the association between the specified share and the specified catalog.
@@ -573,17 +538,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_dissociation = utils.get_request_base_url(
+        url_share_dissociation = self.utils.get_request_base_url(
             route="shares/{}/catalogs/{}".format(share._id, catalog._id)
         )
 
         # request
         req_share_dissociation = self.api_client.delete(
             url=url_share_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -594,6 +555,7 @@ class ApiShare:
         # end of method
         return req_share_dissociation
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def associate_group(self, share: Share, group: Workgroup) -> Response:
         """Associate a group with a share of type 'group'.
@@ -624,17 +586,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_association = utils.get_request_base_url(
+        url_share_association = self.utils.get_request_base_url(
             route="shares/{}/groups/{}".format(share._id, group._id)
         )
 
         # request
         req_share_association = self.api_client.put(
             url=url_share_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -645,6 +603,7 @@ class ApiShare:
         # end of method
         return req_share_association
 
+    @ApiDecorators._invalidate_cache("share")
     @ApiDecorators._check_bearer_validity
     def dissociate_group(self, share: Share, group: Workgroup) -> tuple:
         """Removes the association between the specified share and the specified group.
@@ -676,17 +635,13 @@ class ApiShare:
             pass
 
         # URL
-        url_share_dissociation = utils.get_request_base_url(
+        url_share_dissociation = self.utils.get_request_base_url(
             route="shares/{}/groups/{}".format(share._id, group._id)
         )
 
         # request
         req_share_dissociation = self.api_client.delete(
             url=url_share_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
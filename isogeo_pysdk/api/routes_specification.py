@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # 3rd party
 from requests.models import Response
@@ -43,9 +42,9 @@ class ApiSpecification:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -56,11 +55,11 @@ class ApiSpecification:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiSpecification, self).__init__()
 
-    @lru_cache()
+    @ApiDecorators._cached("specification")
     @ApiDecorators._check_bearer_validity
     def listing(
         self,
@@ -87,18 +86,14 @@ class ApiSpecification:
             payload = None
 
         # request URL
-        url_specifications = utils.get_request_base_url(
+        url_specifications = self.utils.get_request_base_url(
             route="groups/{}/specifications".format(workgroup_id)
         )
 
         # request
         req_specifications_wg = self.api_client.get(
             url_specifications,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -130,17 +125,13 @@ class ApiSpecification:
             pass
 
         # specification route
-        url_specification = utils.get_request_base_url(
+        url_specification = self.utils.get_request_base_url(
             route="specifications/{}".format(specification_id)
         )
 
         # request
         req_specification = self.api_client.get(
             url_specification,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -151,6 +142,7 @@ class ApiSpecification:
         # end of method
         return Specification(**req_specification.json())
 
+    @ApiDecorators._invalidate_cache("specification")
     @ApiDecorators._check_bearer_validity
     def create(
         self,
@@ -191,7 +183,7 @@ class ApiSpecification:
             pass
 
         # build request url
-        url_specification_create = utils.get_request_base_url(
+        url_specification_create = self.utils.get_request_base_url(
             route="groups/{}/specifications".format(workgroup_id)
         )
 
@@ -199,10 +191,6 @@ class ApiSpecification:
         req_new_specification = self.api_client.post(
             url_specification_create,
             data=specification.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -219,6 +207,7 @@ class ApiSpecification:
         # end of method
         return new_specification
 
+    @ApiDecorators._invalidate_cache("specification")
     @ApiDecorators._check_bearer_validity
     def delete(self, workgroup_id: str, specification_id: str) -> dict:
         """Delete a specification from Isogeo database.
@@ -243,17 +232,13 @@ class ApiSpecification:
             pass
 
         # request URL
-        url_specification_delete = utils.get_request_base_url(
+        url_specification_delete = self.utils.get_request_base_url(
             route="groups/{}/specifications/{}".format(workgroup_id, specification_id)
         )
 
         # request
         req_specification_deletion = self.api_client.delete(
             url_specification_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -279,16 +264,12 @@ class ApiSpecification:
 
         # URL builder
         url_specification_exists = "{}{}".format(
-            utils.get_request_base_url("specifications"), specification_id
+            self.utils.get_request_base_url("specifications"), specification_id
         )
 
         # request
         req_specification_exists = self.api_client.get(
             url_specification_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -298,6 +279,7 @@ class ApiSpecification:
 
         return req_specification_exists
 
+    @ApiDecorators._invalidate_cache("specification")
     @ApiDecorators._check_bearer_validity
     def update(self, specification: Specification, caching: bool = 1) -> Specification:
         """Update a specification owned by a workgroup.
@@ -314,7 +296,7 @@ class ApiSpecification:
             pass
 
         # URL
-        url_specification_update = utils.get_request_base_url(
+        url_specification_update = self.utils.get_request_base_url(
             route="groups/{}/specifications/{}".format(
                 specification.owner.get("_id"), specification._id
             )
@@ -324,10 +306,6 @@ class ApiSpecification:
         req_specification_update = self.api_client.put(
             url=url_specification_update,
             data=specification.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -346,6 +324,7 @@ class ApiSpecification:
         return new_specification
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("specification")
     @ApiDecorators._check_bearer_validity
     def associate_metadata(
         self, metadata: Metadata, specification: Specification, conformity: bool = 0
@@ -392,6 +371,7 @@ class ApiSpecification:
             metadata=metadata, conformity=conformity_to_create
         )
 
+    @ApiDecorators._invalidate_cache("specification")
     @ApiDecorators._check_bearer_validity
     def dissociate_metadata(
         self, metadata: Metadata, specification_id: str
@@ -40,9 +40,9 @@ class ApiThesaurus:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -53,7 +53,7 @@ class ApiThesaurus:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiThesaurus, self).__init__()
 
@@ -61,15 +61,11 @@ class ApiThesaurus:
     def thesauri(self, caching: bool = 1) -> list:
         """Get all thesauri."""
         # URL builder
-        url_thesauri = utils.get_request_base_url(route="thesauri")
+        url_thesauri = self.utils.get_request_base_url(route="thesauri")
 
         # request
         req_thesauri = self.api_client.get(
             url=url_thesauri,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -115,18 +111,14 @@ class ApiThesaurus:
             payload = None
 
         # URL builder
-        url_thesaurus = utils.get_request_base_url(
+        url_thesaurus = self.utils.get_request_base_url(
             route="thesauri/{}".format(thesaurus_id)
         )
 
         # request
         req_thesaurus = self.api_client.get(
             url=url_thesaurus,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
@@ -40,9 +39,9 @@ class ApiUser:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -53,12 +52,12 @@ class ApiUser:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
         # initialize
         super(ApiUser, self).__init__()
 
     # -- Routes to manage the  User objects ---------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("user")
     @ApiDecorators._check_bearer_validity
     def listing(self) -> list:
         """Get registered users.
@@ -82,16 +81,12 @@ class ApiUser:
         payload = {"_include": "memberships"}
 
         # request URL
-        url_users = utils.get_request_base_url(route="users")
+        url_users = self.utils.get_request_base_url(route="users")
 
         # request
         req_users = self.api_client.get(
             url=url_users,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -124,16 +119,12 @@ class ApiUser:
             payload = None
 
         # URL
-        url_user = utils.get_request_base_url(route="users/{}".format(user_id))
+        url_user = self.utils.get_request_base_url(route="users/{}".format(user_id))
 
         # request
         req_user = self.api_client.get(
             url=url_user,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -144,6 +135,7 @@ class ApiUser:
         # end of method
         return User(**req_user.json())
 
+    @ApiDecorators._invalidate_cache("user")
     @ApiDecorators._check_bearer_validity
     def create(self, user: object = User, check_exists: bool = 1) -> User:
         """Add a new user to Isogeo.
@@ -179,16 +171,12 @@ class ApiUser:
             pass
 
         # URL
-        url_user_create = utils.get_request_base_url(route="users")
+        url_user_create = self.utils.get_request_base_url(route="users")
 
         # request
         req_new_user = self.api_client.post(
             url=url_user_create,
             json=user.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -202,6 +190,7 @@ class ApiUser:
         # end of method
         return new_user
 
+    @ApiDecorators._invalidate_cache("user")
     @ApiDecorators._check_bearer_validity
     def delete(self, user: User) -> User:
         """Delete an user.
@@ -217,15 +206,13 @@ class ApiUser:
             pass
 
         # URL
-        url_user_delete = utils.get_request_base_url(route="users/{}".format(user._id))
+        url_user_delete = self.utils.get_request_base_url(
+            route="users/{}".format(user._id)
+        )
 
         # request
         req_user_delete = self.api_client.delete(
             url=url_user_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -236,6 +223,7 @@ class ApiUser:
         # end of method
         return req_check
 
+    @ApiDecorators._invalidate_cache("user")
     @ApiDecorators._check_bearer_validity
     def update(self, user: User) -> User:
         """Update an user.
@@ -264,16 +252,14 @@ class ApiUser:
             pass
 
         # URL
-        url_user_update = utils.get_request_base_url(route="users/{}".format(user._id))
+        url_user_update = self.utils.get_request_base_url(
+            route="users/{}".format(user._id)
+        )
 
         # request
         req_user_update = self.api_client.put(
             url=url_user_update,
             json=user.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -295,17 +281,13 @@ class ApiUser:
             "This route doesn't work in 2019. See: https://github.com/isogeo/isogeo-api/issues/7"
         )
         # URL builder
-        url_user_memberships = utils.get_request_base_url(
+        url_user_memberships = self.utils.get_request_base_url(
             route="users/{}/memberships".format(user_id)
         )
 
         # request
         req_user_memberships = self.api_client.get(
             url=url_user_memberships,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -315,6 +297,7 @@ class ApiUser:
 
         return req_user_memberships.json()
 
+    @ApiDecorators._invalidate_cache("user")
     @ApiDecorators._check_bearer_validity
     def subscriptions(self, user: User, subscription: str, subscribe: bool) -> User:
         """Subscribe or unsubscribe an user to/from one of the available subscriptions.
@@ -371,16 +354,14 @@ class ApiUser:
             user_subscription["isInterested"] = bool(subscribe)
 
         # URL
-        url_user_update = utils.get_request_base_url(route="users/{}".format(user._id))
+        url_user_update = self.utils.get_request_base_url(
+            route="users/{}".format(user._id)
+        )
 
         # request
         req_user_update = self.api_client.put(
             url=url_user_update,
             json=user.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
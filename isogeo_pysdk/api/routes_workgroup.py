@@ -13,7 +13,6 @@
 
 # Standard library
 import logging
-from functools import lru_cache
 
 # 3rd party
 from requests.exceptions import Timeout
@@ -47,9 +46,9 @@ class ApiWorkgroup:
         if api_client is not None:
             self.api_client = api_client
 
-        # store API client (Request [Oauthlib] Session) and pass it to the decorators
+        # store API client (Request [Oauthlib] Session) and its URLs builder
         self.api_client = api_client
-        ApiDecorators.api_client = api_client
+        self.utils = api_client.utils
 
         # ensure platform and others params to request
         (
@@ -60,7 +59,7 @@ class ApiWorkgroup:
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(self.api_client.platform)
+        ) = self.utils.set_base_url(self.api_client.platform)
 
         # sub routes
         self.srs = ApiCoordinateSystem(self.api_client)
@@ -69,7 +68,7 @@ class ApiWorkgroup:
         super(ApiWorkgroup, self).__init__()
 
     # -- Routes to manage the  Workgroup objects ---------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def listing(
         self, include: tuple = ("_abilities", "limits"), caching: bool = 1
@@ -86,16 +85,12 @@ class ApiWorkgroup:
             payload = None
 
         # request URL
-        url_workgroups = utils.get_request_base_url(route="groups")
+        url_workgroups = self.utils.get_request_base_url(route="groups")
 
         # request
         req_workgroups = self.api_client.get(
             url=url_workgroups,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -115,7 +110,7 @@ class ApiWorkgroup:
         # end of method
         return wg_workgroups
 
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def get(
         self, workgroup_id: str, include: tuple = ("_abilities", "limits")
@@ -138,18 +133,14 @@ class ApiWorkgroup:
             payload = None
 
         # URL
-        url_workgroup = utils.get_request_base_url(
+        url_workgroup = self.utils.get_request_base_url(
             route="groups/{}".format(workgroup_id)
         )
 
         # request
         req_workgroup = self.api_client.get(
             url=url_workgroup,
-            headers=self.api_client.header,
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -160,6 +151,7 @@ class ApiWorkgroup:
         # end of method
         return Workgroup(**req_workgroup.json())
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def create(self, workgroup: Workgroup, check_exists: int = 1) -> Workgroup:
         """Add a new workgroup to Isogeo.
@@ -195,16 +187,12 @@ class ApiWorkgroup:
             pass
 
         # URL
-        url_workgroup_create = utils.get_request_base_url(route="groups")
+        url_workgroup_create = self.utils.get_request_base_url(route="groups")
 
         # request
         req_new_workgroup = self.api_client.post(
             url=url_workgroup_create,
             data=workgroup.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -221,6 +209,7 @@ class ApiWorkgroup:
         # end of method
         return new_workgroup
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def delete(self, workgroup_id: str):
         """Delete a workgroup from Isogeo database.
@@ -236,17 +225,13 @@ class ApiWorkgroup:
             pass
 
         # URL
-        url_workgroup_delete = utils.get_request_base_url(
+        url_workgroup_delete = self.utils.get_request_base_url(
             route="groups/{}".format(workgroup_id)
         )
 
         # request
         req_workgroup_deletion = self.api_client.delete(
             url=url_workgroup_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -271,17 +256,13 @@ class ApiWorkgroup:
             pass
 
         # URL builder
-        url_workgroup_exists = utils.get_request_base_url(
+        url_workgroup_exists = self.utils.get_request_base_url(
             route="groups/{}".format(workgroup_id)
         )
 
         # request
         req_workgroup_exists = self.api_client.get(
             url=url_workgroup_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -291,6 +272,7 @@ class ApiWorkgroup:
 
         return req_workgroup_exists
 
+    @ApiDecorators._invalidate_cache("workgroup")
     @ApiDecorators._check_bearer_validity
     def update(self, workgroup: Workgroup, caching: bool = 1) -> Workgroup:
         """Update a workgroup owned by a workgroup.
@@ -307,7 +289,7 @@ class ApiWorkgroup:
             pass
 
         # URL
-        url_workgroup_update = utils.get_request_base_url(
+        url_workgroup_update = self.utils.get_request_base_url(
             route="groups/{}".format(workgroup._id)
         )
 
@@ -315,10 +297,6 @@ class ApiWorkgroup:
         req_workgroup_update = self.api_client.put(
             url=url_workgroup_update,
             json=workgroup.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -337,6 +315,7 @@ class ApiWorkgroup:
         return workgroup_updated
 
     # -- Routes to manage the related objects ------------------------------------------
+    @ApiDecorators._invalidate_cache("workgroup")
     def invite(self, workgroup_id: str, invitation: Invitation) -> dict:
         """Invite new user to a workgroup. Just a shortcut.
 
@@ -347,7 +326,7 @@ class ApiWorkgroup:
             workgroup_id=workgroup_id, invitation=invitation
         )
 
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     def invitations(self, workgroup_id: str) -> dict:
         """Returns active invitations (including expired) for the specified workgroup. Just a
         shortcut.
@@ -356,7 +335,7 @@ class ApiWorkgroup:
         """
         return self.api_client.invitation.listing(workgroup_id=workgroup_id)
 
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def limits(self, workgroup_id: str) -> dict:
         """Returns limits for the specified workgroup.
@@ -372,17 +351,13 @@ class ApiWorkgroup:
             pass
 
         # URL builder
-        url_workgroup_limits = utils.get_request_base_url(
+        url_workgroup_limits = self.utils.get_request_base_url(
             route="/groups/{}/limits".format(workgroup_id)
         )
 
         # request
         req_workgroup_limits = self.api_client.get(
             url=url_workgroup_limits,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -392,7 +367,7 @@ class ApiWorkgroup:
 
         return req_workgroup_limits.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def memberships(self, workgroup_id: str) -> dict:
         """Returns memberships for the specified workgroup.
@@ -408,17 +383,13 @@ class ApiWorkgroup:
             pass
 
         # URL builder
-        url_workgroup_memberships = utils.get_request_base_url(
+        url_workgroup_memberships = self.utils.get_request_base_url(
             route="/groups/{}/memberships".format(workgroup_id)
         )
 
         # request
         req_workgroup_memberships = self.api_client.get(
             url=url_workgroup_memberships,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -428,7 +399,7 @@ class ApiWorkgroup:
 
         return req_workgroup_memberships.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def statistics(self, workgroup_id: str) -> dict:
         """Returns statistics for the specified workgroup.
@@ -444,17 +415,13 @@ class ApiWorkgroup:
             pass
 
         # URL builder
-        url_workgroup_statistics = utils.get_request_base_url(
+        url_workgroup_statistics = self.utils.get_request_base_url(
             route="groups/{}/statistics".format(workgroup_id)
         )
 
         # request
         req_workgroup_statistics = self.api_client.get(
             url=url_workgroup_statistics,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
         # checking response
@@ -464,7 +431,7 @@ class ApiWorkgroup:
 
         return req_workgroup_statistics.json()
 
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def statistics_by_tag(self, workgroup_id: str, tag: str) -> dict:
         """Returns statistics for the specified workgroup.
@@ -492,7 +459,7 @@ class ApiWorkgroup:
             )
 
         # URL builder
-        url_workgroup_statistics = utils.get_request_base_url(
+        url_workgroup_statistics = self.utils.get_request_base_url(
             route="groups/{}/statistics/tag/{}".format(workgroup_id, tag)
         )
 
@@ -501,9 +468,6 @@ class ApiWorkgroup:
             req_workgroup_statistics = self.api_client.get(
                 url=url_workgroup_statistics,
                 # headers=self.api_client.header,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=self.api_client.timeout,
             )
         except Timeout as e:
             logger.error(
@@ -520,7 +484,7 @@ class ApiWorkgroup:
         return req_workgroup_statistics.json()
 
     # -- Aliased methods ------------------------------------------------------
-    @lru_cache()
+    @ApiDecorators._cached("workgroup")
     @ApiDecorators._check_bearer_validity
     def coordinate_systems(self, workgroup_id: str, caching: bool = 1) -> list:
         """Returns coordinate-systems for the specified workgroup. It's just an alias for the
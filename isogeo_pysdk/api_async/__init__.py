@@ -0,0 +1,14 @@
+# coding: utf-8
+#! python3  # noqa: E265 F401
+
+from .routes_account import AsyncApiAccount  # noqa: F401
+from .routes_catalog import AsyncApiCatalog  # noqa: F401
+from .routes_contact import AsyncApiContact  # noqa: F401
+from .routes_keyword import AsyncApiKeyword  # noqa: F401
+from .routes_license import AsyncApiLicense  # noqa: F401
+from .routes_metadata import AsyncApiMetadata  # noqa: F401
+from .routes_search import AsyncApiSearch  # noqa: F401
+from .routes_share import AsyncApiShare  # noqa: F401
+from .routes_specification import AsyncApiSpecification  # noqa: F401
+from .routes_thesaurus import AsyncApiThesaurus  # noqa: F401
+from .routes_workgroup import AsyncApiWorkgroup  # noqa: F401
@@ -0,0 +1,79 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Account entity
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import User
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiAccount:
+    """Routes as coroutines of Isogeo API used to manipulate the authenticated user account."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiAccount, self).__init__()
+
+    async def get(self, include: tuple = ("_abilities",)) -> User:
+        """Get authenticated user account(= profile) informations.
+
+        :param tuple include: additional parts of model to include in response
+        """
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        req_account = await self.api_client.request(
+            method="GET", route="account", params=payload
+        )
+
+        # checking response
+        if isinstance(req_account, tuple):
+            return req_account
+
+        # store the user profile
+        self.api_client._user = User(**req_account)
+
+        # end of method
+        return self.api_client._user
+
+    async def memberships(self) -> list:
+        """Returns memberships for the authenticated user."""
+        return await self.api_client.request(method="GET", route="account/memberships")
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_account = AsyncApiAccount()
+    print(api_account)
@@ -0,0 +1,196 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Catalogs entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Catalog, Metadata
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiCatalog:
+    """Routes as coroutines of Isogeo API used to manipulate catalogs."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiCatalog, self).__init__()
+
+    async def listing(
+        self, workgroup_id: str = None, include: tuple = ("_abilities", "count")
+    ) -> list:
+        """Get workgroup catalogs.
+
+        :param str workgroup_id: identifier of the owner workgroup
+        :param tuple include: additionnal subresource to include in the response
+
+        :rtype: list
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        return await self.api_client.request(
+            method="GET",
+            route="groups/{}/catalogs".format(workgroup_id),
+            params=payload,
+        )
+
+    async def metadata(self, metadata_id: str) -> list:
+        """List metadata's catalogs with complete information.
+
+        :param str metadata_id: metadata UUID
+
+        :returns: the list of catalogs associated with the metadata
+        :rtype: list
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata_id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata_id)
+            )
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="GET", route="resources/{}/catalogs/".format(metadata_id)
+        )
+
+    async def get(
+        self,
+        workgroup_id: str,
+        catalog_id: str,
+        include: tuple = ("_abilities", "count"),
+    ) -> Catalog:
+        """Get details about a specific catalog.
+
+        :param str workgroup_id: identifier of the owner workgroup
+        :param str catalog_id: catalog UUID
+        :param list include: additionnal subresource to include in the response
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError(
+                "Workgroup ID is not a correct UUID: {}".format(workgroup_id)
+            )
+        else:
+            pass
+        # check catalog UUID
+        if not checker.check_is_uuid(catalog_id):
+            raise ValueError("Catalog ID is not a correct UUID: {}".format(catalog_id))
+        else:
+            pass
+
+        # request parameter
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        req_catalog = await self.api_client.request(
+            method="GET",
+            route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id),
+            params=payload,
+        )
+
+        # checking response
+        if isinstance(req_catalog, tuple):
+            return req_catalog
+
+        # end of method
+        return Catalog.clean_attributes(req_catalog)
+
+    async def associate_metadata(self, metadata: Metadata, catalog: Catalog):
+        """Associate a metadata with a catalog.
+
+        :param Metadata metadata: metadata object to update
+        :param Catalog catalog: catalog model object to associate
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata._id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata._id)
+            )
+        else:
+            pass
+
+        # check catalog UUID
+        if not checker.check_is_uuid(catalog._id):
+            raise ValueError("Catalog ID is not a correct UUID: {}".format(catalog._id))
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="PUT",
+            route="catalogs/{}/resources/{}".format(catalog._id, metadata._id),
+        )
+
+    async def dissociate_metadata(self, metadata: Metadata, catalog: Catalog):
+        """Removes the association between a metadata and a catalog.
+
+        :param Metadata metadata: metadata object to update
+        :param Catalog catalog: catalog model object to dissociate
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata._id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata._id)
+            )
+        else:
+            pass
+
+        # check catalog UUID
+        if not checker.check_is_uuid(catalog._id):
+            raise ValueError("Catalog ID is not a correct UUID: {}".format(catalog._id))
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="DELETE",
+            route="catalogs/{}/resources/{}".format(catalog._id, metadata._id),
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_catalog = AsyncApiCatalog()
+    print(api_catalog)
@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Contacts entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Contact
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiContact:
+    """Routes as coroutines of Isogeo API used to manipulate contacts."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiContact, self).__init__()
+
+    async def listing(
+        self, workgroup_id: str = None, include: tuple = ("count",)
+    ) -> list:
+        """Get workgroup contacts.
+
+        :param str workgroup_id: identifier of the owner workgroup
+        :param tuple include: additionnal subresource to include in the response
+
+        :rtype: list
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        return await self.api_client.request(
+            method="GET",
+            route="groups/{}/contacts".format(workgroup_id),
+            params=payload,
+        )
+
+    async def get(self, contact_id: str) -> Contact:
+        """Get details about a specific contact.
+
+        :param str contact_id: contact UUID
+        """
+        # check contact UUID
+        if not checker.check_is_uuid(contact_id):
+            raise ValueError("Contact ID is not a correct UUID.")
+        else:
+            pass
+
+        # request
+        req_contact = await self.api_client.request(
+            method="GET", route="contacts/{}".format(contact_id)
+        )
+
+        # checking response
+        if isinstance(req_contact, tuple):
+            return req_contact
+
+        # end of method
+        return Contact(**req_contact)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_contact = AsyncApiContact()
+    print(api_contact)
@@ -0,0 +1,214 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Keywords entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Keyword, KeywordSearch, Metadata
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiKeyword:
+    """Routes as coroutines of Isogeo API used to manipulate keywords."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiKeyword, self).__init__()
+
+    async def metadata(
+        self,
+        metadata_id: str = None,
+        include: tuple = ("_abilities", "count", "thesaurus"),
+    ) -> list:
+        """List a metadata's keywords with complete information.
+
+        :param str metadata_id: metadata UUID
+        :param tuple include: subresources that should be returned
+
+        :rtype: list
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata_id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata_id)
+            )
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        return await self.api_client.request(
+            method="GET",
+            route="resources/{}/keywords/".format(metadata_id),
+            params=payload,
+        )
+
+    async def thesaurus(
+        self,
+        thesaurus_id: str = "1616597fbc4348c8b11ef9d59cf594c8",
+        query: str = "",
+        offset: int = 0,
+        order_by: str = "text",
+        order_dir: str = "desc",
+        page_size: int = 20,
+        specific_md: list = [],
+        specific_tag: list = [],
+        include: tuple = ("_abilities", "count"),
+    ) -> KeywordSearch:
+        """Search for keywords within a specific thesaurus. Parameters are the same as the
+        synchronous :meth:`~isogeo_pysdk.api.routes_keyword.ApiKeyword.thesaurus`.
+
+        :rtype: KeywordSearch
+        """
+        # handling request parameters
+        payload = {
+            "_id": checker._check_filter_specific_md(specific_md),
+            "_include": checker._check_filter_includes(include, "keyword"),
+            "_limit": page_size,
+            "_offset": offset,
+            "_tag": checker._check_filter_specific_tag(specific_tag),
+            "ob": order_by,
+            "od": order_dir,
+            "q": query,
+        }
+
+        # request
+        req_thesaurus_keywords = await self.api_client.request(
+            method="GET",
+            route="thesauri/{}/keywords/search".format(thesaurus_id),
+            params=payload,
+        )
+
+        # checking response
+        if isinstance(req_thesaurus_keywords, tuple):
+            return req_thesaurus_keywords
+
+        # end of method
+        return KeywordSearch(**req_thesaurus_keywords)
+
+    async def get(
+        self, keyword_id: str, include: tuple = ("_abilities", "count", "thesaurus")
+    ) -> Keyword:
+        """Get details about a specific keyword.
+
+        :param str keyword_id: keyword UUID
+        :param tuple include: additionnal subresource to include in the response
+        """
+        # request parameter
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        req_keyword = await self.api_client.request(
+            method="GET", route="keywords/{}".format(keyword_id), params=payload
+        )
+
+        # checking response
+        if isinstance(req_keyword, tuple):
+            return req_keyword
+
+        # end of method
+        return Keyword(**req_keyword)
+
+    async def tagging(self, metadata: Metadata, keyword: Keyword):
+        """Associate a keyword to a metadata. A conflict (409, already tagged) is considered as a
+        success.
+
+        :param Metadata metadata: metadata (resource) to edit
+        :param Keyword keyword: object to associate
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata._id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata._id)
+            )
+        else:
+            pass
+
+        # check keyword UUID
+        if not checker.check_is_uuid(keyword._id):
+            raise ValueError("Keyword ID is not a correct UUID: {}".format(keyword._id))
+        else:
+            pass
+
+        # request
+        req_keyword_associate = await self.api_client.request(
+            method="POST",
+            route="resources/{}/keywords/{}".format(metadata._id, keyword._id),
+        )
+
+        # handle conflict (see: https://developer.mozilla.org/fr/docs/Web/HTTP/Status/409)
+        if isinstance(req_keyword_associate, tuple) and req_keyword_associate[1] == 409:
+            logger.info(
+                "Metadata '{}' is already tagged by the keyword '{}'.".format(
+                    metadata._id, keyword._id
+                )
+            )
+            return True, 409
+
+        # end of method
+        return req_keyword_associate
+
+    async def untagging(self, metadata: Metadata, keyword: Keyword):
+        """Dissociate a keyword from a metadata.
+
+        :param Metadata metadata: metadata (resource) to edit
+        :param Keyword keyword: object to dissociate
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata._id):
+            raise ValueError("Metadata ID is not a correct UUID.")
+        else:
+            pass
+
+        # check keyword UUID
+        if not checker.check_is_uuid(keyword._id):
+            raise ValueError("Keyword ID is not a correct UUID.")
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="DELETE",
+            route="resources/{}/keywords/{}".format(metadata._id, keyword._id),
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_keyword = AsyncApiKeyword()
+    print(api_keyword)
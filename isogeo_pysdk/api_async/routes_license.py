@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Licenses entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import License
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiLicense:
+    """Routes as coroutines of Isogeo API used to manipulate licenses."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiLicense, self).__init__()
+
+    async def listing(
+        self, workgroup_id: str = None, include: tuple = ("_abilities", "count")
+    ) -> list:
+        """Get workgroup licenses.
+
+        :param str workgroup_id: identifier of the owner workgroup
+        :param tuple include: additionnal subresource to include in the response
+
+        :rtype: list
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        return await self.api_client.request(
+            method="GET",
+            route="groups/{}/licenses".format(workgroup_id),
+            params=payload,
+        )
+
+    async def get(self, license_id: str) -> License:
+        """Get details about a specific license.
+
+        :param str license_id: license UUID
+        """
+        # check license UUID
+        if not checker.check_is_uuid(license_id):
+            raise ValueError("License ID is not a correct UUID.")
+        else:
+            pass
+
+        # request
+        req_license = await self.api_client.request(
+            method="GET", route="licenses/{}".format(license_id)
+        )
+
+        # checking response
+        if isinstance(req_license, tuple):
+            return req_license
+
+        # end of method
+        return License(**req_license)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_license = AsyncApiLicense()
+    print(api_license)
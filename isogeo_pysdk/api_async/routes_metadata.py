@@ -0,0 +1,233 @@
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Resources (= Metadata) entity
+
+    See: http://help.isogeo.com/api/complete/index.html#definition-resource
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Metadata
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiMetadata:
+    """Routes as coroutines of Isogeo API used to manipulate metadatas (resources)."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiMetadata, self).__init__()
+
+    async def get(self, metadata_id: str, include: tuple or str = ()) -> Metadata:
+        """Get complete or partial metadata about a specific metadata (= resource).
+
+        :param str metadata_id: metadata UUID to get
+        :param tuple include: subresources that should be included. Available values:
+
+          - one or various from MetadataSubresources (Enum)
+          - "all" to get complete metadata with every subresource included
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata_id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata_id)
+            )
+        else:
+            pass
+
+        # request parameters
+        payload = {
+            "_include": checker._check_filter_includes(
+                includes=include, entity="metadata"
+            )
+        }
+
+        # request
+        req_metadata = await self.api_client.request(
+            method="GET", route="resources/{}".format(metadata_id), params=payload
+        )
+
+        # checking response
+        if isinstance(req_metadata, tuple):
+            return req_metadata
+
+        # end of method
+        return Metadata.clean_attributes(req_metadata)
+
+    async def create(self, workgroup_id: str, metadata: Metadata) -> Metadata:
+        """Add a new metadata to a workgroup.
+
+        :param str workgroup_id: identifier of the owner workgroup
+        :param Metadata metadata: Metadata model object to create
+
+        :rtype: Metadata
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # check required attributes
+        if not metadata.title:
+            raise ValueError("Metadata title is required: {}".format(metadata.title))
+        else:
+            pass
+
+        # request
+        req_new_metadata = await self.api_client.request(
+            method="POST",
+            route="groups/{}/resources".format(workgroup_id),
+            json=metadata.to_dict_creation(),
+        )
+
+        # checking response
+        if isinstance(req_new_metadata, tuple):
+            return req_new_metadata
+
+        # load new metadata
+        req_new_metadata["_creator"] = {"_id": workgroup_id}
+        return Metadata(**req_new_metadata)
+
+    async def delete(self, metadata_id: str):
+        """Delete a metadata from Isogeo database.
+
+        :param str metadata_id: identifier of the resource to delete
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata_id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata_id)
+            )
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="DELETE", route="resources/{}".format(metadata_id)
+        )
+
+    async def exists(self, resource_id: str) -> bool:
+        """Check if the specified resource exists and is available for the authenticated user.
+
+        :param str resource_id: identifier of the resource to verify
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(resource_id):
+            raise ValueError(
+                "Resource ID is not a correct UUID: {}".format(resource_id)
+            )
+        else:
+            pass
+
+        # request
+        req_metadata_exists = await self.api_client.request(
+            method="GET", route="resources/{}".format(resource_id)
+        )
+
+        # checking response
+        if isinstance(req_metadata_exists, tuple):
+            return False
+
+        return True
+
+    async def update(self, metadata: Metadata, _http_method: str = "PATCH") -> Metadata:
+        """Update a metadata, but **ONLY** the root attributes, not the subresources.
+
+        :param Metadata metadata: metadata object to update
+        :param str _http_method: HTTP method (verb) to use. \
+            Default to 'PATCH' but 'PUT' is used for services.
+
+        :rtype: Metadata
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata._id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata._id)
+            )
+        else:
+            pass
+
+        # check metadata required type
+        if not metadata.type:
+            raise ValueError("Metadata type is required: {}".format(metadata.type))
+        else:
+            pass
+
+        # check metadata required editionProfile
+        if not metadata.editionProfile:
+            logger.warning(
+                "Metadata to update is missing a required attribute 'editionProfile'. "
+                "It'll be set to 'manual'."
+                "See: https://github.com/isogeo/isogeo-api-py-minsdk/issues/116."
+            )
+            metadata.editionProfile = "manual"
+        else:
+            pass
+
+        # HTTP method according to the metadata.type
+        if metadata.type == "service":
+            _http_method = "PUT"
+
+        # request
+        req_metadata_update = await self.api_client.request(
+            method=_http_method,
+            route="resources/{}".format(metadata._id),
+            json=metadata.to_dict_creation(),
+        )
+
+        # checking response
+        if isinstance(req_metadata_update, tuple):
+            return req_metadata_update
+
+        # return updated object
+        return Metadata(**req_metadata_update)
+
+    async def download_xml(self, metadata: Metadata) -> bytes:
+        """Download the metadata exported into XML ISO 19139.
+
+        :param Metadata metadata: metadata object to export
+
+        :rtype: bytes
+        """
+        # check metadata UUID
+        if not checker.check_is_uuid(metadata._id):
+            raise ValueError(
+                "Metadata ID is not a correct UUID: {}".format(metadata._id)
+            )
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="GET", route="resources/{}.xml".format(metadata._id), raw=True
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_metadata = AsyncApiMetadata()
+    print(api_metadata)
@@ -0,0 +1,298 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Search
+
+    See: http://help.isogeo.com/api/complete/index.html#definition-resource
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.exceptions import IsogeoSdkError
+from isogeo_pysdk.models import Metadata, MetadataSearch
+from isogeo_pysdk.utils import IsogeoUtils
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+utils = IsogeoUtils()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiSearch:
+    """Routes as coroutines of Isogeo API used to search metadatas (resources)."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiSearch, self).__init__()
+
+    def __call__(self, *args, **kwargs):
+        """Shortcut to :meth:`search`, so that `await isogeo.search(...)` keeps working while \
+            exposing `isogeo.search.iter(...)`."""
+        return self.search(*args, **kwargs)
+
+    async def search(
+        self,
+        # application or group
+        group: str = None,
+        # semantic and objects filters
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        # results model
+        include: tuple = (),
+        # geographic filters
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        # sorting
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        # results size
+        page_size: int = 20,
+        offset: int = 0,
+        # specific options of implemention
+        check: bool = True,
+        expected_total: int = None,
+        whole_results: bool = False,
+        max_concurrency: int = 20,
+    ) -> MetadataSearch:
+        """Search within the resources shared to the application. Parameters are the same as the
+        synchronous :meth:`~isogeo_pysdk.api.routes_search.ApiSearch.search`.
+
+        When `whole_results` is enabled, pages are requested concurrently on the event loop, \
+            limited to `max_concurrency` pages in flight.
+
+        :param int max_concurrency: maximum number of pages requested at the same time
+
+        :rtype: MetadataSearch
+        """
+        # handling request parameters
+        payload = {
+            "_id": checker._check_filter_specific_md(specific_md),
+            "_include": checker._check_filter_includes(
+                includes=include, entity="metadata"
+            ),
+            "_limit": page_size,
+            "_offset": offset,
+            "box": bbox,
+            "geo": poly,
+            "rel": georel,
+            "ob": order_by,
+            "od": order_dir,
+            "q": query,
+            "s": share,
+        }
+
+        # check query parameters
+        if query and check:
+            checker.check_request_parameters(payload)
+        else:
+            pass
+
+        # route
+        if group is None:
+            route_search = "resources/search"
+        elif checker.check_is_uuid(group):
+            route_search = "groups/{}/resources/search".format(group)
+        else:
+            raise ValueError
+
+        # CASE - NO PAGINATION NEEDED
+        if not whole_results:
+            req_metadata_search = await self.api_client.request(
+                method="GET", route=route_search, params=payload, timeout=(5, 200)
+            )
+
+            # checking response
+            if isinstance(req_metadata_search, tuple):
+                return req_metadata_search
+
+            return MetadataSearch(**req_metadata_search)
+
+        # CASE - MULTIPLE PAGINATED SEARCHES
+        # determine if a request to get the total is required
+        if expected_total is None:
+            payload_total = dict(payload, _limit=0, _offset=0, _include="")
+            req_total = await self.api_client.request(
+                method="GET", route=route_search, params=payload_total, timeout=(5, 200)
+            )
+            if isinstance(req_total, tuple):
+                return req_total
+            total_results = req_total.get("total")
+        else:
+            total_results = expected_total
+
+        # launch concurrent searches, limited by a semaphore
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total_pages = utils.pages_counter(total_results, page_size=100)
+        logger.debug("Async search launched with {} pages.".format(total_pages))
+
+        async def _search_page(page_offset: int):
+            async with semaphore:
+                return await self.api_client.request(
+                    method="GET",
+                    route=route_search,
+                    params=dict(payload, _limit=100, _offset=page_offset),
+                    timeout=(5, 200),
+                )
+
+        pages = await asyncio.gather(
+            *[_search_page(page * 100) for page in range(0, total_pages)]
+        )
+
+        # store responses in a fresh Metadata Search object
+        final_search = MetadataSearch(
+            limit=total_results, offset=0, results=[], query={}, tags={}
+        )
+        for page in pages:
+            if isinstance(page, tuple):
+                return page
+            final_search.envelope = page.get("envelope")
+            final_search.query.update(page.get("query"))
+            final_search.results.extend(page.get("results"))
+            final_search.tags.update(page.get("tags"))
+            final_search.total = page.get("total")
+
+        return final_search
+
+    async def iter(
+        self,
+        # application or group
+        group: str = None,
+        # semantic and objects filters
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        # results model
+        include: tuple = (),
+        # geographic filters
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        # sorting
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        # results size
+        page_size: int = 100,
+        offset: int = 0,
+        # specific options of implemention
+        check: bool = True,
+        prefetch: int = 2,
+        as_model: bool = True,
+    ):
+        """Asynchronous generator over the whole search results, page by page. Parameters are \
+            the same as the synchronous :meth:`~isogeo_pysdk.api.routes_search.ApiSearch.iter`.
+
+        :Example:
+
+        .. code-block:: python
+
+            async for md in isogeo.search.iter(query="type:vector-dataset"):
+                print(md.title_or_name())
+        """
+        # check page size
+        if not 0 < page_size <= 100:
+            raise ValueError(
+                "Page size must be between 1 and 100, not: {}".format(page_size)
+            )
+        else:
+            pass
+
+        # handling request parameters
+        payload = {
+            "_id": checker._check_filter_specific_md(specific_md),
+            "_include": checker._check_filter_includes(
+                includes=include, entity="metadata"
+            ),
+            "_limit": page_size,
+            "_offset": offset,
+            "box": bbox,
+            "geo": poly,
+            "rel": georel,
+            "ob": order_by,
+            "od": order_dir,
+            "q": query,
+            "s": share,
+        }
+
+        # check query parameters
+        if query and check:
+            checker.check_request_parameters(payload)
+        else:
+            pass
+
+        # route
+        if group is None:
+            route_search = "resources/search"
+        elif checker.check_is_uuid(group):
+            route_search = "groups/{}/resources/search".format(group)
+        else:
+            raise ValueError
+
+        async def _search_page(page_offset: int) -> dict:
+            page = await self.api_client.request(
+                method="GET",
+                route=route_search,
+                params=dict(payload, _offset=page_offset),
+                timeout=(5, 200),
+            )
+            if isinstance(page, tuple):
+                raise IsogeoSdkError(
+                    "Search page (offset={}) failed with status: {}".format(
+                        page_offset, page[1]
+                    )
+                )
+            return page
+
+        # first page is requested immediately to get the total
+        page = await _search_page(offset)
+        next_offsets = iter(range(offset + page_size, page.get("total"), page_size))
+        pending = []
+
+        def _schedule_next():
+            page_offset = next(next_offsets, None)
+            if page_offset is not None:
+                pending.append(asyncio.ensure_future(_search_page(page_offset)))
+
+        try:
+            for _ in range(max(prefetch, 1)):
+                _schedule_next()
+            while page is not None:
+                for md in page.get("results", []):
+                    yield Metadata.clean_attributes(md) if as_model else md
+                if pending:
+                    page = await pending.pop(0)
+                    _schedule_next()
+                else:
+                    page = None
+        finally:
+            # consumer stopped early or an error occurred: cancel pending pages
+            for task in pending:
+                task.cancel()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    api_search = AsyncApiSearch()
+    print(api_search)
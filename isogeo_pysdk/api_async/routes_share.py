@@ -0,0 +1,107 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Shares entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Share
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiShare:
+    """Routes as coroutines of Isogeo API used to manipulate shares."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiShare, self).__init__()
+
+    async def listing(self, workgroup_id: str = None) -> list:
+        """Get all shares which are accessible by the authenticated user OR shares for a workgroup.
+
+        :param str workgroup_id: identifier of the owner workgroup. If `None`, then list shares for the autenticated user
+        """
+        # route
+        if workgroup_id is not None:
+            if not checker.check_is_uuid(workgroup_id):
+                raise ValueError("Workgroup ID is not a correct UUID.")
+            else:
+                route_shares = "groups/{}/shares".format(workgroup_id)
+        else:
+            route_shares = "shares"
+
+        # request
+        shares = await self.api_client.request(
+            method="GET", route=route_shares, timeout=(5, 200)
+        )
+
+        # store shares of the authenticated application/user
+        if workgroup_id is None and isinstance(shares, list):
+            self.api_client._shares = shares
+
+        # end of method
+        return shares
+
+    async def get(
+        self, share_id: str, include: tuple = ("_abilities", "groups")
+    ) -> Share:
+        """Returns details about a specific share.
+
+        :param str share_id: share UUID
+        :param tuple include: additionnal subresource to include in the response
+        """
+        # check share UUID
+        if not checker.check_is_uuid(share_id):
+            raise ValueError("Share ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        req_share = await self.api_client.request(
+            method="GET", route="shares/{}".format(share_id), params=payload
+        )
+
+        # checking response
+        if isinstance(req_share, tuple):
+            return req_share
+
+        # end of method
+        return Share(**req_share)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_share = AsyncApiShare()
+    print(api_share)
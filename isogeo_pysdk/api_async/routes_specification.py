@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Specifications entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Specification
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiSpecification:
+    """Routes as coroutines of Isogeo API used to manipulate specifications."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiSpecification, self).__init__()
+
+    async def listing(
+        self, workgroup_id: str = None, include: tuple = ("_abilities", "count")
+    ) -> list:
+        """Get workgroup specifications.
+
+        :param str workgroup_id: identifier of the owner workgroup
+        :param tuple include: additionnal subresource to include in the response
+
+        :rtype: list
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        return await self.api_client.request(
+            method="GET",
+            route="groups/{}/specifications".format(workgroup_id),
+            params=payload,
+        )
+
+    async def get(self, specification_id: str) -> Specification:
+        """Get details about a specific specification.
+
+        :param str specification_id: specification UUID
+        """
+        # check specification UUID
+        if not checker.check_is_uuid(specification_id):
+            raise ValueError("Specification ID is not a correct UUID.")
+        else:
+            pass
+
+        # request
+        req_specification = await self.api_client.request(
+            method="GET", route="specifications/{}".format(specification_id)
+        )
+
+        # checking response
+        if isinstance(req_specification, tuple):
+            return req_specification
+
+        # end of method
+        return Specification(**req_specification)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_specification = AsyncApiSpecification()
+    print(api_specification)
@@ -0,0 +1,90 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Thesaurus entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Thesaurus
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiThesaurus:
+    """Routes as coroutines of Isogeo API used to manipulate thesauri."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiThesaurus, self).__init__()
+
+    async def thesauri(self) -> list:
+        """Get all thesauri."""
+        return await self.api_client.request(method="GET", route="thesauri")
+
+    async def thesaurus(
+        self,
+        thesaurus_id: str = "1616597fbc4348c8b11ef9d59cf594c8",
+        include: tuple = ("_abilities",),
+    ) -> Thesaurus:
+        """Get a thesaurus.
+
+        :param str thesaurus_id: thesaurus UUID
+        :param list include: subresources that should be returned. Available values:
+
+          * '_abilities'
+          * 'count'
+        """
+        # check thesaurus UUID
+        if not checker.check_is_uuid(thesaurus_id):
+            raise ValueError("Thesaurus ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        req_thesaurus = await self.api_client.request(
+            method="GET", route="thesauri/{}".format(thesaurus_id), params=payload
+        )
+
+        # checking response
+        if isinstance(req_thesaurus, tuple):
+            return req_thesaurus
+
+        # end of method
+        return Thesaurus(**req_thesaurus)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_thesaurus = AsyncApiThesaurus()
+    print(api_thesaurus)
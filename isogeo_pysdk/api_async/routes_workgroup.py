@@ -0,0 +1,113 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Asynchronous API Routes for Workgroups entities
+
+    See: http://help.isogeo.com/api/complete/index.html
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# submodules
+from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.models import Workgroup
+
+# #############################################################################
+# ########## Global #############
+# ##################################
+
+logger = logging.getLogger(__name__)
+checker = IsogeoChecker()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class AsyncApiWorkgroup:
+    """Routes as coroutines of Isogeo API used to manipulate workgroups."""
+
+    def __init__(self, api_client=None):
+        # store asynchronous API client
+        self.api_client = api_client
+
+        # initialize
+        super(AsyncApiWorkgroup, self).__init__()
+
+    async def listing(self, include: tuple = ("_abilities", "limits")) -> list:
+        """Get workgroups.
+
+        :param list include: additionnal subresource to include in the response
+        """
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        return await self.api_client.request(
+            method="GET", route="groups", params=payload
+        )
+
+    async def get(
+        self, workgroup_id: str, include: tuple = ("_abilities", "limits")
+    ) -> Workgroup:
+        """Get details about a specific workgroup.
+
+        :param str workgroup_id: workgroup UUID
+        :param tuple include: additionnal subresource to include in the response
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # handling request parameters
+        if isinstance(include, (tuple, list)):
+            payload = {"_include": ",".join(include)}
+        else:
+            payload = None
+
+        # request
+        req_workgroup = await self.api_client.request(
+            method="GET", route="groups/{}".format(workgroup_id), params=payload
+        )
+
+        # checking response
+        if isinstance(req_workgroup, tuple):
+            return req_workgroup
+
+        # end of method
+        return Workgroup(**req_workgroup)
+
+    async def statistics(self, workgroup_id: str) -> dict:
+        """Returns statistics for the specified workgroup.
+
+        :param str workgroup_id: workgroup UUID
+        """
+        # check workgroup UUID
+        if not checker.check_is_uuid(workgroup_id):
+            raise ValueError("Workgroup ID is not a correct UUID.")
+        else:
+            pass
+
+        # request
+        return await self.api_client.request(
+            method="GET", route="groups/{}/statistics".format(workgroup_id)
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    api_workgroup = AsyncApiWorkgroup()
+    print(api_workgroup)
@@ -3,6 +3,34 @@
 
 """Complementary set of hooks to use with Isogeo API."""
 
+# ##############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+import logging
+
+# 3rd party
+from requests.models import Response
+
+# optional: faster JSON decoders
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
 # ##############################################################################
 # ########## Classes ###############
 # ##################################
@@ -17,9 +45,75 @@ class IsogeoHooks(object):
         WIP
     """
 
-    def __init__(self):
-        """Instanciate IsogeoHooks module."""
+    def __init__(self, json_decoder: str or callable = "json"):
+        """Instanciate IsogeoHooks module.
+
+        :param str json_decoder: JSON decoder used by :meth:`decode_json`. See \
+            :meth:`get_json_decoder`.
+        """
         super(IsogeoHooks, self).__init__()
+        self.json_loads = self.get_json_decoder(json_decoder)
+
+    @staticmethod
+    def get_json_decoder(decoder: str or callable = "auto") -> callable:
+        """Returns the function used to decode JSON responses.
+
+        :param str decoder: one of:
+
+          - "auto": the fastest installed decoder (orjson, then ujson, then json)
+          - "orjson", "ujson" or "json" (standard library)
+          - a function taking bytes and returning the decoded object
+
+        :raises ImportError: if the required decoder is not installed
+        :raises ValueError: if the decoder is not an accepted value
+
+        :rtype: callable
+        """
+        if callable(decoder):
+            return decoder
+        elif decoder == "auto":
+            if orjson is not None:
+                return orjson.loads
+            elif ujson is not None:
+                return ujson.loads
+            else:
+                return json.loads
+        elif decoder == "json":
+            return json.loads
+        elif decoder in ("orjson", "ujson"):
+            module = orjson if decoder == "orjson" else ujson
+            if module is None:
+                raise ImportError(
+                    "JSON decoder '{}' is not installed. "
+                    "Install it with: pip install {}".format(decoder, decoder)
+                )
+            return module.loads
+        else:
+            raise ValueError(
+                "JSON decoder must be a callable or one of: auto | orjson | ujson | json."
+            )
+
+    def decode_json(self, resp: Response, *args, **kwargs) -> Response:
+        """Replace the `json()` method of responses to use the decoder set for the client. \
+            The body of streamed responses (`stream=True`) is read from the raw stream in \
+            one call instead of being joined from chunks by requests. It's still loaded \
+            whole into memory before decoding: the decoders only parse complete documents.
+        """
+        if self.json_loads is json.loads:
+            return resp
+
+        def fast_json(**json_kwargs):
+            # options are specific to the standard library decoder
+            if json_kwargs:
+                return Response.json(resp, **json_kwargs)
+
+            if resp._content is False:
+                resp._content = resp.raw.read(decode_content=True)
+                resp._content_consumed = True
+            return self.json_loads(resp.content)
+
+        resp.json = fast_json
+        return resp
 
     def check_for_error(self, resp, *args, **kwargs):
         resp.raise_for_status()
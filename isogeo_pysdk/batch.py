@@ -0,0 +1,228 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Batch of association calls, sent as bulk requests
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import threading
+from timeit import default_timer
+
+# submodules
+from isogeo_pysdk.api.routes_metadata_bulk import ApiBulk
+from isogeo_pysdk.decorators import ApiDecorators
+from isogeo_pysdk.models import BulkRequest
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class BatchedCall(object):
+    """Association call queued into a batch. Its outcome is set once the batch is sent.
+
+    :param dict request: bulk request of the call, about one metadata and one object
+    """
+
+    def __init__(self, request: dict):
+        self.request = request
+        self.metadata_id = request.get("query").get("ids")[0]
+        self.status = "pending"  # then: 'done', 'ignored' or 'failed'
+        self.reason = None  # why the API ignored it. See: BulkIgnoreReasons
+        self.error = None  # error of the bulk request, if failed
+
+    @property
+    def ok(self) -> bool:
+        """True if the association is done, or was already there.
+
+        :rtype: bool
+        """
+        return self.status == "done" or self.reason == "alreadyPresent"
+
+    def __repr__(self) -> str:
+        return "<BatchedCall {} {} on {}: {}>".format(
+            self.request.get("action"),
+            self.request.get("target"),
+            self.metadata_id,
+            self.status,
+        )
+
+
+class IsogeoBatch(object):
+    """Queue the association calls between metadata and catalogs, keywords or contacts \
+        made within the context, instead of sending one request by call. On exit, they're \
+        sent as bulk requests: merged, split into chunks and sent in parallel (see: \
+        :meth:`~isogeo_pysdk.api.routes_metadata_bulk.ApiBulk.send`).
+
+    Calls made within the context return a :class:`BatchedCall` whose outcome is set once \
+    the batch is sent. Calls working on the same metadata and objects are sent in the order \
+    they were made. Queued calls are:
+
+    - :meth:`~isogeo_pysdk.api.routes_catalog.ApiCatalog.associate_metadata` and \
+        :meth:`~isogeo_pysdk.api.routes_catalog.ApiCatalog.dissociate_metadata`
+    - :meth:`~isogeo_pysdk.api.routes_keyword.ApiKeyword.tagging` and \
+        :meth:`~isogeo_pysdk.api.routes_keyword.ApiKeyword.untagging`
+    - :meth:`~isogeo_pysdk.api.routes_contact.ApiContact.associate_metadata` and \
+        :meth:`~isogeo_pysdk.api.routes_contact.ApiContact.dissociate_metadata`
+
+    The batch only applies to the thread which opened it. If an exception is raised within \
+    the context, the queued calls are not sent.
+
+    :param Isogeo api_client: authenticated API client
+    :param int chunk_size: maximum number of metadata UUIDs in a bulk request
+    :param int max_workers: maximum number of bulk requests sent at the same time
+    :param int retries: number of times a failed bulk request is sent again
+
+    :Example:
+
+    .. code-block:: python
+
+        with isogeo.batch() as batch:
+            for md in search.results:
+                isogeo.keyword.tagging(metadata=Metadata(**md), keyword=keyword)
+                isogeo.catalog.associate_metadata(Metadata(**md), catalog)
+
+        print(batch.report)
+        >>> {'done': 1998, 'ignored': 2, 'failed': 0, 'duration': 3.2}
+    """
+
+    def __init__(
+        self,
+        api_client,
+        chunk_size: int = 100,
+        max_workers: int = None,
+        retries: int = 1,
+    ):
+        self.api_client = api_client
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.retries = retries
+
+        self.calls = []  # calls queued and not sent yet
+        self.reports = []  # bulk reports of the sent calls
+        self.report = {"done": 0, "ignored": 0, "failed": 0, "duration": 0.0}
+
+        self._lock = threading.Lock()
+        self._previous = None  # batch opened before this one, in the same thread
+
+    def __enter__(self):
+        self._previous = self.api_client.active_batch
+        self.api_client.active_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.api_client.active_batch = self._previous
+        if exc_type is None:
+            self.flush()
+        elif self.calls:
+            logger.warning(
+                "Batch interrupted by an error: {} queued calls not sent.".format(
+                    len(self.calls)
+                )
+            )
+
+    def add(self, action: str, target: str, metadata, model) -> BatchedCall:
+        """Queue an association call.
+
+        :param str action: type of action. See: :class:`~isogeo_pysdk.enums.bulk_actions`.
+        :param str target: kind of object. See: :class:`~isogeo_pysdk.enums.bulk_targets`.
+        :param Metadata metadata: metadata to update
+        :param model: object to associate (model with `to_dict`) or its dict
+
+        :rtype: BatchedCall
+        """
+        request = BulkRequest()
+        request.action = action
+        request.target = target
+        request.query = {"ids": [metadata._id]}
+        request.model = [model.to_dict() if hasattr(model, "to_dict") else model]
+
+        call = BatchedCall(request.to_dict())
+        with self._lock:
+            self.calls.append(call)
+        return call
+
+    @ApiDecorators._invalidate_cache("metadata", "catalog", "contact")
+    @ApiDecorators._check_bearer_validity
+    def flush(self) -> dict:
+        """Send the queued calls and set their outcome.
+
+        :returns: counts of calls done, ignored by the API and failed, for the whole batch, \
+            and the time spent sending them (seconds)
+        :rtype: dict
+        """
+        with self._lock:
+            calls, self.calls = self.calls, []
+        if not calls:
+            return self.report
+
+        start = default_timer()
+        requests = [call.request for call in calls]
+        reports, _, failure = self.api_client.metadata.bulk._submit(
+            requests,
+            chunk_size=self.chunk_size,
+            max_workers=self.max_workers,
+            retries=self.retries,
+        )
+        self.reports.extend(reports.values())
+
+        # map reports back to the calls, through the merged requests they belong to
+        processed = {
+            idx: set(report.request.get("query").get("ids"))
+            for idx, report in reports.items()
+        }
+        for call, idx in zip(calls, ApiBulk._merge(requests)[1]):
+            if call.metadata_id not in processed.get(idx, ()):
+                call.status, call.error = "failed", failure
+            else:
+                call.reason = self._ignore_reason(
+                    reports[idx].ignored or {}, call.metadata_id
+                )
+                call.status = "done" if call.reason is None else "ignored"
+            self.report[call.status] += 1
+
+        self.report["duration"] += default_timer() - start
+        logger.info(
+            "Batch sent: {done} calls done, {ignored} ignored and {failed} failed.".format(
+                **self.report
+            )
+        )
+        return self.report
+
+    @staticmethod
+    def _ignore_reason(ignored: dict, metadata_id: str) -> str:
+        """Find why the API ignored a metadata, from the `ignored` of a bulk report: \
+            reasons by metadata UUID or metadata UUIDs by reason.
+
+        :param dict ignored: ignored part of a bulk report
+        :param str metadata_id: metadata UUID
+
+        :returns: ignore reason, or None if the metadata has not been ignored
+        :rtype: str
+        """
+        if metadata_id in ignored:
+            return ignored.get(metadata_id)
+        for reason, md_ids in ignored.items():
+            if isinstance(md_ids, list) and metadata_id in md_ids:
+                return reason
+        return None
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
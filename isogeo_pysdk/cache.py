@@ -0,0 +1,305 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Responses cache with TTL and LRU eviction, attached to each API client.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import threading
+import time
+from collections import OrderedDict
+from copy import copy, deepcopy
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoCache(object):
+    """In-memory cache of API responses, shared by the routes of an API client
+    (:class:`~isogeo_pysdk.isogeo.Isogeo`).
+
+    Entries are grouped by route family ('metadata', 'catalog', 'workgroup'...):
+
+    - each family has its own time to live (TTL), in seconds. 0 disables the cache for the family;
+    - the total number of entries is limited to `maxsize`, least recently used are evicted first;
+    - values are copied when stored and when read, so that callers can modify returned objects \
+        without altering the cache. Values of the `shallow` families (large search results) \
+        get a cheap copy instead: the object and its results list are copied, not the \
+        records themselves, which must be treated as read-only;
+    - writing routes (create, update, delete, associate...) invalidate their family and the \
+        families which embed it (see: `DEPENDENCIES`).
+
+    To plug another storage, subclass it and override :meth:`get`, :meth:`set` and \
+        :meth:`invalidate`.
+
+    :param int maxsize: maximum number of entries stored, all families included
+    :param int ttl: default time to live (seconds), for families not listed in `ttl_by_family`
+    :param dict ttl_by_family: time to live (seconds) by family. Completes `DEFAULT_TTLS`.
+    :param bool copy: option to copy values on read and write. Disable it only if you \
+        never modify returned objects.
+    :param tuple shallow: families whose values are copied shallowly, because a deep copy \
+        costs about as much as requesting them again. Defaults to `SHALLOW_FAMILIES`.
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import Isogeo, IsogeoCache
+
+        isogeo = Isogeo(
+            client_id=environ.get("ISOGEO_API_USER_LEGACY_CLIENT_ID"),
+            client_secret=environ.get("ISOGEO_API_USER_LEGACY_CLIENT_SECRET"),
+            auth_mode="user_legacy",
+            auto_refresh_url="{}/oauth/token".format(environ.get("ISOGEO_ID_URL")),
+            platform=environ.get("ISOGEO_PLATFORM", "qa"),
+            # keep metadata 5 minutes and never cache searches
+            cache=IsogeoCache(maxsize=2048, ttl_by_family={"metadata": 300, "search": 0}),
+        )
+
+        # after some requests
+        print(isogeo.cache.stats())
+        >>> {'hits': 12, 'misses': 30, 'evictions': 0, 'expirations': 2, 'invalidations': 1, ...}
+
+        # clear a family or the whole cache
+        isogeo.cache.invalidate("catalog")
+        isogeo.cache.clear()
+    """
+
+    # time to live (in seconds) by route family
+    DEFAULT_TTLS = {
+        "account": 600,
+        "application": 600,
+        "catalog": 300,
+        "condition": 120,
+        "conformity": 120,
+        "contact": 300,
+        "datasource": 300,
+        "link": 120,
+        "metadata": 60,
+        "reference": 3600,  # platform-wide references (links kinds/actions...)
+        "search": 60,
+        "share": 300,
+        "specification": 300,
+        "user": 600,
+        "workgroup": 300,
+    }
+
+    # families whose values are copied shallowly: the object and its results list
+    SHALLOW_FAMILIES = ("search",)
+
+    # families to invalidate with the key family because they embed it
+    DEPENDENCIES = {
+        "account": ("user",),
+        "application": ("share", "workgroup"),
+        "catalog": ("metadata", "search", "share", "workgroup"),
+        "condition": ("metadata", "search"),
+        "conformity": ("metadata", "search"),
+        "contact": ("metadata", "search"),
+        "datasource": ("workgroup",),
+        "link": ("metadata", "search"),
+        "metadata": ("search", "catalog", "workgroup"),
+        "share": ("application", "catalog", "search", "workgroup"),
+        "specification": ("conformity", "metadata", "search"),
+        "user": ("account", "workgroup"),
+        "workgroup": ("account", "user"),
+    }
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl: int = 300,
+        ttl_by_family: dict = None,
+        copy: bool = True,
+        shallow: tuple = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttl_by_family:
+            self.ttls.update(ttl_by_family)
+        self.copy = copy
+        self.shallow = frozenset(self.SHALLOW_FAMILIES if shallow is None else shallow)
+
+        # storage: key -> (family, expiration timestamp, value)
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+        self._stats_by_family = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return "{}(maxsize={}, size={})".format(
+            self.__class__.__name__, self.maxsize, len(self)
+        )
+
+    # -- METHODS -----------------------------------------------------------------------
+    def ttl_for(self, family: str) -> int:
+        """Get the time to live of a family.
+
+        :param str family: route family
+
+        :rtype: int
+        """
+        return self.ttls.get(family, self.ttl)
+
+    def get(self, family: str, key: tuple) -> tuple:
+        """Get a value from the cache.
+
+        :param str family: route family
+        :param tuple key: hashable key of the cached call
+
+        :returns: a tuple (hit, value). Value is None if missed.
+        :rtype: tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < time.monotonic():
+                del self._entries[key]
+                self._count(family, "expirations")
+                entry = None
+
+            if entry is None:
+                self._count(family, "misses")
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._count(family, "hits")
+            value = entry[2]
+
+        return True, self._copy(family, value)
+
+    def set(self, family: str, key: tuple, value):
+        """Store a value in the cache, evicting the least recently used entries if needed.
+
+        :param str family: route family
+        :param tuple key: hashable key of the cached call
+        :param value: value to store
+        """
+        ttl = self.ttl_for(family)
+        if not ttl or self.maxsize <= 0:
+            return
+
+        value = self._copy(family, value)
+
+        with self._lock:
+            self._entries[key] = (family, time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                self._count(evicted[0], "evictions")
+
+    def invalidate(self, family: str = None, cascade: bool = True) -> int:
+        """Remove entries of a family (and of the families depending on it) or all entries.
+
+        :param str family: route family to invalidate. If None, the whole cache is cleared.
+        :param bool cascade: option to invalidate families which embed this one too. \
+            See: `DEPENDENCIES`.
+
+        :returns: count of removed entries
+        :rtype: int
+        """
+        with self._lock:
+            if family is None:
+                families = None
+            elif cascade:
+                families = {family, *self.DEPENDENCIES.get(family, ())}
+            else:
+                families = {family}
+
+            keys = [
+                k
+                for k, entry in self._entries.items()
+                if families is None or entry[0] in families
+            ]
+            for k in keys:
+                del self._entries[k]
+            self._stats["invalidations"] += 1
+
+        if keys:
+            logger.debug(
+                "Cache invalidated for {}: {} entries removed.".format(
+                    family or "all families", len(keys)
+                )
+            )
+        return len(keys)
+
+    def clear(self):
+        """Remove all entries. Statistics are kept."""
+        self.invalidate(family=None)
+
+    def stats(self, by_family: bool = False) -> dict:
+        """Get cache statistics.
+
+        :param bool by_family: option to include statistics by family
+
+        :rtype: dict
+        """
+        with self._lock:
+            out = dict(self._stats, size=len(self._entries), maxsize=self.maxsize)
+            if by_family:
+                out["families"] = {k: dict(v) for k, v in self._stats_by_family.items()}
+        return out
+
+    def _copy(self, family: str, value):
+        """Copy a value read or written, according to the settings of its family.
+
+        :param str family: route family
+        :param value: value to copy
+
+        :returns: a deep copy, a shallow copy (with a new results list) for the `shallow` \
+            families or the value itself if copies are disabled
+        """
+        if not self.copy:
+            return value
+        elif family not in self.shallow:
+            return deepcopy(value)
+
+        value = copy(value)
+        if isinstance(value, dict) and isinstance(value.get("results"), list):
+            value["results"] = list(value.get("results"))
+        elif isinstance(getattr(value, "results", None), list):
+            value.results = list(value.results)
+        return value
+
+    def _count(self, family: str, counter: str):
+        """Increment a global counter and the matching family one.
+
+        :param str family: route family
+        :param str counter: counter name
+        """
+        self._stats[counter] += 1
+        family_stats = self._stats_by_family.setdefault(
+            family, {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        )
+        family_stats[counter] += 1
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    cache = IsogeoCache(maxsize=2)
+    cache.set("metadata", ("get", "a"), {"title": "a"})
+    print(cache.get("metadata", ("get", "a")), cache.stats())
@@ -0,0 +1,323 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Record and replay the API exchanges, to run without network
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import gzip
+import json
+import logging
+import threading
+from base64 import b64decode, b64encode
+from hashlib import sha256
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 3rd party
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# response headers which are not stored: body is stored decoded and without cookies
+_headers_ignored = (
+    "connection",
+    "content-encoding",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+)
+
+# fields of the token responses replaced in cassettes
+_token_secrets = ("access_token", "refresh_token")
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class CassetteMissError(ConnectionError):
+    """A request has not been found into a cassette opened in replay mode."""
+
+    pass
+
+
+class IsogeoCassette(object):
+    """File storing the API exchanges (requests and responses) of a client, to replay them \
+        later without network: reproducible profiling of the parsing and models building, \
+        reproduction of production slowdowns, fast tests.
+
+    A cassette is a JSON Lines file, gzip-compressed when its name ends with `.gz`. \
+    Requests are matched on their method, their URL (query parameters sorted) and a hash of \
+    their body. Token requests are matched without their body (credentials) and the tokens \
+    they return are replaced by fake ones. When the same request has been recorded several \
+    times, responses are replayed in the same order. Responses bodies are stored entirely, \
+    streamed ones included.
+
+    :param str path: path to the cassette file
+    :param str mode: one of:
+
+        * 'replay': responses are read from the cassette, unknown requests raise a \
+            :class:`CassetteMissError` [DEFAULT]
+        * 'record': every request is sent and the cassette is rewritten
+        * 'auto': recorded requests are replayed, unknown ones are sent and appended
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import Isogeo, IsogeoCassette
+
+        # record once with the network
+        isogeo = Isogeo(
+            ...,
+            cassette=IsogeoCassette("./tests/fixtures/search.jsonl.gz", mode="record"),
+        )
+        isogeo.connect()
+        isogeo.search(include="all", whole_results=True)
+        isogeo.close()  # closes the cassette file
+
+        # then replay as many times as needed, without network
+        isogeo = Isogeo(..., cassette="./tests/fixtures/search.jsonl.gz")
+        isogeo.connect()
+        isogeo.search(include="all", whole_results=True)
+    """
+
+    MODES = ("auto", "record", "replay")
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in self.MODES:
+            raise ValueError(
+                "Mode value must be one of: {}".format(" | ".join(self.MODES))
+            )
+        self.path = Path(path).expanduser()
+        self.mode = mode
+
+        # statistics
+        self.stats = {"played": 0, "recorded": 0}
+
+        self._lock = threading.Lock()
+        self._interactions = {}  # recorded responses by request key
+        self._positions = {}  # next response to replay by request key
+        self._file = None  # opened when the first response is recorded
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._open("wt").close()
+        elif self.path.is_file():
+            self.load()
+        elif mode == "replay":
+            raise FileNotFoundError("Cassette not found: {}".format(self.path))
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(i) for i in self._interactions.values())
+
+    def __repr__(self) -> str:
+        return "{}(path={}, mode={})".format(
+            self.__class__.__name__, self.path, self.mode
+        )
+
+    def _open(self, mode: str):
+        if self.path.suffix == ".gz":
+            return gzip.open(str(self.path), mode, encoding="utf-8")
+        return open(str(self.path), mode, encoding="utf-8")
+
+    # -- STORAGE -----------------------------------------------------------------------
+    @staticmethod
+    def make_key(method: str, url: str, body: bytes or str = None) -> str:
+        """Build the key matching a request with its recorded responses.
+
+        :param str method: HTTP method (verb)
+        :param str url: full request URL, with query parameters
+        :param bytes body: request body
+
+        :rtype: str
+        """
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        key = "{} {}".format(method.upper(), urlunsplit(parts._replace(query=query)))
+        if hasattr(body, "read"):
+            # streamed body (upload): matched without it
+            return key
+        if body and not parts.path.endswith("oauth/token"):
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            key += " " + sha256(body).hexdigest()
+        return key
+
+    def load(self):
+        """Read the interactions stored into the cassette file."""
+        with self._lock, self._open("rt") as cassette_file:
+            for line in cassette_file:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                self._interactions.setdefault(interaction.get("key"), []).append(
+                    interaction.get("response")
+                )
+        logger.debug("{} interactions loaded from {}".format(len(self), self.path))
+
+    def play(self, key: str) -> dict or None:
+        """Get the next recorded response of a request.
+
+        :param str key: request key. See: :meth:`make_key`
+
+        :returns: recorded response or None if the request has not been recorded
+        :rtype: dict
+        """
+        with self._lock:
+            responses = self._interactions.get(key)
+            if not responses:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            self.stats["played"] += 1
+            # last response is replayed once every recorded one has been
+            return responses[min(position, len(responses) - 1)]
+
+    def record(self, key: str, response: Response) -> dict:
+        """Store a response into the cassette. The body is read.
+
+        :param str key: request key. See: :meth:`make_key`
+        :param Response response: response to store
+
+        :returns: recorded response
+        :rtype: dict
+        """
+        body = response.content or b""
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in _headers_ignored
+        }
+        if key.endswith("oauth/token") and response.status_code == 200:
+            token = json.loads(body)
+            for secret in _token_secrets:
+                if secret in token:
+                    token[secret] = "cassette-{}".format(secret.replace("_", "-"))
+            body = json.dumps(token).encode("utf-8")
+            headers["Content-Length"] = str(len(body))
+
+        recorded = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": headers,
+        }
+        try:
+            recorded["text"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            recorded["base64"] = b64encode(body).decode("ascii")
+
+        with self._lock:
+            self._interactions.setdefault(key, []).append(recorded)
+            if self._file is None:
+                self._file = self._open("at")
+            self._file.write(
+                json.dumps(
+                    {"key": key, "response": recorded},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+                + "\n"
+            )
+            self._file.flush()
+            self.stats["recorded"] += 1
+        return recorded
+
+    def close(self):
+        """Close the cassette file. Required to complete a gzip-compressed cassette."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def rewind(self):
+        """Replay the recorded responses from the first one."""
+        with self._lock:
+            self._positions.clear()
+
+
+class IsogeoCassetteAdapter(BaseAdapter):
+    """Transport adapter recording the exchanges into an :class:`IsogeoCassette` and \
+        replaying them. Requests which are not replayed are sent by the wrapped adapter.
+
+    :param IsogeoCassette cassette: cassette to record or replay
+    :param requests.adapters.BaseAdapter adapter: adapter sending the requests
+    """
+
+    def __init__(self, cassette: IsogeoCassette, adapter: BaseAdapter):
+        super(IsogeoCassetteAdapter, self).__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs) -> Response:
+        """Replay a request from the cassette or send and record it."""
+        key = self.cassette.make_key(request.method, request.url, request.body)
+
+        if self.cassette.mode != "record":
+            recorded = self.cassette.play(key)
+            if recorded is not None:
+                return self._build_response(request, recorded)
+            elif self.cassette.mode == "replay":
+                raise CassetteMissError(
+                    "Request not found in the cassette {}: {}".format(
+                        self.cassette.path, key
+                    ),
+                    request=request,
+                )
+
+        response = self.adapter.send(request, **kwargs)
+        recorded = self.cassette.record(key, response)
+        response.close()
+        return self._build_response(request, recorded)
+
+    def close(self):
+        self.adapter.close()
+        self.cassette.close()
+
+    def _build_response(self, request, recorded: dict) -> Response:
+        """Build a response from a recorded one.
+
+        :param PreparedRequest request: sent request
+        :param dict recorded: recorded response. See: :meth:`IsogeoCassette.record`
+
+        :rtype: Response
+        """
+        response = Response()
+        response.status_code = recorded.get("status")
+        response.reason = recorded.get("reason")
+        response.headers = CaseInsensitiveDict(recorded.get("headers"))
+        if "base64" in recorded:
+            response._content = b64decode(recorded.get("base64"))
+        else:
+            response._content = recorded.get("text").encode("utf-8")
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -12,7 +12,6 @@ import logging
 import socket
 import warnings
 from collections import Counter
-from json import JSONDecodeError
 from uuid import UUID
 
 # modules
@@ -125,7 +124,7 @@ class IsogeoChecker(object):
             # See: https://github.com/isogeo/isogeo-api-py-minsdk/issues/136
             try:
                 resp_error_msg = response.json().get("error")
-            except JSONDecodeError:
+            except ValueError:  # JSONDecodeError, whatever the decoder
                 resp_error_msg = ""
 
             # log it
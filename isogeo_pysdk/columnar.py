@@ -0,0 +1,350 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Columnar tables of search results, for vectorized analytics
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+from importlib import import_module
+
+# submodules
+from isogeo_pysdk.models import Metadata
+from isogeo_pysdk.utils import IsogeoUtils
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# columns of each table and their kind: str, category (few distinct values), datetime \
+# (UTC), int or float. Child tables are linked to metadata by `metadata_id`.
+TABLES = {
+    "metadata": (
+        ("_id", "str"),
+        ("type", "category"),
+        ("title", "str"),
+        ("name", "str"),
+        ("_created", "datetime"),
+        ("_modified", "datetime"),
+        ("format", "category"),
+        ("coordinateSystem", "category"),
+        ("owner_id", "category"),
+        ("owner_name", "category"),
+        ("xmin", "float"),
+        ("ymin", "float"),
+        ("xmax", "float"),
+        ("ymax", "float"),
+        ("features", "int"),
+    ),
+    "tags": (
+        ("metadata_id", "str"),
+        ("tag", "category"),
+        ("kind", "category"),
+        ("label", "category"),
+    ),
+    "keywords": (
+        ("metadata_id", "str"),
+        ("keyword_id", "category"),
+        ("text", "category"),
+        ("thesaurus", "category"),
+    ),
+    "contacts": (
+        ("metadata_id", "str"),
+        ("contact_id", "category"),
+        ("role", "category"),
+        ("name", "category"),
+        ("email", "category"),
+        ("organization", "category"),
+    ),
+    "feature_attributes": (
+        ("metadata_id", "str"),
+        ("name", "category"),
+        ("alias", "category"),
+        ("dataType", "category"),
+        ("description", "str"),
+        ("language", "category"),
+    ),
+}
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def results_to_columns(results) -> dict:
+    """Load search results into columnar tables: one row by metadata into `metadata`, \
+        one row by tag, keyword, contact or feature attribute into the child tables. \
+        Missing values are None. See `TABLES` for the columns.
+
+    :param results: search results (dicts as returned by the API or Metadata), as a list \
+        or any iterable (see: :meth:`~isogeo_pysdk.api.routes_search.ApiSearch.iter`)
+
+    :returns: tables by name, each one being a dict of columns (lists of the same length)
+    :rtype: dict
+
+    :Example:
+
+    .. code-block:: python
+
+        # the whole catalog, without keeping the pages into memory
+        columns = results_to_columns(
+            isogeo.search.iter(include=("contacts", "keywords"), as_model=False)
+        )
+        print(len(columns.get("metadata").get("_id")))
+        >>> 104328
+    """
+    tables = {
+        name: {column: [] for column, _ in schema} for name, schema in TABLES.items()
+    }
+    metadata = tables.get("metadata")
+
+    for md in results:
+        md_id = _value(md, "_id")
+
+        # metadata
+        creator = _value(md, "_creator") or {}
+        coordinate_system = _value(md, "coordinateSystem") or {}
+        xmin, ymin, xmax, ymax = _bbox(md)
+        for column, value in (
+            ("_id", md_id),
+            ("type", _value(md, "type")),
+            ("title", _value(md, "title")),
+            ("name", _value(md, "name")),
+            ("_created", _datetime(_value(md, "_created"))),
+            ("_modified", _datetime(_value(md, "_modified"))),
+            ("format", _value(md, "format")),
+            ("coordinateSystem", _text(coordinate_system.get("code"))),
+            ("owner_id", creator.get("_id")),
+            ("owner_name", (creator.get("contact") or {}).get("name")),
+            ("xmin", xmin),
+            ("ymin", ymin),
+            ("xmax", xmax),
+            ("ymax", ymax),
+            ("features", _value(md, "features")),
+        ):
+            metadata[column].append(value)
+
+        # child tables
+        _extend(
+            tables.get("tags"),
+            (
+                (md_id, tag, tag.split(":", 1)[0], label)
+                for tag, label in (_value(md, "tags") or {}).items()
+            ),
+        )
+        _extend(
+            tables.get("keywords"),
+            (
+                (
+                    md_id,
+                    kw.get("_id"),
+                    kw.get("text"),
+                    (kw.get("thesaurus") or {}).get("code"),
+                )
+                for kw in _value(md, "keywords") or ()
+            ),
+        )
+        _extend(
+            tables.get("contacts"),
+            (
+                (
+                    md_id,
+                    (ctct.get("contact") or {}).get("_id"),
+                    ctct.get("role"),
+                    (ctct.get("contact") or {}).get("name"),
+                    (ctct.get("contact") or {}).get("email"),
+                    (ctct.get("contact") or {}).get("organization"),
+                )
+                for ctct in _value(md, "contacts") or ()
+            ),
+        )
+        _extend(
+            tables.get("feature_attributes"),
+            (
+                (
+                    md_id,
+                    attr.get("name"),
+                    attr.get("alias"),
+                    attr.get("dataType"),
+                    attr.get("description"),
+                    attr.get("language"),
+                )
+                for attr in _value(md, "featureAttributes") or ()
+            ),
+        )
+
+    return tables
+
+
+def columns_to_frames(tables: dict, backend: str = "auto") -> dict:
+    """Convert columnar tables into typed pandas DataFrames or Arrow tables. Columns of \
+        few distinct values are categorical (dictionary encoded with Arrow), dates are \
+        UTC timestamps.
+
+    :param dict tables: tables as returned by :func:`results_to_columns`
+    :param str backend: "pandas", "arrow" or "auto" (pandas if installed, else Arrow)
+
+    :returns: DataFrames or Arrow tables, by table name
+    :rtype: dict
+
+    :Example:
+
+    .. code-block:: python
+
+        frames = columns_to_frames(results_to_columns(search.results), backend="pandas")
+        # top 10 of the feature attributes names
+        print(frames.get("feature_attributes")["name"].value_counts().head(10))
+        # metadata modified by month
+        print(frames.get("metadata").resample("M", on="_modified").size())
+    """
+    if backend == "auto":
+        backend = "pandas" if _find_module("pandas") else "arrow"
+
+    if backend == "pandas":
+        pandas = _import_module("pandas")
+        return {
+            name: _to_pandas(pandas, columns, TABLES.get(name))
+            for name, columns in tables.items()
+        }
+    elif backend == "arrow":
+        pyarrow = _import_module("pyarrow")
+        return {
+            name: _to_arrow(pyarrow, columns, TABLES.get(name))
+            for name, columns in tables.items()
+        }
+    else:
+        raise ValueError(
+            "Backend must be one of: auto | pandas | arrow. Not: {}".format(backend)
+        )
+
+
+# -- UTILS ---------------------------------------------------------------------
+def _value(md, name: str):
+    """Get a field of a result, whether it's a raw dict or a Metadata."""
+    if isinstance(md, dict):
+        value = md.get(name)
+        if value is None and name in Metadata.ATTR_MAP:
+            value = md.get(Metadata.ATTR_MAP.get(name))
+        return value
+    return getattr(md, name, None)
+
+
+def _extend(table: dict, rows):
+    """Append rows (tuples ordered like the table columns) to a table."""
+    columns = list(table.values())
+    for row in rows:
+        for column, value in zip(columns, row):
+            column.append(value)
+
+
+def _bbox(md) -> tuple:
+    """Get the bounding box of a metadata: from its `bbox` or from its envelope."""
+    bbox = _value(md, "bbox")
+    if bbox and len(bbox) == 4:
+        return tuple(bbox)
+
+    # GeoJSON envelope: every position of the geometry
+    positions = list(_positions((_value(md, "envelope") or {}).get("coordinates")))
+    if not positions:
+        return None, None, None, None
+    xs, ys = [p[0] for p in positions], [p[1] for p in positions]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _positions(coordinates):
+    """Yield the positions of GeoJSON coordinates, whatever the geometry type."""
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        yield coordinates
+    else:
+        for part in coordinates or ():
+            yield from _positions(part)
+
+
+def _datetime(value: str):
+    """Parse an API date."""
+    if not value:
+        return None
+    try:
+        return IsogeoUtils.hlpr_datetimes(value)
+    except (AttributeError, TypeError, ValueError):
+        logger.debug("Unreadable date: {}".format(value))
+        return None
+
+
+def _text(value) -> str:
+    """Convert a code (EPSG can be returned as number) into a string."""
+    return None if value is None else str(value)
+
+
+def _find_module(name: str) -> bool:
+    """Check if an optional module is installed."""
+    try:
+        import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _import_module(name: str):
+    """Import an optional module, with an install hint if it's missing."""
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError(
+            "{} is required to build frames from search results. Install it with: "
+            "pip install isogeo-pysdk[analytics]".format(name)
+        )
+
+
+def _to_pandas(pandas, columns: dict, schema: tuple):
+    """Build a typed DataFrame from a table."""
+    frame = pandas.DataFrame(columns)
+    for column, kind in schema:
+        if kind == "category":
+            frame[column] = frame[column].astype("category")
+        elif kind == "datetime":
+            frame[column] = pandas.to_datetime(frame[column], utc=True)
+        elif kind == "int":
+            frame[column] = frame[column].astype("Int64")
+        elif kind == "float":
+            frame[column] = frame[column].astype("float64")
+        else:
+            frame[column] = frame[column].astype("string")
+    return frame
+
+
+def _to_arrow(pyarrow, columns: dict, schema: tuple):
+    """Build a typed Arrow table from a table."""
+    arrays = {}
+    for column, kind in schema:
+        values = columns.get(column)
+        if kind == "category":
+            arrays[column] = pyarrow.array(
+                values, type=pyarrow.string()
+            ).dictionary_encode()
+        elif kind == "datetime":
+            arrays[column] = pyarrow.array(
+                values, type=pyarrow.timestamp("us", tz="UTC")
+            )
+        elif kind == "int":
+            arrays[column] = pyarrow.array(values, type=pyarrow.int64())
+        elif kind == "float":
+            arrays[column] = pyarrow.array(values, type=pyarrow.float64())
+        else:
+            arrays[column] = pyarrow.array(values, type=pyarrow.string())
+    return pyarrow.table(arrays)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -23,40 +23,149 @@ from functools import wraps
 # ########## Classes ###############
 # ##################################
 class ApiDecorators(object):
-
-    # API Client (Requests [oAuthLib] Session)
-    api_client = None
+    """Decorators of the routes methods. They use the API client of the decorated route \
+        (`route.api_client`), so that several clients can be used in the same process.
+    """
 
     @classmethod
     def _check_bearer_validity(self, decorated_func):
         """Check API Bearer token validity and refresh it if needed.
 
         Isogeo ID delivers authentication bearers which are valid during
-        a certain time. So this decorator checks the validity of the token
-        comparing with actual datetime (UTC) and renews it if necessary.
+        a certain time. So this decorator ensures the token of the route API client
+        is not about to expire, through its token manager (see:
+        :class:`~isogeo_pysdk.token_manager.IsogeoTokenManager`) which usually renews
+        it in background.
         See: https://tools.ietf.org/html/rfc6750#section-2
 
         :param decorated_func token: original function to execute after check
         """
 
         @wraps(decorated_func)
-        def wrapper(*args, **kwargs):
-            # compare token expiration date and ask for a new one if it's expired
-            if datetime.utcnow() > datetime.utcfromtimestamp(
-                self.api_client.token.get("expires_at")
+        def wrapper(route, *args, **kwargs):
+            api_client = route.api_client
+            token_manager = getattr(api_client, "token_manager", None)
+            if token_manager is not None:
+                token_manager.ensure_valid()
+            elif datetime.utcnow() > datetime.utcfromtimestamp(
+                api_client.token.get("expires_at")
             ):
-                self.api_client.refresh_token(
-                    token_url=self.api_client.auto_refresh_url
-                )
+                # API client without token manager
+                api_client.refresh_token(token_url=api_client.auto_refresh_url)
                 logging.debug("Token was about to expire, so has been renewed.")
             else:
                 logging.debug("Token is still valid.")
 
             # let continue running the original function
-            return decorated_func(*args, **kwargs)
+            return decorated_func(route, *args, **kwargs)
 
         return wrapper
 
+    @classmethod
+    def _cached(self, family: str, skip: callable = None):
+        """Cache the response of a route method into the cache of the API client (see: \
+            :class:`~isogeo_pysdk.cache.IsogeoCache`). Errors are not cached. If the API client \
+            has no cache or arguments can't be hashed, the route is executed as usual.
+
+        :param str family: route family, used to apply TTL and invalidation
+        :param callable skip: function receiving the keyword arguments of the call and \
+            returning True if the call must not be cached (i.e. results too big to be worth it)
+
+        :Example:
+
+        .. code-block:: python
+
+            @ApiDecorators._cached("metadata")
+            @ApiDecorators._check_bearer_validity
+            def get(self, metadata_id: str, include: tuple or str = ()) -> Metadata:
+        """
+
+        def decorator(decorated_func):
+            @wraps(decorated_func)
+            def wrapper(route, *args, **kwargs):
+                cache = getattr(route.api_client, "cache", None)
+                if cache is None or (skip is not None and skip(kwargs)):
+                    return decorated_func(route, *args, **kwargs)
+
+                # build a hashable key from the call
+                key = (
+                    decorated_func.__qualname__,
+                    tuple(map(_cache_key_arg, args)),
+                    tuple((k, _cache_key_arg(v)) for k, v in sorted(kwargs.items())),
+                )
+                try:
+                    hash(key)
+                except TypeError:
+                    logging.debug(
+                        "Unhashable arguments, {} is not cached.".format(
+                            decorated_func.__qualname__
+                        )
+                    )
+                    return decorated_func(route, *args, **kwargs)
+
+                hit, value = cache.get(family, key)
+                if hit:
+                    return value
+
+                value = decorated_func(route, *args, **kwargs)
+                # do not store errors returned as (False, status_code)
+                if not (isinstance(value, tuple) and value and value[0] is False):
+                    cache.set(family, key, value)
+
+                return value
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def _invalidate_cache(self, *families: str):
+        """Invalidate the cached responses of the given families (and of the families which \
+            embed them) once the decorated writing route has been executed.
+
+        :param str families: route families to invalidate
+
+        :Example:
+
+        .. code-block:: python
+
+            @ApiDecorators._invalidate_cache("metadata")
+            @ApiDecorators._check_bearer_validity
+            def update(self, metadata: Metadata, _http_method: str = "PATCH") -> Metadata:
+        """
+
+        def decorator(decorated_func):
+            @wraps(decorated_func)
+            def wrapper(route, *args, **kwargs):
+                try:
+                    return decorated_func(route, *args, **kwargs)
+                finally:
+                    cache = getattr(route.api_client, "cache", None)
+                    if cache is not None:
+                        for family in families:
+                            cache.invalidate(family)
+
+            return wrapper
+
+        return decorator
+
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+def _cache_key_arg(arg):
+    """Make a route argument usable in a cache key: models are identified by their class and \
+        UUID, lists by a tuple of their items.
+
+    :param arg: route argument
+    """
+    if hasattr(arg, "to_dict") and hasattr(arg, "_id"):
+        return (arg.__class__.__name__, arg._id)
+    elif isinstance(arg, list):
+        return tuple(map(_cache_key_arg, arg))
+    else:
+        return arg
+
 
 # ##############################################################################
 # ##### Stand alone program ########
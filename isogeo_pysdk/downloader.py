@@ -0,0 +1,301 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Parallel download of hosted data
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from pathlib import Path
+
+# submodules
+from isogeo_pysdk.models import Link
+from isogeo_pysdk.transfer import TransferTracker, part_path
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoDownloader(object):
+    """Download many hosted data at once into a folder.
+
+    - links are deduplicated on their URL: a file attached to several metadata is \
+        downloaded once;
+    - several files are received at the same time and written by large blocks;
+    - an interrupted download is resumed from the end of its hidden `.part` file (HTTP \
+        Range), which is renamed once complete;
+    - the size of each file is checked against the link size (`Link.size`) or the size \
+        announced by the API;
+    - files already present with the expected size are skipped. The names of the \
+        downloaded files are stored into a hidden `.isogeo_downloads.json` file, so that \
+        files of a previous run are skipped without requesting them.
+
+    :param Isogeo api_client: authenticated API client
+    :param str out_dir: folder where files are stored. Created if it doesn't exist.
+    :param int max_workers: number of files downloaded at the same time
+    :param int chunk_size: size (bytes) of the blocks read from the network and written
+    :param bool resume: option to resume partial downloads. If False, they're restarted.
+    :param bool overwrite: option to download files already present
+    :param callable progress: function called after each written block with the \
+        downloaded bytes and the total expected bytes (links sizes)
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk.downloader import IsogeoDownloader
+
+        # hosted links of the metadata matching a search
+        search = isogeo.search(query="action:download", include=("links",), whole_results=True)
+        links = [
+            Link(**link)
+            for md in search.results
+            for link in md.get("links")
+            if link.get("type") == "hosted"
+        ]
+
+        downloader = IsogeoDownloader(
+            api_client=isogeo,
+            out_dir="./downloads",
+            progress=lambda done, total: print("{:.1%}".format(done / total), end="\\r"),
+        )
+        report = downloader.download(links)
+        print(report)
+        >>> {'downloaded': 412, 'resumed': 3, 'skipped': 20, 'failed': 1, 'duplicates': 57, ...}
+    """
+
+    def __init__(
+        self,
+        api_client,
+        out_dir: str,
+        max_workers: int = 8,
+        chunk_size: int = 1024 * 1024,
+        resume: bool = True,
+        overwrite: bool = False,
+        progress: callable = None,
+    ):
+        self.api_client = api_client
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.overwrite = overwrite
+
+        self.manifest_path = self.out_dir / ".isogeo_downloads.json"
+        self._manifest = {}  # files names of the downloaded links, by URL
+        self._transfer = TransferTracker(progress=progress)
+        self.stats = self._transfer.stats
+
+    def download(self, links: list) -> dict:
+        """Download the files of hosted links.
+
+        :param list links: links (Link or dict). Links which are not hosted are ignored.
+
+        :returns: report with the counts by status, the bytes received, the duration, \
+            the throughput (bytes per second) and the result of each file (see \
+            :meth:`download_link`)
+        :rtype: dict
+        """
+        # unique hosted links
+        unique_links = {}
+        ignored = 0
+        for link in links:
+            if isinstance(link, dict):
+                link = Link(**link)
+            if link.type != "hosted" or not link.url:
+                ignored += 1
+                continue
+            unique_links.setdefault(link.url, link)
+
+        self._manifest = self.load_manifest()
+        self._transfer.start(
+            expected_bytes=sum(link.size or 0 for link in unique_links.values())
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="IsogeoDownload"
+        ) as executor:
+            results = list(executor.map(self.download_link, unique_links.values()))
+        self.save_manifest()
+
+        return self._transfer.report(
+            results=results,
+            statuses=("downloaded", "resumed", "skipped", "failed"),
+            message="{downloaded} files downloaded, {resumed} resumed, {skipped} skipped "
+            "and {failed} failed ({throughput:.0f} bytes/s).",
+            duplicates=len(links) - ignored - len(unique_links),
+            ignored=ignored,
+            files=results,
+        )
+
+    def load_manifest(self) -> dict:
+        """Load the names of the files downloaded previously, by link URL.
+
+        :rtype: dict
+        """
+        if self.manifest_path.exists():
+            with self.manifest_path.open("r", encoding="utf-8") as in_json:
+                return json.load(in_json)
+        return {}
+
+    def save_manifest(self):
+        """Store the names of the downloaded files into `manifest_path`."""
+        with self._transfer.lock:
+            manifest = dict(self._manifest)
+        if not manifest:
+            return
+
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as out_json:
+            json.dump(manifest, out_json)
+        tmp_path.replace(self.manifest_path)
+
+    def download_link(self, link: Link) -> dict:
+        """Download the file of a hosted link. Errors are reported, not raised.
+
+        :param Link link: hosted link
+
+        :returns: result with the link, the status ('downloaded', 'resumed', 'skipped' or \
+            'failed'), the file path, the size and the error if failed
+        :rtype: dict
+        """
+        result = {"link": link, "status": "failed", "path": None, "size": 0}
+        path_part = part_path(self.out_dir / self._link_key(link))
+        try:
+            # file of a previous run: skipped without request
+            out_path = self._downloaded_path(link)
+            if out_path is not None:
+                result.update(status="skipped", path=out_path, size=link.size)
+                self._transfer.add_bytes(link.size, transferred=False)
+                return result
+
+            offset = path_part.stat().st_size if path_part.exists() else 0
+            if offset and not self.resume:
+                path_part.unlink()
+                offset = 0
+
+            downloaded = self.api_client.metadata.links.download_hosted(
+                link=link, offset=offset
+            )
+            if offset and len(downloaded) == 2:
+                # partial file not matching the hosted one anymore: restarted
+                logger.debug("Resume refused ({}): restarting.".format(downloaded[1]))
+                path_part.unlink()
+                offset = 0
+                downloaded = self.api_client.metadata.links.download_hosted(link=link)
+            if len(downloaded) == 2:
+                result["error"] = "API error: {}".format(downloaded[1])
+                return result
+
+            response, filename, _ = downloaded
+            with response:
+                out_path = result["path"] = self.out_dir / self._transfer.claim_name(
+                    filename, owner=link.url, discriminator=self._link_key(link)
+                )
+                if response.status_code != 206:
+                    offset = 0
+                expected = link.size
+                if (
+                    expected is None
+                    and response.headers.get("Content-Length")
+                    and not response.headers.get("Content-Encoding")
+                ):
+                    expected = offset + int(response.headers.get("Content-Length"))
+
+                if (
+                    not self.overwrite
+                    and out_path.exists()
+                    and out_path.stat().st_size == expected
+                ):
+                    result.update(status="skipped", size=expected)
+                    self._transfer.add_bytes(expected - offset, transferred=False)
+                    self._remember(link, out_path)
+                    return result
+
+                self._transfer.add_bytes(offset, transferred=False)
+                with path_part.open("ab" if offset else "wb") as part_file:
+                    for block in response.iter_content(self.chunk_size):
+                        part_file.write(block)
+                        self._transfer.add_bytes(len(block))
+
+            # integrity
+            size = result["size"] = path_part.stat().st_size
+            if expected is not None and size != expected:
+                result["error"] = "Size mismatch: {} bytes instead of {}".format(
+                    size, expected
+                )
+                if size > expected:
+                    path_part.unlink()
+                return result
+
+            path_part.replace(out_path)
+            self._remember(link, out_path)
+            result["status"] = "resumed" if offset else "downloaded"
+        except Exception as err:
+            # partial file is kept to be resumed
+            logger.error("Download of {} failed: {}".format(link.url, err))
+            result["error"] = str(err)
+
+        return result
+
+    @staticmethod
+    def _link_key(link: Link) -> str:
+        """Identifier of a link: its UUID or a hash of its URL. Names its `.part` file and \
+            tells apart files with the same name.
+
+        :rtype: str
+        """
+        return link._id or sha1(link.url.encode("utf-8")).hexdigest()
+
+    def _downloaded_path(self, link: Link) -> Path:
+        """Get the path of the file of a link downloaded by a previous run, if it's still \
+            there with the link size.
+
+        :param Link link: hosted link
+
+        :returns: path of the file, None if it has to be requested
+        :rtype: Path
+        """
+        filename = self._manifest.get(link.url)
+        if self.overwrite or filename is None or link.size is None:
+            return None
+
+        out_path = self.out_dir / filename
+        if not out_path.is_file() or out_path.stat().st_size != link.size:
+            return None
+        claimed = self._transfer.claim_name(
+            filename, owner=link.url, discriminator=self._link_key(link)
+        )
+        return out_path if claimed == filename else None
+
+    def _remember(self, link: Link, out_path: Path):
+        """Store the name of the file of a link into the manifest.
+
+        :param Link link: hosted link
+        :param Path out_path: path of its file
+        """
+        with self._transfer.lock:
+            self._manifest[link.url] = out_path.name
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,404 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Parallel and incremental export of metadata into XML ISO 19139
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+import logging
+import os
+import tarfile
+import zipfile
+from calendar import timegm
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from time import gmtime
+
+# submodules
+from isogeo_pysdk.models import Metadata
+from isogeo_pysdk.transfer import TransferTracker, open_part, part_path
+from isogeo_pysdk.utils import IsogeoUtils
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# archives formats, by file extension
+_archive_modes = {
+    ".zip": "zip",
+    ".tar": "w",
+    ".tar.gz": "w:gz",
+    ".tgz": "w:gz",
+    ".tar.bz2": "w:bz2",
+    ".tar.xz": "w:xz",
+}
+
+# lowest date of a zip entry: 1980-01-01
+_zip_epoch = 315532800
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoXmlExporter(object):
+    """Export many metadata into XML ISO 19139 at once, into a folder or an archive.
+
+    - several metadata are exported at the same time, each XML being read by blocks;
+    - into a folder, each XML is streamed into a hidden `.part` file, renamed once \
+        complete;
+    - into an archive (`.zip`, `.tar`, `.tar.gz`, `.tgz`, `.tar.bz2`, `.tar.xz`), each XML is \
+        added as soon as it's received into a hidden `.part` archive, which replaces the \
+        previous one once the export is over;
+    - with a `state_path`, the `_modified` and the file name of each exported metadata are \
+        stored: metadata which didn't change since the previous export are skipped. Into an archive, the \
+        XML of the previous archive which were not exported again are copied into the \
+        new one, so that it always holds the whole export.
+
+    :param Isogeo api_client: authenticated API client
+    :param str output: folder, or archive path, where XML files are stored
+    :param str state_path: path to the JSON file storing the state of the previous \
+        export. If None, every metadata is exported.
+    :param int max_workers: number of metadata exported at the same time
+    :param int chunk_size: size (bytes) of the blocks read from the network
+    :param callable filename: function returning the file name of a metadata. Defaults \
+        to its UUID: `{_id}.xml`.
+    :param callable progress: function called after each metadata with the count of \
+        processed metadata and the total
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import IsogeoXmlExporter
+
+        # every metadata of the workgroup, only with the fields required to export
+        search = isogeo.search(group=WORKGROUP_UUID, include=(), whole_results=True)
+
+        exporter = IsogeoXmlExporter(
+            api_client=isogeo,
+            output="./export/iso19139",  # or "./export/iso19139.zip"
+            state_path="./export/iso19139_state.json",
+        )
+        report = exporter.export(search.results)
+        print(report)
+        >>> {'exported': 1980, 'skipped': 0, 'failed': 2, 'bytes': 61234567, ...}
+
+        # later: only the metadata modified since
+        report = exporter.export(isogeo.search(include=(), whole_results=True).results)
+        >>> {'exported': 12, 'skipped': 1970, 'failed': 0, ...}
+    """
+
+    def __init__(
+        self,
+        api_client,
+        output: str,
+        state_path: str = None,
+        max_workers: int = 8,
+        chunk_size: int = 64 * 1024,
+        filename: callable = None,
+        progress: callable = None,
+    ):
+        self.api_client = api_client
+        self.output = Path(output)
+        self.state_path = Path(state_path) if state_path else None
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.filename = filename or (lambda md: "{}.xml".format(md._id))
+
+        # output format
+        self.archive_mode = next(
+            (
+                mode
+                for ext, mode in _archive_modes.items()
+                if self.output.name.lower().endswith(ext)
+            ),
+            None,
+        )
+
+        self._archive = None
+        self._written = set()  # names of the XML added to the archive during an export
+        self._transfer = TransferTracker(progress=progress, unit="items")
+        self._lock = self._transfer.lock
+        self.stats = self._transfer.stats
+
+        # load previous state
+        self.state = self.load_state()
+
+    # -- STATE -------------------------------------------------------------------------
+    def load_state(self) -> dict:
+        """Load the state of the metadata exported previously, by UUID: their `_modified` \
+            and the name of their XML file.
+
+        :rtype: dict
+        """
+        if self.state_path and self.state_path.exists():
+            with self.state_path.open("r", encoding="utf-8") as in_json:
+                return json.load(in_json)
+        return {}
+
+    def save_state(self):
+        """Store the export state into `state_path`, if set."""
+        if not self.state_path:
+            return
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as out_json:
+            json.dump(self.state, out_json)
+        tmp_path.replace(self.state_path)
+
+    # -- EXPORT ------------------------------------------------------------------------
+    def export(self, metadatas: list) -> dict:
+        """Export metadata into XML ISO 19139.
+
+        :param list metadatas: metadata (Metadata or dict, as returned by a search). \
+            `_modified` is required to skip unchanged metadata.
+
+        :returns: report with the counts of exported, skipped and failed metadata, the \
+            bytes received, the duration, the throughput (bytes per second), the errors by \
+            metadata UUID and the result of each metadata (see :meth:`export_metadata`)
+        :rtype: dict
+        """
+        # unique metadata
+        metadatas = list(metadatas)
+        unique_mds = {}
+        for md in metadatas:
+            if isinstance(md, dict):
+                md = Metadata.clean_attributes(md)
+            unique_mds.setdefault(md._id, md)
+
+        results, to_export = [], []
+        for md in unique_mds.values():
+            name = self._previous_name(md)
+            if name is not None:
+                results.append(
+                    {"metadata": md, "status": "skipped", "name": name, "size": 0}
+                )
+            else:
+                to_export.append(md)
+
+        self._written.clear()
+        self._transfer.start(total=len(unique_mds), processed=len(results))
+        # names of the skipped metadata are kept for them
+        for result in results:
+            self._transfer.claim_name(
+                result.get("name"),
+                owner=result["metadata"]._id,
+                discriminator=result["metadata"]._id,
+            )
+        self._open_output()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="IsogeoXmlExport"
+            ) as executor:
+                results.extend(executor.map(self.export_metadata, to_export))
+        finally:
+            self._close_output()
+
+        # store the new state
+        for result in results:
+            if result.get("status") == "exported":
+                self.state[result["metadata"]._id] = {
+                    "_modified": result["metadata"]._modified,
+                    "name": result.get("name"),
+                }
+        self.save_state()
+
+        return self._transfer.report(
+            results=results,
+            statuses=("exported", "skipped", "failed"),
+            message="{exported} metadata exported to XML, {skipped} skipped and {failed} "
+            "failed ({throughput:.0f} bytes/s).",
+            duplicates=len(metadatas) - len(unique_mds),
+            errors={
+                r["metadata"]._id: r.get("error")
+                for r in results
+                if r.get("status") == "failed"
+            },
+            records=results,
+        )
+
+    def export_metadata(self, metadata: Metadata) -> dict:
+        """Export a metadata into the output. Errors are reported, not raised.
+
+        :param Metadata metadata: metadata to export
+
+        :returns: result with the metadata, the status ('exported' or 'failed'), the name \
+            of the XML file, its size and the error if failed
+        :rtype: dict
+        """
+        result = {"metadata": metadata, "status": "failed", "name": None, "size": 0}
+        try:
+            response = self.api_client.metadata.download_xml(metadata)
+            if isinstance(response, tuple):
+                result["error"] = "API error: {}".format(response[1])
+                return result
+
+            name = result["name"] = self._transfer.claim_name(
+                self.filename(metadata),
+                owner=metadata._id,
+                discriminator=metadata._id,
+            )
+            with response:
+                if self.archive_mode:
+                    result["size"] = self._add_to_archive(name, metadata, response)
+                else:
+                    result["size"] = self._write_file(name, metadata, response)
+            result["status"] = "exported"
+        except Exception as err:
+            logger.error("Export of {} failed: {}".format(metadata._id, err))
+            result["error"] = str(err)
+        finally:
+            self._transfer.add_processed()
+
+        return result
+
+    # -- OUTPUT ------------------------------------------------------------------------
+    def _previous_name(self, metadata: Metadata) -> str:
+        """Get the name of the XML file of a metadata which didn't change since the \
+            previous export.
+
+        :param Metadata metadata: metadata to export
+
+        :returns: name of the XML file written by the previous export, None if the metadata \
+            has to be exported
+        :rtype: str
+        """
+        previous = self.state.get(metadata._id)
+        if metadata._modified is None or not isinstance(previous, dict):
+            return None
+        if previous.get("_modified") != metadata._modified:
+            return None
+        # into a folder, the file must still be there
+        if not self.archive_mode and not (self.output / previous.get("name")).exists():
+            return None
+        return previous.get("name")
+
+    def _open_output(self):
+        """Create the output folder or archive."""
+        if not self.archive_mode:
+            self.output.mkdir(parents=True, exist_ok=True)
+            return
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        if self.archive_mode == "zip":
+            self._archive = zipfile.ZipFile(
+                str(part_path(self.output)), mode="w", compression=zipfile.ZIP_DEFLATED
+            )
+        else:
+            self._archive = tarfile.open(
+                str(part_path(self.output)), mode=self.archive_mode
+            )
+
+    def _close_output(self):
+        """Complete the archive, if any, with the XML of the previous one which were not \
+            exported again (incremental export), then replace the previous one."""
+        if self._archive is None:
+            return
+
+        try:
+            if self.state_path and self.output.exists():
+                copied = self._copy_previous_archive()
+                logger.debug("{} XML copied from the previous archive.".format(copied))
+        finally:
+            self._archive.close()
+            self._archive = None
+        part_path(self.output).replace(self.output)
+
+    def _copy_previous_archive(self) -> int:
+        """Copy the XML of the previous archive which were not written by this export.
+
+        :returns: count of copied XML
+        :rtype: int
+        """
+        copied = 0
+        if self.archive_mode == "zip":
+            with zipfile.ZipFile(str(self.output), mode="r") as previous:
+                for info in previous.infolist():
+                    if info.filename not in self._written:
+                        self._archive.writestr(info, previous.read(info))
+                        copied += 1
+        else:
+            with tarfile.open(str(self.output), mode="r:*") as previous:
+                for member in previous:
+                    if member.isfile() and member.name not in self._written:
+                        self._archive.addfile(member, previous.extractfile(member))
+                        copied += 1
+        return copied
+
+    def _write_file(self, name: str, metadata: Metadata, response) -> int:
+        """Stream an XML into a file of the output folder.
+
+        :returns: size of the file
+        :rtype: int
+        """
+        out_path = self.output / name
+        size = 0
+        with open_part(out_path) as part_file:
+            for block in response.iter_content(self.chunk_size):
+                part_file.write(block)
+                size += len(block)
+        self._transfer.add_bytes(size)
+
+        timestamp = self._timestamp(metadata)
+        if timestamp is not None:
+            os.utime(str(out_path), (timestamp, timestamp))
+        return size
+
+    def _add_to_archive(self, name: str, metadata: Metadata, response) -> int:
+        """Add an XML to the output archive. It's received by the worker then written \
+            at once: an archive is written by one thread at a time.
+
+        :returns: size of the XML
+        :rtype: int
+        """
+        content = b"".join(response.iter_content(self.chunk_size))
+        self._transfer.add_bytes(len(content))
+        timestamp = self._timestamp(metadata)
+
+        if self.archive_mode == "zip":
+            info = zipfile.ZipInfo(
+                name,
+                date_time=gmtime(max(timestamp or 0, _zip_epoch))[:6],
+            )
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with self._lock:
+                self._archive.writestr(info, content)
+                self._written.add(name)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mtime = timestamp or 0
+            with self._lock:
+                self._archive.addfile(info, BytesIO(content))
+                self._written.add(name)
+        return len(content)
+
+    @staticmethod
+    def _timestamp(metadata: Metadata) -> int:
+        """Get the modification date of a metadata as a POSIX timestamp.
+
+        :rtype: int
+        """
+        try:
+            return timegm(IsogeoUtils.hlpr_datetimes(metadata._modified).timetuple())
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
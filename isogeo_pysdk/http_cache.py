@@ -0,0 +1,430 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Persistent HTTP cache, stored on disk (SQLite), with conditional requests.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from hashlib import sha256
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# 3rd party
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# to extract the metadata UUID from a resource URL
+_regex_resource_id = re.compile(r"/resources/([0-9a-fA-F]{32})")
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoHttpCache(object):
+    """Persistent cache of API responses stored in a SQLite database, reused from one run to \
+        another. Used by :class:`IsogeoCachingAdapter`, mounted on the API client when the \
+        `http_cache` option is set.
+
+    Each response is stored with its validators (ETag, Last-Modified) and, for metadata, \
+        with its `_modified` stamp:
+
+    - when the API returns validators, next requests are conditional (`If-None-Match`, \
+        `If-Modified-Since`) and a `304 Not Modified` answer is served from the cache;
+    - otherwise, stamps retrieved by a cheap search can be compared to the stored ones with \
+        :meth:`revalidate_stamps`: unchanged metadata are then served from the cache without \
+        any request during `stamp_ttl` seconds, changed ones are dropped.
+
+    :param str path: path to the SQLite database file. Parent folders are created if needed.
+    :param int stamp_ttl: duration (seconds) during which a metadata validated by \
+        :meth:`revalidate_stamps` is served without request
+    :param int max_age: entries stored for longer (seconds) are removed by :meth:`purge`
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import Isogeo, IsogeoHttpCache
+
+        isogeo = Isogeo(
+            client_id=environ.get("ISOGEO_API_GROUP_CLIENT_ID"),
+            client_secret=environ.get("ISOGEO_API_GROUP_CLIENT_SECRET"),
+            auth_mode="group",
+            auto_refresh_url="{}/oauth/token".format(environ.get("ISOGEO_ID_URL")),
+            platform=environ.get("ISOGEO_PLATFORM", "qa"),
+            http_cache="~/.cache/isogeo/http_cache.sqlite",
+        )
+        isogeo.connect()
+
+        # cheap search to get modification stamps
+        search = isogeo.search(whole_results=1, include=())
+        print(isogeo.http_cache.revalidate_stamps(search.results))
+        >>> {'fresh': 5800, 'stale': 12}
+
+        # unchanged metadata are read from disk
+        for md in search.results:
+            metadata = isogeo.metadata.get(md.get("_id"), include="all")
+    """
+
+    def __init__(self, path: str, stamp_ttl: int = 3600, max_age: int = 2592000):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.stamp_ttl = stamp_ttl
+        self.max_age = max_age
+
+        # statistics
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+
+        # connection shared between threads, serialized by a lock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT, body BLOB, "
+                "etag TEXT, last_modified TEXT, md_id TEXT, md_modified TEXT, "
+                "stored_at REAL, checked_at REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_md_id ON responses (md_id)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return "{}(path={})".format(self.__class__.__name__, self.path)
+
+    # -- STORAGE -----------------------------------------------------------------------
+    @staticmethod
+    def make_key(url: str, scope: str = "") -> str:
+        """Build the storage key of a request. The scope (client ID and user) is part of the \
+            key because responses depend on the authenticated client.
+
+        :param str url: full request URL, with query parameters
+        :param str scope: authentication scope
+
+        :rtype: str
+        """
+        return sha256("{}|{}".format(scope, url).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict:
+        """Get a stored response.
+
+        :param str key: storage key. See: :meth:`make_key`
+
+        :returns: stored response as dict or None
+        :rtype: dict
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, body, etag, last_modified, md_id, "
+                "md_modified, stored_at, checked_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        return dict(
+            zip(
+                (
+                    "url",
+                    "status",
+                    "headers",
+                    "body",
+                    "etag",
+                    "last_modified",
+                    "md_id",
+                    "md_modified",
+                    "stored_at",
+                    "checked_at",
+                ),
+                row,
+            )
+        )
+
+    def set(self, key: str, response: Response):
+        """Store a response with its validators and, for metadata, its modification stamp.
+
+        :param str key: storage key. See: :meth:`make_key`
+        :param Response response: response to store. Its content must be already read.
+        """
+        # content is stored decoded
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower()
+            not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+
+        # metadata stamp
+        md_id = md_modified = None
+        match = _regex_resource_id.search(urlsplit(response.url).path)
+        if match:
+            md_id = match.group(1)
+            try:
+                body = response.json()
+                if isinstance(body, dict):
+                    md_modified = body.get("_modified")
+            except ValueError:
+                pass
+
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(headers),
+                    response.content,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    md_id,
+                    md_modified,
+                    time.time(),
+                    None,
+                ),
+            )
+        self.count("stored")
+
+    def count(self, counter: str):
+        """Increment a statistics counter. Thread-safe: the adapter is used by several threads.
+
+        :param str counter: counter name. See: `stats`
+        """
+        with self._lock:
+            self.stats[counter] += 1
+
+    def touch(self, key: str):
+        """Reset the storage date of a response confirmed by a `304 Not Modified`: its age \
+            starts again from now, so it's kept by :meth:`purge` like a response just stored. \
+            It's not marked as validated by stamps (see: :meth:`is_stamp_fresh`).
+
+        :param str key: storage key
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+    def is_stamp_fresh(self, entry: dict) -> bool:
+        """Check if a stored metadata has been validated by :meth:`revalidate_stamps` recently.
+
+        :param dict entry: stored response. See: :meth:`get`
+
+        :rtype: bool
+        """
+        return bool(
+            entry.get("checked_at")
+            and time.time() - entry.get("checked_at") < self.stamp_ttl
+        )
+
+    # -- INVALIDATION ------------------------------------------------------------------
+    def revalidate_stamps(self, stamps) -> dict:
+        """Compare stored metadata with their modification stamps (`_modified`), typically \
+            retrieved by a search without subresources. Unchanged metadata are considered fresh \
+            during `stamp_ttl`, changed ones are removed. Metadata missing from stamps are left \
+            untouched.
+
+        :param stamps: dict of {metadata UUID: _modified} or iterable of metadata (dicts or \
+            Metadata objects) with `_id` and `_modified`
+
+        :returns: count of fresh and stale metadata
+        :rtype: dict
+        """
+        # normalize stamps
+        if not isinstance(stamps, dict):
+            stamps = {
+                (md.get("_id") if isinstance(md, dict) else md._id): (
+                    md.get("_modified") if isinstance(md, dict) else md._modified
+                )
+                for md in stamps
+            }
+
+        now = time.time()
+        fresh = stale = 0
+        with self._lock, self._db:
+            rows = self._db.execute(
+                "SELECT DISTINCT md_id, md_modified FROM responses "
+                "WHERE md_modified IS NOT NULL"
+            ).fetchall()
+            for md_id, md_modified in rows:
+                if md_id not in stamps:
+                    continue
+                elif stamps.get(md_id) == md_modified:
+                    self._db.execute(
+                        "UPDATE responses SET checked_at = ? WHERE md_id = ?",
+                        (now, md_id),
+                    )
+                    fresh += 1
+                else:
+                    self._db.execute("DELETE FROM responses WHERE md_id = ?", (md_id,))
+                    stale += 1
+
+        logger.debug(
+            "HTTP cache revalidated from stamps: {} fresh, {} stale.".format(
+                fresh, stale
+            )
+        )
+        return {"fresh": fresh, "stale": stale}
+
+    def invalidate_url(self, url: str) -> int:
+        """Remove stored responses related to a URL: every response about the same metadata \
+            if it's a resource URL, or every response starting with the same path otherwise.
+
+        :param str url: URL modified by a writing request
+
+        :returns: count of removed responses
+        :rtype: int
+        """
+        parts = urlsplit(url)
+        match = _regex_resource_id.search(parts.path)
+        with self._lock, self._db:
+            if match:
+                cursor = self._db.execute(
+                    "DELETE FROM responses WHERE md_id = ?", (match.group(1),)
+                )
+            else:
+                cursor = self._db.execute(
+                    "DELETE FROM responses WHERE url LIKE ?",
+                    ("{}://{}{}%".format(parts.scheme, parts.netloc, parts.path),),
+                )
+        return cursor.rowcount
+
+    def purge(self, older_than: int = None) -> int:
+        """Remove responses stored for a long time.
+
+        :param int older_than: age in seconds. Defaults to `max_age`.
+
+        :returns: count of removed responses
+        :rtype: int
+        """
+        limit = time.time() - (older_than if older_than is not None else self.max_age)
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE stored_at < ?", (limit,)
+            )
+        return cursor.rowcount
+
+    def clear(self):
+        """Remove every stored response."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+class IsogeoCachingAdapter(HTTPAdapter):
+    """Transport adapter storing GET responses into an :class:`IsogeoHttpCache` and \
+        revalidating them with conditional requests. Writing requests (POST, PUT, PATCH, \
+        DELETE) invalidate the related stored responses.
+
+    Streamed requests (hosted data downloads...) are never cached.
+
+    :param IsogeoHttpCache cache: persistent cache
+    :param str scope: authentication scope (client ID and user) to separate stored responses
+    """
+
+    def __init__(self, cache: IsogeoHttpCache, scope: str = "", **kwargs):
+        self.cache = cache
+        self.scope = scope
+        super(IsogeoCachingAdapter, self).__init__(**kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        """Send a request, using the persistent cache for GET requests."""
+        # writing requests invalidate the cache
+        if request.method != "GET":
+            response = super(IsogeoCachingAdapter, self).send(
+                request, stream=stream, **kwargs
+            )
+            if response.status_code < 400:
+                self.cache.invalidate_url(request.url)
+            return response
+
+        # streamed or partial requests are not cached
+        if stream or "Range" in request.headers:
+            return super(IsogeoCachingAdapter, self).send(
+                request, stream=stream, **kwargs
+            )
+
+        key = self.cache.make_key(request.url, self.scope)
+        entry = self.cache.get(key)
+
+        # metadata validated by stamps are served without request
+        if entry and self.cache.is_stamp_fresh(entry):
+            self.cache.count("hits")
+            return self._build_cached_response(request, entry)
+
+        # conditional request
+        if entry and entry.get("etag"):
+            request.headers["If-None-Match"] = entry.get("etag")
+        if entry and entry.get("last_modified"):
+            request.headers["If-Modified-Since"] = entry.get("last_modified")
+
+        response = super(IsogeoCachingAdapter, self).send(
+            request, stream=stream, **kwargs
+        )
+
+        if response.status_code == 304 and entry:
+            response.close()
+            self.cache.touch(key)
+            self.cache.count("revalidated")
+            return self._build_cached_response(request, entry)
+
+        self.cache.count("misses")
+        if response.status_code == 200:
+            self.cache.set(key, response)
+
+        return response
+
+    def _build_cached_response(self, request, entry: dict) -> Response:
+        """Build a response from a stored one.
+
+        :param PreparedRequest request: sent request
+        :param dict entry: stored response. See: :meth:`IsogeoHttpCache.get`
+
+        :rtype: Response
+        """
+        response = Response()
+        response.status_code = entry.get("status")
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(json.loads(entry.get("headers")))
+        response._content = entry.get("body")
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
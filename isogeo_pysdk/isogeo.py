@@ -13,10 +13,14 @@ Author: Julien Moura (@geojulien) for @Isogeo
 
 # Standard library
 import logging
+import threading
+from concurrent.futures import Future
+from timeit import default_timer
 
 # 3rd party library
 from oauthlib.oauth2 import BackendApplicationClient, LegacyApplicationClient
 from requests.adapters import HTTPAdapter
+from requests.models import Response
 from requests_oauthlib import OAuth2Session
 from urllib3.util import Retry
 
@@ -24,8 +28,16 @@ from urllib3.util import Retry
 from isogeo_pysdk import api
 from isogeo_pysdk.__about__ import __version__ as version
 from isogeo_pysdk.api_hooks import IsogeoHooks
+from isogeo_pysdk.batch import IsogeoBatch
+from isogeo_pysdk.cache import IsogeoCache
+from isogeo_pysdk.cassette import IsogeoCassette, IsogeoCassetteAdapter
 from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.http_cache import IsogeoCachingAdapter, IsogeoHttpCache
+from isogeo_pysdk.metrics import IsogeoMetrics
+from isogeo_pysdk.middlewares import IsogeoMiddleware
 from isogeo_pysdk.models import Application, User
+from isogeo_pysdk.scheduler import IsogeoScheduler
+from isogeo_pysdk.token_manager import IsogeoTokenManager
 from isogeo_pysdk.utils import IsogeoUtils
 
 # ##############################################################################
@@ -34,13 +46,45 @@ from isogeo_pysdk.utils import IsogeoUtils
 
 logger = logging.getLogger(__name__)
 checker = IsogeoChecker()
-utils = IsogeoUtils()
+
+# connectivity checks shared by the clients of the process, by proxies settings
+_connection_checks = {}
+_connection_checks_lock = threading.Lock()
 
 # #############################################################################
 # ########## Classes ###############
 # ##################################
 
 
+class LazyRoute(object):
+    """Route of the client built on first access then stored into the client attributes, \
+        so that creating a client does not build every route.
+
+    :param str factory: name of the route class in :mod:`isogeo_pysdk.api` or function \
+        taking the client and returning the route
+    """
+
+    def __init__(self, factory: str or callable):
+        self.factory = factory
+        self.name = None
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        with self._lock:
+            route = instance.__dict__.get(self.name)
+            if route is None:
+                if isinstance(self.factory, str):
+                    # route modules are imported on first access too
+                    self.factory = getattr(api, self.factory)
+                route = instance.__dict__[self.name] = self.factory(instance)
+        return route
+
+
 class Isogeo(OAuth2Session):
     """Main class in Isogeo API Python wrapper. Manage authentication and requests to the REST API.
     Inherits from :class:`requests_oauthlib.OAuth2Session`.
@@ -67,6 +111,35 @@ class Isogeo(OAuth2Session):
         See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
     :param int pool_maxsize: custom the maximum number of connections to save in the pool.\
         See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
+    :param IsogeoCache cache: cache used to store routes responses. Pass True (default) to use \
+        a cache with default settings, False to disable it or a custom :class:`~isogeo_pysdk.cache.IsogeoCache`.
+    :param IsogeoHttpCache http_cache: persistent HTTP cache, reused from one run to another. \
+        Pass a path to a SQLite file or a :class:`~isogeo_pysdk.http_cache.IsogeoHttpCache`. \
+        Disabled by default.
+    :param str json_decoder: decoder used for JSON responses: "auto" (default) picks the \
+        fastest installed one (orjson, ujson, then the standard library). Also accepts \
+        "orjson", "ujson", "json" or a function taking bytes.
+    :param bool json_stream: option to read search pages from the raw stream in one call \
+        instead of by chunks, saving a copy of the body. Pages are still loaded whole \
+        before being decoded. Streamed responses are not stored into the `http_cache`.
+    :param list middlewares: :class:`~isogeo_pysdk.middlewares.IsogeoMiddleware` executed \
+        around every request. See :meth:`add_middleware`.
+    :param IsogeoMetrics metrics: pass True to record metrics about requests (latency, \
+        bytes, cache hits...) into `metrics`, or a custom \
+        :class:`~isogeo_pysdk.metrics.IsogeoMetrics`. Disabled by default.
+    :param IsogeoCassette cassette: file where the exchanges with the API are recorded to \
+        be replayed without network. Pass a path to replay an existing cassette or a \
+        :class:`~isogeo_pysdk.cassette.IsogeoCassette` to choose the mode. Disabled by default.
+    :param bool check_connection: option to check the internet connection in background \
+        when the client is created. :meth:`connect` raises an `EnvironmentError` if it failed. \
+        Disabled by default. See :meth:`check_connection`.
+    :param int token_refresh_margin: delay (seconds) before the token expiration from which \
+        it is renewed in background. Defaults to 60. See \
+        :class:`~isogeo_pysdk.token_manager.IsogeoTokenManager`.
+    :param IsogeoScheduler scheduler: budget shared by the requests of the client: rate \
+        limit, adaptive concurrency and waiting on `429 Too Many Requests`. Pass True \
+        (default) to use a scheduler with default settings, bounded by `pool_maxsize`, \
+        False to disable it or a custom :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`.
 
     :returns: authenticated requests Session you can use to send requests to the API.
     :rtype: requests_oauthlib.OAuth2Session
@@ -130,6 +203,36 @@ class Isogeo(OAuth2Session):
         "guess": {},
     }
 
+    # -- ROUTES ---------------------------------------------------------------
+    # built on first access
+    about = LazyRoute(
+        lambda isogeo: api.ApiAbout(platform=isogeo.platform, proxies=isogeo.proxies)
+    )
+    account = LazyRoute("ApiAccount")
+    application = LazyRoute("ApiApplication")
+    catalog = LazyRoute("ApiCatalog")
+    contact = LazyRoute("ApiContact")
+    coordinate_system = LazyRoute("ApiCoordinateSystem")
+    datasource = LazyRoute("ApiDatasource")
+    directive = LazyRoute("ApiDirective")
+    formats = LazyRoute("ApiFormat")
+    keyword = LazyRoute("ApiKeyword")
+    invitation = LazyRoute("ApiInvitation")
+    license = LazyRoute("ApiLicense")
+    metadata = LazyRoute("ApiMetadata")
+    search = LazyRoute("ApiSearch")
+    services = LazyRoute("ApiService")
+    share = LazyRoute("ApiShare")
+    specification = LazyRoute("ApiSpecification")
+    thesaurus = LazyRoute("ApiThesaurus")
+    user = LazyRoute("ApiUser")
+    workgroup = LazyRoute("ApiWorkgroup")
+
+    @property
+    def srs(self) -> "api.ApiCoordinateSystem":
+        """Alias of `coordinate_system`."""
+        return self.coordinate_system
+
     def __init__(
         self,
         # custom
@@ -143,6 +246,16 @@ class Isogeo(OAuth2Session):
         max_retries: int = 2,
         pool_connections: int = 20,
         pool_maxsize: int = 50,
+        cache: IsogeoCache or bool = True,
+        http_cache: IsogeoHttpCache or str = None,
+        json_decoder: str or callable = "auto",
+        json_stream: bool = False,
+        middlewares: list = None,
+        metrics: IsogeoMetrics or bool = False,
+        cassette: IsogeoCassette or str = None,
+        check_connection: bool = False,
+        token_refresh_margin: int = 60,
+        scheduler: IsogeoScheduler or bool = True,
         # additional
         **kwargs,
     ):
@@ -150,8 +263,41 @@ class Isogeo(OAuth2Session):
         self.app_name = app_name  # custom settings
         client_id = kwargs.get("client_id")
         self.client_secret = client_secret
-        self.custom_hooks = IsogeoHooks()  # custom hooks
+        self.custom_hooks = IsogeoHooks(json_decoder=json_decoder)  # custom hooks
+        self.json_stream = json_stream  # read search pages from the raw stream
+        self.middlewares = list(middlewares or [])  # executed around every request
         self.timeout = timeout  # default timeout
+        self._batches = threading.local()  # batch of association calls, by thread
+
+        # routes responses cache
+        if isinstance(cache, IsogeoCache):
+            self.cache = cache
+        elif cache:
+            self.cache = IsogeoCache()
+        else:
+            self.cache = None
+
+        # persistent HTTP cache
+        if http_cache is None or isinstance(http_cache, IsogeoHttpCache):
+            self.http_cache = http_cache
+        else:
+            self.http_cache = IsogeoHttpCache(path=http_cache)
+
+        # record/replay of the exchanges
+        if cassette is None or isinstance(cassette, IsogeoCassette):
+            self.cassette = cassette
+        else:
+            self.cassette = IsogeoCassette(path=cassette)
+
+        # instrumentation, as close as possible to the network
+        if isinstance(metrics, IsogeoMetrics):
+            self.metrics = metrics
+        elif metrics:
+            self.metrics = IsogeoMetrics(cache=self.cache, http_cache=self.http_cache)
+        else:
+            self.metrics = None
+        if self.metrics is not None:
+            self.middlewares.append(self.metrics)
 
         # auth mode
         if auth_mode and auth_mode not in self.AUTH_MODES:
@@ -186,12 +332,6 @@ class Isogeo(OAuth2Session):
         self._wg_shares = {}  # workgroup shares
         self._wg_specifications_names = {}  # workgroup specifications by names
 
-        # checking internet connection
-        if not checker.check_internet_connection():
-            raise EnvironmentError("Internet connection issue.")
-        else:
-            pass
-
         # testing parameters
         if not checker.check_is_uuid(client_id.split("-")[-1]):
             logger.error("Client ID structure length issue: it should be 64 chars.")
@@ -206,6 +346,9 @@ class Isogeo(OAuth2Session):
         else:
             pass
 
+        # URLs builder, specific to this client: platform and language
+        self.utils = IsogeoUtils()
+
         # platform to request
         (
             self.platform,
@@ -215,7 +358,7 @@ class Isogeo(OAuth2Session):
             self.mng_url,
             self.oc_url,
             self.ssl,
-        ) = utils.set_base_url(platform)
+        ) = self.utils.set_base_url(platform)
 
         # max retries
         if max_retries > 0:
@@ -227,6 +370,16 @@ class Isogeo(OAuth2Session):
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
 
+        # budget shared by the requests sent in parallel
+        if isinstance(scheduler, IsogeoScheduler):
+            self.scheduler = scheduler
+        elif scheduler:
+            self.scheduler = IsogeoScheduler(
+                concurrency=min(10, pool_maxsize), max_concurrency=pool_maxsize
+            )
+        else:
+            self.scheduler = None
+
         # setting language
         if lang.lower() not in ("fr", "en"):
             logger.warning(
@@ -235,7 +388,7 @@ class Isogeo(OAuth2Session):
             self.lang = "en"
         else:
             self.lang = lang.lower()
-        utils.set_lang_and_locale(self.lang)
+        self.utils.set_lang_and_locale(self.lang)
 
         # handling proxy parameters
         # see: http://docs.python-requests.org/en/latest/user/advanced/#proxies
@@ -255,6 +408,7 @@ class Isogeo(OAuth2Session):
             self.proxies = {}
             logger.debug("No proxy set. Use default configuration.")
             pass
+        self.utils.proxies = self.proxies
 
         # set client
         self.auto_refresh_kwargs = {
@@ -271,27 +425,14 @@ class Isogeo(OAuth2Session):
                 "Mode {} is not implemented yet.".format(auth_mode)
             )
 
-        # load routes as subclass
-        self.about = api.ApiAbout(platform=self.platform, proxies=self.proxies)
-        self.account = api.ApiAccount(self)
-        self.application = api.ApiApplication(self)
-        self.catalog = api.ApiCatalog(self)
-        self.contact = api.ApiContact(self)
-        self.coordinate_system = self.srs = api.ApiCoordinateSystem(self)
-        self.datasource = api.ApiDatasource(self)
-        self.directive = api.ApiDirective(self)
-        self.formats = api.ApiFormat(self)
-        self.keyword = api.ApiKeyword(self)
-        self.invitation = api.ApiInvitation(self)
-        self.license = api.ApiLicense(self)
-        self.metadata = api.ApiMetadata(self)
-        self.search = api.ApiSearch(self).search
-        self.services = api.ApiService(self)
-        self.share = api.ApiShare(self)
-        self.specification = api.ApiSpecification(self)
-        self.thesaurus = api.ApiThesaurus(self)
-        self.user = api.ApiUser(self)
-        self.workgroup = api.ApiWorkgroup(self)
+        # token renewal, planned once connected
+        self.token_manager = IsogeoTokenManager(self, margin=token_refresh_margin)
+
+        # opt-in connectivity check, running in background until connect() needs it
+        if check_connection:
+            self.connection_check = self.check_connection()
+        else:
+            self.connection_check = None
 
         super().__init__(
             # client_id=client_id,
@@ -301,6 +442,9 @@ class Isogeo(OAuth2Session):
             **kwargs,
         )
 
+        # decode every JSON response with the chosen decoder
+        self.hooks["response"].append(self.custom_hooks.decode_json)
+
     def connect(self, username: str = None, password: str = None):
         """Custom the HTTP client and authenticate application with user credentials \
             and fetch token.
@@ -311,16 +455,36 @@ class Isogeo(OAuth2Session):
         :param str username: user login (email). Not required for group apps (Client Credentials).
         :param str password: user password. Not required for group apps (Client Credentials).
         """
+        # wait for the connectivity check, if enabled
+        if self.connection_check is not None and not self.connection_check.result():
+            raise EnvironmentError("Internet connection issue.")
+        else:
+            pass
+
         # customize HTTPAdapter
-        adapter = HTTPAdapter(
-            max_retries=Retry(
+        adapter_options = {
+            "max_retries": Retry(
                 total=self.max_retries,
                 backoff_factor=1,
                 status_forcelist=[502, 503, 504],
             ),
-            pool_connections=self.pool_connections,
-            pool_maxsize=self.pool_maxsize,
-        )
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+        }
+        if self.http_cache is not None:
+            # stored responses are separated by client and user
+            adapter = IsogeoCachingAdapter(
+                cache=self.http_cache,
+                scope="{}:{}".format(self.client_id, username or ""),
+                **adapter_options,
+            )
+            logger.debug("Responses are cached into: {}".format(self.http_cache.path))
+        else:
+            adapter = HTTPAdapter(**adapter_options)
+        if self.cassette is not None:
+            # requests not replayed are sent by the previous adapter
+            adapter = IsogeoCassetteAdapter(cassette=self.cassette, adapter=adapter)
+            logger.debug("Exchanges cassette: {}".format(self.cassette))
         self.mount("https://", adapter)
         self.mount("http://", adapter)
         logger.debug(
@@ -342,6 +506,7 @@ class Isogeo(OAuth2Session):
                 proxies=self.proxies,
                 verify=self.ssl,
             )
+            self.token_manager.schedule()
             # get authenticated user informations
             self.account.get()
         elif self.auth_mode == "group":
@@ -353,6 +518,7 @@ class Isogeo(OAuth2Session):
                 proxies=self.proxies,
                 verify=self.ssl,
             )
+            self.token_manager.schedule()
             # get authenticated application informations
             associated_shares = self.share.listing(caching=1)
             if not len(associated_shares):
@@ -369,7 +535,193 @@ class Isogeo(OAuth2Session):
                     **self.share.listing()[0].get("applications")[0]
                 )
 
+    # -- REQUESTS PIPELINE ----------------------------------------------------
+    def check_connection(self) -> Future:
+        """Check the internet connection in a background thread. The check is shared by \
+            the clients of the process using the same proxies: it is performed only once, \
+            until it fails.
+
+        :returns: future whose result is True if the connection is operational
+        :rtype: concurrent.futures.Future
+
+        :Example:
+
+        .. code-block:: python
+
+            isogeo = Isogeo(...)
+            if not isogeo.check_connection().result(timeout=5):
+                print("Isogeo API is unreachable")
+        """
+        key = tuple(sorted(self.proxies.items()))
+        with _connection_checks_lock:
+            connection_check = _connection_checks.get(key)
+            if connection_check is not None and not (
+                connection_check.done() and not connection_check.result()
+            ):
+                return connection_check
+            connection_check = _connection_checks[key] = Future()
+
+        def run():
+            connection_check.set_result(
+                checker.check_internet_connection(proxies=self.proxies or None)
+            )
+
+        threading.Thread(target=run, name="IsogeoConnectionCheck", daemon=True).start()
+        return connection_check
+
+    def add_middleware(self, middleware: IsogeoMiddleware):
+        """Plug a middleware into the requests pipeline. It'll be executed after the \
+            middlewares already added.
+
+        :param IsogeoMiddleware middleware: middleware to add
+        """
+        self.middlewares.append(middleware)
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Single path of every request sent by the client. Applies the client settings \
+            (headers, proxies, SSL verification and timeout) unless the caller overrides them, \
+            then executes the middlewares around the request.
+
+        :param str method: HTTP method (verb)
+        :param str url: URL to request
+
+        :rtype: Response
+        """
+        # the client token is empty while it's renewed
+        if url != self.auto_refresh_url:
+            self.token_manager.wait()
+
+        # client settings
+        if kwargs.get("headers") is None:
+            kwargs["headers"] = (self.header if self.token else None) or {}
+        kwargs.setdefault("proxies", self.proxies)
+        kwargs.setdefault("verify", self.ssl)
+        kwargs.setdefault("timeout", self.timeout)
+
+        for middleware in self.middlewares:
+            middleware.before_send(method, url, kwargs)
+
+        stale_token = self.token_manager.access_token
+        try:
+            response = self._send(method, url, **kwargs)
+            # token refused (expired or revoked): renewed once and request sent again
+            if (
+                response.status_code == 401
+                and stale_token
+                and not kwargs.get("withhold_token")
+                and url != self.auto_refresh_url
+            ):
+                response.close()
+                self.token_manager.refresh(stale_token=stale_token)
+                if hasattr(kwargs.get("data"), "seek"):
+                    kwargs.get("data").seek(0)  # streamed body (upload)
+                response = self._send(method, url, **kwargs)
+        except Exception as err:
+            for middleware in reversed(self.middlewares):
+                middleware.on_error(method, url, err)
+            raise
+
+        for middleware in reversed(self.middlewares):
+            response = middleware.after_receive(method, url, response)
+
+        return response
+
+    def _send(self, method: str, url: str, **kwargs) -> Response:
+        """Send a request within the budget of the scheduler. While the API answers \
+            `429 Too Many Requests`, the request is sent again once the `Retry-After` \
+            delay is over. The number of times it has been sent again is stored into the \
+            `scheduler_retries` attribute of the response.
+
+        :param str method: HTTP method (verb)
+        :param str url: URL to request
+
+        :rtype: Response
+        """
+        if self.scheduler is None or url == self.auto_refresh_url:
+            return super().request(method, url, **kwargs)
+
+        route = IsogeoMetrics.route_template(url)
+        # streamed body (upload) is rewound to be sent again
+        body = kwargs.get("data")
+        if hasattr(body, "read"):
+            body_start = body.tell() if hasattr(body, "seek") else None
+        else:
+            body = body_start = None
+
+        for attempt in range(self.scheduler.max_retries + 1):
+            if attempt and body is not None:
+                body.seek(body_start)
+            self.scheduler.acquire()
+            start = default_timer()
+            try:
+                response = super().request(method, url, **kwargs)
+            except Exception as err:
+                self.scheduler.release(route=route, error=err)
+                raise
+            self.scheduler.release(
+                latency=default_timer() - start,
+                status=response.status_code,
+                retry_after=response.headers.get("Retry-After"),
+                route=route,
+            )
+            if (
+                response.status_code != 429
+                or attempt == self.scheduler.max_retries
+                or (body is not None and body_start is None)
+            ):
+                break
+            logger.debug("Too many requests, {} sent again later.".format(route))
+            response.close()
+
+        # counted by the metrics with the retries of urllib3
+        response.scheduler_retries = attempt
+        return response
+
+    def batch(
+        self, chunk_size: int = 100, max_workers: int = None, retries: int = 1
+    ) -> IsogeoBatch:
+        """Context queueing the association calls between metadata and catalogs, keywords \
+            or contacts, sent as bulk requests on exit. See: \
+            :class:`~isogeo_pysdk.batch.IsogeoBatch`.
+
+        :param int chunk_size: maximum number of metadata UUIDs in a bulk request
+        :param int max_workers: maximum number of bulk requests sent at the same time
+        :param int retries: number of times a failed bulk request is sent again
+
+        :rtype: IsogeoBatch
+
+        :Example:
+
+        .. code-block:: python
+
+            with isogeo.batch() as batch:
+                for md in li_metadata:
+                    isogeo.keyword.tagging(metadata=md, keyword=keyword)
+            print(batch.report)
+        """
+        return IsogeoBatch(
+            self, chunk_size=chunk_size, max_workers=max_workers, retries=retries
+        )
+
+    def close(self):
+        """Cancel the planned token renewal and close the HTTP client."""
+        self.token_manager.cancel()
+        super().close()
+
     # -- PROPERTIES -----------------------------------------------------------
+    @property
+    def active_batch(self) -> IsogeoBatch:
+        """Batch opened by the current thread, queueing the association calls. None if \
+            calls are sent right away.
+
+        :rtype: IsogeoBatch
+        """
+        return getattr(self._batches, "current", None)
+
+    @active_batch.setter
+    def active_batch(self, batch: IsogeoBatch):
+        self._batches.current = batch
+
     @property
     def header(self) -> dict:
         if self.auth_mode == "group":
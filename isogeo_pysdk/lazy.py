@@ -0,0 +1,59 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Lazy loading of the packages public objects (PEP 562)
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import sys
+from importlib import import_module
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def lazy_attributes(package: str, objects: dict) -> tuple:
+    """Build the module-level `__getattr__` and `__dir__` of a package whose public objects \
+        are imported on first access, so that importing the package does not import every \
+        module (and their dependencies).
+
+    :param str package: name of the package (`__name__`)
+    :param dict objects: module (relative to the package) of each public object, by name. \
+        Use `module:name` when the object has another name in its module (aliases).
+
+    :returns: `__getattr__` and `__dir__` functions to set into the package
+    :rtype: tuple
+
+    :Example:
+
+    .. code-block:: python
+
+        # mypackage/__init__.py
+        __getattr__, __dir__ = lazy_attributes(
+            __name__, {"Metadata": ".metadata", "Resource": ".metadata:Metadata"}
+        )
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        target = objects.get(name)
+        if target is None:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(package, name)
+            )
+        module_name, _, object_name = target.partition(":")
+        value = getattr(import_module(module_name, package), object_name or name)
+        # next accesses do not go through this function
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(namespace).union(objects))
+
+    return __getattr__, __dir__
@@ -0,0 +1,364 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Instrumentation of the requests sent by the client
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import re
+import threading
+from collections import deque
+from timeit import default_timer
+from urllib.parse import urlsplit
+
+# 3rd party
+from requests.models import Response
+
+# submodules
+from isogeo_pysdk.middlewares import IsogeoMiddleware
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# path segments replaced in route templates
+_regex_segment_id = re.compile(r"^[0-9a-fA-F]{32}$|^[0-9a-fA-F-]{36}$")
+_regex_segment_code = re.compile(r"^\d+$")
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoMetrics(IsogeoMiddleware):
+    """Middleware recording metrics about the requests sent by the client, by route \
+        template (`resources/{id}`, `groups/{id}/catalogs`...): count, errors, latency \
+        percentiles, bytes transferred, JSON decoding time, retries (by urllib3 and by the \
+        scheduler after a `429 Too Many Requests`) and responses served by the HTTP cache. \
+        Token requests are counted apart.
+
+    Enabled with `Isogeo(metrics=True)` and available as `isogeo.metrics`. When disabled, \
+    nothing is recorded and no middleware is executed.
+
+    :param IsogeoCache cache: routes cache whose statistics are included in snapshots
+    :param IsogeoHttpCache http_cache: HTTP cache whose statistics are included in snapshots
+    :param int reservoir: number of latest durations kept by route to compute percentiles
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(..., metrics=True)
+        isogeo.connect()
+        isogeo.search(include="all", whole_results=True)
+
+        pprint(isogeo.metrics.snapshot())
+        >>> {'routes': {'GET resources/search': {'count': 12,
+                                                 'errors': 0,
+                                                 'latency': {'p50': 0.41, 'p95': 0.87, ...},
+                                                 'bytes': 18530482,
+                                                 'json_decode': 1.21,
+                                                 ...}},
+             'token_requests': 1,
+             'cache': {'hits': 3, 'misses': 8, ...}}
+
+        # Prometheus text format
+        print(isogeo.metrics.to_prometheus())
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, cache=None, http_cache=None, reservoir: int = 1024):
+        self.cache = cache
+        self.http_cache = http_cache
+        self.reservoir = reservoir
+        self._lock = threading.Lock()
+        self._pending = threading.local()
+        self._otel_instruments = None
+        self.reset()
+
+    # -- MIDDLEWARE --------------------------------------------------------------------
+    def before_send(self, method: str, url: str, kwargs: dict):
+        starts = getattr(self._pending, "starts", None)
+        if starts is None:
+            starts = self._pending.starts = []
+        starts.append(default_timer())
+
+    def after_receive(self, method: str, url: str, response: Response) -> Response:
+        duration = default_timer() - self._pending.starts.pop()
+        key = self.route_key(method, url)
+
+        # bytes transferred: announced length or bytes already read
+        size = response.headers.get("Content-Length")
+        if size is None:
+            try:
+                size = response.raw.tell()
+            except Exception:
+                size = 0
+
+        # retries performed by urllib3, then by the scheduler (429)
+        retries = len(getattr(getattr(response.raw, "retries", None), "history", ()))
+        retries += getattr(response, "scheduler_retries", 0)
+
+        self._record(
+            key,
+            duration=duration,
+            error=response.status_code >= 400,
+            size=int(size),
+            retries=retries,
+            from_cache=getattr(response, "from_cache", False),
+        )
+
+        # measure JSON decoding, when the route asks for it
+        json_decode = response.json
+
+        def timed_json(**kwargs):
+            start = default_timer()
+            try:
+                return json_decode(**kwargs)
+            finally:
+                with self._lock:
+                    route = self._routes.get(key)
+                    if route is not None:
+                        route["json_decode"] += default_timer() - start
+
+        response.json = timed_json
+        return response
+
+    def on_error(self, method: str, url: str, error: Exception):
+        duration = default_timer() - self._pending.starts.pop()
+        self._record(self.route_key(method, url), duration=duration, error=True)
+
+    # -- RECORDING ---------------------------------------------------------------------
+    @staticmethod
+    def route_template(url: str) -> str:
+        """Build the route template from a requested URL, replacing identifiers by `{id}` \
+            and numeric codes by `{code}`.
+
+        :param str url: requested URL
+
+        :rtype: str
+
+        :Example:
+
+        >>> IsogeoMetrics.route_template("https://v1.api.isogeo.com/resources/0269...22b/?_include=")
+        'resources/{id}'
+        """
+        segments = []
+        for segment in urlsplit(url).path.split("/"):
+            if not segment:
+                continue
+            elif _regex_segment_id.match(segment):
+                segments.append("{id}")
+            elif _regex_segment_code.match(segment):
+                segments.append("{code}")
+            else:
+                segments.append(segment)
+        return "/".join(segments)
+
+    def route_key(self, method: str, url: str) -> str:
+        """Key of the route in metrics: HTTP method and route template.
+
+        :rtype: str
+        """
+        return "{} {}".format(method.upper(), self.route_template(url))
+
+    def _record(
+        self,
+        key: str,
+        duration: float,
+        error: bool = False,
+        size: int = 0,
+        retries: int = 0,
+        from_cache: bool = False,
+    ):
+        """Store the measures of a request.
+
+        :param str key: route key
+        :param float duration: request duration in seconds
+        :param bool error: True if the request failed
+        :param int size: bytes transferred
+        :param int retries: number of retries
+        :param bool from_cache: True if the response was served by the HTTP cache
+        """
+        with self._lock:
+            route = self._routes.get(key)
+            if route is None:
+                route = self._routes[key] = {
+                    "count": 0,
+                    "errors": 0,
+                    "durations": deque(maxlen=self.reservoir),
+                    "duration_sum": 0.0,
+                    "bytes": 0,
+                    "json_decode": 0.0,
+                    "retries": 0,
+                    "from_cache": 0,
+                }
+            route["count"] += 1
+            route["errors"] += error
+            route["durations"].append(duration)
+            route["duration_sum"] += duration
+            route["bytes"] += size
+            route["retries"] += retries
+            route["from_cache"] += from_cache
+            if key.endswith("oauth/token"):
+                self._token_requests += 1
+
+        if self._otel_instruments is not None:
+            method, template = key.split(" ", 1)
+            attributes = {"http.method": method, "isogeo.route": template}
+            self._otel_instruments[0].record(duration, attributes=attributes)
+            self._otel_instruments[1].add(size, attributes=attributes)
+
+    def reset(self):
+        """Forget every measure."""
+        with self._lock:
+            self._routes = {}
+            self._token_requests = 0
+
+    # -- EXPORT ------------------------------------------------------------------------
+    def snapshot(self) -> dict:
+        """Get the current metrics.
+
+        :returns: metrics by route key, count of token requests and caches statistics
+        :rtype: dict
+        """
+        routes = {}
+        with self._lock:
+            for key, route in self._routes.items():
+                durations = sorted(route.get("durations"))
+                latency = {
+                    "p{}".format(pct): durations[
+                        min(len(durations) - 1, int(len(durations) * pct / 100))
+                    ]
+                    for pct in self.PERCENTILES
+                }
+                latency["max"] = durations[-1]
+                latency["mean"] = route.get("duration_sum") / route.get("count")
+                routes[key] = {
+                    "count": route.get("count"),
+                    "errors": route.get("errors"),
+                    "latency": latency,
+                    "bytes": route.get("bytes"),
+                    "json_decode": route.get("json_decode"),
+                    "retries": route.get("retries"),
+                    "from_cache": route.get("from_cache"),
+                }
+            token_requests = self._token_requests
+
+        out = {"routes": routes, "token_requests": token_requests}
+        if self.cache is not None:
+            out["cache"] = self.cache.stats(by_family=True)
+        if self.http_cache is not None:
+            out["http_cache"] = dict(self.http_cache.stats)
+        return out
+
+    def to_prometheus(self, prefix: str = "isogeo") -> str:
+        """Export the metrics in the Prometheus text format.
+
+        :param str prefix: metrics names prefix
+
+        :rtype: str
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def labels(key: str, **extra) -> str:
+            method, template = key.split(" ", 1)
+            pairs = dict(method=method, route=template, **extra)
+            return ",".join('{}="{}"'.format(k, v) for k, v in pairs.items())
+
+        routes = snapshot.get("routes")
+        for name, kind, field in (
+            ("requests_total", "counter", "count"),
+            ("errors_total", "counter", "errors"),
+            ("response_bytes_total", "counter", "bytes"),
+            ("json_decode_seconds_total", "counter", "json_decode"),
+            ("retries_total", "counter", "retries"),
+            ("http_cache_responses_total", "counter", "from_cache"),
+        ):
+            lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+            for key, route in routes.items():
+                lines.append(
+                    "{}_{}{{{}}} {}".format(prefix, name, labels(key), route.get(field))
+                )
+
+        lines.append("# TYPE {}_request_duration_seconds summary".format(prefix))
+        for key, route in routes.items():
+            latency = route.get("latency")
+            for pct in self.PERCENTILES:
+                lines.append(
+                    "{}_request_duration_seconds{{{}}} {}".format(
+                        prefix,
+                        labels(key, quantile=pct / 100),
+                        latency.get("p{}".format(pct)),
+                    )
+                )
+            lines.append(
+                "{}_request_duration_seconds_sum{{{}}} {}".format(
+                    prefix, labels(key), latency.get("mean") * route.get("count")
+                )
+            )
+            lines.append(
+                "{}_request_duration_seconds_count{{{}}} {}".format(
+                    prefix, labels(key), route.get("count")
+                )
+            )
+
+        lines.append("# TYPE {}_token_requests_total counter".format(prefix))
+        lines.append(
+            "{}_token_requests_total {}".format(prefix, snapshot.get("token_requests"))
+        )
+
+        for counter in ("hits", "misses"):
+            lines.append("# TYPE {}_cache_{}_total counter".format(prefix, counter))
+            families = snapshot.get("cache", {}).get("families", {})
+            for family, stats in families.items():
+                lines.append(
+                    '{}_cache_{}_total{{family="{}"}} {}'.format(
+                        prefix, counter, family, stats.get(counter)
+                    )
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def bind_opentelemetry(self, meter):
+        """Forward the next measures to OpenTelemetry instruments created from the given \
+            meter: a histogram of durations (`isogeo.client.duration`) and a counter of \
+            bytes transferred (`isogeo.client.response.size`).
+
+        :param opentelemetry.metrics.Meter meter: meter, e.g. \
+            `opentelemetry.metrics.get_meter("isogeo-pysdk")`
+        """
+        self._otel_instruments = (
+            meter.create_histogram(
+                "isogeo.client.duration",
+                unit="s",
+                description="Duration of the requests sent to the Isogeo API",
+            ),
+            meter.create_counter(
+                "isogeo.client.response.size",
+                unit="By",
+                description="Bytes received from the Isogeo API",
+            ),
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    print(
+        IsogeoMetrics.route_template(
+            "https://v1.api.isogeo.com/groups/32f7e95ec4e94ca3bc1afda960003882/catalogs/"
+        )
+    )
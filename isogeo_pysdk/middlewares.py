@@ -0,0 +1,89 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Middlewares plugged into the requests pipeline of the client
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+
+# 3rd party
+from requests.models import Response
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoMiddleware(object):
+    """Base class of the middlewares executed by :meth:`Isogeo.request` around every \
+        request sent by the client (routes, token...). Subclass it and override the methods \
+        you need. Middlewares are called in the order they have been added for `before_send` \
+        and in the reverse order for `after_receive` and `on_error`.
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import Isogeo, IsogeoMiddleware
+
+        class TraceMiddleware(IsogeoMiddleware):
+            def before_send(self, method, url, kwargs):
+                kwargs.get("headers")["X-Request-Source"] = "my-script"
+
+            def after_receive(self, method, url, response):
+                print(method, url, response.status_code, response.elapsed)
+                return response
+
+        isogeo = Isogeo(..., middlewares=[TraceMiddleware()])
+    """
+
+    def before_send(self, method: str, url: str, kwargs: dict):
+        """Called before the request is sent.
+
+        :param str method: HTTP method (verb)
+        :param str url: requested URL
+        :param dict kwargs: request options (params, headers, timeout...), to modify in place
+        """
+        pass
+
+    def after_receive(self, method: str, url: str, response: Response) -> Response:
+        """Called once the response has been received, whatever its status code.
+
+        :param str method: HTTP method (verb)
+        :param str url: requested URL
+        :param Response response: response returned by the API
+
+        :returns: the response to pass to the next middleware and to the route
+        :rtype: Response
+        """
+        return response
+
+    def on_error(self, method: str, url: str, error: Exception):
+        """Called when the request failed without response (connection error, timeout...). \
+            The error is raised again after the middlewares.
+
+        :param str method: HTTP method (verb)
+        :param str url: requested URL
+        :param Exception error: raised exception
+        """
+        pass
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
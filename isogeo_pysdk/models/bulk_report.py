@@ -14,6 +14,9 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import model_to_dict
+
 # other model
 from isogeo_pysdk.models.bulk_request import BulkRequest
 
@@ -52,8 +55,7 @@ class BulkReport(object):
 
     @ignored.setter
     def ignored(self, ignored: dict):
-        """Sets the ignored of this Bulk Request.
-        """
+        """Sets the ignored of this Bulk Request."""
 
         self._ignored = ignored
 
@@ -79,32 +81,7 @@ class BulkReport(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the request properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(BulkReport, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return model_to_dict(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the request."""
@@ -13,6 +13,9 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import model_to_dict
+
 # other model
 from isogeo_pysdk.enums import BulkActions, BulkTargets
 
@@ -149,32 +152,7 @@ class BulkRequest(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(BulkRequest, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return model_to_dict(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -20,6 +20,7 @@ from typing import Union
 
 # package
 from isogeo_pysdk.enums import MetadataTypes
+from isogeo_pysdk.models.serializer import model_to_dict
 
 # others models
 from isogeo_pysdk.models import CoordinateSystem, Workgroup
@@ -234,21 +235,44 @@ class Metadata(object):
         "featureAttributes": "feature-attributes",
     }
 
+    # values are stored into a single dictionary, keyed like ATTR_TYPES
+    __slots__ = ("_data",)
+
     # -- CLASS METHODS -----------------------------------------------------------------
     @classmethod
     def clean_attributes(cls, raw_object: dict):
         """Renames attributes which are incompatible with Python (hyphens...). See related issue:
         https://github.com/isogeo/isogeo-api-py-minsdk/issues/82.
 
+        The dictionary is not modified and its values are not converted: nested objects \
+        (contacts, conditions, events, links...) are returned as they come from the API. \
+        It's the fastest way to build many Metadata, from search results for example.
+
         :param dict raw_object: metadata dictionary returned by a request.json()
 
         :returns: the metadata with correct attributes
         :rtype: Metadata
         """
+        data = dict(raw_object)
         for k, v in cls.ATTR_MAP.items():
-            raw_object[k] = raw_object.pop(v, [])
+            data[k] = data.pop(v, [])
+
+        # warn about unsupported attributes
+        unexpected = data.keys() - cls.ATTR_TYPES.keys()
+        if unexpected:
+            logger.warning(
+                "Folllowings fields were not expected and have been ignored. "
+                "Maybe consider adding them to the model: {}.".format(
+                    " | ".join(unexpected)
+                )
+            )
+            for k in unexpected:
+                del data[k]
 
-        return cls(**raw_object)
+        # skip the constructor: the dictionary is used as is
+        metadata = cls.__new__(cls)
+        metadata._data = data
+        return metadata
 
     # -- CLASS INSTANCIATION -----------------------------------------------------------
 
@@ -303,147 +327,13 @@ class Metadata(object):
         **kwargs,
     ):
         """Metadata model."""
-
-        # default values for the object attributes/properties
-        self.__abilities = None
-        self.__created = None
-        self.__creator = None
-        self.__id = None
-        self.__modified = None
-        self._abstract = None
-        self._collectionContext = None
-        self._collectionMethod = None
-        self._conditions = None
-        self._contacts = None
-        self._coordinateSystem = None
-        self._creation = None  # = created
-        self._distance = None
-        self._editionProfile = None
-        self._encoding = None
-        self._envelope = None
-        self._events = None
-        self._featureAttributes = None
-        self._features = None
-        self._format = None
-        self._formatVersion = None
-        self._geometry = None
-        self._keywords = None
-        self._language = None
-        self._layers = None
-        self._limitations = None
-        self._links = None
-        self._modification = None  # = modified
-        self._name = None
-        self._operations = None
-        self._path = None
-        self._precision = None
-        self._published = None
-        self._scale = None
-        self._series = None
-        self._serviceLayers = None
-        self._specifications = None
-        self._tags = None
-        self._thumbnailUrl = None
-        self._title = None
-        self._topologicalConsistency = None
-        self._type = None
-        self._updateFrequency = None
-        self._validFrom = None
-        self._validTo = None
-        self._validityComment = None
-
-        # if values have been passed, so use them as objects attributes.
-        # attributes are prefixed by an underscore '_'
-        if _abilities is not None:
-            self.__abilities = _abilities
-        if _created is not None:
-            self.__created = _created
-        if _creator is not None:
-            self.__creator = _creator
-        if _id is not None:
-            self.__id = _id
-        if _modified is not None:
-            self.__modified = _modified
-        if abstract is not None:
-            self._abstract = abstract
-        if collectionContext is not None:
-            self._collectionContext = collectionContext
-        if collectionMethod is not None:
-            self._collectionMethod = collectionMethod
-        if conditions is not None:
-            self._conditions = conditions
-        if contacts is not None:
-            self._contacts = contacts
-        if coordinateSystem is not None:
-            self._coordinateSystem = coordinateSystem
-        if created is not None:
-            self._creation = created
-        if distance is not None:
-            self._distance = distance
-        if editionProfile is not None:
-            self._editionProfile = editionProfile
-        if encoding is not None:
-            self._encoding = encoding
-        if envelope is not None:
-            self._envelope = envelope
-        if events is not None:
-            self._events = events
-        if featureAttributes is not None:
-            self._featureAttributes = featureAttributes
-        if features is not None:
-            self._features = features
-        if format is not None:
-            self._format = format
-        if formatVersion is not None:
-            self._formatVersion = formatVersion
-        if geometry is not None:
-            self._geometry = geometry
-        if keywords is not None:
-            self._keywords = keywords
-        if language is not None:
-            self._language = language
-        if layers is not None:
-            self._layers = layers
-        if limitations is not None:
-            self._limitations = limitations
-        if links is not None:
-            self._links = links
-        if modified is not None:
-            self._modification = modified
-        if name is not None:
-            self._name = name
-        if operations is not None:
-            self._operations = operations
-        if path is not None:
-            self._path = path
-        if precision is not None:
-            self._precision = precision
-        if published is not None:
-            self._published = published
-        if scale is not None:
-            self._scale = scale
-        if serviceLayers is not None:
-            self._serviceLayers = serviceLayers
-        if specifications is not None:
-            self._specifications = specifications
-        if tags is not None:
-            self._tags = tags
-        if thumbnailUrl is not None:
-            self._thumbnailUrl = thumbnailUrl
-        if title is not None:
-            self._title = title
-        if topologicalConsistency is not None:
-            self._topologicalConsistency = topologicalConsistency
-        if type is not None:
-            self._type = type
-        if updateFrequency is not None:
-            self._updateFrequency = updateFrequency
-        if validFrom is not None:
-            self._validFrom = validFrom
-        if validTo is not None:
-            self._validTo = validTo
-        if validityComment is not None:
-            self._validityComment = validityComment
+        # values are stored as passed, in a dictionary consistent with the API one
+        attributes = locals()
+        self._data = {
+            attr: attributes.get(attr)
+            for attr in self.ATTR_TYPES
+            if attributes.get(attr) is not None
+        }
 
         # warn about unsupported attributes
         if len(kwargs):
@@ -463,7 +353,7 @@ class Metadata(object):
         :return: The abilities of this Metadata.
         :rtype: list
         """
-        return self.__abilities
+        return self._data.get("_abilities")
 
     # _created
     @property
@@ -474,7 +364,7 @@ class Metadata(object):
         :return: The created of this Metadata.
         :rtype: str
         """
-        return self.__created
+        return self._data.get("_created")
 
     # _modified
     @property
@@ -485,7 +375,7 @@ class Metadata(object):
         :return: The modified of this Metadata.
         :rtype: str
         """
-        return self.__modified
+        return self._data.get("_modified")
 
     # metadata owner
     @property
@@ -495,7 +385,7 @@ class Metadata(object):
         :return: The creator of this Metadata.
         :rtype: dict
         """
-        return self.__creator
+        return self._data.get("_creator")
 
     # metadata UUID
     @property
@@ -505,7 +395,7 @@ class Metadata(object):
         :return: The id of this Metadata.
         :rtype: str
         """
-        return self.__id
+        return self._data.get("_id")
 
     @_id.setter
     def _id(self, _id: str):
@@ -514,7 +404,7 @@ class Metadata(object):
         :param str id: The id of this Metadata.
         """
 
-        self.__id = _id
+        self._data["_id"] = _id
 
     # metadata description
     @property
@@ -524,7 +414,7 @@ class Metadata(object):
         :return: The abstract of this Metadata.
         :rtype: str
         """
-        return self._abstract
+        return self._data.get("abstract")
 
     @abstract.setter
     def abstract(self, abstract: str):
@@ -533,7 +423,7 @@ class Metadata(object):
         :param str abstract: the abstract of this Metadata.
         """
 
-        self._abstract = abstract
+        self._data["abstract"] = abstract
 
     # collection context
     @property
@@ -543,7 +433,7 @@ class Metadata(object):
         :return: The collectionContext of this Metadata.
         :rtype: str
         """
-        return self._collectionContext
+        return self._data.get("collectionContext")
 
     @collectionContext.setter
     def collectionContext(self, collectionContext: str):
@@ -552,7 +442,7 @@ class Metadata(object):
         :param str collectionContext: The collection context of this Metadata.
         """
 
-        self._collectionContext = collectionContext
+        self._data["collectionContext"] = collectionContext
 
     # collection method
     @property
@@ -562,7 +452,7 @@ class Metadata(object):
         :return: The collection method of this Metadata.
         :rtype: str
         """
-        return self._collectionMethod
+        return self._data.get("collectionMethod")
 
     @collectionMethod.setter
     def collectionMethod(self, collectionMethod: str):
@@ -571,7 +461,7 @@ class Metadata(object):
         :param str collectionMethod: the collection method to set. Accepts markdown.
         """
 
-        self._collectionMethod = collectionMethod
+        self._data["collectionMethod"] = collectionMethod
 
     # CGUs
     @property
@@ -581,7 +471,7 @@ class Metadata(object):
         :return: The conditions of this Metadata.
         :rtype: list
         """
-        return self._conditions
+        return self._data.get("conditions")
 
     @conditions.setter
     def conditions(self, conditions: list):
@@ -590,7 +480,7 @@ class Metadata(object):
         :param list conditions: conditions to be set
         """
 
-        self._conditions = conditions
+        self._data["conditions"] = conditions
 
     # contacts
     @property
@@ -600,7 +490,7 @@ class Metadata(object):
         :return: The contacts of this Metadata.
         :rtype: list
         """
-        return self._contacts
+        return self._data.get("contacts")
 
     @contacts.setter
     def contacts(self, contacts: list):
@@ -609,7 +499,7 @@ class Metadata(object):
         :param list contacts: to be set
         """
 
-        self._contacts = contacts
+        self._data["contacts"] = contacts
 
     # coordinateSystem
     @property
@@ -619,7 +509,7 @@ class Metadata(object):
         :return: The coordinateSystem of this Metadata.
         :rtype: CoordinateSystem
         """
-        return self._coordinateSystem
+        return self._data.get("coordinateSystem")
 
     @coordinateSystem.setter
     def coordinateSystem(self, coordinateSystem: Union[dict, CoordinateSystem]):
@@ -628,11 +518,11 @@ class Metadata(object):
         :param Union[dict, CoordinateSystem] coordinateSystem: coordinate-system to be set
         """
         if isinstance(coordinateSystem, dict):
-            self._coordinateSystem = CoordinateSystem(**coordinateSystem)
+            self._data["coordinateSystem"] = CoordinateSystem(**coordinateSystem)
         elif isinstance(coordinateSystem, CoordinateSystem):
-            self._coordinateSystem = coordinateSystem
+            self._data["coordinateSystem"] = coordinateSystem
         else:
-            self._coordinateSystem = None
+            self._data["coordinateSystem"] = None
 
     # created
     @property
@@ -645,7 +535,7 @@ class Metadata(object):
         :return: The creation of this Metadata.
         :rtype: str
         """
-        return self._creation
+        return self._data.get("created")
 
     # distance
     @property
@@ -655,7 +545,7 @@ class Metadata(object):
         :return: The distance of this Metadata.
         :rtype: str
         """
-        return self._distance
+        return self._data.get("distance")
 
     @distance.setter
     def distance(self, distance: str):
@@ -664,7 +554,7 @@ class Metadata(object):
         :param str distance: to be set
         """
 
-        self._distance = distance
+        self._data["distance"] = distance
 
     # editionProfile
     @property
@@ -674,7 +564,7 @@ class Metadata(object):
         :return: The editionProfile of this Metadata.
         :rtype: str
         """
-        return self._editionProfile
+        return self._data.get("editionProfile")
 
     @editionProfile.setter
     def editionProfile(self, editionProfile: str):
@@ -683,7 +573,7 @@ class Metadata(object):
         :param str editionProfile: to be set
         """
 
-        self._editionProfile = editionProfile
+        self._data["editionProfile"] = editionProfile
 
     # encoding
     @property
@@ -693,7 +583,7 @@ class Metadata(object):
         :return: The encoding of this Metadata.
         :rtype: str
         """
-        return self._encoding
+        return self._data.get("encoding")
 
     @encoding.setter
     def encoding(self, encoding: str):
@@ -702,7 +592,7 @@ class Metadata(object):
         :param str encoding: to be set
         """
 
-        self._encoding = encoding
+        self._data["encoding"] = encoding
 
     # envelope
     @property
@@ -712,7 +602,7 @@ class Metadata(object):
         :return: The envelope of this Metadata.
         :rtype: str
         """
-        return self._envelope
+        return self._data.get("envelope")
 
     @envelope.setter
     def envelope(self, envelope: str):
@@ -721,7 +611,7 @@ class Metadata(object):
         :param str envelope: to be set
         """
 
-        self._envelope = envelope
+        self._data["envelope"] = envelope
 
     # events
     @property
@@ -731,7 +621,7 @@ class Metadata(object):
         :return: The events of this Metadata.
         :rtype: list
         """
-        return self._events
+        return self._data.get("events")
 
     @events.setter
     def events(self, events: list):
@@ -740,7 +630,7 @@ class Metadata(object):
         :param list events: to be set
         """
 
-        self._events = events
+        self._data["events"] = events
 
     # featureAttributes
     @property
@@ -750,7 +640,7 @@ class Metadata(object):
         :return: The featureAttributes of this Metadata.
         :rtype: list
         """
-        return self._featureAttributes
+        return self._data.get("featureAttributes")
 
     @featureAttributes.setter
     def featureAttributes(self, featureAttributes: list):
@@ -759,7 +649,7 @@ class Metadata(object):
         :param list featureAttributes: to be set
         """
 
-        self._featureAttributes = featureAttributes
+        self._data["featureAttributes"] = featureAttributes
 
     # features
     @property
@@ -769,7 +659,7 @@ class Metadata(object):
         :return: The features of this Metadata.
         :rtype: int
         """
-        return self._features
+        return self._data.get("features")
 
     @features.setter
     def features(self, features: int):
@@ -778,7 +668,7 @@ class Metadata(object):
         :param int features: to be set
         """
 
-        self._features = features
+        self._data["features"] = features
 
     # format
     @property
@@ -788,7 +678,7 @@ class Metadata(object):
         :return: The format of this Metadata.
         :rtype: str
         """
-        return self._format
+        return self._data.get("format")
 
     @format.setter
     def format(self, format: str):
@@ -797,7 +687,7 @@ class Metadata(object):
         :param str format: to be set
         """
 
-        self._format = format
+        self._data["format"] = format
 
     # formatVersion
     @property
@@ -807,7 +697,7 @@ class Metadata(object):
         :return: The formatVersion of this Metadata.
         :rtype: str
         """
-        return self._formatVersion
+        return self._data.get("formatVersion")
 
     @formatVersion.setter
     def formatVersion(self, formatVersion: str):
@@ -816,7 +706,7 @@ class Metadata(object):
         :param str formatVersion: to be set
         """
 
-        self._formatVersion = formatVersion
+        self._data["formatVersion"] = formatVersion
 
     # geometry
     @property
@@ -826,7 +716,7 @@ class Metadata(object):
         :return: The geometry of this Metadata.
         :rtype: str
         """
-        return self._geometry
+        return self._data.get("geometry")
 
     @geometry.setter
     def geometry(self, geometry: str):
@@ -835,7 +725,7 @@ class Metadata(object):
         :param str geometry: to be set
         """
 
-        self._geometry = geometry
+        self._data["geometry"] = geometry
 
     # keywords
     @property
@@ -845,7 +735,7 @@ class Metadata(object):
         :return: The keywords of this Metadata.
         :rtype: str
         """
-        return self._keywords
+        return self._data.get("keywords")
 
     @keywords.setter
     def keywords(self, keywords: str):
@@ -854,7 +744,7 @@ class Metadata(object):
         :param str keywords: to be set
         """
 
-        self._keywords = keywords
+        self._data["keywords"] = keywords
 
     # language
     @property
@@ -864,7 +754,7 @@ class Metadata(object):
         :return: The language of this Metadata.
         :rtype: str
         """
-        return self._language
+        return self._data.get("language")
 
     @language.setter
     def language(self, language: str):
@@ -873,7 +763,7 @@ class Metadata(object):
         :param str language: to be set
         """
 
-        self._language = language
+        self._data["language"] = language
 
     # layers
     @property
@@ -883,7 +773,7 @@ class Metadata(object):
         :return: The layers of this Metadata.
         :rtype: list
         """
-        return self._layers
+        return self._data.get("layers")
 
     @layers.setter
     def layers(self, layers: list):
@@ -892,7 +782,7 @@ class Metadata(object):
         :param list layers: to be set
         """
 
-        self._layers = layers
+        self._data["layers"] = layers
 
     # limitations
     @property
@@ -902,7 +792,7 @@ class Metadata(object):
         :return: The limitations of this Metadata.
         :rtype: str
         """
-        return self._limitations
+        return self._data.get("limitations")
 
     @limitations.setter
     def limitations(self, limitations: str):
@@ -911,7 +801,7 @@ class Metadata(object):
         :param str limitations: to be set
         """
 
-        self._limitations = limitations
+        self._data["limitations"] = limitations
 
     # links
     @property
@@ -921,7 +811,7 @@ class Metadata(object):
         :return: The links of this Metadata.
         :rtype: str
         """
-        return self._links
+        return self._data.get("links")
 
     @links.setter
     def links(self, links: str):
@@ -930,7 +820,7 @@ class Metadata(object):
         :param str links: to be set
         """
 
-        self._links = links
+        self._data["links"] = links
 
     # modification
     @property
@@ -942,7 +832,7 @@ class Metadata(object):
         :return: The modification of this Metadata.
         :rtype: str
         """
-        return self._modification
+        return self._data.get("modified")
 
     # name
     @property
@@ -952,7 +842,7 @@ class Metadata(object):
         :return: The name of this Metadata.
         :rtype: str
         """
-        return self._name
+        return self._data.get("name")
 
     @name.setter
     def name(self, name: str):
@@ -961,7 +851,7 @@ class Metadata(object):
         :param str name: technical name this Metadata.
         """
 
-        self._name = name
+        self._data["name"] = name
 
     # operations
     @property
@@ -971,7 +861,7 @@ class Metadata(object):
         :return: The operations of this Metadata.
         :rtype: list
         """
-        return self._operations
+        return self._data.get("operations")
 
     @operations.setter
     def operations(self, operations: list):
@@ -980,7 +870,7 @@ class Metadata(object):
         :param list operations: to be set
         """
 
-        self._operations = operations
+        self._data["operations"] = operations
 
     # path
     @property
@@ -990,7 +880,7 @@ class Metadata(object):
         :return: The path of this Metadata.
         :rtype: str
         """
-        return self._path
+        return self._data.get("path")
 
     @path.setter
     def path(self, path: str):
@@ -999,7 +889,7 @@ class Metadata(object):
         :param str path: to be set
         """
 
-        self._path = path
+        self._data["path"] = path
 
     # precision
     @property
@@ -1009,7 +899,7 @@ class Metadata(object):
         :return: The precision of this Metadata.
         :rtype: str
         """
-        return self._precision
+        return self._data.get("precision")
 
     @precision.setter
     def precision(self, precision: str):
@@ -1018,7 +908,7 @@ class Metadata(object):
         :param str precision: to be set
         """
 
-        self._precision = precision
+        self._data["precision"] = precision
 
     # published
     @property
@@ -1028,7 +918,7 @@ class Metadata(object):
         :return: The published of this Metadata.
         :rtype: str
         """
-        return self._published
+        return self._data.get("published")
 
     @published.setter
     def published(self, published: str):
@@ -1037,7 +927,7 @@ class Metadata(object):
         :param str published: to be set
         """
 
-        self._published = published
+        self._data["published"] = published
 
     # scale
     @property
@@ -1047,7 +937,7 @@ class Metadata(object):
         :return: The scale of this Metadata.
         :rtype: str
         """
-        return self._scale
+        return self._data.get("scale")
 
     @scale.setter
     def scale(self, scale: str):
@@ -1056,7 +946,7 @@ class Metadata(object):
         :param str scale: to be set
         """
 
-        self._scale = scale
+        self._data["scale"] = scale
 
     # series
     @property
@@ -1066,7 +956,7 @@ class Metadata(object):
         :return: The series of this Metadata.
         :rtype: str
         """
-        return self._series
+        return self._data.get("series")
 
     @series.setter
     def series(self, series: str):
@@ -1075,7 +965,7 @@ class Metadata(object):
         :param str series: to be set
         """
 
-        self._series = series
+        self._data["series"] = series
 
     # serviceLayers
     @property
@@ -1085,7 +975,7 @@ class Metadata(object):
         :return: The serviceLayers of this Metadata.
         :rtype: list
         """
-        return self._serviceLayers
+        return self._data.get("serviceLayers")
 
     @serviceLayers.setter
     def serviceLayers(self, serviceLayers: list):
@@ -1094,7 +984,7 @@ class Metadata(object):
         :param list serviceLayers: to be set
         """
 
-        self._serviceLayers = serviceLayers
+        self._data["serviceLayers"] = serviceLayers
 
     # specifications
     @property
@@ -1104,7 +994,7 @@ class Metadata(object):
         :return: The specifications of this Metadata.
         :rtype: str
         """
-        return self._specifications
+        return self._data.get("specifications")
 
     @specifications.setter
     def specifications(self, specifications: str):
@@ -1113,7 +1003,7 @@ class Metadata(object):
         :param str specifications: to be set
         """
 
-        self._specifications = specifications
+        self._data["specifications"] = specifications
 
     # tags
     @property
@@ -1123,7 +1013,7 @@ class Metadata(object):
         :return: The tags of this Metadata.
         :rtype: str
         """
-        return self._tags
+        return self._data.get("tags")
 
     @tags.setter
     def tags(self, tags: str):
@@ -1132,7 +1022,7 @@ class Metadata(object):
         :param str tags: to be set
         """
 
-        self._tags = tags
+        self._data["tags"] = tags
 
     # thumbnailUrl
     @property
@@ -1148,7 +1038,7 @@ class Metadata(object):
                 "Its use is not guaranted."
             )
         )
-        return self._thumbnailUrl
+        return self._data.get("thumbnailUrl")
 
     # title
     @property
@@ -1158,7 +1048,7 @@ class Metadata(object):
         :return: The title of this Metadata.
         :rtype: str
         """
-        return self._title
+        return self._data.get("title")
 
     @title.setter
     def title(self, title: str):
@@ -1167,7 +1057,7 @@ class Metadata(object):
         :param str title: to be set
         """
 
-        self._title = title
+        self._data["title"] = title
 
     # topologicalConsistency
     @property
@@ -1177,7 +1067,7 @@ class Metadata(object):
         :return: The topologicalConsistency of this Metadata.
         :rtype: str
         """
-        return self._topologicalConsistency
+        return self._data.get("topologicalConsistency")
 
     @topologicalConsistency.setter
     def topologicalConsistency(self, topologicalConsistency: str):
@@ -1186,7 +1076,7 @@ class Metadata(object):
         :param str topologicalConsistency: to be set
         """
 
-        self._topologicalConsistency = topologicalConsistency
+        self._data["topologicalConsistency"] = topologicalConsistency
 
     # type
     @property
@@ -1196,7 +1086,7 @@ class Metadata(object):
         :return: The type of this Metadata.
         :rtype: str
         """
-        return self._type
+        return self._data.get("type")
 
     @type.setter
     def type(self, type: str):
@@ -1213,7 +1103,7 @@ class Metadata(object):
                 )
             )
 
-        self._type = type
+        self._data["type"] = type
 
     # updateFrequency
     @property
@@ -1223,7 +1113,7 @@ class Metadata(object):
         :return: The updateFrequency of this Metadata.
         :rtype: str
         """
-        return self._updateFrequency
+        return self._data.get("updateFrequency")
 
     @updateFrequency.setter
     def updateFrequency(self, updateFrequency: str):
@@ -1232,7 +1122,7 @@ class Metadata(object):
         :param str updateFrequency: to be set
         """
 
-        self._updateFrequency = updateFrequency
+        self._data["updateFrequency"] = updateFrequency
 
     # validFrom
     @property
@@ -1242,7 +1132,7 @@ class Metadata(object):
         :return: The validFrom of this Metadata.
         :rtype: str
         """
-        return self._validFrom
+        return self._data.get("validFrom")
 
     @validFrom.setter
     def validFrom(self, validFrom: str):
@@ -1251,7 +1141,7 @@ class Metadata(object):
         :param str validFrom: to be set
         """
 
-        self._validFrom = validFrom
+        self._data["validFrom"] = validFrom
 
     # validTo
     @property
@@ -1261,7 +1151,7 @@ class Metadata(object):
         :return: The validTo of this Metadata.
         :rtype: str
         """
-        return self._validTo
+        return self._data.get("validTo")
 
     @validTo.setter
     def validTo(self, validTo: str):
@@ -1270,7 +1160,7 @@ class Metadata(object):
         :param str validTo: to be set
         """
 
-        self._validTo = validTo
+        self._data["validTo"] = validTo
 
     # validityComment
     @property
@@ -1280,7 +1170,7 @@ class Metadata(object):
         :return: The validityComment of this Metadata.
         :rtype: str
         """
-        return self._validityComment
+        return self._data.get("validityComment")
 
     @validityComment.setter
     def validityComment(self, validityComment: str):
@@ -1289,7 +1179,7 @@ class Metadata(object):
         :param str validityComment: to be set
         """
 
-        self._validityComment = validityComment
+        self._data["validityComment"] = validityComment
 
     # -- SPECIFIC TO IMPLEMENTATION ----------------------------------------------------
     @property
@@ -1342,10 +1232,10 @@ class Metadata(object):
         :returns: the title or the name of this Metadata.
         :rtype: str
         """
-        if self._title:
-            title_or_name = self._title
-        elif self._name:
-            title_or_name = self._name
+        if self.title:
+            title_or_name = self.title
+        elif self.name:
+            title_or_name = self.name
         else:
             logger.warning(
                 "Metadata has no title nor name. So this method is useless..."
@@ -1366,65 +1256,11 @@ class Metadata(object):
 
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Metadata, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return model_to_dict(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
-        result = {}
-
-        for attr, _ in self.ATTR_CREA.items():
-            # get attribute value
-            value = getattr(self, attr)
-            # switch attribute name for creation purpose
-            if attr in self.ATTR_MAP:
-                attr = self.ATTR_MAP.get(attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Metadata, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return model_to_dict(self, creation=True)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -1439,7 +1275,9 @@ class Metadata(object):
         if not isinstance(other, Metadata):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            self._data.get(attr) == other._data.get(attr) for attr in self.ATTR_TYPES
+        )
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -14,6 +14,9 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import model_to_dict
+
 # other model
 # from isogeo_pysdk.models.resource import Metadata
 # from isogeo_pysdk.models.tag import Tag
@@ -56,6 +59,9 @@ class MetadataSearch(object):
         self._tags = None
         self._total = None
 
+        # not returned by the API: filled by keyset paginated searches
+        self.pagination_report = None
+
         # if values have been passed, so use them as objects attributes.
         # attributes are prefixed by an underscore '_'
         if envelope is not None:
@@ -218,32 +224,40 @@ class MetadataSearch(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(MetadataSearch, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return model_to_dict(self)
+
+    def to_columns(self) -> dict:
+        """Load the results into columnar tables: metadata and exploded tags, keywords, \
+            contacts and feature attributes. See: \
+            :func:`~isogeo_pysdk.columnar.results_to_columns`.
+
+        :rtype: dict
+        """
+        from isogeo_pysdk.columnar import results_to_columns
+
+        return results_to_columns(self.results or ())
+
+    def to_frames(self, backend: str = "auto") -> dict:
+        """Load the results into typed pandas DataFrames or Arrow tables, to aggregate \
+            them with vectorized operations. Requires pandas or pyarrow. See: \
+            :func:`~isogeo_pysdk.columnar.columns_to_frames`.
+
+        :param str backend: "pandas", "arrow" or "auto" (pandas if installed, else Arrow)
+
+        :rtype: dict
+
+        :Example:
+
+        .. code-block:: python
+
+            search = isogeo.search(include=("feature-attributes",), whole_results=True)
+            frames = search.to_frames(backend="pandas")
+            # metadata by format and coordinate system
+            frames.get("metadata").groupby(["format", "coordinateSystem"]).size()
+        """
+        from isogeo_pysdk.columnar import columns_to_frames
+
+        return columns_to_frames(self.to_columns(), backend=backend)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
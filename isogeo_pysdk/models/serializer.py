@@ -0,0 +1,147 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Serializer shared by the models
+
+    Converts models into dictionaries (and JSON bytes) in a single pass, using a list of
+    fields compiled once per model class.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+import logging
+
+# optional: faster JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# values returned as is
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+# values kept as is inside lists and dictionaries
+_RAW_TYPES = _SCALAR_TYPES | {dict, list}
+
+# compiled fields by (model class, creation)
+_FIELDS = {}
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def _compile_fields(model_class: type, creation: bool = False) -> tuple:
+    """Build the list of fields to serialize for a model class, once.
+
+    :param type model_class: model class, with ATTR_TYPES, ATTR_CREA and ATTR_MAP tables
+    :param bool creation: option to use the creation fields (ATTR_CREA) and renamings (ATTR_MAP)
+
+    :returns: tuple of (attribute name, output key)
+    :rtype: tuple
+    """
+    if creation:
+        renamings = getattr(model_class, "ATTR_MAP", {})
+        fields = tuple(
+            (attr, renamings.get(attr, attr)) for attr in model_class.ATTR_CREA
+        )
+    else:
+        fields = tuple((attr, attr) for attr in model_class.ATTR_TYPES)
+
+    _FIELDS[model_class, creation] = fields
+    return fields
+
+
+def _convert(value):
+    """Convert a model nested into a list or a dictionary, keeping other values as is."""
+    if value.__class__ in _RAW_TYPES:
+        return value
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict is not None else value
+
+
+def serialize_value(value):
+    """Convert an attribute value into serializable values: nested models are converted \
+        using their `to_dict` method, lists and dictionaries are copied (one level).
+
+    :param value: value to convert
+    """
+    if value.__class__ in _SCALAR_TYPES:
+        return value
+    elif isinstance(value, list):
+        return [_convert(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: _convert(item) for key, item in value.items()}
+    else:
+        return _convert(value)
+
+
+def model_to_dict(model, creation: bool = False) -> dict:
+    """Returns the model properties as a dict. Used by the `to_dict` and `to_dict_creation` \
+        methods of the models.
+
+    Models storing their values into a `_data` dictionary (like :class:`Metadata`) are \
+    read directly, without their properties.
+
+    :param model: model to serialize
+    :param bool creation: option to structure the dict for creation purpose (POST/PUT): \
+        only ATTR_CREA attributes, renamed according to ATTR_MAP.
+
+    :rtype: dict
+    """
+    model_class = model.__class__
+    fields = _FIELDS.get((model_class, creation))
+    if fields is None:
+        fields = _compile_fields(model_class, creation)
+
+    data = getattr(model, "_data", None)
+    if data is not None:
+        return {key: serialize_value(data.get(attr)) for attr, key in fields}
+    else:
+        return {key: serialize_value(getattr(model, attr)) for attr, key in fields}
+
+
+def model_to_json(model, creation: bool = False) -> bytes:
+    """Returns the model properties as JSON bytes (UTF-8). Uses orjson if it's installed.
+
+    :param model: model to serialize
+    :param bool creation: option to structure the JSON for creation purpose (POST/PUT)
+
+    :rtype: bytes
+
+    :Example:
+
+    .. code-block:: python
+
+        # send a metadata without going through requests' JSON encoder
+        isogeo.post(
+            url=url,
+            data=model_to_json(metadata, creation=True),
+            headers={"Content-Type": "application/json", **isogeo.header},
+        )
+    """
+    data = model_to_dict(model, creation=creation)
+    if orjson is not None:
+        return orjson.dumps(data)
+    else:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -8,16 +8,13 @@
 #
 # Python:       2.7.x
 # Created:      14/04/2016
-# Updated:      10/05/2017
+# Updated:      18/10/2026
 # ------------------------------------------------------------------------------
 
 # ##############################################################################
 # ########## Libraries #############
 # ##################################
 
-# Standard library
-from collections import Counter
-
 # Isogeo
 from isogeo_pysdk import Isogeo, MetadataSearch
 
@@ -66,58 +63,31 @@ if __name__ == "__main__":
     else:
         pass
 
-    # variables
-    attributes = {}
-    attributes_names = []
-    attributes_types = []
-    attributes_alias = []
-    attributes_description = []
-    vectors_without_attributes = []
-
-    # parse
-    for md in search.results:
-        md_attributes = md.get("feature-attributes")
-        if not md_attributes:
-            vectors_without_attributes.append(
-                "{} ({})".format(md.get("title"), md.get("_id"))
-            )
-            continue
-        for field in md_attributes:
-            attributes_names.append(field.get("name"))
-            attributes_alias.append(field.get("alias", "NR"))
-            attributes_types.append(field.get("dataType"))
-            attributes_description.append(field.get("description", "NR"))
-            attributes[field.get("name")] = (
-                field.get("dataType"),
-                field.get("alias", "NR"),
-                field.get("description", "NR"),
-            )
+    # columnar tables of the results (requires pandas: pip install isogeo-pysdk[analytics])
+    frames = search.to_frames(backend="pandas")
+    metadata = frames.get("metadata")
+    attributes = frames.get("feature_attributes")
+    vectors_without_attributes = metadata[
+        ~metadata["_id"].isin(attributes["metadata_id"])
+    ]
 
     # global metrics
     print(
         "{} attributes among "
         "{} metadatas retrieved of which "
         "{} do not have feature attributes.".format(
-            len(attributes_names), len(search.results), len(vectors_without_attributes),
+            len(attributes),
+            len(metadata),
+            len(vectors_without_attributes),
         )
     )
 
-    # attributes names
-    names_frequency = Counter(attributes_names)
-    names_top10 = names_frequency.most_common(10)
-    print("\nTop 10 attributes names: ", names_top10)
-
-    # attributes types
-    types_frequency = Counter(attributes_types)
-    types_top10 = types_frequency.most_common(10)
-    print("\nTop 10 attributes types: ", types_top10)
-
-    # attributes aliases
-    alias_frequency = Counter(attributes_alias)
-    alias_top10 = alias_frequency.most_common(10)
-    print("\nTop 10 attributes aliases: ", alias_top10)
-
-    # attributes descriptions
-    description_frequency = Counter(attributes_description)
-    description_top10 = description_frequency.most_common(10)
-    print("\nTop 10 attributes descriptions: ", description_top10)
+    # top 10 by attributes names, types, aliases and descriptions
+    for column, label in (
+        ("name", "names"),
+        ("dataType", "types"),
+        ("alias", "aliases"),
+        ("description", "descriptions"),
+    ):
+        top10 = attributes[column].astype("string").fillna("NR").value_counts().head(10)
+        print("\nTop 10 attributes {}: ".format(label), list(top10.items()))
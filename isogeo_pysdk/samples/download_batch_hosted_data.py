@@ -18,6 +18,7 @@ from pathlib import Path
 
 # Isogeo
 from isogeo_pysdk import Isogeo
+from isogeo_pysdk.downloader import IsogeoDownloader
 
 # #############################################################################
 # ########## Globals ###############
@@ -63,11 +64,13 @@ if __name__ == "__main__":
         query="action:download",
         include=("links",),
     )
+    # parse and download, in parallel and resuming previous partial downloads
+    downloader = IsogeoDownloader(api_client=isogeo, out_dir=out_dir)
+    report = downloader.download(
+        [link for md in latest_data_modified.results for link in md.get("links")]
+    )
+    print(
+        "{downloaded} downloaded, {resumed} resumed, {skipped} skipped, "
+        "{failed} failed".format(**report)
+    )
     isogeo.close()
-    # parse and download
-    for md in latest_data_modified.results:
-        for link in filter(lambda x: x.get("type") == "hosted", md.get("links")):
-            dl_stream = isogeo.metadata.links.download_hosted(link=link)
-            with open(out_dir / dl_stream[1], "wb") as fd:
-                for block in dl_stream[0].iter_content(1024):
-                    fd.write(block)
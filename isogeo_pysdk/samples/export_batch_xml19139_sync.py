@@ -8,7 +8,7 @@
 #
 # Python:       3.5+
 # Created:      14/11/2016
-# Updated:      15/04/2019
+# Updated:      18/10/2026
 # ------------------------------------------------------------------------------
 
 # ##############################################################################
@@ -20,7 +20,7 @@ from pathlib import Path
 from timeit import default_timer
 
 # Isogeo
-from isogeo_pysdk import Isogeo, Metadata
+from isogeo_pysdk import Isogeo, IsogeoXmlExporter
 
 # #############################################################################
 # ########## Globals ###############
@@ -62,18 +62,24 @@ if __name__ == "__main__":
 
     # Process #########
     latest_data_modified = isogeo.search(
-        page_size=10, order_by="modified", whole_results=0
+        page_size=10, order_by="modified", whole_results=0, include=()
     )
-    isogeo.close()
 
-    for md in latest_data_modified.results:
-        metadata = Metadata.clean_attributes(md)
-        title = metadata.title
-        xml_stream = isogeo.metadata.download_xml(metadata)
+    # parallel export, skipping metadata not modified since the previous export
+    exporter = IsogeoXmlExporter(
+        api_client=isogeo,
+        output=out_dir / "xml19139",
+        state_path=out_dir / "xml19139_state.json",
+    )
+    report = exporter.export(latest_data_modified.results)
+    isogeo.close()
 
-        with open(out_dir / "{}.xml".format(title), "wb") as fd:
-            for block in xml_stream.iter_content(1024):
-                fd.write(block)
+    print(
+        "{exported} exported, {skipped} unchanged, {failed} failed "
+        "({throughput:.0f} bytes/s)".format(**report)
+    )
+    for md_id, error in report.get("errors").items():
+        print("Export of {} failed: {}".format(md_id, error))
 
     # chrono
     chrono_end = default_timer()
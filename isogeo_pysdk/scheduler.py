@@ -0,0 +1,284 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Scheduling of the requests sent by a client: rate limit and \
+    adaptive concurrency
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+
+# 3rd party
+from requests.exceptions import Timeout
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# latencies below this one (seconds) are not considered as a sign of overload
+_latency_floor = 0.05
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoScheduler(object):
+    """Budget shared by every request of an API client, whichever operation sends them \
+        (search pages, get_many, downloads, bulk...) and whichever thread.
+
+    - rate limit: a token bucket lets `rate` requests per second pass, with bursts up \
+        to `burst` requests.
+    - adaptive concurrency (AIMD): the number of requests in flight grows by one per \
+        round-trip while the API answers quickly. It's halved when the API is overloaded: \
+        `429 Too Many Requests`, `503 Service Unavailable`, timeouts or smoothed latency \
+        of a route above `latency_tolerance` times the lowest one observed on this route.
+    - a `429 Too Many Requests` pauses every request of the client during the delay set by \
+        its `Retry-After` header, then the request is sent again (up to `max_retries` times).
+
+    Created by :class:`~isogeo_pysdk.isogeo.Isogeo` and available as `isogeo.scheduler`. \
+    Requests to the token URL are not scheduled. A streamed response (download) leaves the \
+    budget once its headers are received.
+
+    :param float rate: maximum number of requests sent per second. None (default) for no limit.
+    :param int burst: number of requests which can be sent at once by the rate limit. \
+        Defaults to the rate.
+    :param int concurrency: initial number of requests in flight
+    :param int min_concurrency: lowest number of requests in flight
+    :param int max_concurrency: highest number of requests in flight. Should not exceed the \
+        connection pool size of the client.
+    :param float latency_tolerance: factor applied to the lowest latency observed on a route \
+        above which the API is considered as overloaded
+    :param int max_retries: number of times a request is sent again after a \
+        `429 Too Many Requests`
+
+    :Example:
+
+    .. code-block:: python
+
+        # at most 20 requests per second, whatever the number of threads
+        isogeo = Isogeo(..., scheduler=IsogeoScheduler(rate=20, max_concurrency=16))
+        isogeo.connect()
+        isogeo.metadata.get_many(md_ids)
+        print(isogeo.scheduler.snapshot())
+        >>> {'concurrency': 16, 'in_flight': 0, 'throttled': 0, 'overloads': 0, ...}
+    """
+
+    def __init__(
+        self,
+        rate: float = None,
+        burst: int = None,
+        concurrency: int = 10,
+        min_concurrency: int = 1,
+        max_concurrency: int = 50,
+        latency_tolerance: float = 2.0,
+        max_retries: int = 3,
+    ):
+        if min_concurrency < 1 or not min_concurrency <= concurrency <= max_concurrency:
+            raise ValueError(
+                "Concurrency settings must be: 1 <= min_concurrency <= concurrency "
+                "<= max_concurrency"
+            )
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second.")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_tolerance = latency_tolerance
+        self.max_retries = max_retries
+
+        self._condition = threading.Condition()
+        self._limit = float(concurrency)  # current concurrency, grown by fractions
+        self._in_flight = 0
+        self._tokens = float(self.burst)  # token bucket
+        self._filled_at = monotonic()
+        self._paused_until = 0.0  # set by Retry-After
+        self._latencies = {}  # by route: [lowest, exponential moving average]
+        self._decreased_at = 0.0
+
+        # statistics
+        self.stats = {"requests": 0, "throttled": 0, "overloads": 0, "waited": 0.0}
+
+    # -- PROPERTIES --------------------------------------------------------------------
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight.
+
+        :rtype: int
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight.
+
+        :rtype: int
+        """
+        return self._in_flight
+
+    # -- BUDGET ------------------------------------------------------------------------
+    def acquire(self):
+        """Wait until a request can be sent, then count it in flight."""
+        started = monotonic()
+        with self._condition:
+            while True:
+                now = monotonic()
+                delay = self._paused_until - now
+                if delay <= 0 and self._in_flight < int(self._limit):
+                    delay = self._take_token(now)
+                    if delay <= 0:
+                        break
+                elif delay <= 0:
+                    delay = None  # until a request is released
+                self._condition.wait(delay)
+
+            self._in_flight += 1
+            self.stats["requests"] += 1
+            self.stats["waited"] += monotonic() - started
+
+    def release(
+        self,
+        latency: float = None,
+        status: int = None,
+        retry_after: str = None,
+        route: str = None,
+        error: Exception = None,
+    ):
+        """Remove a request from the requests in flight and adapt the concurrency \
+            to the outcome.
+
+        :param float latency: duration (seconds) of the request. None if it failed.
+        :param int status: response status code. None if the request failed.
+        :param str retry_after: value of the `Retry-After` header of the response
+        :param str route: route template, whose latencies are compared together. \
+            See: :meth:`~isogeo_pysdk.metrics.IsogeoMetrics.route_template`
+        :param Exception error: error raised instead of a response. Timeouts are \
+            considered as an overload.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            now = monotonic()
+
+            if status == 429:
+                self.stats["throttled"] += 1
+                self._paused_until = max(
+                    self._paused_until, now + self.parse_retry_after(retry_after)
+                )
+                self._decrease(now)
+            elif status == 503 or isinstance(error, Timeout):
+                self._decrease(now)
+            elif latency is not None and status is not None:
+                self._observe(route, latency, now)
+
+            self._condition.notify_all()
+
+    def reset(self):
+        """Forget the observed latencies and come back to the initial settings, except \
+            the concurrency."""
+        with self._condition:
+            self._latencies.clear()
+            self._paused_until = 0.0
+            self._tokens = float(self.burst)
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict:
+        """Current state of the scheduler.
+
+        :rtype: dict
+        """
+        with self._condition:
+            return dict(
+                self.stats,
+                concurrency=self.concurrency,
+                in_flight=self._in_flight,
+                paused=max(self._paused_until - monotonic(), 0.0),
+            )
+
+    # -- UTILS -------------------------------------------------------------------------
+    @staticmethod
+    def parse_retry_after(retry_after: str, default: float = 1.0) -> float:
+        """Get the delay (seconds) set by a `Retry-After` header: a number of seconds \
+            or an HTTP date.
+
+        :param str retry_after: header value
+        :param float default: delay returned if the header is missing or unreadable
+
+        :rtype: float
+        """
+        if not retry_after:
+            return default
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time(), 0.0)
+        except (TypeError, ValueError):
+            logger.debug("Unreadable Retry-After header: {}".format(retry_after))
+            return default
+
+    def _take_token(self, now: float) -> float:
+        """Take a token from the bucket.
+
+        :param float now: monotonic time
+
+        :returns: 0 if a token has been taken, else delay (seconds) before the next one
+        :rtype: float
+        """
+        if self.rate is None:
+            return 0
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._filled_at) * self.rate
+        )
+        self._filled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def _observe(self, route: str, latency: float, now: float):
+        """Additive increase while the latency of the route stays close to its lowest one."""
+        latencies = self._latencies.get(route)
+        if latencies is None:
+            latencies = self._latencies[route] = [latency, latency]
+        else:
+            latencies[0] = min(latencies[0], latency)
+            latencies[1] = 0.8 * latencies[1] + 0.2 * latency
+
+        if latencies[1] > self.latency_tolerance * max(latencies[0], _latency_floor):
+            self._decrease(now, round_trip=latencies[1])
+        else:
+            # one more request in flight per round-trip of the whole window
+            self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+
+    def _decrease(self, now: float, round_trip: float = _latency_floor):
+        """Multiplicative decrease, at most once per round-trip: the requests already in \
+            flight were sent before the decrease."""
+        if now - self._decreased_at < round_trip:
+            return
+        self._decreased_at = now
+        self._limit = max(self.min_concurrency, self._limit / 2)
+        self.stats["overloads"] += 1
+        logger.debug(
+            "API overloaded, concurrency reduced to {}".format(self.concurrency)
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
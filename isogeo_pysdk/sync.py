@@ -0,0 +1,359 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Incremental synchronization of metadata into a local store
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from timeit import default_timer
+
+# submodules
+from isogeo_pysdk.models import Metadata
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# search parameters set by the synchronization itself
+RESERVED_FILTERS = (
+    "as_model",
+    "check",
+    "include",
+    "order_by",
+    "order_dir",
+    "specific_md",
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class SyncSink(object):
+    """Base class of the destinations where :class:`IsogeoSync` writes changes. Subclass it and \
+        implement :meth:`upsert` and :meth:`delete` to plug a database, an index, etc.
+    """
+
+    def upsert(self, metadata: Metadata):
+        """Create or replace a metadata in the destination.
+
+        :param Metadata metadata: metadata to write
+        """
+        raise NotImplementedError
+
+    def delete(self, metadata_id: str):
+        """Remove a metadata from the destination.
+
+        :param str metadata_id: UUID of the metadata deleted or no longer visible
+        """
+        raise NotImplementedError
+
+    def commit(self):
+        """Called once at the end of each synchronization, after every change has been written. \
+            Does nothing by default."""
+        pass
+
+
+class SyncSinkDict(SyncSink):
+    """Keep synchronized metadata in a dictionary, by UUID.
+
+    :param dict store: dictionary to fill. A new one is created if not set.
+    """
+
+    def __init__(self, store: dict = None):
+        self.store = store if store is not None else {}
+
+    def upsert(self, metadata: Metadata):
+        self.store[metadata._id] = metadata
+
+    def delete(self, metadata_id: str):
+        self.store.pop(metadata_id, None)
+
+
+class SyncSinkJsonFolder(SyncSink):
+    """Write each synchronized metadata as a JSON file named after its UUID.
+
+    :param str folder: path to the output folder. Created if it doesn't exist.
+    """
+
+    def __init__(self, folder: str):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    def upsert(self, metadata: Metadata):
+        out_path = self.folder / "{}.json".format(metadata._id)
+        with out_path.open("w", encoding="utf-8") as out_json:
+            json.dump(metadata.to_dict(), out_json, ensure_ascii=False, default=str)
+
+    def delete(self, metadata_id: str):
+        out_path = self.folder / "{}.json".format(metadata_id)
+        if out_path.exists():
+            out_path.unlink()
+
+
+class IsogeoSync(object):
+    """Mirror the metadata visible to an API client into a :class:`SyncSink`, fetching only \
+        what changed since the previous synchronization.
+
+    Each run:
+
+    1. scans the search results sorted by `_modified`, without subresources (cheap);
+    2. collects the metadata modified since the high-water mark (the latest `_modified` of \
+        the previous run). Records sharing the high-water mark but unknown at that time are \
+        collected too, to never miss simultaneous edits;
+    3. requests these metadata with the expected subresources, by batches of 100 through \
+        the search `specific_md` filter, and writes them into the sink;
+    4. if `detect_deletions` is enabled, compares the scanned UUIDs with the ones known from \
+        the previous run. Records moving while the results are paged can be skipped by the \
+        scan, so the missing UUIDs are requested again through the `specific_md` filter and \
+        only the ones still not found are removed from the sink. Otherwise, the scan stops \
+        as soon as it reaches the high-water mark;
+    5. stores the new state (high-water mark and known UUIDs) into `state_path`.
+
+    :param Isogeo api_client: authenticated API client
+    :param SyncSink sink: destination of the changes
+    :param str state_path: path to the JSON file storing the synchronization state. \
+        If not set, the state is only kept in memory (`state` attribute).
+    :param tuple include: subresources to fetch for changed metadata. Defaults to "all".
+    :param bool detect_deletions: option to scan every UUID to detect deletions
+    :param dict search_filters: filters passed to the search (group, query, share...). \
+        Sorting, subresources and output parameters are set by the synchronization.
+
+    :raises ValueError: if `search_filters` contains a parameter set by the synchronization
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import Isogeo
+        from isogeo_pysdk.sync import IsogeoSync, SyncSinkJsonFolder
+
+        isogeo = Isogeo(...)
+        isogeo.connect()
+
+        sync = IsogeoSync(
+            api_client=isogeo,
+            sink=SyncSinkJsonFolder("./mirror"),
+            state_path="./mirror/.sync_state.json",
+            search_filters={"query": "type:dataset"},
+        )
+        report = sync.run()
+        print(report)
+        >>> {'created': 0, 'updated': 3, 'deleted': 1, 'scanned': 5812, ...}
+    """
+
+    def __init__(
+        self,
+        api_client,
+        sink: SyncSink,
+        state_path: str = None,
+        include: tuple or str = "all",
+        detect_deletions: bool = True,
+        search_filters: dict = None,
+    ):
+        self.api_client = api_client
+        self.sink = sink
+        self.state_path = Path(state_path) if state_path else None
+        self.include = include
+        self.detect_deletions = detect_deletions
+        self.search_filters = search_filters or {}
+
+        # check filters
+        reserved = sorted(set(self.search_filters).intersection(RESERVED_FILTERS))
+        if reserved:
+            raise ValueError(
+                "search_filters can't contain {} which are set by the synchronization.".format(
+                    ", ".join(reserved)
+                )
+            )
+
+        # load previous state
+        self.state = self.load_state()
+
+    # -- STATE -------------------------------------------------------------------------
+    def load_state(self) -> dict:
+        """Load the state of the previous synchronization.
+
+        :rtype: dict
+        """
+        if self.state_path and self.state_path.exists():
+            with self.state_path.open("r", encoding="utf-8") as in_json:
+                state = json.load(in_json)
+            logger.debug(
+                "Sync state loaded: high-water mark {} with {} known metadata.".format(
+                    state.get("high_water_mark"), len(state.get("ids", []))
+                )
+            )
+            return state
+
+        return {
+            "high_water_mark": None,
+            "boundary_ids": [],
+            "ids": [],
+            "last_sync": None,
+        }
+
+    def save_state(self):
+        """Store the synchronization state into `state_path`, if set."""
+        if not self.state_path:
+            return
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as out_json:
+            json.dump(self.state, out_json)
+        tmp_path.replace(self.state_path)
+
+    # -- SYNCHRONIZATION ---------------------------------------------------------------
+    def _scan(self, known_ids: set = ()):
+        """Iterate over the stamps of the searched metadata, latest modified first, without \
+            subresources.
+
+        Results are paged by offset, so a record modified during the scan moves to the top \
+        and can shift another one past a page already read. If `detect_deletions` is enabled, \
+        the known UUIDs not met are then requested again by batches of 100 and the ones still \
+        existing are yielded at the end.
+
+        :param set known_ids: UUIDs known from the previous run
+
+        :rtype: Iterator[dict]
+        """
+        scanned_ids = set()
+        for md in self.api_client.search.iter(
+            include=(),
+            order_by="_modified",
+            order_dir="desc",
+            as_model=False,
+            **self.search_filters
+        ):
+            scanned_ids.add(md.get("_id"))
+            yield md
+
+        if not self.detect_deletions:
+            return
+
+        # check again the missing UUIDs before considering them as deleted
+        missing_ids = sorted(set(known_ids) - scanned_ids)
+        for idx in range(0, len(missing_ids), 100):
+            for md in self.api_client.search.iter(
+                specific_md=tuple(missing_ids[idx : idx + 100]),
+                include=(),
+                check=False,
+                as_model=False,
+                **self.search_filters
+            ):
+                if md.get("_id") not in scanned_ids:
+                    logger.debug(
+                        "Metadata {} skipped by the scan but still exists.".format(
+                            md.get("_id")
+                        )
+                    )
+                    scanned_ids.add(md.get("_id"))
+                    yield md
+
+    def run(self) -> dict:
+        """Synchronize the sink with the API.
+
+        :returns: report with counts of created, updated, deleted and scanned metadata, \
+            the new high-water mark and the duration (seconds)
+        :rtype: dict
+        """
+        start = default_timer()
+        high_water_mark = self.state.get("high_water_mark")
+        boundary_ids = set(self.state.get("boundary_ids", []))
+        known_ids = set(self.state.get("ids", []))
+
+        # 1. cheap scan on the stamps, latest modified first
+        scanned_ids = set()
+        changed_ids = []
+        new_high_water_mark = high_water_mark
+        new_boundary_ids = set(boundary_ids)
+        for md in self._scan(known_ids):
+            md_modified = md.get("_modified")
+            if (
+                high_water_mark is None
+                or md_modified > high_water_mark
+                or (
+                    md_modified == high_water_mark and md.get("_id") not in boundary_ids
+                )
+            ):
+                changed_ids.append(md.get("_id"))
+            elif md_modified < high_water_mark and not self.detect_deletions:
+                # sorted results: older ones are unchanged
+                break
+            scanned_ids.add(md.get("_id"))
+            if new_high_water_mark is None or md_modified > new_high_water_mark:
+                new_high_water_mark = md_modified
+                new_boundary_ids = {md.get("_id")}
+            elif md_modified == new_high_water_mark:
+                new_boundary_ids.add(md.get("_id"))
+
+        # 2. fetch changed metadata with their subresources, by batches
+        created = updated = 0
+        for idx in range(0, len(changed_ids), 100):
+            batch = tuple(changed_ids[idx : idx + 100])
+            for metadata in self.api_client.search.iter(
+                specific_md=batch,
+                include=self.include,
+                check=False,
+                **{
+                    k: v
+                    for k, v in self.search_filters.items()
+                    if k in ("group", "share")
+                }
+            ):
+                if metadata._id in known_ids:
+                    updated += 1
+                else:
+                    created += 1
+                self.sink.upsert(metadata)
+
+        # 3. deletions
+        deleted_ids = known_ids - scanned_ids if self.detect_deletions else set()
+        for md_id in deleted_ids:
+            self.sink.delete(md_id)
+
+        self.sink.commit()
+
+        # 4. store new state
+        if self.detect_deletions:
+            known_ids = scanned_ids
+        else:
+            known_ids.update(scanned_ids)
+        self.state = {
+            "high_water_mark": new_high_water_mark,
+            "boundary_ids": sorted(new_boundary_ids),
+            "ids": sorted(known_ids),
+            "last_sync": datetime.utcnow().isoformat(),
+        }
+        self.save_state()
+
+        report = {
+            "created": created,
+            "updated": updated,
+            "deleted": len(deleted_ids),
+            "scanned": len(scanned_ids),
+            "high_water_mark": new_high_water_mark,
+            "duration": round(default_timer() - start, 3),
+        }
+        logger.info("Synchronization done: {}".format(report))
+        return report
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Renewal of the API client token
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import threading
+import time
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoTokenManager(object):
+    """Keep the token of an API client valid. The token is renewed in background a little \
+        before its expiration, so that requests are not delayed by the renewal. Concurrent \
+        renewals (several threads finding an expired token or receiving a `401 Unauthorized`) \
+        are merged into a single token request.
+
+    Created by :class:`~isogeo_pysdk.isogeo.Isogeo` and available as `isogeo.token_manager`.
+
+    :param Isogeo api_client: API client whose token is renewed
+    :param int margin: delay (seconds) before the expiration from which the token is renewed
+    :param bool background: option to renew the token in a background thread. If False, \
+        the token is renewed by the first request sent within the margin.
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(..., token_refresh_margin=120)
+        isogeo.connect()
+        print(isogeo.token_manager.expires_in)
+        >>> 3599.7
+    """
+
+    def __init__(self, api_client, margin: int = 60, background: bool = True):
+        self.api_client = api_client
+        self.margin = margin
+        self.background = background
+        self._lock = threading.Lock()
+        self._timer = None
+
+    # -- PROPERTIES --------------------------------------------------------------------
+    @property
+    def expires_in(self) -> float:
+        """Seconds before the token expiration. Infinite if the token has no expiration.
+
+        :rtype: float
+        """
+        expires_at = (self.api_client.token or {}).get("expires_at")
+        if expires_at is None:
+            return float("inf")
+        return expires_at - time.time()
+
+    @property
+    def access_token(self) -> str:
+        """Current access token.
+
+        :rtype: str
+        """
+        return (self.api_client.token or {}).get("access_token")
+
+    # -- RENEWAL -----------------------------------------------------------------------
+    def ensure_valid(self):
+        """Renew the token if it expires within the margin. Cheap when the token is valid."""
+        if self.api_client.token and self.expires_in <= self.margin:
+            self.refresh(stale_token=self.access_token)
+        else:
+            pass
+
+    def refresh(self, stale_token: str = None) -> dict:
+        """Renew the token. If another thread renewed it while waiting for the lock, its \
+            token is kept and no request is sent.
+
+        :param str stale_token: access token known as expired or refused. If None, \
+            the token is renewed anyway.
+
+        :returns: current token
+        :rtype: dict
+        """
+        with self._lock:
+            if stale_token is not None and self.access_token != stale_token:
+                logger.debug("Token has already been renewed by another thread.")
+                return self.api_client.token
+
+            client = self.api_client
+            if client.auth_mode == "group":
+                # client credentials: a new token is fetched
+                client.token = client.fetch_token(
+                    token_url=client.auto_refresh_url,
+                    client_id=client.client_id,
+                    client_secret=client.client_secret,
+                    proxies=client.proxies,
+                    verify=client.ssl,
+                )
+            else:
+                client.token = client.refresh_token(
+                    token_url=client.auto_refresh_url,
+                    proxies=client.proxies,
+                    verify=client.ssl,
+                    **client.auto_refresh_kwargs,
+                )
+            logger.debug("Token has been renewed.")
+            self.schedule()
+            return client.token
+
+    def wait(self):
+        """Wait for the end of the renewal in progress, if any."""
+        if self._lock.locked():
+            with self._lock:
+                pass
+        else:
+            pass
+
+    def schedule(self):
+        """Plan the next renewal in background, from the current token expiration."""
+        self.cancel()
+        if not self.background or self.expires_in == float("inf"):
+            return
+
+        def refresh_in_background():
+            try:
+                self.refresh(stale_token=token)
+            except Exception as err:
+                # next requests will try again
+                logger.warning("Token renewal in background failed: {}".format(err))
+
+        token = self.access_token
+        self._timer = threading.Timer(
+            max(self.expires_in - self.margin, 0), refresh_in_background
+        )
+        self._timer.name = "IsogeoTokenRefresh"
+        self._timer.daemon = True
+        self._timer.start()
+
+    def cancel(self):
+        """Cancel the planned renewal."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
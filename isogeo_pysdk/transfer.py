@@ -0,0 +1,205 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Bookkeeping shared by the parallel transfers: downloads, uploads \
+        and exports
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from timeit import default_timer
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def part_path(path: Path) -> Path:
+    """Get the hidden path where a file is written until it's complete: `.{name}.part`, \
+        in the same folder.
+
+    :param Path path: path of the complete file
+
+    :rtype: Path
+    """
+    path = Path(path)
+    return path.with_name(".{}.part".format(path.name))
+
+
+@contextmanager
+def open_part(path: Path):
+    """Write a file through its `.part` file (see: :func:`part_path`). It's renamed into \
+        the file once written, or removed if writing failed.
+
+    :param Path path: path of the complete file
+
+    :Example:
+
+    .. code-block:: python
+
+        with open_part(Path("./export/metadata.xml")) as part_file:
+            for block in response.iter_content(65536):
+                part_file.write(block)
+    """
+    path_part = part_path(path)
+    try:
+        with path_part.open("wb") as part_file:
+            yield part_file
+        path_part.replace(path)
+    finally:
+        if path_part.exists():
+            path_part.unlink()
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TransferTracker(object):
+    """State of a run of transfers shared by its worker threads: bytes counters, progress, \
+        files names claimed by the items and final report.
+
+    :param callable progress: function called with the progress and the expected total
+    :param str unit: what the progress counts: 'bytes' (bytes done out of the expected \
+        bytes) or 'items' (processed items out of the total)
+
+    :Example:
+
+    .. code-block:: python
+
+        tracker = TransferTracker(progress=print)
+        tracker.start(expected_bytes=2048)
+        tracker.add_bytes(1024)
+        >>> 1024 2048
+        tracker.report(
+            results=[{"status": "done"}],
+            statuses=("done", "failed"),
+            message="{done} done and {failed} failed ({throughput:.0f} bytes/s).",
+        )
+    """
+
+    def __init__(self, progress: callable = None, unit: str = "bytes"):
+        self.progress = progress
+        self.unit = unit
+
+        self.lock = threading.Lock()
+        # bytes received or sent, bytes done (including the ones already there), expected
+        # bytes, processed items and total of items
+        self.stats = {}
+        self._names = {}  # files names claimed by the items of the run
+        self._start = None
+        self.start()
+
+    def start(self, expected_bytes: int = 0, total: int = 0, processed: int = 0):
+        """Reset the counters and the claimed names for a new run.
+
+        :param int expected_bytes: bytes expected to be transferred
+        :param int total: number of items of the run
+        :param int processed: number of items already processed (skipped before the run)
+        """
+        with self.lock:
+            self._names.clear()
+            self.stats.update(
+                bytes=0,
+                done_bytes=0,
+                expected_bytes=expected_bytes,
+                processed=processed,
+                total=total,
+            )
+            self._start = default_timer()
+
+    def add_bytes(self, size: int, transferred: bool = True):
+        """Count bytes done. Negative to cancel bytes which will be sent again.
+
+        :param int size: bytes done
+        :param bool transferred: False if bytes were already there (skipped or resumed file)
+        """
+        with self.lock:
+            self.stats["done_bytes"] += size
+            if transferred:
+                self.stats["bytes"] += size
+            done, total = self.stats.get("done_bytes"), self.stats.get("expected_bytes")
+        if self.unit == "bytes":
+            self._notify(done, total)
+
+    def add_processed(self):
+        """Count a processed item."""
+        with self.lock:
+            self.stats["processed"] += 1
+            done, total = self.stats.get("processed"), self.stats.get("total")
+        if self.unit == "items":
+            self._notify(done, total)
+
+    def claim_name(self, name: str, owner: str, discriminator: str) -> str:
+        """Claim a file name for an item of the run. If another item already claimed it, \
+            the discriminator of the item is added to the name.
+
+        :param str name: file name
+        :param str owner: identifier of the item claiming the name
+        :param str discriminator: text added to the name if it's claimed by another item: \
+            `{stem}_{discriminator}{suffix}`
+
+        :returns: name to use
+        :rtype: str
+        """
+        with self.lock:
+            if self._names.setdefault(name, owner) != owner:
+                path = Path(name)
+                name = "{}_{}{}".format(path.stem, discriminator, path.suffix)
+                self._names[name] = owner
+        return name
+
+    def report(self, results: list, statuses: tuple, message: str, **extra) -> dict:
+        """Build and log the report of the run: the count of results by status, the bytes \
+            transferred, the duration, the throughput (bytes per second), then `extra`.
+
+        :param list results: results of the items, each one with a 'status'
+        :param tuple statuses: statuses to count
+        :param str message: log message, formatted with the report
+        :param extra: items added to the report
+
+        :rtype: dict
+        """
+        duration = default_timer() - self._start
+        report = {
+            status: sum(1 for r in results if r.get("status") == status)
+            for status in statuses
+        }
+        report.update(
+            bytes=self.stats.get("bytes"),
+            duration=duration,
+            throughput=self.stats.get("bytes") / duration if duration else None,
+            **extra
+        )
+        logger.info(
+            message.format(**dict(report, throughput=report.get("throughput") or 0))
+        )
+        return report
+
+    def _notify(self, done: int, total: int):
+        """Call the progress function, if any."""
+        if self.progress is not None:
+            self.progress(done, total)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,401 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo Python SDK - Streamed and parallel upload of hosted data
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from uuid import uuid4
+
+# 3rd party
+from requests.exceptions import ConnectionError, Timeout
+
+# submodules
+from isogeo_pysdk.models import Link
+from isogeo_pysdk.transfer import TransferTracker
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# characters escaped in the multipart headers parameters (WHATWG HTML)
+_header_param_escapes = {ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"}
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class MultipartFileEncoder(object):
+    """Body of a `multipart/form-data` request made of form fields and one file, read by \
+        blocks while it is sent: the file is never loaded into memory. Pass it as `data` to \
+        requests with its `content_type` as `Content-Type` header. The body length is known, \
+        so it's sent with a `Content-Length` and can be read again from the start.
+
+    :param dict fields: form fields. Lists are sent as repeated fields, None values are \
+        skipped (like requests does).
+    :param str file_path: path to the file to send
+    :param str filename: file name sent to the server. Defaults to the name of the file.
+    :param str file_type: MIME type of the file
+    :param str file_field: name of the form field of the file
+    :param callable progress: function called after each block read with the bytes of the \
+        file read and the file size
+
+    :Example:
+
+    .. code-block:: python
+
+        with MultipartFileEncoder({"title": "Data"}, "./data.zip") as body:
+            requests.post(url, data=body, headers={"Content-Type": body.content_type})
+    """
+
+    def __init__(
+        self,
+        fields: dict,
+        file_path: str,
+        filename: str = None,
+        file_type: str = "application/octet-stream",
+        file_field: str = "file",
+        progress: callable = None,
+    ):
+        self.file_path = Path(file_path)
+        self.boundary = uuid4().hex
+        self.content_type = "multipart/form-data; boundary={}".format(self.boundary)
+        self.progress = progress
+
+        # form fields and file headers, then file content, then closing boundary
+        head = BytesIO()
+        for name, values in fields.items():
+            if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+                values = [values]
+            for value in values:
+                if value is None:
+                    continue
+                if not isinstance(value, bytes):
+                    value = str(value).encode("utf-8")
+                head.write(self._part_header(name))
+                head.write(value + b"\r\n")
+        head.write(
+            self._part_header(
+                file_field, filename or self.file_path.name, file_type=file_type
+            )
+        )
+        self._head = head.getvalue()
+        self._tail = "\r\n--{}--\r\n".format(self.boundary).encode("ascii")
+        self._file_size = self.file_path.stat().st_size
+        self.len = len(self._head) + self._file_size + len(self._tail)
+
+        self._file = None
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _part_header(
+        self, name: str, filename: str = None, file_type: str = None
+    ) -> bytes:
+        """Build the headers of a part.
+
+        :param str name: form field name
+        :param str filename: file name, for the file part
+        :param str file_type: MIME type, for the file part
+
+        :rtype: bytes
+        """
+        header = '--{}\r\nContent-Disposition: form-data; name="{}"'.format(
+            self.boundary, name.translate(_header_param_escapes)
+        )
+        if filename is not None:
+            header += '; filename="{}"\r\nContent-Type: {}'.format(
+                filename.translate(_header_param_escapes), file_type
+            )
+        return (header + "\r\n\r\n").encode("utf-8")
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next block of the body.
+
+        :param int size: maximum number of bytes to read. Reads everything if negative.
+
+        :rtype: bytes
+        """
+        if size is None or size < 0:
+            size = self.len - self._position
+        chunks = []
+        while size > 0 and self._position < self.len:
+            chunk = self._read_at(self._position, size)
+            self._position += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+        if self.progress is not None and chunks:
+            self.progress(
+                min(max(self._position - len(self._head), 0), self._file_size),
+                self._file_size,
+            )
+        return b"".join(chunks)
+
+    def _read_at(self, position: int, size: int) -> bytes:
+        """Read bytes from a position of the body, within one of its parts."""
+        file_start = len(self._head)
+        file_end = file_start + self._file_size
+        if position < file_start:
+            return self._head[position : position + size]
+        elif position < file_end:
+            if self._file is None:
+                self._file = self.file_path.open("rb")
+            self._file.seek(position - file_start)
+            return self._file.read(min(size, file_end - position))
+        else:
+            return self._tail[position - file_end : position - file_end + size]
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Move to a position of the body. Used to send it again."""
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            offset += self.len
+        self._position = max(0, min(offset, self.len))
+        return self._position
+
+    def close(self):
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class IsogeoUploader(object):
+    """Upload many files as hosted data, each one attached to a metadata through a new link.
+
+    - files are streamed (see :class:`MultipartFileEncoder`): memory doesn't grow with \
+        their size;
+    - several files are sent at the same time, so that a slow file doesn't hold the \
+        others back;
+    - a file is sent again after a network error or a server error (5xx, 429), up to \
+        `retries` times with an increasing delay. Client errors (4xx) are not retried;
+    - after a network error, the API may have created the link before the connection was \
+        lost: the links of the metadata are listed and a new hosted link (not there before \
+        the upload) with the same title and the size of the file is taken as the uploaded \
+        one, instead of sending the file again and creating a duplicate.
+
+    :param Isogeo api_client: authenticated API client
+    :param int max_workers: number of files sent at the same time
+    :param int retries: number of times a file is sent again after a failure
+    :param float backoff: delay (seconds) before the first retry, doubled at each retry
+    :param callable progress: function called after each block sent with the bytes sent \
+        and the total bytes of the files to send
+
+    :Example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+        from isogeo_pysdk import IsogeoUploader, Link
+
+        uploads = [
+            (metadata, Link(title=path.stem), path)
+            for metadata, path in zip(li_metadata, Path("./packages").glob("*.zip"))
+        ]
+        report = IsogeoUploader(api_client=isogeo, max_workers=4).upload(uploads)
+        print(report)
+        >>> {'uploaded': 120, 'failed': 0, 'retried': 2, 'bytes': 9876543210, ...}
+    """
+
+    def __init__(
+        self,
+        api_client,
+        max_workers: int = 4,
+        retries: int = 2,
+        backoff: float = 1.0,
+        progress: callable = None,
+    ):
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+
+        self._transfer = TransferTracker(progress=progress)
+        self.stats = self._transfer.stats
+
+    def upload(self, uploads: list) -> dict:
+        """Upload files, each one as a new hosted link of a metadata.
+
+        :param list uploads: tuples of (Metadata, Link, file path). See: \
+            :meth:`~isogeo_pysdk.api.routes_link.ApiLink.upload_hosted`
+
+        :returns: report with the counts of uploaded, failed and retried files, the bytes \
+            sent, the duration, the throughput (bytes per second) and the result of each \
+            file (see :meth:`upload_file`)
+        :rtype: dict
+        """
+        uploads = list(uploads)
+        self._transfer.start(
+            expected_bytes=sum(
+                Path(path).stat().st_size
+                for _, _, path in uploads
+                if Path(path).is_file()
+            )
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="IsogeoUpload"
+        ) as executor:
+            results = list(executor.map(lambda u: self.upload_file(*u), uploads))
+
+        return self._transfer.report(
+            results=results,
+            statuses=("uploaded", "failed"),
+            message="{uploaded} files uploaded, {failed} failed, {retried} retried "
+            "({throughput:.0f} bytes/s).",
+            retried=sum(1 for r in results if r.get("attempts") > 1),
+            files=results,
+        )
+
+    def upload_file(self, metadata, link, file_path: str) -> dict:
+        """Upload a file as a new hosted link of a metadata, retrying on transient errors. \
+            Errors are reported, not raised.
+
+        :param Metadata metadata: metadata to attach the file to
+        :param Link link: link to create
+        :param str file_path: path to the file
+
+        :returns: result with the metadata, the path, the status ('uploaded' or 'failed'), \
+            the created link, the number of attempts and the error if failed
+        :rtype: dict
+        """
+        result = {
+            "metadata": metadata,
+            "path": Path(file_path),
+            "status": "failed",
+            "link": None,
+            "attempts": 0,
+        }
+        sent = [0]  # bytes of the file counted into the progress
+        # links there before the upload, to recognize the one created by a lost response
+        known_ids = self._link_ids(metadata)
+
+        def progress(file_sent: int, file_size: int):
+            self._transfer.add_bytes(file_sent - sent[0])
+            sent[0] = file_sent
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+                # body is sent again from the start
+                progress(0, 0)
+            result["attempts"] = attempt + 1
+            try:
+                created = self.api_client.metadata.links.upload_hosted(
+                    metadata=metadata,
+                    link=link,
+                    file_to_upload=file_path,
+                    progress=progress,
+                )
+            except (ConnectionError, Timeout) as err:
+                result["error"] = str(err)
+                logger.warning("Upload of {} failed: {}".format(file_path, err))
+                created = self._find_uploaded(metadata, link, file_path, known_ids)
+                if created is None:
+                    continue
+                logger.info(
+                    "Upload of {} had been received before the connection was lost: "
+                    "not sent again.".format(file_path)
+                )
+            except Exception as err:
+                result["error"] = str(err)
+                logger.error("Upload of {} failed: {}".format(file_path, err))
+                break
+
+            if isinstance(created, tuple):
+                result["error"] = "API error: {}".format(created[1])
+                if created[1] >= 500 or created[1] == 429:
+                    continue
+                break
+
+            result.update(status="uploaded", link=created)
+            result.pop("error", None)
+            break
+
+        return result
+
+    def _link_ids(self, metadata) -> set:
+        """List the identifiers of the links of a metadata.
+
+        :param Metadata metadata: metadata
+
+        :returns: links UUIDs, None if links can't be listed
+        :rtype: set
+        """
+        links = self._list_links(metadata)
+        return None if links is None else {lk.get("_id") for lk in links}
+
+    def _list_links(self, metadata) -> list:
+        """List the links of a metadata, without raising on network errors.
+
+        :param Metadata metadata: metadata
+
+        :returns: links as dicts, None if links can't be listed
+        :rtype: list
+        """
+        try:
+            links = self.api_client.metadata.links.listing(metadata)
+        except (ConnectionError, Timeout) as err:
+            logger.warning("Links of {} can't be listed: {}".format(metadata._id, err))
+            return None
+        return None if isinstance(links, tuple) else links
+
+    def _find_uploaded(self, metadata, link, file_path: str, known_ids: set) -> Link:
+        """Find the link created by an upload whose response has been lost: a hosted link of \
+            the metadata created since the upload started, with the title of the link and the \
+            size of the file.
+
+        :param Metadata metadata: metadata the file was sent to
+        :param Link link: link sent
+        :param str file_path: path to the file sent
+        :param set known_ids: UUIDs of the links of the metadata before the upload. If None, \
+            the created link can't be told apart from the existing ones: nothing is found.
+
+        :returns: the created link, None if not found or if links can't be listed
+        :rtype: Link
+        """
+        links = self._list_links(metadata) if known_ids is not None else None
+        if links is None:
+            return None
+
+        file_size = Path(file_path).stat().st_size
+        for lk in links:
+            if (
+                lk.get("_id") not in known_ids
+                and lk.get("type") == "hosted"
+                and lk.get("title") == link.title
+                and lk.get("size") == file_size
+            ):
+                return Link(**lk)
+        return None
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -190,9 +190,9 @@ class IsogeoUtils(object):
             self.ssl,
         )
 
-    @classmethod
-    def set_lang_and_locale(cls, lang: str):
-        """Set requests language and the matching locale.
+    def set_lang_and_locale(self, lang: str):
+        """Set requests language and the matching locale. The language is specific to this \
+            instance, whereas the locale is process-wide.
 
         :param str lang: language code to set API localization ("en" or "fr"). Defaults to 'fr'.
         """
@@ -216,12 +216,15 @@ class IsogeoUtils(object):
             )
         logger.debug("Locale set to: {}".format(locale.getlocale()))
 
-        cls.lang = lang
+        self.lang = lang
 
     @classmethod
     def cache_clearer(cls, only_already_hit: bool = 1):
         """Clear all LRU cached functions.
 
+        Responses of the API client routes are not stored there but in the client cache: \
+            use `isogeo.cache.clear()` (see: :class:`~isogeo_pysdk.cache.IsogeoCache`).
+
         :param bool only_already_hit: option to clear cache only for functions which \
             have been already hit. Defaults to True.
         """
@@ -49,8 +49,11 @@ setup(
     # dependencies
     install_requires=["requests>=2.20.0", "requests-oauthlib>=1.2.0"],
     extras_require={
+        "analytics": ["pandas>=1.0", "pyarrow>=4.0"],
+        "async": ["aiohttp>=3.6"],
         "dev": ["black", "python-dotenv"],
-        "test": ["pytest", "pytest-cov"],
+        "speedups": ["orjson>=3.0"],
+        "test": ["pandas>=1.0", "pyarrow>=4.0", "pytest", "pytest-cov"],
     },
     python_requires=">=3.6, <4",
     # packaging
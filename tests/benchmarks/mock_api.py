@@ -0,0 +1,789 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Local stand-in of the Isogeo API, serving synthetic data to benchmark the SDK offline.
+
+    Served routes:
+
+    - POST oauth/token
+    - GET account and shares
+    - GET resources/search and groups/{id}/resources/search
+    - GET resources/{id}
+    - GET resources/{id}/keywords, resources/{id}/catalogs and resources/{id}/links
+    - GET groups/{id}/catalogs
+    - GET .../links/{id}... (hosted files)
+    - POST resources (bulk)
+    - POST resources/{id}/links (hosted file upload)
+
+    Usage as a standalone server:
+
+    ```python
+    python -m tests.benchmarks.mock_api --port 8000 --total 5000 --latency 20
+    ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from email.parser import BytesParser
+from email.policy import HTTP
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from uuid import UUID
+
+# 3rd party
+from requests.adapters import HTTPAdapter
+
+# package
+from isogeo_pysdk import AsyncIsogeo, Isogeo
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# hosts of the Isogeo platform redirected to the mock server
+MOCKED_HOSTS = ("api.isogeo.com", "v1.api.isogeo.com", "id.api.isogeo.com")
+
+# fields returned by the search when no sub-resource is included
+SEARCH_BASE_FIELDS = (
+    "_abilities",
+    "_created",
+    "_creator",
+    "_id",
+    "_modified",
+    "abstract",
+    "name",
+    "path",
+    "tags",
+    "title",
+    "type",
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class MockIsogeoApi(object):
+    """Threaded HTTP server answering like the Isogeo API with generated metadata.
+
+    :param int total: number of metadata in the fake share
+    :param float latency: delay in seconds added to every response
+    :param int payload_size: factor applied to the size of each metadata \
+        (abstract length, number of keywords, contacts, events...)
+    :param float error_rate: share of responses replaced by a `503 Service Unavailable`
+    :param int hosted_size: size in bytes of the hosted files
+    :param int token_lifetime: duration (seconds) of the issued tokens. Requests with an \
+        unknown or expired token get a `401 Unauthorized`.
+    :param int max_in_flight: number of requests processed at once beyond which a \
+        `429 Too Many Requests` is answered. None for no limit.
+    :param float retry_after: delay (seconds) sent in the `Retry-After` header of the 429
+    :param int seed: seed of the random generator, to get repeatable data and errors
+    :param str host: listening address
+    :param int port: listening port. 0 to pick a free one.
+
+    :Example:
+
+    .. code-block:: python
+
+        with MockIsogeoApi(total=5000, latency=0.02) as mock_api:
+            print(mock_api.url, mock_api.ids[:3])
+    """
+
+    def __init__(
+        self,
+        total: int = 2000,
+        latency: float = 0.0,
+        payload_size: int = 1,
+        error_rate: float = 0.0,
+        hosted_size: int = 10 * 1024 * 1024,
+        token_lifetime: int = 3600,
+        max_in_flight: int = None,
+        retry_after: float = 1,
+        seed: int = 42,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.total = total
+        self.latency = latency
+        self.payload_size = payload_size
+        self.error_rate = error_rate
+        self.hosted_size = hosted_size
+        self.token_lifetime = token_lifetime
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.tokens = {}  # expiration of the issued tokens
+        self.uploads = []  # files received: metadata, fields, file name, size and hash
+        self.created_links = {}  # links created by the uploads, by metadata
+        self.upload_drops = 0  # number of next uploads processed but left unanswered
+        self.bulks = []  # bulk payloads received
+        self.bulk_failures = 0  # number of next bulk requests answered with an error
+        self.bulk_failure_status = 500  # status of these errors
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "tokens": 0, "throttled": 0}
+        self._stats_lock = threading.Lock()
+
+        # synthetic data
+        self.workgroup = self._workgroup(rand=random.Random(seed))
+        self.records = [self._metadata(i) for i in range(total)]
+        self.by_id = {md.get("_id"): md for md in self.records}
+        self.ids = [md.get("_id") for md in self.records]
+        self.catalogs = [self._catalog(i) for i in range(max(3, payload_size))]
+
+        # server
+        self.server = ThreadingHTTPServer((host, port), MockApiHandler)
+        self.server.daemon_threads = True
+        self.server.mock_api = self
+        self._thread = None
+
+    # -- LIFECYCLE ---------------------------------------------------------------------
+    @property
+    def url(self) -> str:
+        """Base URL of the running server.
+
+        :rtype: str
+        """
+        return "http://{}:{}".format(*self.server.server_address[:2])
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="MockIsogeoApi", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Mock Isogeo API listening on {}".format(self.url))
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    # -- DATA --------------------------------------------------------------------------
+    def _uuid(self, rand: random.Random) -> str:
+        return UUID(int=rand.getrandbits(128), version=4).hex
+
+    def _workgroup(self, rand: random.Random) -> dict:
+        return {
+            "_id": self._uuid(rand),
+            "_tag": "owner:{}".format(self._uuid(rand)),
+            "contact": {"_id": self._uuid(rand), "name": "Benchmark workgroup"},
+            "canCreateMetadata": True,
+        }
+
+    def _catalog(self, index: int) -> dict:
+        rand = random.Random(index)
+        catalog_id = self._uuid(rand)
+        return {
+            "_abilities": ["catalog:delete", "catalog:update"],
+            "_created": "2019-01-01T00:00:00.000000+00:00",
+            "_id": catalog_id,
+            "_modified": "2019-01-01T00:00:00.000000+00:00",
+            "_tag": "catalog:{}".format(catalog_id),
+            "code": "catalog-{}".format(index),
+            "count": self.total,
+            "name": "Catalog {}".format(index),
+            "owner": self.workgroup,
+            "scan": False,
+        }
+
+    def _keyword(self, rand: random.Random, index: int) -> dict:
+        keyword_id = self._uuid(rand)
+        return {
+            "_id": keyword_id,
+            "_tag": "keyword:isogeo:keyword-{}".format(index),
+            "code": "keyword-{}".format(index),
+            "text": "Keyword {}".format(index),
+            "thesaurus": {"_id": "1616597fbc4348c8b11ef9d59cf594c8", "code": "isogeo"},
+        }
+
+    def _metadata(self, index: int) -> dict:
+        """Build a complete metadata, stable for a given index."""
+        rand = random.Random(index)
+        md_id = self._uuid(rand)
+        size = self.payload_size
+        created = datetime(2015, 1, 1) + timedelta(minutes=index)
+        keywords = [self._keyword(rand, rand.randrange(200)) for _ in range(5 * size)]
+        return {
+            "_abilities": ["resource:delete", "resource:update"],
+            "_created": created.isoformat() + ".000000+00:00",
+            "_creator": self.workgroup,
+            "_id": md_id,
+            "_modified": (created + timedelta(days=1)).isoformat() + ".000000+00:00",
+            "abstract": "Lorem ipsum dolor sit amet. " * 20 * size,
+            "conditions": [
+                {"_id": self._uuid(rand), "description": "Use it with care."}
+                for _ in range(size)
+            ],
+            "contacts": [
+                {
+                    "_id": self._uuid(rand),
+                    "role": "pointOfContact",
+                    "contact": {
+                        "_id": self._uuid(rand),
+                        "name": "Contact {}".format(i),
+                        "email": "contact{}@example.com".format(i),
+                    },
+                }
+                for i in range(2 * size)
+            ],
+            "coordinate-system": {"code": "2154", "name": "RGF93 / Lambert-93"},
+            "events": [
+                {"_id": self._uuid(rand), "date": "2019-01-01", "kind": "update"}
+                for _ in range(3 * size)
+            ],
+            "format": "shp",
+            "keywords": keywords,
+            "links": [
+                {
+                    "_id": self._uuid(rand),
+                    "kind": "data",
+                    "size": self.hosted_size,
+                    "actions": ["download"],
+                    "title": "Hosted data",
+                    "type": "hosted",
+                    "url": "/resources/{}/links/{}.bin".format(md_id, self._uuid(rand)),
+                }
+            ],
+            "name": "dataset_{}.shp".format(index),
+            "path": "/data/dataset_{}.shp".format(index),
+            "tags": dict(
+                {kw.get("_tag"): kw.get("text") for kw in keywords},
+                **{"format:shp": "ESRI Shapefile", "type:vector-dataset": "Vecteur"},
+            ),
+            "title": "Metadata {}".format(index),
+            "type": "vectorDataset",
+        }
+
+    # -- BEHAVIOR ----------------------------------------------------------------------
+    def should_fail(self) -> bool:
+        """Draw if the current response has to be an error."""
+        if not self.error_rate:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.error_rate
+
+    def issue_token(self, grant_type: str = "client_credentials") -> dict:
+        """Create a new token.
+
+        :param str grant_type: oAuth2 grant requested. User grants ('password' and \
+            'refresh_token') also get a refresh token.
+        """
+        with self._stats_lock:
+            self.stats["tokens"] += 1
+            access_token = "mock-token-{}".format(self.stats.get("tokens"))
+            self.tokens[access_token] = time.time() + self.token_lifetime
+        token = {
+            "access_token": access_token,
+            "token_type": "Bearer",
+            "expires_in": self.token_lifetime,
+        }
+        if grant_type in ("password", "refresh_token"):
+            token["refresh_token"] = "mock-refresh-{}".format(access_token)
+        return token
+
+    def is_authorized(self, authorization: str) -> bool:
+        """Check the token sent in the Authorization header."""
+        access_token = (authorization or "").replace("Bearer ", "")
+        return self.tokens.get(access_token, 0) > time.time()
+
+    def revoke_tokens(self):
+        """Make every issued token invalid."""
+        with self._stats_lock:
+            self.tokens.clear()
+
+    def enter(self) -> bool:
+        """Count a request in process.
+
+        :returns: False if too many requests are already processed
+        """
+        with self._stats_lock:
+            self.in_flight += 1
+            if self.max_in_flight and self.in_flight > self.max_in_flight:
+                self.stats["throttled"] += 1
+                return False
+            return True
+
+    def leave(self):
+        """Count the end of a request process."""
+        with self._stats_lock:
+            self.in_flight -= 1
+
+    def count(self, error: bool = False):
+        """Count a served request."""
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["errors"] += error
+
+    def upload(self, md_id: str, content_type: str, body: bytes) -> list:
+        """Store a hosted file sent as multipart form and answer with the created link."""
+        message = BytesParser(policy=HTTP).parsebytes(
+            "Content-Type: {}\r\n\r\n".format(content_type).encode("utf-8") + body
+        )
+        upload = {"metadata": md_id, "fields": {}}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if part.get_filename() is None:
+                upload["fields"][name] = part.get_content()
+            else:
+                content = part.get_payload(decode=True)
+                upload.update(
+                    filename=part.get_filename(),
+                    size=len(content),
+                    sha256=sha256(content).hexdigest(),
+                )
+        with self._stats_lock:
+            self.uploads.append(upload)
+        with self._random_lock:
+            link_id = self._uuid(self._random)
+        link = {
+            "_id": link_id,
+            "actions": ["download"],
+            "kind": "data",
+            "size": upload.get("size"),
+            "title": upload.get("fields").get("title"),
+            "type": "hosted",
+            "url": "/resources/{}/links/{}.bin".format(md_id, link_id),
+        }
+        with self._stats_lock:
+            self.created_links.setdefault(md_id, []).append(link)
+        return [link]
+
+    def drop_upload(self) -> bool:
+        """Check if the response of an upload must be lost, like on a network failure."""
+        with self._stats_lock:
+            if self.upload_drops > 0:
+                self.upload_drops -= 1
+                return True
+        return False
+
+    def bulk(self, payload: list) -> tuple:
+        """Report bulk requests: unknown metadata are ignored.
+
+        :returns: response body and status
+        """
+        with self._stats_lock:
+            if self.bulk_failures:
+                self.bulk_failures -= 1
+                return {"error": "Bulk failed (mock)"}, self.bulk_failure_status
+            self.bulks.append(payload)
+        return (
+            [
+                {
+                    "ignored": {
+                        md_id: "notFound"
+                        for md_id in request.get("query").get("ids")
+                        if md_id not in self.by_id
+                    },
+                    "request": request,
+                }
+                for request in payload
+            ],
+            200,
+        )
+
+    def search(self, params: dict) -> dict:
+        """Answer to a search with the query parameters sent by the SDK."""
+        results = self.records
+        specific_md = params.get("_id")
+        if specific_md:
+            results = [
+                self.by_id.get(i) for i in specific_md.split(",") if i in self.by_id
+            ]
+
+        # sorting
+        order_by = params.get("ob", "_created")
+        if order_by in ("_created", "_modified"):
+            results = sorted(
+                results,
+                key=lambda md: md.get(order_by),
+                reverse=params.get("od", "desc") == "desc",
+            )
+
+        # page
+        total = len(results)
+        limit = min(int(params.get("_limit", 20)), 100)
+        offset = int(params.get("_offset", 0))
+        page = results[offset : offset + limit]
+
+        # sub-resources
+        includes = params.get("_include", "")
+        if includes != "all":
+            fields = set(SEARCH_BASE_FIELDS).union(includes.split(","))
+            page = [{k: v for k, v in md.items() if k in fields} for md in page]
+
+        return {
+            "envelope": None,
+            "limit": limit,
+            "offset": offset,
+            "query": {"_tags": [], "_terms": []},
+            "results": page,
+            "tags": {"type:vector-dataset": "Vecteur"},
+            "total": total,
+        }
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Dispatch requests to the :class:`MockIsogeoApi` attached to the server."""
+
+    disable_nagle_algorithm = True  # headers and body are written apart
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def api(self) -> MockIsogeoApi:
+        return self.server.mock_api
+
+    def send_json(self, data, status: int = 200, headers: dict = None):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.api.count(error=status >= 400)
+
+    def send_file(self, name: str):
+        # resume from the requested position (Range: bytes=start-)
+        start = 0
+        requested_range = self.headers.get("Range", "")
+        if requested_range.startswith("bytes="):
+            start = int(requested_range[6:].split("-")[0])
+            if start >= self.api.hosted_size:
+                self.send_json({"error": "Range Not Satisfiable"}, status=416)
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                "bytes {}-{}/{}".format(
+                    start, self.api.hosted_size - 1, self.api.hosted_size
+                ),
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Disposition", "attachment; filename={}".format(name))
+        self.send_header("Content-Length", str(self.api.hosted_size - start))
+        self.end_headers()
+        block = b"\0" * 65536
+        remaining = self.api.hosted_size - start
+        while remaining > 0:
+            self.wfile.write(block[:remaining])
+            remaining -= len(block)
+        self.api.count()
+
+    def send_xml(self, md: dict):
+        # minimal ISO 19139 export, sent by chunks like the API does
+        xml = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<gmd:MD_Metadata xmlns:gmd="http://www.isotc211.org/2005/gmd" '
+            'xmlns:gco="http://www.isotc211.org/2005/gco">\n'
+            "  <gmd:fileIdentifier><gco:CharacterString>{_id}</gco:CharacterString>"
+            "</gmd:fileIdentifier>\n"
+            "  <gmd:dateStamp><gco:DateTime>{_modified}</gco:DateTime></gmd:dateStamp>\n"
+            "  <gmd:abstract><gco:CharacterString>{abstract}</gco:CharacterString>"
+            "</gmd:abstract>\n"
+            "</gmd:MD_Metadata>\n".format(**md)
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for idx in range(0, len(xml), 4096):
+            block = xml[idx : idx + 4096]
+            self.wfile.write("{:x}\r\n".format(len(block)).encode("ascii"))
+            self.wfile.write(block + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.api.count()
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def prepare(self) -> tuple:
+        """Common part of requests: latency, errors and URL parsing.
+
+        :returns: path segments and query parameters, or None if an error has been sent
+        """
+        accepted = self.api.enter()
+        try:
+            if self.api.latency:
+                time.sleep(self.api.latency)
+        finally:
+            self.api.leave()
+        if not accepted:
+            self.read_body()
+            self.send_json(
+                {"error": "Too Many Requests (mock)"},
+                status=429,
+                headers={"Retry-After": str(self.api.retry_after)},
+            )
+            return None
+        if self.api.should_fail():
+            self.read_body()
+            self.send_json({"error": "Service Unavailable (mock)"}, status=503)
+            return None
+        url = urlsplit(self.path)
+        segments = [s for s in url.path.split("/") if s]
+        if segments[-2:] != ["oauth", "token"] and not self.api.is_authorized(
+            self.headers.get("Authorization")
+        ):
+            self.read_body()
+            self.send_json({"error": "Unauthorized (mock)"}, status=401)
+            return None
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        return segments, params
+
+    def do_GET(self):
+        prepared = self.prepare()
+        if prepared is None:
+            return
+        segments, params = prepared
+
+        if segments[-1:] == ["search"] and "resources" in segments:
+            self.send_json(self.api.search(params))
+        elif segments == ["account"]:
+            self.send_json(
+                {
+                    "_id": self.api.workgroup.get("_id"),
+                    "contact": {"name": "Benchmark user", "email": "user@example.com"},
+                    "language": "fr",
+                    "staff": False,
+                    "timezone": "Europe/Paris",
+                }
+            )
+        elif segments == ["shares"]:
+            self.send_json(
+                [
+                    {
+                        "_id": self.api.workgroup.get("_id"),
+                        "applications": [
+                            {
+                                "_id": self.api.workgroup.get("_id"),
+                                "name": "Benchmark",
+                                "type": "group",
+                            }
+                        ],
+                        "name": "Benchmark share",
+                        "type": "application",
+                    }
+                ]
+            )
+        elif segments[:1] == ["resources"] and segments[2:] == ["links"]:
+            md = self.api.by_id.get(segments[1]) or {}
+            self.send_json(
+                md.get("links", []) + self.api.created_links.get(segments[1], [])
+            )
+        elif "links" in segments:
+            self.send_file(segments[-1])
+        elif segments[:1] == ["groups"] and segments[2:] == ["catalogs"]:
+            self.send_json(self.api.catalogs)
+        elif segments[:1] == ["resources"] and segments[1].endswith(".xml"):
+            md = self.api.by_id.get(segments[1][:-4])
+            if md is None:
+                self.send_json({"error": "Not found"}, status=404)
+            else:
+                self.send_xml(md)
+        elif segments[:1] == ["resources"] and len(segments) >= 2:
+            md = self.api.by_id.get(segments[1])
+            if md is None:
+                self.send_json({"error": "Not found"}, status=404)
+            elif segments[2:] == ["keywords"]:
+                self.send_json(md.get("keywords"))
+            elif segments[2:] == ["catalogs"]:
+                self.send_json(self.api.catalogs)
+            else:
+                self.send_json(md)
+        else:
+            self.send_json({"error": "Not served by the mock"}, status=404)
+
+    def do_POST(self):
+        prepared = self.prepare()
+        if prepared is None:
+            return
+        segments, params = prepared
+        body = self.read_body()
+
+        if segments[-2:] == ["oauth", "token"]:
+            form = parse_qs(body.decode("utf-8"))
+            self.send_json(
+                self.api.issue_token(form.get("grant_type", ["client_credentials"])[0])
+            )
+        elif segments == ["resources"]:
+            self.send_json(*self.api.bulk(json.loads(body)))
+        elif segments[:1] == ["resources"] and segments[2:] == ["links"]:
+            created = self.api.upload(
+                segments[1], self.headers.get("Content-Type"), body
+            )
+            if self.api.drop_upload():
+                # link created but connection lost before the response
+                self.close_connection = True
+                return
+            self.send_json(created)
+        else:
+            self.send_json({"error": "Not served by the mock"}, status=404)
+
+
+class MockApiAdapter(HTTPAdapter):
+    """Transport adapter sending the requests for the Isogeo hosts to the mock server, \
+        so the whole SDK pipeline (OAuth, middlewares, hooks, retries) is exercised.
+
+    :param str target: base URL of the mock server
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(...)
+        MockApiAdapter(mock_api.url).mount_on(isogeo)
+        isogeo.connect(username="user", password="pass")
+    """
+
+    def __init__(self, target: str, **kwargs):
+        super(MockApiAdapter, self).__init__(**kwargs)
+        self.target = target
+
+    def mount_on(self, session):
+        """Mount the adapter on the Isogeo hosts. Their prefixes are longer than \
+            `https://` so the adapter is kept when the client mounts its own.
+
+        :param requests.Session session: session to redirect
+        """
+        for host in MOCKED_HOSTS:
+            session.mount("https://{}/".format(host), self)
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        request.url = "{}{}{}".format(
+            self.target, url.path, "?" + url.query if url.query else ""
+        )
+        return super(MockApiAdapter, self).send(request, **kwargs)
+
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def make_client(mock_api: MockIsogeoApi, connect: bool = True, **kwargs) -> Isogeo:
+    """Build an API client (group authentication, without cache) redirected to the mock \
+        server, authenticated unless `connect` is False.
+
+    :param MockIsogeoApi mock_api: started mock server
+    :param bool connect: option to get a token
+    :param kwargs: options of the client, overriding the defaults
+
+    :rtype: Isogeo
+
+    :Example:
+
+    .. code-block:: python
+
+        with MockIsogeoApi(total=100) as mock_api:
+            isogeo = make_client(mock_api, lang="en")
+            print(isogeo.search(page_size=0).total)
+            >>> 100
+    """
+    params = {
+        "auth_mode": "group",
+        "client_id": "test-{}".format(mock_api.workgroup.get("_id")),
+        "client_secret": "s" * 64,
+        "auto_refresh_url": "https://id.api.isogeo.com/oauth/token",
+        "platform": "prod",
+        "cache": False,
+    }
+    params.update(kwargs)
+    isogeo = Isogeo(**params)
+    MockApiAdapter(target=mock_api.url).mount_on(isogeo)
+    if connect:
+        isogeo.connect()
+    return isogeo
+
+
+def make_async_client(mock_api: MockIsogeoApi, **kwargs) -> AsyncIsogeo:
+    """Build an asynchronous API client (group authentication) redirected to the mock \
+        server. Requires aiohttp.
+
+    :param MockIsogeoApi mock_api: started mock server
+    :param kwargs: options of the client, overriding the defaults
+
+    :rtype: AsyncIsogeo
+
+    :Example:
+
+    .. code-block:: python
+
+        async with make_async_client(mock_api) as isogeo:
+            await isogeo.connect()
+            search = await isogeo.search(page_size=0)
+    """
+    params = {
+        "auth_mode": "group",
+        "client_id": "test-{}".format(mock_api.workgroup.get("_id")),
+        "client_secret": "s" * 64,
+        "auto_refresh_url": "{}/oauth/token".format(mock_api.url),
+        "platform": "prod",
+    }
+    params.update(kwargs)
+    isogeo = AsyncIsogeo(**params)
+
+    # aiohttp has no transport adapters: routes URLs are built for the mock server
+    build_url = isogeo.utils.get_request_base_url
+
+    def get_request_base_url(route: str, prot: str = "https") -> str:
+        url = urlsplit(build_url(route, prot))
+        return "{}{}?{}".format(mock_api.url, url.path, url.query)
+
+    isogeo.utils.get_request_base_url = get_request_base_url
+    return isogeo
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in of the Isogeo API")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--total", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0, help="in milliseconds")
+    parser.add_argument("--payload-size", type=int, default=1)
+    parser.add_argument("--error-rate", type=float, default=0)
+    args = parser.parse_args()
+
+    mock_api = MockIsogeoApi(
+        total=args.total,
+        latency=args.latency / 1000,
+        payload_size=args.payload_size,
+        error_rate=args.error_rate,
+        port=args.port,
+    )
+    print("Serving {} metadata on {}".format(args.total, mock_api.url))
+    try:
+        mock_api.server.serve_forever()
+    except KeyboardInterrupt:
+        mock_api.stop()
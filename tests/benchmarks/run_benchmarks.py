@@ -0,0 +1,415 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Offline benchmarks of the SDK against a local stand-in of the Isogeo API.
+
+    Every scenario is run through the whole client pipeline (OAuth session, middlewares, \
+    hooks, retries) and measured: wall time, throughput, requests latency by route and \
+    peak memory. Results are stored as JSON to compare versions.
+
+    Usage from the repo root folder:
+
+    ```python
+    # run every scenario and store the results
+    python -m tests.benchmarks.run_benchmarks --output bench_3.5.1.json
+
+    # simulate a slow network with errors and compare with a previous run
+    python -m tests.benchmarks.run_benchmarks --latency 30 --error-rate 0.01 \
+        --compare bench_3.5.0.json
+
+    # simulate an API throttling beyond 8 requests at once (429 Too Many Requests)
+    python -m tests.benchmarks.run_benchmarks --latency 30 --max-in-flight 8
+
+    # only some scenarios
+    python -m tests.benchmarks.run_benchmarks --scenarios search_page get_many
+    ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from timeit import default_timer
+
+# 3rd party
+from urllib3.util import Retry
+
+# Isogeo
+from isogeo_pysdk import (
+    Isogeo,
+    IsogeoDownloader,
+    IsogeoXmlExporter,
+    Keyword,
+    Link,
+    __version__,
+)
+from tests.benchmarks.mock_api import MockApiAdapter, MockIsogeoApi
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Scenarios #############
+# ##################################
+# each scenario sends its requests and returns the number of processed items
+
+
+def search_page(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """One page of 100 complete metadata."""
+    return len(isogeo.search(page_size=100, include="all").results)
+
+
+def search_whole_results(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """Every metadata, pages requested at once from offsets."""
+    return len(isogeo.search(include="all", whole_results=True).results)
+
+
+def search_keyset(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """Every metadata, pages overlapping on a stable key."""
+    return len(
+        isogeo.search(include="all", whole_results=True, pagination="keyset").results
+    )
+
+
+def search_iter(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """Every metadata, streamed page by page."""
+    return sum(1 for _ in isogeo.search.iter(include="all"))
+
+
+def metadata_get(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """100 metadata, one request each, with their keywords and catalogs."""
+    for md_id in mock_api.ids[:100]:
+        isogeo.metadata.get(md_id, include="all")
+        isogeo.keyword.metadata(md_id)
+        isogeo.catalog.metadata(md_id)
+    return 100
+
+
+def get_many(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """1000 metadata fetched by batches."""
+    return len(isogeo.metadata.get_many(mock_api.ids[:1000], include="all"))
+
+
+def bulk(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """A keyword added to every metadata, in one bulk request."""
+    keyword = Keyword(**mock_api.records[0].get("keywords")[0])
+    for i in range(0, len(mock_api.ids), 100):
+        isogeo.metadata.bulk.prepare(
+            metadatas=mock_api.ids[i : i + 100],
+            action="add",
+            target="keywords",
+            models=(keyword,),
+        )
+    return sum(
+        len(r.request.get("query").get("ids")) for r in isogeo.metadata.bulk.send()
+    )
+
+
+def hosted_download(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """A hosted file downloaded by blocks. Items are bytes."""
+    link = Link(**mock_api.records[0].get("links")[0])
+    stream, filename, size = isogeo.metadata.links.download_hosted(link)
+    return sum(len(block) for block in stream.iter_content(65536))
+
+
+def download_many(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """8 hosted files downloaded in parallel to disk. Items are bytes."""
+    links = [md.get("links")[0] for md in mock_api.records[:8]]
+    with tempfile.TemporaryDirectory() as out_dir:
+        return IsogeoDownloader(api_client=isogeo, out_dir=out_dir).download(links)[
+            "bytes"
+        ]
+
+
+def export_xml(isogeo: Isogeo, mock_api: MockIsogeoApi) -> int:
+    """1000 metadata exported into XML ISO 19139 in parallel, into a zip archive."""
+    records = [
+        {"_id": md.get("_id"), "_modified": md.get("_modified")}
+        for md in mock_api.records[:1000]
+    ]
+    with tempfile.TemporaryDirectory() as out_dir:
+        return IsogeoXmlExporter(
+            api_client=isogeo, output=Path(out_dir) / "export.zip"
+        ).export(records)["exported"]
+
+
+SCENARIOS = {
+    func.__name__: func
+    for func in (
+        search_page,
+        search_whole_results,
+        search_keyset,
+        search_iter,
+        metadata_get,
+        get_many,
+        bulk,
+        hosted_download,
+        download_many,
+        export_xml,
+    )
+}
+
+# statements whose import time is measured in a fresh interpreter
+IMPORT_STATEMENTS = (
+    "import isogeo_pysdk",
+    "from isogeo_pysdk import Metadata",
+    "from isogeo_pysdk import Isogeo",
+)
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def get_client(mock_api: MockIsogeoApi, json_decoder: str = "auto") -> Isogeo:
+    """Authenticated client whose requests are sent to the mock server.
+
+    :param MockIsogeoApi mock_api: running mock server
+    :param str json_decoder: JSON decoder used by the client
+
+    :rtype: Isogeo
+    """
+    isogeo = Isogeo(
+        auth_mode="user_legacy",
+        client_id="benchmark-{}".format(mock_api.workgroup.get("_id")),
+        client_secret="s" * 64,
+        auto_refresh_url="https://id.api.isogeo.com/oauth/token",
+        platform="prod",
+        cache=False,
+        json_decoder=json_decoder,
+        metrics=True,
+    )
+    MockApiAdapter(
+        target=mock_api.url,
+        max_retries=Retry(
+            total=isogeo.max_retries, backoff_factor=0, status_forcelist=[502, 503, 504]
+        ),
+        pool_connections=isogeo.pool_connections,
+        pool_maxsize=isogeo.pool_maxsize,
+    ).mount_on(isogeo)
+    isogeo.connect(username="benchmark@example.com", password="benchmark")
+    return isogeo
+
+
+def run_scenario(
+    name: str, isogeo: Isogeo, mock_api: MockIsogeoApi, repeat: int = 3
+) -> dict:
+    """Run a scenario several times and measure it. Peak memory is measured on an \
+        additional run, tracing allocations slowing down the execution.
+
+    :param str name: scenario name
+    :param Isogeo isogeo: authenticated client
+    :param MockIsogeoApi mock_api: running mock server
+    :param int repeat: number of timed runs
+
+    :returns: measures
+    :rtype: dict
+    """
+    scenario = SCENARIOS.get(name)
+
+    # timed runs
+    durations = []
+    isogeo.metrics.reset()
+    for _ in range(repeat):
+        start = default_timer()
+        items = scenario(isogeo, mock_api)
+        durations.append(default_timer() - start)
+    requests_metrics = isogeo.metrics.snapshot().get("routes")
+
+    # memory
+    tracemalloc.start()
+    scenario(isogeo, mock_api)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = min(durations)
+    return {
+        "items": items,
+        "durations": durations,
+        "best": best,
+        "mean": sum(durations) / len(durations),
+        "throughput": items / best if best else None,
+        "requests": sum(r.get("count") for r in requests_metrics.values()) // repeat,
+        "errors": sum(r.get("errors") for r in requests_metrics.values()),
+        "latency": {
+            route: metrics.get("latency") for route, metrics in requests_metrics.items()
+        },
+        "peak_memory": peak_memory,
+    }
+
+
+def measure_import(statement: str, repeat: int = 5) -> float:
+    """Measure the best duration of an import statement, executed in fresh interpreters.
+
+    :param str statement: import statement
+    :param int repeat: number of interpreters
+
+    :returns: duration in seconds
+    :rtype: float
+    """
+    code = (
+        "from timeit import default_timer; start = default_timer(); {}; "
+        "print(default_timer() - start)".format(statement)
+    )
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, check=True
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def compare(results: dict, reference: dict) -> str:
+    """Build a text table comparing results to a previous run.
+
+    :param dict results: current results
+    :param dict reference: previous results, loaded from their JSON file
+
+    :rtype: str
+    """
+    lines = [
+        "{:<22}{:>12}{:>12}{:>9}{:>14}{:>14}".format(
+            "scenario", "best (s)", "ref (s)", "ratio", "peak (KiB)", "ref (KiB)"
+        )
+    ]
+    ref_scenarios = reference.get("scenarios", {})
+    for name, measures in results.get("scenarios").items():
+        ref = ref_scenarios.get(name)
+        if ref is None:
+            lines.append(
+                "{:<22}{:>12.4f}{:>12}".format(name, measures.get("best"), "-")
+            )
+            continue
+        lines.append(
+            "{:<22}{:>12.4f}{:>12.4f}{:>8.2f}x{:>14.0f}{:>14.0f}".format(
+                name,
+                measures.get("best"),
+                ref.get("best"),
+                ref.get("best") / measures.get("best"),
+                measures.get("peak_memory") / 1024,
+                ref.get("peak_memory") / 1024,
+            )
+        )
+    ref_imports = reference.get("imports", {})
+    for statement, duration in results.get("imports").items():
+        if statement in ref_imports:
+            lines.append(
+                "{:<40}{:>12.4f}{:>12.4f}{:>8.2f}x".format(
+                    statement,
+                    duration,
+                    ref_imports.get(statement),
+                    ref_imports.get(statement) / duration,
+                )
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list = None) -> dict:
+    """Parse the command line, run the benchmarks and store the results.
+
+    :param list argv: command line arguments
+
+    :returns: results
+    :rtype: dict
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--total", type=int, default=2000, help="metadata served")
+    parser.add_argument("--latency", type=float, default=0, help="in milliseconds")
+    parser.add_argument("--payload-size", type=int, default=1)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument(
+        "--max-in-flight", type=int, help="requests processed at once before 429"
+    )
+    parser.add_argument("--hosted-size", type=int, default=10 * 1024 * 1024)
+    parser.add_argument("--json-decoder", default="auto")
+    parser.add_argument(
+        "--output", default="benchmarks_{}.json".format(__version__), help="JSON file"
+    )
+    parser.add_argument("--compare", help="JSON file of a previous run")
+    args = parser.parse_args(argv)
+
+    config = {
+        "total": args.total,
+        "latency": args.latency,
+        "payload_size": args.payload_size,
+        "error_rate": args.error_rate,
+        "max_in_flight": args.max_in_flight,
+        "hosted_size": args.hosted_size,
+        "json_decoder": args.json_decoder,
+        "repeat": args.repeat,
+    }
+    results = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now().isoformat(),
+        "config": config,
+        "scenarios": {},
+        "imports": {},
+    }
+
+    for statement in IMPORT_STATEMENTS:
+        duration = results["imports"][statement] = measure_import(statement)
+        print("{:<40} {:>9.4f}s".format(statement, duration))
+
+    with MockIsogeoApi(
+        total=args.total,
+        latency=args.latency / 1000,
+        payload_size=args.payload_size,
+        error_rate=args.error_rate,
+        hosted_size=args.hosted_size,
+        max_in_flight=args.max_in_flight,
+    ) as mock_api:
+        isogeo = get_client(mock_api, json_decoder=args.json_decoder)
+        for name in args.scenarios:
+            measures = run_scenario(name, isogeo, mock_api, repeat=args.repeat)
+            results["scenarios"][name] = measures
+            print(
+                "{:<22} {:>9.4f}s {:>12.1f} items/s {:>6} requests {:>10.0f} KiB".format(
+                    name,
+                    measures.get("best"),
+                    measures.get("throughput"),
+                    measures.get("requests"),
+                    measures.get("peak_memory") / 1024,
+                )
+            )
+        isogeo.close()
+        results["mock_api"] = dict(mock_api.stats)
+
+    with open(args.output, "w", encoding="utf-8") as out_file:
+        json.dump(results, out_file, indent=4)
+    print("Results stored into: {}".format(args.output))
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as ref_file:
+            print(compare(results, json.load(ref_file)))
+
+    return results
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_api_hooks ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# 3rd party
+from requests import Session
+
+# module target
+from isogeo_pysdk import IsogeoHooks
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class FakeSearchHandler(BaseHTTPRequestHandler):
+    """Serves a search page."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({"total": 1, "results": [{"title": "Été"}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestIsogeoHooks(unittest.TestCase):
+    """Test hooks applied to API responses."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.server = HTTPServer(("127.0.0.1", 0), FakeSearchHandler)
+        cls.url = "http://127.0.0.1:{}/resources/search".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after the last test."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.decoded = []
+        self.hooks = IsogeoHooks(json_decoder=self.counting_loads)
+        self.session = Session()
+        self.session.hooks["response"].append(self.hooks.decode_json)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.session.close()
+
+    def counting_loads(self, content: bytes):
+        self.decoded.append(content)
+        return json.loads(content)
+
+    # -- Tests -------------------------------------------------------------------
+    def test_json_decoders(self):
+        """Decoders are resolved by name."""
+        self.assertIs(IsogeoHooks.get_json_decoder("json"), json.loads)
+        self.assertTrue(callable(IsogeoHooks.get_json_decoder("auto")))
+        self.assertIs(IsogeoHooks.get_json_decoder(len), len)
+        with self.assertRaises(ValueError):
+            IsogeoHooks.get_json_decoder("simplejson")
+
+    def test_decode_json(self):
+        """Responses are decoded by the client decoder."""
+        response = self.session.get(self.url)
+        self.assertEqual(response.json().get("results")[0].get("title"), "Été")
+        self.assertEqual(len(self.decoded), 1)
+
+        # standard library options still work
+        self.assertEqual(response.json(parse_int=str).get("total"), "1")
+        self.assertEqual(len(self.decoded), 1)
+
+    def test_decode_json_stream(self):
+        """Streamed responses are read from the raw stream and remain readable."""
+        response = self.session.get(self.url, stream=True)
+        self.assertEqual(response.json().get("total"), 1)
+        self.assertIsInstance(self.decoded[0], bytes)
+        self.assertEqual(json.loads(response.text).get("total"), 1)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_async
+    # for specific
+    python -m unittest tests.test_async.TestAsyncIsogeo.test_async_search_whole_results
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import logging
+import unittest
+from os import environ
+from pathlib import Path
+from sys import exit
+
+# 3rd party
+from dotenv import load_dotenv
+import urllib3
+
+
+# module target
+from isogeo_pysdk import AsyncIsogeo, Metadata, MetadataSearch
+
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+if Path("dev.env").exists():
+    load_dotenv("dev.env", override=True)
+
+# API access
+METADATA_TEST_FIXTURE_UUID = environ.get("ISOGEO_FIXTURES_METADATA_COMPLETE")
+WORKGROUP_TEST_FIXTURE_UUID = environ.get("ISOGEO_WORKGROUP_TEST_UUID")
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestAsyncIsogeo(unittest.TestCase):
+    """Test asynchronous client."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        # checks
+        if not environ.get("ISOGEO_API_GROUP_CLIENT_ID") or not environ.get(
+            "ISOGEO_API_GROUP_CLIENT_SECRET"
+        ):
+            logging.critical("No API credentials set as env variables.")
+            exit()
+        else:
+            pass
+
+        # ignore warnings related to the QA self-signed cert
+        if environ.get("ISOGEO_PLATFORM").lower() == "qa":
+            urllib3.disable_warnings()
+
+        # event loop
+        cls.loop = asyncio.new_event_loop()
+
+        # API connection
+        cls.isogeo = AsyncIsogeo(
+            auth_mode="group",
+            client_id=environ.get("ISOGEO_API_GROUP_CLIENT_ID"),
+            client_secret=environ.get("ISOGEO_API_GROUP_CLIENT_SECRET"),
+            auto_refresh_url="{}/oauth/token".format(environ.get("ISOGEO_ID_URL")),
+            platform=environ.get("ISOGEO_PLATFORM", "qa"),
+        )
+        # getting a token
+        cls.loop.run_until_complete(cls.isogeo.connect())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after the last test."""
+        # close sessions
+        cls.loop.run_until_complete(cls.isogeo.close())
+        cls.loop.close()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_async_search_simple(self):
+        """GET :resources/search as a coroutine."""
+        search = self.loop.run_until_complete(self.isogeo.search(page_size=10))
+        self.assertIsInstance(search, MetadataSearch)
+        self.assertLessEqual(len(search.results), 10)
+
+    def test_async_search_whole_results(self):
+        """Concurrent pages are concatenated into one search."""
+        search = self.loop.run_until_complete(
+            self.isogeo.search(whole_results=1, include=())
+        )
+        self.assertIsInstance(search, MetadataSearch)
+        self.assertEqual(len(search.results), search.total)
+        # no duplicates
+        self.assertEqual(
+            len({md.get("_id") for md in search.results}), len(search.results)
+        )
+
+    def test_async_metadata_get_concurrently(self):
+        """Concurrent GET :resources/{metadata_uuid}."""
+        search = self.loop.run_until_complete(self.isogeo.search(page_size=5))
+
+        async def _get_all():
+            return await asyncio.gather(
+                *[
+                    self.isogeo.metadata.get(md.get("_id"), include="all")
+                    for md in search.results
+                ]
+            )
+
+        metadatas = self.loop.run_until_complete(_get_all())
+        self.assertEqual(len(metadatas), len(search.results))
+        for md in metadatas:
+            self.assertIsInstance(md, Metadata)
+
+    def test_async_shares_listing(self):
+        """GET :shares/"""
+        shares = self.loop.run_until_complete(self.isogeo.share.listing())
+        self.assertIsInstance(shares, list)
+
+    def test_async_metadata_bad_uuid(self):
+        """Bad UUIDs are still checked before sending requests."""
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(self.isogeo.metadata.get("oops"))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
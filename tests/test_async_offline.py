@@ -0,0 +1,123 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_async_offline ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import time
+import unittest
+import warnings
+
+# 3rd party
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# module target
+from isogeo_pysdk import Metadata, MetadataSearch
+from isogeo_pysdk.exceptions import IsogeoSdkError
+from tests.benchmarks.mock_api import MockIsogeoApi, make_async_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncIsogeoOffline(unittest.TestCase):
+    """Test asynchronous client against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=120).start()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.loop.close()
+        self.mock_api.stop()
+
+    def run_async(self, coroutine):
+        """Run a coroutine on the test event loop, failing on deprecated calls of the SDK."""
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "error", category=DeprecationWarning, module="isogeo_pysdk"
+            )
+            return self.loop.run_until_complete(coroutine)
+
+    # -- Tests -------------------------------------------------------------------
+    def test_search_and_get(self):
+        """Searches and metadata are requested concurrently."""
+
+        async def harvest():
+            async with make_async_client(self.mock_api) as isogeo:
+                await isogeo.connect()
+                search = await isogeo.search(whole_results=True)
+                li_md = await asyncio.gather(
+                    *[isogeo.metadata.get(md.get("_id")) for md in search.results[:10]]
+                )
+                unknown = await isogeo.metadata.get("0" * 32)
+            return search, li_md, unknown
+
+        search, li_md, unknown = self.run_async(harvest())
+        self.assertIsInstance(search, MetadataSearch)
+        self.assertEqual(len(search.results), 120)
+        self.assertEqual(
+            [md.get("_id") for md in search.results], list(reversed(self.mock_api.ids))
+        )
+        self.assertIsInstance(li_md[0], Metadata)
+        self.assertEqual(
+            [md._id for md in li_md], [md.get("_id") for md in search.results[:10]]
+        )
+        self.assertEqual(unknown, (False, 404))
+
+    def test_token_error(self):
+        """A failed token request raises an explicit error."""
+        self.mock_api.error_rate = 1
+
+        async def connect():
+            async with make_async_client(self.mock_api) as isogeo:
+                await isogeo.connect()
+
+        with self.assertRaises(IsogeoSdkError) as context:
+            self.run_async(connect())
+        self.assertIn("503", str(context.exception))
+
+    def test_user_token_renewal(self):
+        """User tokens are renewed with the refresh token, the password is not kept."""
+
+        async def renew(drop_refresh_token: bool):
+            async with make_async_client(
+                self.mock_api, auth_mode="user_legacy"
+            ) as isogeo:
+                await isogeo.connect(username="user@example.com", password="p4ssW0rd")
+                self.assertNotIn("p4ssW0rd", repr(vars(isogeo)))
+                # token about to expire
+                isogeo.token["expires_at"] = time.time() + 30
+                if drop_refresh_token:
+                    isogeo.token.pop("refresh_token")
+                return await isogeo.account.get()
+
+        account = self.run_async(renew(drop_refresh_token=False))
+        self.assertEqual(account._id, self.mock_api.workgroup.get("_id"))
+        self.assertEqual(self.mock_api.stats.get("tokens"), 2)
+
+        with self.assertRaises(IsogeoSdkError):
+            self.run_async(renew(drop_refresh_token=True))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -31,7 +31,7 @@ from sys import exit
 from dotenv import load_dotenv
 
 # Isogeo
-from isogeo_pysdk import Isogeo, IsogeoChecker
+from isogeo_pysdk import Isogeo, IsogeoChecker, IsogeoMiddleware
 
 # #############################################################################
 # ######## Globals #################
@@ -200,6 +200,62 @@ class TestAuthentication(unittest.TestCase):
         # close
         isogeo.close()
 
+    def test_middlewares(self):
+        """Middlewares are executed around every request."""
+
+        class CountingMiddleware(IsogeoMiddleware):
+            def __init__(self):
+                self.sent = []
+                self.received = []
+
+            def before_send(self, method, url, kwargs):
+                self.sent.append((method, url))
+
+            def after_receive(self, method, url, response):
+                self.received.append(response.status_code)
+                return response
+
+        counter = CountingMiddleware()
+        isogeo = Isogeo(
+            auth_mode="user_legacy",
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            auto_refresh_url="{}/oauth/token".format(environ.get("ISOGEO_ID_URL")),
+            platform=environ.get("ISOGEO_PLATFORM", "qa"),
+            middlewares=[counter],
+        )
+        isogeo.connect(
+            username=environ.get("ISOGEO_USER_NAME"),
+            password=environ.get("ISOGEO_USER_PASSWORD"),
+        )
+        # token + account
+        self.assertGreaterEqual(len(counter.sent), 2)
+        self.assertEqual(len(counter.sent), len(counter.received))
+
+        # close
+        isogeo.close()
+
+    def test_lazy_startup(self):
+        """Client creation sends no request and routes are built on first access."""
+        isogeo = Isogeo(
+            auth_mode="group",
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            platform=environ.get("ISOGEO_PLATFORM", "qa"),
+        )
+        self.assertIsNone(isogeo.connection_check)
+        self.assertNotIn("metadata", vars(isogeo))
+        self.assertIs(isogeo.metadata, isogeo.metadata)
+        self.assertIs(isogeo.srs, isogeo.coordinate_system)
+
+        # opt-in connectivity check, shared between clients
+        connection_check = isogeo.check_connection()
+        self.assertTrue(connection_check.result(timeout=5))
+        self.assertIs(isogeo.check_connection(), connection_check)
+
+        # close
+        isogeo.close()
+
 
 # #############################################################################
 # ######## Standalone ##############
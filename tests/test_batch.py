@@ -0,0 +1,138 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_batch ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+import unittest
+from uuid import uuid4
+
+# module target
+from isogeo_pysdk import Catalog, Keyword, Metadata
+from isogeo_pysdk.batch import BatchedCall
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoBatch(unittest.TestCase):
+    """Test association calls batched into bulk requests against a local stand-in of \
+        the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=120).start()
+        self.isogeo = make_client(self.mock_api)
+
+        self.metadatas = [Metadata(_id=md_id) for md_id in self.mock_api.ids]
+        self.keyword = Keyword(**self.mock_api.records[0].get("keywords")[0])
+        self.catalog = Catalog.clean_attributes(self.mock_api.catalogs[0])
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_batch(self):
+        """Calls are queued then sent as bulk requests, with their outcome."""
+        unknown = Metadata(_id=uuid4().hex)
+        requests_before = self.mock_api.stats.get("requests")
+        with self.isogeo.batch(chunk_size=50) as batch:
+            tagged = [
+                self.isogeo.keyword.tagging(metadata=md, keyword=self.keyword)
+                for md in self.metadatas + [unknown]
+            ]
+            associated = self.isogeo.catalog.associate_metadata(
+                self.metadatas[:30], self.catalog
+            )
+            self.assertIsInstance(tagged[0], BatchedCall)
+            self.assertEqual(tagged[0].status, "pending")
+            self.assertEqual(self.mock_api.stats.get("requests"), requests_before)
+
+        # 151 metadata UUIDs by 50
+        self.assertEqual(len(self.mock_api.bulks), 4)
+        self.assertEqual(batch.report.get("done"), 150)
+        self.assertTrue(all(call.ok for call in tagged[:-1] + associated))
+        self.assertEqual(tagged[-1].status, "ignored")
+        self.assertEqual(tagged[-1].reason, "notFound")
+        self.assertIsNone(self.isogeo.active_batch)
+
+    def test_batch_failure(self):
+        """Calls of failed bulk requests are reported as failed."""
+        self.mock_api.bulk_failures = 10
+        with self.isogeo.batch(retries=0) as batch:
+            call = self.isogeo.keyword.untagging(self.metadatas[0], self.keyword)
+        self.assertEqual(call.status, "failed")
+        self.assertEqual(call.error, (False, 500))
+        self.assertEqual(batch.report.get("failed"), 1)
+
+    def test_batch_order(self):
+        """Calls on the same metadata and object are sent in the order they were made."""
+        with self.isogeo.batch() as batch:
+            calls = [
+                self.isogeo.keyword.tagging(self.metadatas[0], self.keyword),
+                self.isogeo.keyword.untagging(self.metadatas[0], self.keyword),
+                self.isogeo.keyword.tagging(self.metadatas[1], self.keyword),
+                self.isogeo.keyword.tagging(self.metadatas[0], self.keyword),
+            ]
+
+        self.assertEqual(
+            [
+                [(r.get("action"), r.get("query").get("ids")) for r in payload]
+                for payload in self.mock_api.bulks
+            ],
+            [
+                [("add", [self.metadatas[0]._id, self.metadatas[1]._id])],
+                [("delete", [self.metadatas[0]._id])],
+                [("add", [self.metadatas[0]._id])],
+            ],
+        )
+        self.assertTrue(all(call.status == "done" for call in calls))
+        self.assertEqual(batch.report.get("done"), 4)
+
+    def test_batch_check_exists(self):
+        """Checking existing keywords can't be queued."""
+        with self.isogeo.batch() as batch:
+            with self.assertRaises(ValueError):
+                self.isogeo.keyword.tagging(
+                    self.metadatas[0], self.keyword, check_exists=1
+                )
+        self.assertEqual(batch.calls, [])
+        self.assertEqual(self.mock_api.bulks, [])
+
+    def test_batch_scope(self):
+        """Only calls of the thread within the context are queued, and not sent if an \
+            error occurred."""
+        other_threads = []
+        with self.assertRaises(RuntimeError):
+            with self.isogeo.batch() as batch:
+                self.isogeo.keyword.tagging(self.metadatas[0], self.keyword)
+                thread = threading.Thread(
+                    target=lambda: other_threads.append(self.isogeo.active_batch)
+                )
+                thread.start()
+                thread.join()
+                raise RuntimeError("interrupted")
+
+        self.assertEqual(other_threads, [None])
+        self.assertEqual(len(batch.calls), 1)
+        self.assertEqual(self.mock_api.bulks, [])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
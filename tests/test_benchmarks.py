@@ -0,0 +1,104 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_benchmarks ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# 3rd party
+from requests import Session
+
+# module target
+from tests.benchmarks.mock_api import MockApiAdapter, MockIsogeoApi
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMockApi(unittest.TestCase):
+    """Test the local stand-in of the Isogeo API used by benchmarks."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.mock_api = MockIsogeoApi(total=250, hosted_size=1000).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after the last test."""
+        cls.mock_api.stop()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.session = Session()
+        MockApiAdapter(target=self.mock_api.url).mount_on(self.session)
+        self.session.headers["Authorization"] = "Bearer {}".format(
+            self.mock_api.issue_token().get("access_token")
+        )
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.session.close()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_search(self):
+        """Search pages are sorted and sub-resources are only included on demand."""
+        page = self.session.get(
+            "https://api.isogeo.com/resources/search",
+            params={"_limit": 100, "_offset": 200, "ob": "_created", "od": "asc"},
+        ).json()
+        self.assertEqual(page.get("total"), 250)
+        self.assertEqual(len(page.get("results")), 50)
+        self.assertEqual(page.get("results")[0].get("_id"), self.mock_api.ids[200])
+        self.assertNotIn("keywords", page.get("results")[0])
+
+        page = self.session.get(
+            "https://api.isogeo.com/resources/search",
+            params={"_id": ",".join(self.mock_api.ids[:3]), "_include": "keywords"},
+        ).json()
+        self.assertEqual(page.get("total"), 3)
+        self.assertIn("keywords", page.get("results")[0])
+
+    def test_resources(self):
+        """Metadata, their sub-resources and hosted files are served."""
+        md_id = self.mock_api.ids[0]
+        md = self.session.get("https://v1.api.isogeo.com/resources/" + md_id).json()
+        self.assertEqual(md.get("_id"), md_id)
+
+        keywords = self.session.get(
+            "https://v1.api.isogeo.com/resources/{}/keywords/".format(md_id)
+        )
+        self.assertEqual(keywords.json(), md.get("keywords"))
+
+        hosted = self.session.get(
+            "https://api.isogeo.com" + md.get("links")[0].get("url")
+        )
+        self.assertEqual(len(hosted.content), 1000)
+        self.assertEqual(
+            self.session.get("https://api.isogeo.com/resources/unknown").status_code,
+            404,
+        )
+
+        # token required
+        del self.session.headers["Authorization"]
+        self.assertEqual(
+            self.session.get("https://api.isogeo.com/resources/" + md_id).status_code,
+            401,
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
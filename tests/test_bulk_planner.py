@@ -0,0 +1,213 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_bulk_planner ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from uuid import uuid4
+
+# module target
+from isogeo_pysdk import BulkReport, Keyword, Metadata
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestBulkPlanner(unittest.TestCase):
+    """Test merge, chunking and parallel submission of bulk requests against a local \
+        stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=250).start()
+        self.isogeo = make_client(self.mock_api)
+
+        self.bulk = self.isogeo.metadata.bulk
+        self.keyword = Keyword(**self.mock_api.records[0].get("keywords")[0])
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_prepare(self):
+        """Metadata passed are not modified and every valid UUID is kept, in order."""
+        metadatas = [
+            Metadata(_id=self.mock_api.ids[0]),
+            "not-an-uuid",
+            self.mock_api.ids[1],
+            Metadata(_id=self.mock_api.ids[2]),
+            self.mock_api.ids[1],
+        ]
+        request = self.bulk.prepare(
+            metadatas=metadatas, action="add", target="keywords", models=(self.keyword,)
+        )
+
+        self.assertEqual(request.query.get("ids"), self.mock_api.ids[:3])
+        self.assertEqual(len(metadatas), 5)
+        self.assertIsInstance(metadatas[0], Metadata)
+
+    def test_plan(self):
+        """Requests sharing action, target and models are merged, then chunked."""
+        for i in range(0, 200, 50):
+            self.bulk.prepare(
+                metadatas=self.mock_api.ids[i : i + 60],
+                action="add",
+                target="keywords",
+                models=(self.keyword,),
+            )
+        self.bulk.prepare(
+            metadatas=self.mock_api.ids[:30],
+            action="delete",
+            target="keywords",
+            models=(self.keyword,),
+        )
+        payloads = self.bulk.plan(chunk_size=100)
+
+        self.assertEqual(
+            [[len(r.get("query").get("ids")) for r in p] for p in payloads],
+            [[100], [100], [10], [30]],
+        )
+        self.assertEqual(
+            [r.get("action") for p in payloads for r in p],
+            ["add", "add", "add", "delete"],
+        )
+
+    def test_plan_order(self):
+        """Requests are merged only when no request in between works on the same \
+            metadata and models."""
+        other_keyword = Keyword(**self.mock_api.records[1].get("keywords")[0])
+        for action, metadatas, keyword in (
+            ("add", self.mock_api.ids[:10], self.keyword),
+            ("add", self.mock_api.ids[:10], other_keyword),
+            ("delete", self.mock_api.ids[:10], self.keyword),
+            ("add", self.mock_api.ids[10:20], other_keyword),
+            ("add", self.mock_api.ids[5:15], self.keyword),
+        ):
+            self.bulk.prepare(
+                metadatas=metadatas, action=action, target="keywords", models=(keyword,)
+            )
+        payloads = self.bulk.plan(chunk_size=100)
+
+        self.assertEqual(
+            [
+                [(r.get("action"), r.get("model")[0].get("_id")) for r in p]
+                for p in payloads
+            ],
+            [
+                [("add", self.keyword._id), ("add", other_keyword._id)],
+                [("delete", self.keyword._id)],
+                [("add", self.keyword._id)],
+            ],
+        )
+        self.assertEqual(len(payloads[0][1].get("query").get("ids")), 20)
+
+    def test_send_add_delete_add(self):
+        """Dependent requests are sent one after another, in the prepared order."""
+        for action in ("add", "delete", "add"):
+            self.bulk.prepare(
+                metadatas=self.mock_api.ids[:150],
+                action=action,
+                target="keywords",
+                models=(self.keyword,),
+            )
+        reports = self.bulk.send(chunk_size=100)
+
+        self.assertEqual(
+            [payload[0].get("action") for payload in self.mock_api.bulks],
+            ["add", "add", "delete", "delete", "add", "add"],
+        )
+        self.assertEqual(
+            [report.request.get("action") for report in reports],
+            ["add", "delete", "add"],
+        )
+
+    def test_send(self):
+        """Chunks are sent in parallel and reported by merged request."""
+        unknown_id = uuid4().hex
+        for i in range(0, 250, 50):
+            self.bulk.prepare(
+                metadatas=self.mock_api.ids[i : i + 50] + [unknown_id],
+                action="add",
+                target="keywords",
+                models=(self.keyword,),
+            )
+        reports = self.bulk.send(chunk_size=60)
+
+        self.assertEqual(len(self.mock_api.bulks), 5)
+        self.assertEqual(len(reports), 1)
+        self.assertIsInstance(reports[0], BulkReport)
+        self.assertEqual(
+            sorted(reports[0].request.get("query").get("ids")),
+            sorted(self.mock_api.ids + [unknown_id]),
+        )
+        self.assertEqual(reports[0].ignored, {unknown_id: "notFound"})
+        self.assertEqual(self.bulk.BULK_DATA, [])
+
+    def test_send_retry(self):
+        """Only failed chunks are sent again, then kept to be sent later."""
+        self.bulk.prepare(
+            metadatas=self.mock_api.ids,
+            action="add",
+            target="keywords",
+            models=(self.keyword,),
+        )
+        self.mock_api.bulk_failures = 1
+        reports = self.bulk.send(chunk_size=100, max_workers=1)
+        self.assertEqual(len(self.mock_api.bulks), 3)
+        self.assertEqual(len(reports[0].request.get("query").get("ids")), 250)
+
+        # every attempt failed: requests are kept
+        self.bulk.prepare(
+            metadatas=self.mock_api.ids,
+            action="add",
+            target="keywords",
+            models=(self.keyword,),
+        )
+        self.mock_api.bulk_failures = 10
+        self.assertEqual(self.bulk.send(chunk_size=100, retries=1), (False, 500))
+        self.assertEqual(
+            sum(len(r.get("query").get("ids")) for r in self.bulk.BULK_DATA), 250
+        )
+
+    def test_send_no_retry_client_error(self):
+        """Chunks rejected by the API are not sent again, nor the ones depending on them."""
+        self.bulk.prepare(
+            metadatas=self.mock_api.ids[:10],
+            action="add",
+            target="keywords",
+            models=(self.keyword,),
+        )
+        self.bulk.prepare(
+            metadatas=self.mock_api.ids[:10],
+            action="delete",
+            target="keywords",
+            models=(self.keyword,),
+        )
+        self.mock_api.bulk_failures = 1
+        self.mock_api.bulk_failure_status = 400
+        self.assertEqual(self.bulk.send(retries=3), (False, 400))
+        self.assertEqual(self.mock_api.bulks, [])
+        self.assertEqual(self.mock_api.bulk_failures, 0)
+        self.assertEqual(
+            [r.get("action") for r in self.bulk.BULK_DATA], ["add", "delete"]
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
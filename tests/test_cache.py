@@ -0,0 +1,190 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_cache ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from time import sleep
+
+# module target
+from isogeo_pysdk import ApiDecorators, IsogeoCache, Metadata, MetadataSearch
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class FakeClient(object):
+    """Minimal API client holding a cache."""
+
+    def __init__(self, cache=None):
+        self.cache = cache
+
+
+class FakeRoutes(object):
+    """Routes counting their real executions."""
+
+    def __init__(self, api_client):
+        self.api_client = api_client
+        self.calls = 0
+
+    @ApiDecorators._cached("metadata")
+    def get(self, metadata_id: str, include: tuple = ()) -> dict:
+        self.calls += 1
+        return {"_id": metadata_id, "include": include, "keywords": []}
+
+    @ApiDecorators._cached("metadata")
+    def keywords(self, metadata: Metadata) -> list:
+        self.calls += 1
+        return [metadata._id]
+
+    @ApiDecorators._cached("search", skip=lambda kwargs: kwargs.get("whole_results"))
+    def search(self, query: str = "", whole_results: bool = False) -> dict:
+        self.calls += 1
+        return {"query": query, "results": [{"_id": "a"}]}
+
+    @ApiDecorators._cached("metadata")
+    def fails(self) -> tuple:
+        self.calls += 1
+        return False, 404
+
+    @ApiDecorators._invalidate_cache("catalog")
+    def associate(self) -> bool:
+        return True
+
+
+class TestIsogeoCache(unittest.TestCase):
+    """Test cache of API responses."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.cache = IsogeoCache(maxsize=3)
+        self.routes = FakeRoutes(FakeClient(self.cache))
+
+    # -- Tests -------------------------------------------------------------------
+    def test_hits_and_misses(self):
+        """Same arguments are served from cache."""
+        self.routes.get("a")
+        self.routes.get("a")
+        self.routes.get(metadata_id="a")  # different signature, different key
+        self.routes.get("b")
+        self.assertEqual(self.routes.calls, 3)
+        stats = self.cache.stats(by_family=True)
+        self.assertEqual(stats.get("hits"), 1)
+        self.assertEqual(stats.get("misses"), 3)
+        self.assertEqual(stats.get("families").get("metadata").get("hits"), 1)
+
+    def test_copy_on_read(self):
+        """Modifying a returned value does not alter the cache."""
+        md = self.routes.get("a")
+        md.get("keywords").append("modified")
+        self.assertEqual(self.routes.get("a").get("keywords"), [])
+
+    def test_shallow_families(self):
+        """Values of shallow families get a new results list, records are not copied."""
+        search = self.routes.search("a")
+        search.get("results").append({"_id": "added"})
+        cached = self.routes.search("a")
+        self.assertEqual(self.routes.calls, 1)
+        self.assertEqual(cached.get("results"), [{"_id": "a"}])
+        self.assertIs(
+            cached.get("results")[0], self.routes.search("a").get("results")[0]
+        )
+
+        # search model
+        cache = IsogeoCache()
+        cache.set("search", ("key",), MetadataSearch(results=[{"_id": "a"}], total=1))
+        cache.get("search", ("key",))[1].results.clear()
+        self.assertEqual(len(cache.get("search", ("key",))[1].results), 1)
+
+        cache = IsogeoCache(shallow=())
+        cache.set("search", ("key",), search)
+        self.assertIsNot(
+            cache.get("search", ("key",))[1].get("results")[0], search.get("results")[0]
+        )
+
+    def test_skip(self):
+        """Calls matching the skip function are neither read from nor stored into the \
+            cache."""
+        self.routes.search("a", whole_results=True)
+        self.routes.search("a", whole_results=True)
+        self.assertEqual(self.routes.calls, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first."""
+        for md_id in ("a", "b", "c"):
+            self.routes.get(md_id)
+        self.routes.get("a")  # 'a' is now the most recently used
+        self.routes.get("d")  # evicts 'b'
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.stats().get("evictions"), 1)
+        calls = self.routes.calls
+        self.routes.get("a")
+        self.assertEqual(self.routes.calls, calls)
+        self.routes.get("b")
+        self.assertEqual(self.routes.calls, calls + 1)
+
+    def test_ttl(self):
+        """Expired entries are requested again and disabled families are never stored."""
+        self.cache.ttls["metadata"] = 0.05
+        self.routes.get("a")
+        sleep(0.1)
+        self.routes.get("a")
+        self.assertEqual(self.routes.calls, 2)
+        self.assertEqual(self.cache.stats().get("expirations"), 1)
+
+        self.cache.ttls["metadata"] = 0
+        self.routes.get("b")
+        self.routes.get("b")
+        self.assertEqual(self.routes.calls, 4)
+
+    def test_errors_not_cached(self):
+        """Errors returned as tuples are not cached."""
+        self.routes.fails()
+        self.routes.fails()
+        self.assertEqual(self.routes.calls, 2)
+
+    def test_models_as_arguments(self):
+        """Models are identified by their UUID."""
+        self.routes.keywords(Metadata(_id="a", title="first"))
+        self.routes.keywords(Metadata(_id="a", title="same metadata"))
+        self.routes.keywords(Metadata(_id="b"))
+        self.assertEqual(self.routes.calls, 2)
+
+    def test_invalidation(self):
+        """Writing routes invalidate their family and dependent families."""
+        self.routes.get("a")
+        self.cache.set("user", ("listing",), [])
+        self.routes.associate()  # catalog invalidates metadata
+        self.assertEqual(len(self.cache), 1)
+        self.routes.get("a")
+        self.assertEqual(self.routes.calls, 2)
+
+        # without cascade
+        self.assertEqual(self.cache.invalidate("account", cascade=False), 0)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_no_cache(self):
+        """Routes are executed normally without cache."""
+        routes = FakeRoutes(FakeClient(cache=None))
+        routes.get("a")
+        routes.get("a")
+        self.assertEqual(routes.calls, 2)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_cassette ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# 3rd party
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+# module target
+from isogeo_pysdk import IsogeoCassette
+from isogeo_pysdk.cassette import CassetteMissError, IsogeoCassetteAdapter
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """Serves a counter, a token and binary data."""
+
+    counter = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        FakeApiHandler.counter += 1
+        if self.path.startswith("/hosted"):
+            body = bytes(range(256))
+            content_type = "application/octet-stream"
+        else:
+            body = json.dumps({"count": FakeApiHandler.counter}).encode("utf-8")
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length")))
+        body = json.dumps({"access_token": "secret", "expires_in": 3600}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestIsogeoCassette(unittest.TestCase):
+    """Test record and replay of the API exchanges."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.server = HTTPServer(("127.0.0.1", 0), FakeApiHandler)
+        cls.base_url = "http://127.0.0.1:{}".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after the last test."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "cassette.jsonl.gz"
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    def _session(self, cassette: IsogeoCassette) -> Session:
+        session = Session()
+        session.mount(
+            "http://", IsogeoCassetteAdapter(cassette=cassette, adapter=HTTPAdapter())
+        )
+        return session
+
+    # -- Tests -------------------------------------------------------------------
+    def test_record_replay(self):
+        """Recorded responses are replayed in order, without request."""
+        session = self._session(IsogeoCassette(self.path, mode="record"))
+        recorded = [
+            session.get(self.base_url + "/resources/?b=2&a=1").json().get("count")
+            for _ in range(2)
+        ]
+        token = session.post(self.base_url + "/oauth/token", data={"password": "pwd"})
+        self.assertEqual(token.json().get("access_token"), "cassette-access-token")
+        hosted = session.get(self.base_url + "/hosted", stream=True).content
+        session.close()
+        self.assertNotIn(b"secret", self.path.read_bytes())
+
+        counter = FakeApiHandler.counter
+        cassette = IsogeoCassette(self.path)
+        session = self._session(cassette)
+        self.assertEqual(
+            [
+                session.get(self.base_url + "/resources/?a=1&b=2").json().get("count")
+                for _ in range(2)
+            ],
+            recorded,
+        )
+        session.post(self.base_url + "/oauth/token", data={"password": "other"})
+        self.assertEqual(
+            b"".join(
+                session.get(self.base_url + "/hosted", stream=True).iter_content(100)
+            ),
+            hosted,
+        )
+        self.assertEqual(FakeApiHandler.counter, counter)
+        self.assertEqual(cassette.stats.get("played"), 4)
+
+        with self.assertRaises(CassetteMissError):
+            session.get(self.base_url + "/unknown")
+
+    def test_auto(self):
+        """Unknown requests are sent and appended to the cassette."""
+        self.assertRaises(FileNotFoundError, IsogeoCassette, self.path)
+        cassette = IsogeoCassette(self.path, mode="auto")
+        session = self._session(cassette)
+        first = session.get(self.base_url + "/resources/").json()
+        session.close()
+
+        cassette = IsogeoCassette(self.path, mode="auto")
+        session = self._session(cassette)
+        self.assertEqual(session.get(self.base_url + "/resources/").json(), first)
+        session.get(self.base_url + "/catalogs/")
+        session.close()
+        self.assertEqual(cassette.stats, {"played": 1, "recorded": 1})
+        self.assertEqual(len(IsogeoCassette(self.path)), 2)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_columnar ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from collections import Counter
+from datetime import datetime
+from importlib.util import find_spec
+
+# module target
+from isogeo_pysdk import Metadata, MetadataSearch
+from isogeo_pysdk.columnar import TABLES, results_to_columns
+from tests.benchmarks.mock_api import MockIsogeoApi
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+with MockIsogeoApi(total=30, payload_size=2) as mock_api:
+    RECORDS = mock_api.records
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestColumnar(unittest.TestCase):
+    """Test columnar tables of search results."""
+
+    # -- Tests -------------------------------------------------------------------
+    def test_columns(self):
+        """Each table has its columns, of the same length, linked to the metadata."""
+        tables = MetadataSearch(results=RECORDS).to_columns()
+
+        self.assertEqual(set(tables), set(TABLES))
+        for name, columns in tables.items():
+            self.assertEqual(list(columns), [column for column, _ in TABLES.get(name)])
+            self.assertEqual(len({len(values) for values in columns.values()}), 1)
+
+        metadata = tables.get("metadata")
+        self.assertEqual(metadata.get("_id"), [md.get("_id") for md in RECORDS])
+        self.assertIsInstance(metadata.get("_modified")[0], datetime)
+        self.assertEqual(set(metadata.get("coordinateSystem")), {"2154"})
+        self.assertEqual(
+            len(tables.get("keywords").get("metadata_id")),
+            sum(len(md.get("keywords")) for md in RECORDS),
+        )
+        self.assertEqual(
+            Counter(tables.get("tags").get("kind")).get("format"), len(RECORDS)
+        )
+
+    def test_models_and_envelope(self):
+        """Metadata objects give the same tables, bbox comes from the envelope."""
+        record = dict(
+            RECORDS[0],
+            envelope={
+                "type": "Polygon",
+                "coordinates": [[[-1.5, 43.0], [7.5, 43.0], [7.5, 49.5], [-1.5, 43.0]]],
+            },
+        )
+        from_dicts = results_to_columns([record])
+        from_models = results_to_columns([Metadata.clean_attributes(record)])
+
+        self.assertEqual(from_models, from_dicts)
+        metadata = from_dicts.get("metadata")
+        self.assertEqual(
+            [metadata.get(c)[0] for c in ("xmin", "ymin", "xmax", "ymax")],
+            [-1.5, 43.0, 7.5, 49.5],
+        )
+
+    @unittest.skipIf(find_spec("pandas") is None, "pandas is not installed")
+    def test_pandas(self):
+        """DataFrames are typed."""
+        frames = MetadataSearch(results=RECORDS).to_frames(backend="pandas")
+
+        metadata = frames.get("metadata")
+        self.assertEqual(len(metadata), len(RECORDS))
+        self.assertEqual(str(metadata["type"].dtype), "category")
+        self.assertEqual(str(metadata["_modified"].dt.tz), "UTC")
+        self.assertEqual(
+            frames.get("tags")["kind"].value_counts().get("format"), len(RECORDS)
+        )
+
+    @unittest.skipIf(find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_arrow(self):
+        """Arrow tables are typed."""
+        tables = MetadataSearch(results=RECORDS).to_frames(backend="arrow")
+
+        metadata = tables.get("metadata")
+        self.assertEqual(metadata.num_rows, len(RECORDS))
+        self.assertEqual(
+            str(metadata.schema.field("_modified").type), "timestamp[us, tz=UTC]"
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
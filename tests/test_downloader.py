@@ -0,0 +1,115 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_downloader ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import IsogeoDownloader
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoDownloader(unittest.TestCase):
+    """Test parallel download of hosted data against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=6, hosted_size=300000).start()
+        self.isogeo = make_client(self.mock_api)
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.links = [md.get("links")[0] for md in self.mock_api.records]
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+        self.tmp_dir.cleanup()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_download(self):
+        """Files are downloaded once, with the expected size."""
+        progress = []
+        downloader = IsogeoDownloader(
+            api_client=self.isogeo,
+            out_dir=self.tmp_dir.name,
+            chunk_size=65536,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+        report = downloader.download(self.links + self.links[:2])
+
+        self.assertEqual(report.get("downloaded"), 6)
+        self.assertEqual(report.get("duplicates"), 2)
+        self.assertEqual(report.get("bytes"), 6 * 300000)
+        self.assertEqual(progress[-1], (6 * 300000, 6 * 300000))
+        for result in report.get("files"):
+            self.assertEqual(result.get("path").stat().st_size, 300000)
+        self.assertEqual(list(Path(self.tmp_dir.name).glob(".*.part")), [])
+
+        # second run: nothing to download, nor to request
+        requests = self.mock_api.stats.get("requests")
+        report = downloader.download(self.links)
+        self.assertEqual(report.get("skipped"), 6)
+        self.assertEqual(report.get("bytes"), 0)
+        self.assertEqual(self.mock_api.stats.get("requests"), requests)
+
+        # a file modified since is requested again
+        report.get("files")[0].get("path").write_bytes(b"modified")
+        report = IsogeoDownloader(
+            api_client=self.isogeo, out_dir=self.tmp_dir.name
+        ).download(self.links)
+        self.assertEqual(report.get("downloaded"), 1)
+        self.assertEqual(report.get("skipped"), 5)
+        self.assertEqual(self.mock_api.stats.get("requests"), requests + 1)
+
+    def test_resume(self):
+        """A partial download is resumed from its end."""
+        downloader = IsogeoDownloader(api_client=self.isogeo, out_dir=self.tmp_dir.name)
+        result = downloader.download(self.links[:1]).get("files")[0]
+
+        # simulate an interrupted download
+        part_path = Path(self.tmp_dir.name) / ".{}.part".format(
+            self.links[0].get("_id")
+        )
+        with result.get("path").open("rb") as in_file:
+            part_path.write_bytes(in_file.read(100000))
+        result.get("path").unlink()
+
+        report = downloader.download(self.links[:1])
+        self.assertEqual(report.get("resumed"), 1)
+        self.assertEqual(report.get("bytes"), 200000)
+        self.assertEqual(result.get("path").stat().st_size, 300000)
+
+    def test_size_mismatch(self):
+        """A file whose size differs from the link one is reported as failed."""
+        link = dict(self.links[0], size=123)
+        report = IsogeoDownloader(
+            api_client=self.isogeo, out_dir=self.tmp_dir.name
+        ).download([link])
+
+        self.assertEqual(report.get("failed"), 1)
+        self.assertIn("Size mismatch", report.get("files")[0].get("error"))
+        self.assertEqual(list(Path(self.tmp_dir.name).iterdir()), [])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_exporter ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import IsogeoXmlExporter
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoXmlExporter(unittest.TestCase):
+    """Test bulk export into XML ISO 19139 against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=12, payload_size=3).start()
+        self.isogeo = make_client(self.mock_api)
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.tmp_dir.name)
+        self.records = [
+            {"_id": md.get("_id"), "_modified": md.get("_modified")}
+            for md in self.mock_api.records
+        ]
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+        self.tmp_dir.cleanup()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_export_folder(self):
+        """XML files are written once, then only the modified metadata."""
+        state_path = self.out_dir / "state.json"
+        progress = []
+        exporter = IsogeoXmlExporter(
+            api_client=self.isogeo,
+            output=self.out_dir / "xml",
+            state_path=state_path,
+            chunk_size=1024,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+        report = exporter.export(self.records + self.records[:2])
+
+        self.assertEqual(report.get("exported"), 12)
+        self.assertEqual(report.get("duplicates"), 2)
+        self.assertEqual(progress[-1], (12, 12))
+        li_xml = sorted((self.out_dir / "xml").iterdir())
+        self.assertEqual([p.stem for p in li_xml], sorted(self.mock_api.ids))
+        self.assertEqual(sum(p.stat().st_size for p in li_xml), report.get("bytes"))
+        xml_path = self.out_dir / "xml" / "{}.xml".format(self.mock_api.ids[0])
+        self.assertIn(self.mock_api.ids[0], xml_path.read_text(encoding="utf-8"))
+
+        # second run, from a new exporter: only the modified metadata
+        self.records[0]["_modified"] = "2020-01-01T00:00:00.000000+00:00"
+        (self.out_dir / "xml" / "{}.xml".format(self.records[1].get("_id"))).unlink()
+        report = IsogeoXmlExporter(
+            api_client=self.isogeo, output=self.out_dir / "xml", state_path=state_path
+        ).export(self.records)
+        self.assertEqual(report.get("exported"), 2)
+        self.assertEqual(report.get("skipped"), 10)
+
+    def test_export_archives(self):
+        """XML files are added to zip and tar archives."""
+        for name in ("export.zip", "export.tar.gz"):
+            report = IsogeoXmlExporter(
+                api_client=self.isogeo, output=self.out_dir / name
+            ).export(self.records)
+            self.assertEqual(report.get("exported"), 12)
+
+        with zipfile.ZipFile(str(self.out_dir / "export.zip")) as archive:
+            self.assertEqual(len(archive.namelist()), 12)
+            content = archive.read("{}.xml".format(self.mock_api.ids[0]))
+        with tarfile.open(str(self.out_dir / "export.tar.gz")) as archive:
+            self.assertEqual(len(archive.getnames()), 12)
+            member = archive.getmember("{}.xml".format(self.mock_api.ids[0]))
+            self.assertEqual(archive.extractfile(member).read(), content)
+        self.assertIn(self.mock_api.ids[0].encode("ascii"), content)
+
+    def test_export_archives_incremental(self):
+        """An incremental export keeps the XML of the previous archive."""
+        for name in ("export.zip", "export.tar"):
+            state_path = self.out_dir / "{}.json".format(name)
+            IsogeoXmlExporter(
+                api_client=self.isogeo,
+                output=self.out_dir / name,
+                state_path=state_path,
+            ).export(self.records)
+
+            # second run: one modified metadata
+            records = [dict(md) for md in self.records]
+            records[0]["_modified"] = "2020-01-01T00:00:00.000000+00:00"
+            report = IsogeoXmlExporter(
+                api_client=self.isogeo,
+                output=self.out_dir / name,
+                state_path=state_path,
+            ).export(records)
+            self.assertEqual(report.get("exported"), 1)
+            self.assertEqual(report.get("skipped"), 11)
+
+        with zipfile.ZipFile(str(self.out_dir / "export.zip")) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()),
+                sorted("{}.xml".format(md_id) for md_id in self.mock_api.ids),
+            )
+        with tarfile.open(str(self.out_dir / "export.tar")) as archive:
+            self.assertEqual(len(archive.getnames()), 12)
+        self.assertEqual(list(self.out_dir.glob(".*.part")), [])
+
+    def test_export_same_names(self):
+        """Metadata sharing a file name are skipped once exported."""
+        state_path = self.out_dir / "state.json"
+        for _ in range(2):
+            report = IsogeoXmlExporter(
+                api_client=self.isogeo,
+                output=self.out_dir / "xml",
+                state_path=state_path,
+                filename=lambda md: "metadata.xml",
+            ).export(self.records[:3])
+        self.assertEqual(report.get("exported"), 0)
+        self.assertEqual(report.get("skipped"), 3)
+        self.assertEqual(len(list((self.out_dir / "xml").iterdir())), 3)
+
+        # a modified metadata keeps its own file
+        previous_name = json.loads(state_path.read_text()).get(self.records[2]["_id"])
+        records = [dict(md) for md in self.records[:3]]
+        records[2]["_modified"] = "2020-01-01T00:00:00.000000+00:00"
+        report = IsogeoXmlExporter(
+            api_client=self.isogeo,
+            output=self.out_dir / "xml",
+            state_path=state_path,
+            filename=lambda md: "metadata.xml",
+        ).export(records)
+        self.assertEqual(report.get("exported"), 1)
+        exported = [r for r in report.get("records") if r.get("status") == "exported"]
+        self.assertEqual(exported[0].get("name"), previous_name.get("name"))
+        self.assertEqual(len(list((self.out_dir / "xml").iterdir())), 3)
+
+    def test_export_failures(self):
+        """Unknown metadata are reported as failed and not stored into the state."""
+        state_path = self.out_dir / "state.json"
+        unknown = {"_id": "0" * 32, "_modified": "2020-01-01T00:00:00.000000+00:00"}
+        exporter = IsogeoXmlExporter(
+            api_client=self.isogeo, output=self.out_dir / "xml", state_path=state_path
+        )
+        report = exporter.export(self.records[:2] + [unknown])
+
+        self.assertEqual(report.get("failed"), 1)
+        self.assertIn("404", report.get("errors").get(unknown.get("_id")))
+        self.assertNotIn(unknown.get("_id"), exporter.load_state())
+        self.assertEqual(list((self.out_dir / "xml").glob(".*.part")), [])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
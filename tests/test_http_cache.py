@@ -0,0 +1,196 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_http_cache ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# 3rd party
+from requests import Session
+
+# module target
+from isogeo_pysdk.http_cache import IsogeoCachingAdapter, IsogeoHttpCache
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+MD_ID = "0269803d50c446b09f5060ef7fe3e22b"
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """Serves a metadata with an ETag and a catalogs listing without validators."""
+
+    requests_count = 0
+    metadata = {"_id": MD_ID, "_modified": "2020-01-01T00:00:00+00:00", "title": "a"}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        FakeApiHandler.requests_count += 1
+        if self.path.startswith("/resources/{}".format(MD_ID)):
+            etag = '"{}"'.format(self.metadata.get("_modified"))
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps(self.metadata).encode("utf-8")
+            self.send_response(200)
+            self.send_header("ETag", etag)
+        else:
+            body = json.dumps([{"_id": "catalog"}]).encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_DELETE(self):
+        self.send_response(204)
+        self.end_headers()
+
+
+class TestIsogeoHttpCache(unittest.TestCase):
+    """Test persistent HTTP cache."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.server = HTTPServer(("127.0.0.1", 0), FakeApiHandler)
+        cls.base_url = "http://127.0.0.1:{}".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after the last test."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp_dir.name) / "cache" / "http.sqlite"
+        self.cache = IsogeoHttpCache(path=self.cache_path)
+        self.session = self._session(self.cache)
+        self.md_url = "{}/resources/{}/?_include=all".format(self.base_url, MD_ID)
+        FakeApiHandler.requests_count = 0
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.session.close()
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def _session(self, cache: IsogeoHttpCache, scope: str = "app") -> Session:
+        session = Session()
+        session.mount("http://", IsogeoCachingAdapter(cache=cache, scope=scope))
+        return session
+
+    # -- Tests -------------------------------------------------------------------
+    def test_conditional_request(self):
+        """Responses with an ETag are revalidated."""
+        first = self.session.get(self.md_url)
+        second = self.session.get(self.md_url)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(second.status_code, 200)
+        self.assertTrue(getattr(second, "from_cache", False))
+        self.assertEqual(self.cache.stats.get("revalidated"), 1)
+        self.assertEqual(FakeApiHandler.requests_count, 2)
+
+        # confirmed response: its age starts again, it's not validated by stamps
+        key = self.cache.make_key(self.md_url, "app")
+        stored_at = self.cache.get(key).get("stored_at")
+        self.session.get(self.md_url)
+        self.assertGreater(self.cache.get(key).get("stored_at"), stored_at)
+        self.assertFalse(self.cache.is_stamp_fresh(self.cache.get(key)))
+
+    def test_stats_threads(self):
+        """Statistics are counted from several threads."""
+        threads = [
+            threading.Thread(
+                target=lambda: [self.cache.count("hits") for _ in range(1000)]
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.cache.stats.get("hits"), 8000)
+
+    def test_persistence_and_scope(self):
+        """Stored responses are reused by another session but not by another client."""
+        self.session.get(self.md_url)
+        self.cache.close()
+
+        cache = IsogeoHttpCache(path=self.cache_path)
+        self.assertEqual(len(cache), 1)
+        response = self._session(cache).get(self.md_url)
+        self.assertTrue(getattr(response, "from_cache", False))
+
+        response = self._session(cache, scope="another_app").get(self.md_url)
+        self.assertFalse(getattr(response, "from_cache", False))
+        self.cache = cache
+
+    def test_stamps(self):
+        """Metadata validated by their stamps are served without request."""
+        self.session.get(self.md_url)
+        self.session.get("{}/resources/{}/keywords/".format(self.base_url, MD_ID))
+        self.session.get("{}/catalogs/".format(self.base_url))
+
+        # unchanged
+        report = self.cache.revalidate_stamps(
+            [{"_id": MD_ID, "_modified": FakeApiHandler.metadata.get("_modified")}]
+        )
+        self.assertEqual(report, {"fresh": 1, "stale": 0})
+        count = FakeApiHandler.requests_count
+        self.session.get(self.md_url)
+        self.session.get("{}/resources/{}/keywords/".format(self.base_url, MD_ID))
+        self.assertEqual(FakeApiHandler.requests_count, count)
+
+        # changed
+        report = self.cache.revalidate_stamps({MD_ID: "2020-02-02T00:00:00+00:00"})
+        self.assertEqual(report, {"fresh": 0, "stale": 1})
+        self.assertEqual(len(self.cache), 1)
+
+    def test_invalidation(self):
+        """Writing requests remove related responses."""
+        self.session.get(self.md_url)
+        self.session.get("{}/catalogs/".format(self.base_url))
+        self.session.delete("{}/resources/{}".format(self.base_url, MD_ID))
+        self.assertEqual(len(self.cache), 1)
+        self.session.delete("{}/catalogs/".format(self.base_url))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_purge(self):
+        """Old responses are purged."""
+        self.session.get(self.md_url)
+        self.assertEqual(self.cache.purge(older_than=3600), 0)
+        self.assertEqual(self.cache.purge(older_than=-1), 1)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
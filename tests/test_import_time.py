@@ -0,0 +1,92 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_import_time ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import subprocess
+import sys
+import unittest
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+# modules which must not be imported by `import isogeo_pysdk`
+HEAVY_MODULES = (
+    "requests",
+    "requests_oauthlib",
+    "oauthlib",
+    "urllib3",
+    "isogeo_pysdk.isogeo",
+    "isogeo_pysdk.translator",
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestImportTime(unittest.TestCase):
+    """Guard the cost of importing the package."""
+
+    # -- Helpers -----------------------------------------------------------------
+    def loaded_modules(self, statement: str) -> list:
+        """Modules loaded by a statement, executed in a fresh interpreter."""
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import json, sys; {}; print(json.dumps(list(sys.modules)))".format(
+                    statement
+                ),
+            ],
+            capture_output=True,
+            check=True,
+        )
+        return json.loads(out.stdout)
+
+    # -- Tests -------------------------------------------------------------------
+    def test_import_package(self):
+        """Importing the package does not import the HTTP client nor the routes."""
+        modules = self.loaded_modules("import isogeo_pysdk")
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+        self.assertFalse([m for m in modules if m.startswith("isogeo_pysdk.api.")])
+
+    def test_import_models(self):
+        """Models and enums are usable without the HTTP client."""
+        modules = self.loaded_modules(
+            "from isogeo_pysdk import Metadata, MetadataTypes, Resource"
+        )
+        self.assertIn("isogeo_pysdk.models.metadata", modules)
+        self.assertNotIn("requests", modules)
+        self.assertNotIn("isogeo_pysdk.models.share", modules)
+
+    def test_lazy_objects(self):
+        """Public objects are still available from the package."""
+        import isogeo_pysdk
+
+        self.assertIs(isogeo_pysdk.Resource, isogeo_pysdk.Metadata)
+        self.assertIs(isogeo_pysdk.ApiSearch, isogeo_pysdk.api.ApiSearch)
+        self.assertIn("Isogeo", dir(isogeo_pysdk))
+        self.assertNotIn("lazy_attributes", dir(isogeo_pysdk))
+        self.assertNotIn("lazy", dir(isogeo_pysdk))
+        self.assertNotIn("lazy_attributes", dir(isogeo_pysdk.models))
+        with self.assertRaises(AttributeError):
+            isogeo_pysdk.NotAnObject
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -234,6 +234,23 @@ class TestMetadatas(unittest.TestCase):
     #     #                         whole_results=0,
     #     #                         specific_md=md)
 
+    def test_metadatas_get_many(self):
+        """GET :resources/search?_id={metadata_uuids}"""
+        search = self.isogeo.search(page_size=10, whole_results=0)
+        li_md_ids = [md.get("_id") for md in search.results]
+        li_md_ids.append(METADATA_TEST_FIXTURE_UUID)
+
+        li_metadatas = self.isogeo.metadata.get_many(li_md_ids, include=("contacts",))
+        # same length and order
+        self.assertEqual(len(li_metadatas), len(li_md_ids))
+        for md_id, metadata in zip(li_md_ids, li_metadatas):
+            self.assertIsInstance(metadata, Metadata)
+            self.assertEqual(metadata._id, md_id)
+
+        # bad UUID
+        with self.assertRaises(ValueError):
+            self.isogeo.metadata.get_many(["oh_my_bad_uuid"])
+
     def test_metadatas_get_detailed(self):
         """GET :resources/{metadata_uuid}"""
         # retrieve fixture metadata
@@ -0,0 +1,102 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_metadatas_offline ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import time
+import unittest
+from unittest.mock import patch
+
+# module target
+from isogeo_pysdk import Metadata
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMetadatasOffline(unittest.TestCase):
+    """Test metadata routes against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=150).start()
+        self.isogeo = make_client(self.mock_api)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_get_many(self):
+        """Metadata are returned in input order, duplicates included."""
+        md_ids = list(reversed(self.mock_api.ids[:120])) + self.mock_api.ids[:2]
+        requests_before = self.mock_api.stats.get("requests")
+        li_md = self.isogeo.metadata.get_many(
+            (md_id for md_id in md_ids), include=("keywords",)
+        )
+
+        self.assertEqual([md._id for md in li_md], md_ids)
+        self.assertIsInstance(li_md[0], Metadata)
+        self.assertIs(li_md[-2], li_md[119])
+        self.assertIsNotNone(li_md[0].keywords)
+        # 2 searches (100 + 20 UUIDs), no request by metadata
+        self.assertEqual(self.mock_api.stats.get("requests") - requests_before, 2)
+
+    def test_get_many_fallback(self):
+        """Metadata not returned by the search are requested one by one."""
+        hidden_id = self.mock_api.ids[1]
+        unknown_id = "0" * 32
+        search = self.mock_api.search
+
+        def search_without_one(params: dict) -> dict:
+            page = search(params)
+            page["results"] = [
+                md for md in page.get("results") if md.get("_id") != hidden_id
+            ]
+            return page
+
+        md_ids = self.mock_api.ids[:3] + [unknown_id]
+        with patch.object(self.mock_api, "search", side_effect=search_without_one):
+            li_md = self.isogeo.metadata.get_many(md_ids)
+            self.assertEqual([md._id for md in li_md[:3]], md_ids[:3])
+            self.assertIsInstance(li_md[3], tuple)
+
+            li_md = self.isogeo.metadata.get_many(md_ids, fallback=False)
+            self.assertEqual([li_md[1], li_md[3]], [None, None])
+            self.assertEqual(li_md[2]._id, md_ids[2])
+
+        with self.assertRaises(ValueError):
+            self.isogeo.metadata.get_many(md_ids[:1] + ["oh_my_bad_uuid"])
+
+    def test_get_many_fallback_parallel(self):
+        """Metadata missing from the search are requested at the same time."""
+        md_ids = self.mock_api.ids[:6]
+        self.mock_api.latency = 0.2
+        with patch.object(
+            self.mock_api, "search", side_effect=lambda params: {"results": []}
+        ):
+            start = time.perf_counter()
+            li_md = self.isogeo.metadata.get_many(md_ids, max_workers=6)
+            elapsed = time.perf_counter() - start
+        self.assertEqual([md._id for md in li_md], md_ids)
+        # 1 search, then 6 requests at once
+        self.assertLess(elapsed, 0.2 * 4)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
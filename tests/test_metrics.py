@@ -0,0 +1,136 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_metrics ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# 3rd party
+from requests import Session
+
+# module target
+from isogeo_pysdk import IsogeoCache, IsogeoMetrics
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+MD_ID = "0269803d50c446b09f5060ef7fe3e22b"
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """Serves a metadata and a 404 for anything else."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/resources/"):
+            body = json.dumps({"_id": MD_ID}).encode("utf-8")
+            self.send_response(200)
+        else:
+            body = json.dumps({"error": "not found"}).encode("utf-8")
+            self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestIsogeoMetrics(unittest.TestCase):
+    """Test instrumentation of requests."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.server = HTTPServer(("127.0.0.1", 0), FakeApiHandler)
+        cls.base_url = "http://127.0.0.1:{}".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after the last test."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.session = Session()
+        self.metrics = IsogeoMetrics(cache=IsogeoCache())
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.session.close()
+
+    def _get(self, url: str):
+        """Send a request through the metrics middleware, like Isogeo.request does."""
+        kwargs = {}
+        self.metrics.before_send("GET", url, kwargs)
+        response = self.session.get(url, **kwargs)
+        return self.metrics.after_receive("GET", url, response)
+
+    # -- Tests -------------------------------------------------------------------
+    def test_route_template(self):
+        """Identifiers and codes are replaced in route templates."""
+        self.assertEqual(
+            IsogeoMetrics.route_template(
+                "https://v1.api.isogeo.com/groups/{}/catalogs/?_include=".format(MD_ID)
+            ),
+            "groups/{id}/catalogs",
+        )
+        self.assertEqual(
+            IsogeoMetrics.route_template(
+                "https://v1.api.isogeo.com/coordinate-systems/2154"
+            ),
+            "coordinate-systems/{code}",
+        )
+
+    def test_snapshot(self):
+        """Requests are counted by route with their latency, size and decoding time."""
+        for _ in range(3):
+            self._get("{}/resources/{}".format(self.base_url, MD_ID)).json()
+        self._get("{}/catalogs/".format(self.base_url))
+
+        snapshot = self.metrics.snapshot()
+        route = snapshot.get("routes").get("GET resources/{id}")
+        self.assertEqual(route.get("count"), 3)
+        self.assertEqual(route.get("errors"), 0)
+        self.assertGreater(route.get("bytes"), 0)
+        self.assertGreater(route.get("json_decode"), 0)
+        self.assertLessEqual(
+            route.get("latency").get("p50"), route.get("latency").get("p99")
+        )
+        self.assertEqual(snapshot.get("routes").get("GET catalogs").get("errors"), 1)
+        self.assertIn("hits", snapshot.get("cache"))
+
+        # export
+        prometheus = self.metrics.to_prometheus()
+        self.assertIn(
+            'isogeo_requests_total{method="GET",route="resources/{id}"} 3', prometheus
+        )
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot().get("routes"), {})
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
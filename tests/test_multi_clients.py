@@ -0,0 +1,107 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_multi_clients ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# module target
+from isogeo_pysdk import Isogeo, Keyword
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMultiClients(unittest.TestCase):
+    """Test several API clients used in the same process."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=20).start()
+        self.clients = []
+
+    def tearDown(self):
+        """Executed after each test."""
+        for isogeo in self.clients:
+            isogeo.close()
+        self.mock_api.stop()
+
+    def client(self, connect: bool = True, **kwargs) -> Isogeo:
+        isogeo = make_client(self.mock_api, connect=connect, **kwargs)
+        self.clients.append(isogeo)
+        return isogeo
+
+    # -- Tests -------------------------------------------------------------------
+    def test_urls_by_client(self):
+        """Each client requests its own platform in its own language."""
+        isogeo_prod = self.client(connect=False, platform="prod", lang="fr")
+        isogeo_qa = self.client(connect=False, platform="qa", lang="en")
+
+        self.assertEqual(
+            isogeo_prod.metadata.utils.get_request_base_url("resources"),
+            "https://api.isogeo.com/resources/?_lang=fr",
+        )
+        self.assertEqual(
+            isogeo_qa.metadata.utils.get_request_base_url("resources"),
+            "https://api.qa.isogeo.com/resources/?_lang=en",
+        )
+        self.assertEqual(isogeo_prod.metadata.platform, "prod")
+        self.assertEqual(isogeo_qa.metadata.platform, "qa")
+
+    def test_concurrent_clients(self):
+        """Clients used from the same thread pool keep their own token."""
+        isogeo_a = self.client()
+        isogeo_b = self.client()
+        self.assertNotEqual(
+            isogeo_a.token.get("access_token"), isogeo_b.token.get("access_token")
+        )
+
+        def get(args):
+            isogeo, md_id = args
+            isogeo.metadata.get(md_id)
+            return isogeo.token.get("access_token")
+
+        jobs = [
+            (isogeo, md_id) for md_id in self.mock_api.ids for isogeo in self.clients
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(get, jobs))
+
+        self.assertEqual(
+            tokens, [isogeo.token.get("access_token") for isogeo, _ in jobs]
+        )
+        self.assertEqual(self.mock_api.stats.get("tokens"), 2)
+
+    def test_bulk_by_client(self):
+        """Bulk requests prepared with a client are not sent by another one."""
+        isogeo_a = self.client()
+        isogeo_b = self.client()
+        keyword = Keyword(**self.mock_api.records[0].get("keywords")[0])
+
+        isogeo_a.metadata.bulk.prepare(
+            metadatas=self.mock_api.ids[:2],
+            action="add",
+            target="keywords",
+            models=(keyword,),
+        )
+        self.assertEqual(len(isogeo_a.metadata.bulk.BULK_DATA), 1)
+        self.assertEqual(isogeo_b.metadata.bulk.BULK_DATA, [])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_scheduler ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer
+
+# module target
+from isogeo_pysdk import IsogeoScheduler
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoScheduler(unittest.TestCase):
+    """Test the requests budget of a client."""
+
+    # -- Tests -------------------------------------------------------------------
+    def test_rate_limit(self):
+        """Requests are spread according to the rate, after the burst."""
+        scheduler = IsogeoScheduler(rate=50, burst=5)
+        start = default_timer()
+        for _ in range(15):
+            scheduler.acquire()
+            scheduler.release(latency=0.01, status=200)
+        # 5 at once then 10 at 50 per second
+        self.assertGreaterEqual(default_timer() - start, 0.18)
+
+    def test_aimd(self):
+        """Concurrency grows with fast responses and is halved on overload."""
+        scheduler = IsogeoScheduler(concurrency=4, max_concurrency=8)
+        for _ in range(40):
+            scheduler.acquire()
+            scheduler.release(latency=0.01, status=200, route="resources/{id}")
+        self.assertEqual(scheduler.concurrency, 8)
+
+        scheduler.acquire()
+        scheduler.release(status=429, retry_after="0")
+        self.assertEqual(scheduler.concurrency, 4)
+        self.assertEqual(scheduler.snapshot().get("throttled"), 1)
+
+    def test_parse_retry_after(self):
+        """Retry-After is read as seconds or HTTP date."""
+        self.assertEqual(IsogeoScheduler.parse_retry_after("3"), 3)
+        self.assertEqual(
+            IsogeoScheduler.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0
+        )
+        self.assertEqual(IsogeoScheduler.parse_retry_after("soon", default=2), 2)
+
+    def test_throttled_api(self):
+        """Parallel requests of a client adapt to an API answering 429."""
+        with MockIsogeoApi(
+            total=40, latency=0.02, max_in_flight=4, retry_after=0.1
+        ) as mock_api:
+            isogeo = make_client(
+                mock_api,
+                scheduler=IsogeoScheduler(concurrency=16, max_concurrency=16),
+                metrics=True,
+            )
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                li_md = list(executor.map(isogeo.metadata.get, mock_api.ids))
+            isogeo.close()
+
+        self.assertEqual([md._id for md in li_md], mock_api.ids)
+        self.assertGreater(mock_api.stats.get("throttled"), 0)
+        self.assertLess(isogeo.scheduler.concurrency, 16)
+        self.assertEqual(isogeo.scheduler.in_flight, 0)
+        # requests sent again are reported to the metrics
+        routes = isogeo.metrics.snapshot().get("routes")
+        self.assertEqual(
+            sum(route.get("retries") for route in routes.values()),
+            mock_api.stats.get("throttled"),
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -325,3 +325,41 @@ class TestSearch(unittest.TestCase):
 
         # launch again to test event loop management is OK
         self.isogeo.search(whole_results=1, augment=1)
+
+    def test_search_iter(self):
+        """Streamed searches."""
+        total = self.isogeo.search(page_size=0, whole_results=0).total
+
+        # iterate over all results
+        ids = [md._id for md in self.isogeo.search.iter(page_size=50, prefetch=2)]
+        self.assertEqual(len(ids), total)
+        self.assertEqual(len(set(ids)), total)
+
+        # raw dicts, without prefetching
+        for md in self.isogeo.search.iter(prefetch=0, as_model=0):
+            self.assertIsInstance(md, dict)
+            break
+
+        # bad page size
+        with self.assertRaises(ValueError):
+            next(self.isogeo.search.iter(page_size=200))
+
+    def test_search_full_keyset(self):
+        """Complete searches with keyset pagination."""
+        search = self.isogeo.search(
+            whole_results=1, pagination="keyset", order_by="_modified", order_dir="asc"
+        )
+        self.assertIsInstance(search.pagination_report, dict)
+        self.assertEqual(len(search.results), search.pagination_report.get("retrieved"))
+        self.assertEqual(
+            len({md.get("_id") for md in search.results}), len(search.results)
+        )
+        # results are sorted on the key
+        modified = [md.get("_modified") for md in search.results]
+        self.assertEqual(modified, sorted(modified))
+
+        # keyset pagination requires a stable key
+        with self.assertRaises(ValueError):
+            self.isogeo.search(whole_results=1, pagination="keyset", order_by="title")
+        with self.assertRaises(ValueError):
+            self.isogeo.search(whole_results=1, pagination="cursor")
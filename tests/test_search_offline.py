@@ -0,0 +1,174 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_search_offline ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import time
+import unittest
+from unittest.mock import patch
+
+# module target
+from isogeo_pysdk import Metadata
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSearchOffline(unittest.TestCase):
+    """Test searches against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=250).start()
+        self.isogeo = make_client(self.mock_api)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+
+    def _requested_offsets(self, search_mock) -> list:
+        """Offsets of the search pages requested to the mock API."""
+        return [int(c.args[0].get("_offset", 0)) for c in search_mock.call_args_list]
+
+    # -- Tests -------------------------------------------------------------------
+    def test_iter_order(self):
+        """Results are yielded in the search order, with or without prefetching."""
+        ids = [
+            md._id
+            for md in self.isogeo.search.iter(
+                page_size=30, prefetch=3, order_by="_created", order_dir="asc"
+            )
+        ]
+        self.assertEqual(ids, self.mock_api.ids)
+
+        results = list(
+            self.isogeo.search.iter(
+                page_size=100, offset=40, prefetch=0, as_model=0, order_dir="desc"
+            )
+        )
+        self.assertIsInstance(results[0], dict)
+        self.assertEqual(
+            [md.get("_id") for md in results], list(reversed(self.mock_api.ids))[40:]
+        )
+
+        with self.assertRaises(ValueError):
+            next(self.isogeo.search.iter(page_size=200))
+
+    def test_iter_prefetch(self):
+        """No more than `prefetch` pages are requested ahead of the consumer."""
+        with patch.object(
+            self.mock_api, "search", wraps=self.mock_api.search
+        ) as search_mock:
+            results = self.isogeo.search.iter(page_size=20, prefetch=2)
+            self.assertIsInstance(next(results), Metadata)
+            time.sleep(0.2)
+            # first page, then 2 pages ahead
+            self.assertEqual(sorted(self._requested_offsets(search_mock)), [0, 20, 40])
+
+            # consuming the first page releases one more request
+            for _ in range(20):
+                next(results)
+            time.sleep(0.2)
+            self.assertEqual(
+                sorted(self._requested_offsets(search_mock)), [0, 20, 40, 60]
+            )
+            results.close()
+
+    def test_iter_early_close(self):
+        """Stopping the iteration does not wait for the pages requested ahead."""
+        self.mock_api.latency = 0.5
+        with patch.object(
+            self.mock_api, "search", wraps=self.mock_api.search
+        ) as search_mock:
+            results = self.isogeo.search.iter(page_size=10, prefetch=2)
+            next(results)
+            start = time.perf_counter()
+            results.close()
+            self.assertLess(time.perf_counter() - start, 0.4)
+
+            # pages already in flight are the only ones requested
+            time.sleep(1)
+            self.assertLessEqual(search_mock.call_count, 3)
+            with self.assertRaises(StopIteration):
+                next(results)
+
+    def test_keyset(self):
+        """Overlapping pages are merged into the whole results, without duplicates."""
+        search = self.isogeo.search(
+            whole_results=1, pagination="keyset", order_by="_created", order_dir="desc"
+        )
+        self.assertEqual(
+            [md.get("_id") for md in search.results], list(reversed(self.mock_api.ids))
+        )
+        self.assertEqual(
+            search.pagination_report,
+            {
+                "key": "_created",
+                "expected": 250,
+                "retrieved": 250,
+                # pages at offsets 0, 90 and 180 overlap by 10 records
+                "duplicates": 20,
+                "retried": 0,
+                "missing_ranges": [],
+            },
+        )
+
+    def test_keyset_shifted_records(self):
+        """A boundary broken by shifted records is requested again, then reported."""
+        search = self.mock_api.search
+        shifts = []  # records removed before the page at offset 90, by request
+
+        def shifted_search(params: dict) -> dict:
+            if params.get("_offset") == "90" and shifts:
+                params = dict(params, _offset=str(90 + shifts.pop(0)))
+            return search(params)
+
+        with patch.object(self.mock_api, "search", side_effect=shifted_search):
+            # shifted once: fixed by the retry
+            shifts[:] = [20]
+            search_full = self.isogeo.search(
+                whole_results=1, pagination="keyset", order_dir="asc"
+            )
+            report = search_full.pagination_report
+            self.assertEqual((report.get("retried"), report.get("retrieved")), (1, 250))
+            self.assertEqual(report.get("missing_ranges"), [])
+            self.assertEqual(
+                [md.get("_id") for md in search_full.results], self.mock_api.ids
+            )
+
+            # still shifted when requested again: records 100 to 109 are missing
+            shifts[:] = [20, 20]
+            report = self.isogeo.search(
+                whole_results=1, pagination="keyset", order_dir="asc"
+            ).pagination_report
+            self.assertEqual((report.get("retried"), report.get("retrieved")), (1, 240))
+            self.assertEqual(
+                report.get("missing_ranges"),
+                [
+                    {
+                        "offset_start": 90,
+                        "offset_end": 100,
+                        "after": self.mock_api.records[99].get("_created"),
+                        "before": self.mock_api.records[110].get("_created"),
+                    }
+                ],
+            )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
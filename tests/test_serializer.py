@@ -0,0 +1,73 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_serializer ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import unittest
+
+# module target
+from isogeo_pysdk import Condition, Contact, License, Metadata, Workgroup
+from isogeo_pysdk.models.serializer import model_to_dict, model_to_json
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSerializer(unittest.TestCase):
+    """Test models serialization."""
+
+    # -- Tests -------------------------------------------------------------------
+    def test_to_dict(self):
+        """Every model attribute is serialized and nested models are converted."""
+        condition = Condition(
+            description="use it", license=License(name="Licence Ouverte")
+        )
+        condition_dict = condition.to_dict()
+        self.assertEqual(list(condition_dict), list(Condition.ATTR_TYPES))
+        self.assertEqual(condition_dict.get("license").get("name"), "Licence Ouverte")
+
+        workgroup = Workgroup(_id="abc", contact=Contact(name="Isogeo"))
+        self.assertEqual(workgroup.to_dict().get("contact").get("name"), "Isogeo")
+
+    def test_metadata(self):
+        """Metadata are serialized from their raw values, renamed for creation."""
+        metadata = Metadata.clean_attributes(
+            {
+                "_id": "0269803d50c446b09f5060ef7fe3e22b",
+                "title": "Été",
+                "type": "vectorDataset",
+                "coordinate-system": {"code": 2154},
+                "contacts": [{"role": "author"}],
+            }
+        )
+        md_dict = metadata.to_dict()
+        self.assertEqual(md_dict.get("coordinateSystem"), {"code": 2154})
+        self.assertEqual(md_dict.get("contacts"), [{"role": "author"}])
+        self.assertIsNot(md_dict.get("contacts"), metadata.contacts)
+
+        md_creation = model_to_dict(metadata, creation=True)
+        self.assertEqual(md_creation, metadata.to_dict_creation())
+        self.assertIn("coordinate-system", md_creation)
+        self.assertNotIn("_id", md_creation)
+
+        # JSON bytes
+        md_json = model_to_json(metadata, creation=True)
+        self.assertIsInstance(md_json, bytes)
+        self.assertEqual(json.loads(md_json), md_creation)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_sync ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import IsogeoSync, Metadata
+from isogeo_pysdk.sync import SyncSinkDict, SyncSinkJsonFolder
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class FakeSearch(object):
+    """Serves metadata from a dict like ApiSearch.iter does."""
+
+    def __init__(self, database: dict):
+        self.database = database
+        self.fetched = []
+        self.skipped = set()  # records shifted out of the scan pages
+
+    def iter(
+        self,
+        specific_md: tuple = (),
+        include: tuple = (),
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        as_model: bool = True,
+        **kwargs
+    ):
+        results = sorted(
+            self.database.values(),
+            key=lambda md: md.get(order_by) or "",
+            reverse=order_dir == "desc",
+        )
+        if specific_md:
+            results = [md for md in results if md.get("_id") in specific_md]
+            self.fetched.extend(md.get("_id") for md in results)
+        else:
+            results = [md for md in results if md.get("_id") not in self.skipped]
+        for md in results:
+            yield Metadata.clean_attributes(dict(md)) if as_model else dict(md)
+
+
+class FakeClient(object):
+    """Minimal API client with a search."""
+
+    def __init__(self, database: dict):
+        self.search = FakeSearch(database)
+
+
+class TestIsogeoSync(unittest.TestCase):
+    """Test incremental synchronization."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.database = {
+            "{:032x}".format(i): {
+                "_id": "{:032x}".format(i),
+                "_modified": "2020-01-{:02d}T00:00:00+00:00".format(i),
+                "title": "metadata {}".format(i),
+            }
+            for i in range(1, 11)
+        }
+        self.client = FakeClient(self.database)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.tmp_dir.name) / "state.json"
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_first_then_incremental_sync(self):
+        """First run harvests everything, next ones only changes."""
+        sink = SyncSinkDict()
+        sync = IsogeoSync(self.client, sink=sink, state_path=self.state_path)
+        report = sync.run()
+        self.assertEqual(report.get("created"), 10)
+        self.assertEqual(len(sink.store), 10)
+        self.assertEqual(report.get("high_water_mark"), "2020-01-10T00:00:00+00:00")
+
+        # nothing changed: a new instance reloads the state
+        self.client.search.fetched.clear()
+        sync = IsogeoSync(self.client, sink=sink, state_path=self.state_path)
+        report = sync.run()
+        self.assertEqual((report.get("created"), report.get("updated")), (0, 0))
+        self.assertEqual(self.client.search.fetched, [])
+
+        # a modification, a creation with the same stamp and a deletion
+        self.database["{:032x}".format(3)]["_modified"] = "2020-02-01T00:00:00+00:00"
+        self.database["{:032x}".format(3)]["title"] = "modified"
+        self.database["{:032x}".format(99)] = {
+            "_id": "{:032x}".format(99),
+            "_modified": "2020-02-01T00:00:00+00:00",
+            "title": "new",
+        }
+        del self.database["{:032x}".format(5)]
+        report = sync.run()
+        self.assertEqual(report.get("updated"), 1)
+        self.assertEqual(report.get("created"), 1)
+        self.assertEqual(report.get("deleted"), 1)
+        self.assertEqual(sink.store.get("{:032x}".format(3)).title, "modified")
+        self.assertNotIn("{:032x}".format(5), sink.store)
+
+        # state is stored
+        with self.state_path.open() as in_json:
+            state = json.load(in_json)
+        self.assertEqual(len(state.get("ids")), 10)
+        self.assertEqual(len(state.get("boundary_ids")), 2)
+
+    def test_without_deletions_detection(self):
+        """Scan stops at the high-water mark."""
+        sink = SyncSinkDict()
+        sync = IsogeoSync(self.client, sink=sink, detect_deletions=False)
+        sync.run()
+        del self.database["{:032x}".format(5)]
+        report = sync.run()
+        self.assertEqual(report.get("deleted"), 0)
+        self.assertLessEqual(report.get("scanned"), 1)
+        self.assertIn("{:032x}".format(5), sink.store)
+
+    def test_shifted_record_not_deleted(self):
+        """A record missed by the scan but still existing is kept."""
+        sink = SyncSinkDict()
+        sync = IsogeoSync(self.client, sink=sink)
+        sync.run()
+        self.client.search.skipped.add("{:032x}".format(5))
+        del self.database["{:032x}".format(7)]
+        report = sync.run()
+        self.assertEqual(report.get("deleted"), 1)
+        self.assertIn("{:032x}".format(5), sink.store)
+        self.assertNotIn("{:032x}".format(7), sink.store)
+        self.assertIn("{:032x}".format(5), sync.state.get("ids"))
+
+    def test_reserved_filters(self):
+        """Filters set by the synchronization are rejected."""
+        for key in ("order_by", "order_dir", "include", "as_model"):
+            with self.assertRaises(ValueError):
+                IsogeoSync(self.client, sink=SyncSinkDict(), search_filters={key: 1})
+
+    def test_json_folder_sink(self):
+        """Metadata are written as JSON files."""
+        sink = SyncSinkJsonFolder(Path(self.tmp_dir.name) / "mirror")
+        IsogeoSync(self.client, sink=sink).run()
+        self.assertEqual(len(list(sink.folder.glob("*.json"))), 10)
+        sink.delete("{:032x}".format(1))
+        self.assertEqual(len(list(sink.folder.glob("*.json"))), 9)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
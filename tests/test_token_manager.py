@@ -0,0 +1,81 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_token_manager ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# module target
+from isogeo_pysdk import Isogeo, Metadata
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoTokenManager(unittest.TestCase):
+    """Test renewal of the client token against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=20, token_lifetime=3600).start()
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+
+    def connect(self, **kwargs) -> Isogeo:
+        self.isogeo = make_client(self.mock_api, **kwargs)
+        return self.isogeo
+
+    # -- Tests -------------------------------------------------------------------
+    def test_renewal_in_background(self):
+        """Token is renewed before its expiration, without request."""
+        self.mock_api.token_lifetime = 3
+        isogeo = self.connect(token_refresh_margin=2)
+        first_token = isogeo.token.get("access_token")
+
+        time.sleep(1.5)
+        self.assertNotEqual(isogeo.token.get("access_token"), first_token)
+        self.assertEqual(self.mock_api.stats.get("tokens"), 2)
+        self.assertGreater(isogeo.token_manager.expires_in, 1)
+
+    def test_renewal_before_request(self):
+        """Token about to expire is renewed by the route."""
+        isogeo = self.connect()
+        isogeo.token_manager.cancel()
+        isogeo.token["expires_at"] = time.time() + 10
+
+        self.assertIsInstance(isogeo.metadata.get(self.mock_api.ids[0]), Metadata)
+        self.assertEqual(self.mock_api.stats.get("tokens"), 2)
+
+    def test_refused_token(self):
+        """Refused token is renewed once for every concurrent request, which is sent again."""
+        isogeo = self.connect()
+        self.mock_api.revoke_tokens()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(isogeo.metadata.get, self.mock_api.ids[:16]))
+
+        self.assertTrue(all(isinstance(md, Metadata) for md in results))
+        self.assertEqual(self.mock_api.stats.get("tokens"), 2)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
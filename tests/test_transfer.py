@@ -0,0 +1,88 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_transfer ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from pathlib import Path
+
+# module target
+from isogeo_pysdk.transfer import TransferTracker, open_part, part_path
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestTransfer(unittest.TestCase):
+    """Test the bookkeeping shared by the parallel transfers."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.out_path = Path(self.tmp_dir.name) / "data.xml"
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_open_part(self):
+        """Files are written through a hidden .part file, removed on failure."""
+        self.assertEqual(part_path(self.out_path).name, ".data.xml.part")
+        with open_part(self.out_path) as part_file:
+            part_file.write(b"<xml/>")
+            self.assertFalse(self.out_path.exists())
+        self.assertEqual(self.out_path.read_bytes(), b"<xml/>")
+
+        with self.assertRaises(OSError):
+            with open_part(self.out_path) as part_file:
+                part_file.write(b"<partial")
+                raise OSError("connection lost")
+        self.assertEqual(self.out_path.read_bytes(), b"<xml/>")
+        self.assertEqual(list(Path(self.tmp_dir.name).glob(".*.part")), [])
+
+    def test_tracker(self):
+        """Bytes, progress, names and report of a run."""
+        progress = []
+        tracker = TransferTracker(progress=lambda *args: progress.append(args))
+        tracker.start(expected_bytes=30)
+        tracker.add_bytes(10, transferred=False)
+        tracker.add_bytes(20)
+        self.assertEqual(progress, [(10, 30), (30, 30)])
+
+        self.assertEqual(tracker.claim_name("a.xml", "1", "1"), "a.xml")
+        self.assertEqual(tracker.claim_name("a.xml", "1", "1"), "a.xml")
+        self.assertEqual(tracker.claim_name("a.xml", "2", "2"), "a_2.xml")
+
+        report = tracker.report(
+            results=[{"status": "done"}, {"status": "failed"}],
+            statuses=("done", "failed"),
+            message="{done} done, {failed} failed ({throughput:.0f} bytes/s).",
+            files=[],
+        )
+        self.assertEqual((report.get("done"), report.get("failed")), (1, 1))
+        self.assertEqual(report.get("bytes"), 20)
+        self.assertEqual(report.get("files"), [])
+
+        # new run
+        tracker.start()
+        self.assertEqual(tracker.stats.get("bytes"), 0)
+        self.assertEqual(tracker.claim_name("a.xml", "2", "2"), "a.xml")
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
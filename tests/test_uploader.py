@@ -0,0 +1,154 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python python -m unittest tests.test_uploader ```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import os
+import tempfile
+import tracemalloc
+import unittest
+from hashlib import sha256
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import IsogeoUploader, Link, Metadata
+from isogeo_pysdk.uploader import MultipartFileEncoder
+from tests.benchmarks.mock_api import MockIsogeoApi, make_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoUploader(unittest.TestCase):
+    """Test streamed and parallel upload of hosted data against a local stand-in of the API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.mock_api = MockIsogeoApi(total=6).start()
+        self.isogeo = make_client(self.mock_api)
+
+        # files to upload
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(6):
+            path = Path(self.tmp_dir.name) / "package_{}.zip".format(i)
+            path.write_bytes(os.urandom(100000 + i))
+            self.paths.append(path)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.mock_api.stop()
+        self.tmp_dir.cleanup()
+
+    # -- Tests -------------------------------------------------------------------
+    def test_encoder_streaming(self):
+        """The body is read by blocks, without loading the file."""
+        path = Path(self.tmp_dir.name) / "big.bin"
+        with path.open("wb") as big_file:
+            for _ in range(64):
+                big_file.write(os.urandom(131072))  # 8 MiB
+
+        tracemalloc.start()
+        with MultipartFileEncoder({"title": "Big"}, path) as body:
+            read = 0
+            block = body.read(65536)
+            while block:
+                read += len(block)
+                block = body.read(65536)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertEqual(read, len(body))
+        self.assertLess(peak_memory, 1024 * 1024)
+
+        # read again from the start
+        body.seek(0)
+        self.assertTrue(body.read(100).startswith(b"--" + body.boundary.encode()))
+        body.close()
+
+    def test_upload_hosted(self):
+        """A file is sent as multipart form with the link fields."""
+        progress = []
+        link = self.isogeo.metadata.links.upload_hosted(
+            metadata=Metadata(_id=self.mock_api.ids[0]),
+            link=Link(title="Package"),
+            file_to_upload=self.paths[0],
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertIsInstance(link, Link)
+        self.assertEqual(link.size, 100000)
+        upload = self.mock_api.uploads[0]
+        self.assertEqual(upload.get("filename"), "package_0.zip")
+        self.assertEqual(upload.get("fields").get("title"), "Package")
+        self.assertEqual(upload.get("fields").get("type"), "hosted")
+        self.assertEqual(
+            upload.get("sha256"), sha256(self.paths[0].read_bytes()).hexdigest()
+        )
+        self.assertEqual(progress[-1][0], progress[-1][1])
+
+    def test_upload_many(self):
+        """Files are uploaded in parallel, retrying server errors."""
+        self.mock_api.error_rate = 0.3
+        uploads = [
+            (Metadata(_id=md_id), Link(title=path.stem), path)
+            for md_id, path in zip(self.mock_api.ids, self.paths)
+        ]
+        report = IsogeoUploader(
+            api_client=self.isogeo, max_workers=3, retries=8, backoff=0.01
+        ).upload(uploads)
+
+        self.assertEqual(report.get("uploaded"), 6, report.get("files"))
+        self.assertGreater(report.get("retried"), 0)
+        self.assertEqual(
+            sorted(u.get("filename") for u in self.mock_api.uploads),
+            sorted(path.name for path in self.paths),
+        )
+        self.assertEqual(
+            report.get("bytes"), sum(path.stat().st_size for path in self.paths)
+        )
+
+    def test_upload_response_lost(self):
+        """A file received before the connection was lost is not sent again."""
+        self.mock_api.upload_drops = 1
+        report = IsogeoUploader(api_client=self.isogeo, retries=2, backoff=0.01).upload(
+            [(Metadata(_id=self.mock_api.ids[0]), Link(title="Lost"), self.paths[0])]
+        )
+
+        self.assertEqual(report.get("uploaded"), 1, report.get("files"))
+        self.assertEqual(len(self.mock_api.uploads), 1)
+        self.assertEqual(
+            report.get("files")[0].get("link")._id,
+            self.mock_api.created_links.get(self.mock_api.ids[0])[0].get("_id"),
+        )
+
+        # same file uploaded again, lost again: the existing link is not taken for the new one
+        self.mock_api.upload_drops = 1
+        report = IsogeoUploader(api_client=self.isogeo, retries=2, backoff=0.01).upload(
+            [(Metadata(_id=self.mock_api.ids[0]), Link(title="Lost"), self.paths[0])]
+        )
+        created_links = self.mock_api.created_links.get(self.mock_api.ids[0])
+        self.assertEqual(report.get("uploaded"), 1, report.get("files"))
+        self.assertEqual(len(self.mock_api.uploads), 2)
+        self.assertEqual(len(created_links), 2)
+        self.assertEqual(
+            report.get("files")[0].get("link")._id, created_links[1].get("_id")
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()